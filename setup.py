@@ -101,6 +101,7 @@ if __name__ == '__main__':
         install_requires=['pyparsing', 'fparser==0.0.8', 'configparser',
                           'six'],
         include_package_data=True,
-        scripts=['bin/psyclone', 'bin/genkernelstub'],
+        scripts=['bin/psyclone', 'bin/genkernelstub',
+                 'bin/psyclone-autotune'],
         data_files=[('share/psyclone', ['config/psyclone.cfg'])]
     )
@@ -54,6 +54,48 @@ class Alg(object):
     def __init__(self, ast, psy):
         self._ast = ast
         self._psy = psy
+        # The invoke calls must be found before gen() renames them
+        self._invoke_sequences = self._find_invoke_sequences()
+
+    def _find_invoke_sequences(self):
+        '''
+        Find the invoke calls that are made one immediately after
+        another in the algorithm code.
+
+        :returns: the indices of the invokes in each sequence.
+        :rtype: list of lists of int
+
+        '''
+        from fparser import api
+        from psyclone.parse import adjacent_statements
+        sequences = []
+        previous = None
+        idx = 0
+        for stmt, _ in api.walk(self._ast, -1):
+            if isinstance(stmt, fparser.one.statements.Call) and \
+               stmt.designator == "invoke":
+                if previous is not None and \
+                   adjacent_statements(previous, stmt):
+                    sequences[-1].append(idx)
+                else:
+                    sequences.append([idx])
+                previous = stmt
+                idx += 1
+        return sequences
+
+    @property
+    def invoke_sequences(self):
+        '''
+        :returns: the invokes (from the PSy layer) whose calls are made \
+                  one immediately after another in the algorithm code, \
+                  so that no other code can modify their arguments in \
+                  between. Each invoke is in exactly one sequence.
+        :rtype: list of lists of :py:class:`psyclone.psyGen.Invoke`
+
+        '''
+        invokes = self._psy.invokes.invoke_list
+        return [[invokes[idx] for idx in sequence]
+                for sequence in self._invoke_sequences]
 
     @property
     def gen(self):
@@ -0,0 +1,553 @@
+# -----------------------------------------------------------------------------
+# BSD 3-Clause License
+#
+# Copyright (c) 2019, Science and Technology Facilities Council
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+# -----------------------------------------------------------------------------
+
+''' This module provides a simple, empirical autotuner for the dynamo0.3
+    API. A search space of transformation recipes is applied to every
+    invoke of an Algorithm file, each resulting variant is built and run
+    with the profiling library (see lib/profiling) and the fastest recipe
+    for each invoke is reported or written out as a transformation
+    script that can be passed to 'psyclone -s'. '''
+
+from __future__ import absolute_import, print_function
+import argparse
+import itertools
+import os
+import re
+import shutil
+import subprocess
+import sys
+import tempfile
+from psyclone.psyGen import GenerationError
+from psyclone.transformations import TransformationError, \
+    VALID_OMP_SCHEDULES
+
+# The module name used for all profiling regions created by the autotuner.
+# Each invoke gets its own region, named after the invoke.
+PROFILE_MODULE_NAME = "autotune"
+
+# Matches a line of timing output as written by ProfileFinalise in the
+# simple_timing library: "module::region count sum min average max"
+TIMING_LINE = re.compile(
+    r"^\s*(?P<module>\w+)::(?P<region>[\w-]+)\s+(?P<count>\d+)\s+"
+    r"(?P<sum>[-+.\w]+)\s+(?P<min>[-+.\w]+)\s+(?P<average>[-+.\w]+)\s+"
+    r"(?P<max>[-+.\w]+)\s*$")
+
+
+# =============================================================================
+class Recipe(object):
+    '''A single point in the autotuning search space, i.e. a set of
+    transformations to apply to a dynamo0.3 invoke. Transformations
+    that are not valid for a particular loop (e.g. OpenMP on a loop with
+    an INC access that has not been coloured) are silently skipped for
+    that loop so that every recipe can be applied to every invoke.
+
+    :param str omp_schedule: the OpenMP schedule to use for parallel \
+                             loops or None to leave loops serial.
+    :param bool colour: whether to colour loops over cells that update \
+                        fields on continuous function spaces.
+    :param bool fuse: whether to fuse neighbouring loops where allowed.
+    :param int redundant_depth: depth of redundant computation to apply \
+                                to loops or None for no redundant \
+                                computation.
+
+    :raises GenerationError: if the OpenMP schedule is not valid.
+    :raises GenerationError: if the redundant-computation depth is not \
+                             a positive integer.
+    '''
+    def __init__(self, omp_schedule=None, colour=False, fuse=False,
+                 redundant_depth=None):
+        if omp_schedule is not None and \
+           omp_schedule.split(',')[0].lower() not in VALID_OMP_SCHEDULES:
+            raise GenerationError(
+                "Recipe: OpenMP schedule must be one of {0} or None but "
+                "got '{1}'".format(VALID_OMP_SCHEDULES, omp_schedule))
+        if redundant_depth is not None and \
+           (not isinstance(redundant_depth, int) or redundant_depth < 1):
+            raise GenerationError(
+                "Recipe: redundant_depth must be a positive integer or None "
+                "but got '{0}'".format(redundant_depth))
+        self._omp_schedule = omp_schedule
+        self._colour = colour
+        self._fuse = fuse
+        self._redundant_depth = redundant_depth
+
+    def __repr__(self):
+        return ("Recipe(omp_schedule={0!r}, colour={1!r}, fuse={2!r}, "
+                "redundant_depth={3!r})".format(
+                    self._omp_schedule, self._colour, self._fuse,
+                    self._redundant_depth))
+
+    def __eq__(self, other):
+        return isinstance(other, Recipe) and repr(self) == repr(other)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(repr(self))
+
+    @property
+    def omp_schedule(self):
+        ''' :returns: the OpenMP schedule or None if OpenMP is not used.
+        :rtype: str or NoneType '''
+        return self._omp_schedule
+
+    @property
+    def colour(self):
+        ''' :returns: whether loops are coloured.
+        :rtype: bool '''
+        return self._colour
+
+    @property
+    def fuse(self):
+        ''' :returns: whether neighbouring loops are fused.
+        :rtype: bool '''
+        return self._fuse
+
+    @property
+    def redundant_depth(self):
+        ''' :returns: the redundant-computation depth or None.
+        :rtype: int or NoneType '''
+        return self._redundant_depth
+
+    def apply(self, schedule, profile=False):
+        '''Apply the transformations described by this recipe to the
+        supplied schedule. Loops are fused first, then coloured, then
+        redundant computation is added and finally OpenMP is applied.
+
+        :param schedule: the schedule of a dynamo0.3 invoke.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :param bool profile: whether to enclose the whole schedule in a \
+                             profiling region named after the invoke.
+        :returns: the transformed schedule.
+        :rtype: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        '''
+        from psyclone.psyGen import Loop
+        from psyclone.dynamo0p3 import DISCONTINUOUS_FUNCTION_SPACES
+        from psyclone.transformations import DynamoLoopFuseTrans, \
+            Dynamo0p3ColourTrans, Dynamo0p3RedundantComputationTrans, \
+            DynamoOMPParallelLoopTrans, ProfileRegionTrans
+
+        if self._fuse:
+            ftrans = DynamoLoopFuseTrans()
+            idx = 0
+            while idx < len(schedule.children) - 1:
+                node1 = schedule.children[idx]
+                node2 = schedule.children[idx+1]
+                try:
+                    schedule, _ = ftrans.apply(node1, node2)
+                except TransformationError:
+                    idx += 1
+
+        if self._colour:
+            ctrans = Dynamo0p3ColourTrans()
+            for child in schedule.children[:]:
+                if isinstance(child, Loop) and child.loop_type == "" and \
+                   child.field_space.orig_name not in \
+                   DISCONTINUOUS_FUNCTION_SPACES and child.has_inc_arg():
+                    schedule, _ = ctrans.apply(child)
+
+        if self._redundant_depth:
+            rtrans = Dynamo0p3RedundantComputationTrans()
+            for loop in self._innermost_loops(schedule):
+                try:
+                    schedule, _ = rtrans.apply(loop,
+                                               depth=self._redundant_depth)
+                except TransformationError:
+                    pass
+
+        if self._omp_schedule:
+            otrans = DynamoOMPParallelLoopTrans(
+                omp_schedule=self._omp_schedule)
+            for loop in self._innermost_loops(schedule):
+                try:
+                    schedule, _ = otrans.apply(loop)
+                except TransformationError:
+                    pass
+
+        if profile:
+            ptrans = ProfileRegionTrans()
+            schedule, _ = ptrans.apply(schedule.children,
+                                       region_name=schedule.invoke.name,
+                                       module_name=PROFILE_MODULE_NAME)
+        return schedule
+
+    @staticmethod
+    def _innermost_loops(schedule):
+        '''
+        :param schedule: the schedule to search.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :returns: the loops immediately enclosing kernel calls, i.e. the \
+                  inner loop of a coloured loop nest and all other loops.
+        :rtype: list of :py:class:`psyclone.psyGen.Loop`
+        '''
+        from psyclone.psyGen import Loop
+        loops = []
+        for child in schedule.children:
+            if not isinstance(child, Loop):
+                continue
+            if child.loop_type == "colours":
+                loops.append(child.children[0])
+            else:
+                loops.append(child)
+        return loops
+
+
+# =============================================================================
+def search_space(omp_schedules=None, colour=(False, True),
+                 fuse=(False, True), redundant_depths=(None,)):
+    '''Create the list of recipes formed by the Cartesian product of the
+    supplied options.
+
+    :param omp_schedules: OpenMP schedules to try. None in the list \
+                          means 'no OpenMP'. Defaults to serial plus \
+                          all valid OpenMP schedules.
+    :type omp_schedules: list of str or NoneType
+    :param colour: colouring choices to try.
+    :type colour: tuple of bool
+    :param fuse: loop-fusion choices to try.
+    :type fuse: tuple of bool
+    :param redundant_depths: redundant-computation depths to try.
+    :type redundant_depths: tuple of int or NoneType
+    :returns: list of recipes.
+    :rtype: list of :py:class:`psyclone.autotuner.Recipe`
+    '''
+    if omp_schedules is None:
+        omp_schedules = [None] + VALID_OMP_SCHEDULES
+    recipes = []
+    for sched, col, fus, depth in itertools.product(
+            omp_schedules, colour, fuse, redundant_depths):
+        recipe = Recipe(omp_schedule=sched, colour=col, fuse=fus,
+                        redundant_depth=depth)
+        if recipe not in recipes:
+            recipes.append(recipe)
+    return recipes
+
+
+def parse_timings(output, module_name=PROFILE_MODULE_NAME):
+    '''Extract the timing information written by the simple_timing
+    profiling library.
+
+    :param str output: the standard output of the executable.
+    :param str module_name: only regions of this module are returned.
+    :returns: mapping from region name to the total time spent in \
+              that region.
+    :rtype: dict of str: float
+    '''
+    timings = {}
+    for line in output.splitlines():
+        match = TIMING_LINE.match(line)
+        if not match or match.group("module") != module_name:
+            continue
+        try:
+            timings[match.group("region")] = float(match.group("sum"))
+        except ValueError:
+            continue
+    return timings
+
+
+def script_text(recipes, default=None, profile=False):
+    '''Create the text of a PSyclone transformation script that applies
+    the given recipe to each invoke.
+
+    :param recipes: mapping from invoke name to recipe.
+    :type recipes: dict of str: :py:class:`psyclone.autotuner.Recipe`
+    :param default: recipe to apply to invokes not in `recipes` or None.
+    :type default: :py:class:`psyclone.autotuner.Recipe` or NoneType
+    :param bool profile: whether the script adds a profile region \
+                         around each invoke.
+    :returns: the Python source of the transformation script.
+    :rtype: str
+    '''
+    lines = ["''' PSyclone transformation script created by "
+             "psyclone-autotune. '''",
+             "from psyclone.autotuner import Recipe",
+             "",
+             "RECIPES = {"]
+    for name in sorted(recipes):
+        lines.append("    {0!r}: {1!r},".format(name, recipes[name]))
+    lines.extend(["}",
+                  "DEFAULT = {0!r}".format(default),
+                  "",
+                  "",
+                  "def trans(psy):",
+                  "    ''' Apply the tuned recipe to each invoke. '''",
+                  "    for invoke in psy.invokes.invoke_list:",
+                  "        recipe = RECIPES.get(invoke.name, DEFAULT)",
+                  "        if recipe:",
+                  "            invoke.schedule = recipe.apply("
+                  "invoke.schedule, profile={0!r})".format(profile),
+                  "    return psy",
+                  ""])
+    return "\n".join(lines)
+
+
+# =============================================================================
+class Autotuner(object):
+    '''Drives the empirical search. Every recipe is applied to all
+    invokes of the Algorithm file, the generated code is written to
+    `alg_out`/`psy_out`, built with `build_cmd` and run with `run_cmd`.
+    Both commands are executed by the shell in `work_dir` and the build
+    must link against a profiling library which prints the simple_timing
+    summary (e.g. lib/profiling/simple_timing).
+
+    :param str filename: the Algorithm file.
+    :param str build_cmd: shell command that builds the executable.
+    :param str run_cmd: shell command that runs the executable.
+    :param str alg_out: file to write the generated Algorithm code to.
+    :param str psy_out: file to write the generated PSy code to.
+    :param str kernel_path: directory containing the kernel sources.
+    :param bool distributed_memory: whether to generate DM code.
+    :param str work_dir: directory in which to run the commands. \
+                         Defaults to the current working directory.
+    :param int repeat: number of times to run each variant. The \
+                       fastest run is kept.
+    '''
+    # pylint: disable=too-many-instance-attributes,too-many-arguments
+    def __init__(self, filename, build_cmd, run_cmd, alg_out, psy_out,
+                 kernel_path="", distributed_memory=None, work_dir=None,
+                 repeat=1):
+        self._filename = filename
+        self._build_cmd = build_cmd
+        self._run_cmd = run_cmd
+        self._alg_out = alg_out
+        self._psy_out = psy_out
+        self._kernel_path = kernel_path
+        self._distributed_memory = distributed_memory
+        self._work_dir = work_dir if work_dir else os.getcwd()
+        if repeat < 1:
+            raise GenerationError(
+                "Autotuner: the number of repeats must be at least 1 but "
+                "got {0}".format(repeat))
+        self._repeat = repeat
+        # Map from recipe to the timings (per invoke) that it produced
+        self._results = {}
+
+    @property
+    def results(self):
+        ''' :returns: the timings obtained for each recipe.
+        :rtype: dict of :py:class:`psyclone.autotuner.Recipe`: \
+                dict of str: float '''
+        return self._results
+
+    def generate(self, recipe, profile=True):
+        '''Generate the Algorithm and PSy code for the supplied recipe
+        and write them to file.
+
+        :param recipe: the recipe to apply to all invokes.
+        :type recipe: :py:class:`psyclone.autotuner.Recipe`
+        :param bool profile: whether to add a profile region per invoke.
+        '''
+        from psyclone.generator import generate
+        # Every variant gets a uniquely-named script so that the module
+        # imported by the generator is never a stale one.
+        mod_name = "psyclone_autotune_{0}".format(len(self._results))
+        script_dir = tempfile.mkdtemp(prefix="psyclone_autotune")
+        try:
+            script = os.path.join(script_dir, mod_name + ".py")
+            with open(script, "w") as sfile:
+                sfile.write(script_text({}, default=recipe, profile=profile))
+            alg, psy = generate(self._filename, api="dynamo0.3",
+                                kernel_path=self._kernel_path,
+                                script_name=script,
+                                distributed_memory=self._distributed_memory)
+        finally:
+            sys.modules.pop(mod_name, None)
+            shutil.rmtree(script_dir, ignore_errors=True)
+        with open(self._alg_out, "w") as afile:
+            afile.write(str(alg))
+        with open(self._psy_out, "w") as pfile:
+            pfile.write(str(psy))
+
+    def _run(self, cmd):
+        '''Run a shell command in the working directory.
+
+        :param str cmd: the command.
+        :returns: the standard output of the command.
+        :rtype: str
+        :raises GenerationError: if the command fails.
+        '''
+        proc = subprocess.Popen(cmd, shell=True, cwd=self._work_dir,
+                                stdout=subprocess.PIPE,
+                                stderr=subprocess.STDOUT)
+        output, _ = proc.communicate()
+        output = output.decode("utf-8", "replace")
+        if proc.returncode != 0:
+            raise GenerationError(
+                "Autotuner: command '{0}' failed with exit status {1}:\n"
+                "{2}".format(cmd, proc.returncode, output))
+        return output
+
+    def evaluate(self, recipe):
+        '''Generate, build and run the variant for a recipe.
+
+        :param recipe: the recipe to evaluate.
+        :type recipe: :py:class:`psyclone.autotuner.Recipe`
+        :returns: the best time (over all repeats) for each invoke.
+        :rtype: dict of str: float
+        '''
+        self.generate(recipe)
+        self._run(self._build_cmd)
+        best = {}
+        for _ in range(self._repeat):
+            timings = parse_timings(self._run(self._run_cmd))
+            for name, time in timings.items():
+                best[name] = min(time, best.get(name, time))
+        self._results[recipe] = best
+        return best
+
+    def tune(self, recipes, verbose=False):
+        '''Evaluate all of the supplied recipes. Recipes that cannot be
+        generated, built or run are reported (if verbose) and ignored.
+
+        :param recipes: the recipes to evaluate.
+        :type recipes: list of :py:class:`psyclone.autotuner.Recipe`
+        :param bool verbose: whether to print progress information.
+        :returns: the best recipe and time for each invoke.
+        :rtype: dict of str: (:py:class:`psyclone.autotuner.Recipe`, float)
+        '''
+        for idx, recipe in enumerate(recipes):
+            if verbose:
+                print("[{0}/{1}] {2}".format(idx+1, len(recipes), recipe))
+            try:
+                timings = self.evaluate(recipe)
+            except (GenerationError, TransformationError) as err:
+                if verbose:
+                    print("    failed: {0}".format(str(err)))
+                continue
+            if verbose:
+                for name in sorted(timings):
+                    print("    {0}: {1}".format(name, timings[name]))
+        return self.best()
+
+    def best(self):
+        '''
+        :returns: the fastest recipe (and its time) for each invoke from \
+                  the recipes evaluated so far.
+        :rtype: dict of str: (:py:class:`psyclone.autotuner.Recipe`, float)
+        '''
+        best = {}
+        for recipe, timings in self._results.items():
+            for name, time in timings.items():
+                if name not in best or time < best[name][1]:
+                    best[name] = (recipe, time)
+        return best
+
+
+# =============================================================================
+def main(args):
+    '''
+    Parses the command-line arguments, runs the autotuner and reports
+    (and optionally writes a script containing) the best recipes.
+
+    :param list args: the command-line arguments.
+    '''
+    from psyclone.configuration import Config
+    Config.get(do_not_load_file=True)
+
+    parser = argparse.ArgumentParser(
+        description="Empirically tune the PSyclone transformations applied "
+        "to each invoke of a dynamo0.3 Algorithm file")
+    parser.add_argument("filename", help="algorithm-layer source code")
+    parser.add_argument("--build", required=True,
+                        help="shell command that builds the executable")
+    parser.add_argument("--run", required=True,
+                        help="shell command that runs the executable")
+    parser.add_argument("-oalg", required=True,
+                        help="filename of generated algorithm code")
+    parser.add_argument("-opsy", required=True,
+                        help="filename of generated PSy code")
+    parser.add_argument("-o", "--output",
+                        help="filename of the transformation script to "
+                        "write with the best recipe for each invoke")
+    parser.add_argument("-d", "--directory", default="",
+                        help="path to root of directory structure "
+                        "containing kernel source code")
+    parser.add_argument("--workdir", default=None,
+                        help="directory in which to build and run, "
+                        "default is the current working directory")
+    parser.add_argument("--schedules", default=None,
+                        help="colon-separated list of OpenMP schedules to "
+                        "try ('none' for no OpenMP), default is all")
+    parser.add_argument("--depths", default="none",
+                        help="comma-separated list of redundant-computation "
+                        "depths to try ('none' for no redundant "
+                        "computation), default 'none'")
+    parser.add_argument("--repeat", type=int, default=1,
+                        help="number of runs per variant, default 1")
+    parser.add_argument("-dm", "--dist_mem", dest="dist_mem",
+                        action="store_true",
+                        help="generate distributed memory code")
+    parser.add_argument("-nodm", "--no_dist_mem", dest="dist_mem",
+                        action="store_false",
+                        help="do not generate distributed memory code")
+    parser.add_argument("--config", help="Config file with "
+                        "PSyclone specific options.")
+    parser.set_defaults(dist_mem=Config.get().distributed_memory)
+    args = parser.parse_args(args)
+
+    Config.get().load(args.config)
+
+    try:
+        schedules = None
+        if args.schedules:
+            schedules = [None if sched.lower() == "none" else sched for
+                         sched in args.schedules.split(":")]
+        depths = [None if depth.lower() == "none" else int(depth) for
+                  depth in args.depths.split(",")]
+        recipes = search_space(omp_schedules=schedules,
+                               redundant_depths=depths)
+        tuner = Autotuner(args.filename, args.build, args.run, args.oalg,
+                          args.opsy, kernel_path=args.directory,
+                          distributed_memory=args.dist_mem,
+                          work_dir=args.workdir, repeat=args.repeat)
+        best = tuner.tune(recipes, verbose=True)
+    except (ValueError, IOError, OSError, GenerationError) as err:
+        print(str(err), file=sys.stderr)
+        exit(1)
+
+    if not best:
+        print("No timing information was obtained for any recipe. Check "
+              "that the build links against the profiling library and that "
+              "ProfileFinalise is called.", file=sys.stderr)
+        exit(1)
+
+    print("Best recipe per invoke:")
+    for name in sorted(best):
+        print("  {0}: {1} ({2})".format(name, best[name][0], best[name][1]))
+    if args.output:
+        with open(args.output, "w") as ofile:
+            ofile.write(script_text(
+                dict((name, val[0]) for name, val in best.items())))
+        print("Transformation script written to '{0}'".format(args.output))
@@ -163,6 +163,15 @@ class Config(object):
         # reproducible reductions are created.
         self._reprod_pad_size = None
 
+        # True if the per-thread buffers used by reproducible reductions
+        # are kept in the PSy-layer module rather than allocated (and
+        # deallocated) every time a reduction is performed.
+        self._reprod_persistent_buffers = None
+
+        # True if invoke calls that are made one immediately after
+        # another in the algorithm layer are merged into a single invoke
+        self._merge_invokes = None
+
         # Where to write transformed kernels - set at runtime
         self._kernel_output_dir = None
 
@@ -278,6 +287,23 @@ class Config(object):
                 "error while parsing REPROD_PAD_SIZE: {0}".format(str(err)),
                 config=self)
 
+        try:
+            self._reprod_persistent_buffers = \
+                self._config['DEFAULT'].getboolean(
+                    'REPROD_PERSISTENT_BUFFERS', fallback=False)
+        except ValueError as err:
+            raise ConfigurationError(
+                "error while parsing REPROD_PERSISTENT_BUFFERS: {0}".
+                format(str(err)), config=self)
+
+        try:
+            self._merge_invokes = self._config['DEFAULT'].getboolean(
+                'MERGE_INVOKES', fallback=False)
+        except ValueError as err:
+            raise ConfigurationError(
+                "error while parsing MERGE_INVOKES: {0}".format(str(err)),
+                config=self)
+
         # Now we deal with the API-specific sections of the config file. We
         # create a dictionary to hold the API-specifc Config objects.
         self._api_conf = {}
@@ -481,6 +507,30 @@ class Config(object):
         '''
         return self._reprod_pad_size
 
+    @property
+    def reprod_persistent_buffers(self):
+        '''
+        Getter for whether the per-thread buffers required for
+        reproducible OpenMP reductions are kept in the PSy-layer module
+        and combined using a pairwise tree.
+
+        :returns: True if the buffers are persistent, False otherwise.
+        :rtype: bool
+        '''
+        return self._reprod_persistent_buffers
+
+    @property
+    def merge_invokes(self):
+        '''
+        Getter for whether invoke calls that are made one immediately
+        after another in the algorithm layer are merged into a single
+        invoke (and thus a single PSy-layer subroutine).
+
+        :returns: True if adjacent invokes are merged, False otherwise.
+        :rtype: bool
+        '''
+        return self._merge_invokes
+
     @property
     def filename(self):
         '''
@@ -597,6 +647,46 @@ class DynConfig(object):
                 "error while parsing COMPUTE_ANNEXED_DOFS in the [dynamo0.3] "
                 "section of the config file: {0}".format(str(err)),
                 config=self._config)
+        try:
+            self._group_halo_exchanges = section.getboolean(
+                'GROUP_HALO_EXCHANGES', fallback=False)
+        except ValueError as err:
+            raise ConfigurationError(
+                "error while parsing GROUP_HALO_EXCHANGES in the [dynamo0.3] "
+                "section of the config file: {0}".format(str(err)),
+                config=self._config)
+        try:
+            self._group_global_sums = section.getboolean(
+                'GROUP_GLOBAL_SUMS', fallback=False)
+        except ValueError as err:
+            raise ConfigurationError(
+                "error while parsing GROUP_GLOBAL_SUMS in the [dynamo0.3] "
+                "section of the config file: {0}".format(str(err)),
+                config=self._config)
+        try:
+            self._propagate_halo_state = section.getboolean(
+                'PROPAGATE_HALO_STATE', fallback=False)
+        except ValueError as err:
+            raise ConfigurationError(
+                "error while parsing PROPAGATE_HALO_STATE in the [dynamo0.3] "
+                "section of the config file: {0}".format(str(err)),
+                config=self._config)
+        try:
+            self._cache_basis_functions = section.getboolean(
+                'CACHE_BASIS_FUNCTIONS', fallback=False)
+        except ValueError as err:
+            raise ConfigurationError(
+                "error while parsing CACHE_BASIS_FUNCTIONS in the [dynamo0.3] "
+                "section of the config file: {0}".format(str(err)),
+                config=self._config)
+        try:
+            self._vectorise_builtins = section.getboolean(
+                'VECTORISE_BUILTINS', fallback=False)
+        except ValueError as err:
+            raise ConfigurationError(
+                "error while parsing VECTORISE_BUILTINS in the [dynamo0.3] "
+                "section of the config file: {0}".format(str(err)),
+                config=self._config)
 
     @property
     def compute_annexed_dofs(self):
@@ -609,6 +699,61 @@ class DynConfig(object):
         '''
         return self._compute_annexed_dofs
 
+    @property
+    def group_halo_exchanges(self):
+        '''
+        Getter for whether or not adjacent halo exchanges of the same
+        depth are grouped into a single (batched) halo exchange.
+        :returns: True if we are to group halo exchanges
+        :rtype: bool
+
+        '''
+        return self._group_halo_exchanges
+
+    @property
+    def group_global_sums(self):
+        '''
+        Getter for whether or not global sums that can be performed
+        together are grouped into a single (batched) global reduction.
+        :returns: True if we are to group global sums
+        :rtype: bool
+
+        '''
+        return self._group_global_sums
+
+    @property
+    def propagate_halo_state(self):
+        '''
+        Getter for whether or not the known state of halos is propagated
+        between invokes that are called one after another.
+        :returns: True if we are to propagate the state of halos
+        :rtype: bool
+
+        '''
+        return self._propagate_halo_state
+
+    @property
+    def cache_basis_functions(self):
+        '''
+        Getter for whether or not basis and differential basis functions
+        are cached in the PSy-layer module and reused between invokes.
+        :returns: True if we are to cache basis functions
+        :rtype: bool
+
+        '''
+        return self._cache_basis_functions
+
+    @property
+    def vectorise_builtins(self):
+        '''
+        Getter for whether or not loops over dofs containing built-ins
+        are generated in a form suitable for SIMD vectorisation.
+        :returns: True if we are to generate SIMD-friendly built-ins
+        :rtype: bool
+
+        '''
+        return self._vectorise_builtins
+
 
 # =============================================================================
 class GOceanConfig(object):
@@ -53,7 +53,7 @@ from psyclone.configuration import Config
 from psyclone.psyGen import PSy, Invokes, Invoke, Schedule, Loop, Kern, \
     Arguments, KernelArgument, NameSpaceFactory, GenerationError, \
     InternalError, FieldNotFoundError, HaloExchange, GlobalSum, \
-    FORTRAN_INTENT_NAMES, DataAccess
+    FORTRAN_INTENT_NAMES, DataAccess, ACCDataDirective, ACCParallelDirective
 
 # First section : Parser specialisations and classes
 
@@ -109,6 +109,15 @@ GH_READ_ONLY_ACCESS = ["gh_read"]
 
 VALID_ACCESS_DESCRIPTOR_NAMES = GH_READ_ONLY_ACCESS + GH_WRITE_ACCESSES
 
+# Precisions that may be specified for a field or operator using the
+# precision=... meta-data element and the Fortran kind of real that
+# each maps to. Arguments without a precision are of the default kind.
+PRECISION_KINDS = OrderedDict([("gh_r_def", "r_def"),
+                               ("gh_r_single", "r_single"),
+                               ("gh_r_double", "r_double")])
+VALID_PRECISION_NAMES = list(PRECISION_KINDS.keys())
+DEFAULT_KIND = "r_def"
+
 # Stencils
 VALID_STENCIL_TYPES = ["x1d", "y1d", "xory1d", "cross", "region"]
 # Note, can't use VALID_STENCIL_DIRECTIONS at all locations in this
@@ -132,22 +141,31 @@ VALID_MESH_TYPES = ["gh_coarse", "gh_fine"]
 # halo. It is useful to group these together as we often need to
 # determine whether an access to a field or other object includes
 # access to the halo, or not.
-HALO_ACCESS_LOOP_BOUNDS = ["cell_halo", "dof_halo", "colour_halo"]
+HALO_ACCESS_LOOP_BOUNDS = ["cell_halo", "dof_halo", "colour_halo",
+                           "tile_halo", "tilecell_halo"]
 
 VALID_LOOP_BOUNDS_NAMES = (["start",     # the starting
                                          # index. Currently this is
                                          # always 1
-                            "inner",     # a placeholder for when we
-                                         # support loop splitting into
-                                         # work that does not access
-                                         # the halo and work that does.
-                                         # This will be used to help
-                                         # overlap computation and
-                                         # communication
+                            "inner",     # the owned cells that are at
+                                         # least the specified number
+                                         # of cells from the edge of
+                                         # the partition. Used when a
+                                         # loop is split into work that
+                                         # does not access the halo and
+                                         # work that does so that
+                                         # computation and
+                                         # communication can overlap
                             "ncolour",   # the number of cells with
                                          # the current colour
                             "ncolours",  # the number of colours in a
                                          # coloured loop
+                            "ntilecolours",  # the number of colours of
+                                             # tiles in a tiled loop
+                            "ntiles",    # the number of tiles with the
+                                         # current colour
+                            "ntilecell",  # the number of cells in the
+                                          # current tile
                             "ncells",    # the number of owned cells
                             "ndofs",     # the number of owned dofs
                             "nannexed"]  # the number of owned dofs
@@ -169,7 +187,8 @@ FIELD_ACCESS_MAP = {"write": "gh_write", "read": "gh_read",
 
 # Valid Dynamo0.3 loop types. The default is "" which is over cells (in the
 # horizontal plane).
-VALID_LOOP_TYPES = ["dofs", "colours", "colour", ""]
+VALID_LOOP_TYPES = ["dofs", "colours", "colour", "tilecolours", "tiles",
+                    "tile", ""]
 
 # Mappings used by non-API-Specific code in psyGen
 psyGen.MAPPING_REDUCTIONS = {"sum": "gh_sum"}
@@ -404,6 +423,41 @@ def cma_on_space(function_space, arguments):
                 return arg
     return None
 
+
+def infrastructure_type(arg_type, kind=DEFAULT_KIND, proxy=False):
+    '''
+    Returns the names of the LFRic infrastructure module and derived type
+    that hold a field or operator (or its proxy) with data of the
+    specified kind. Those of the default kind are provided by field_mod
+    and operator_mod while the names for any other kind are prefixed
+    with that kind, e.g. r_single_field_type from r_single_field_mod.
+
+    :param str arg_type: the type of the argument (gh_field, gh_operator \
+                         or gh_columnwise_operator).
+    :param str kind: the Fortran kind of the data held by the argument.
+    :param bool proxy: whether to return the name of the proxy type.
+    :returns: the names of the module and of the derived type.
+    :rtype: 2-tuple of str
+    :raises InternalError: if the argument type is not a field or operator.
+
+    '''
+    bases = {"gh_field": ("field_mod", "field"),
+             "gh_operator": ("operator_mod", "operator"),
+             "gh_columnwise_operator": ("operator_mod",
+                                        "columnwise_operator")}
+    if arg_type not in bases:
+        raise InternalError(
+            "infrastructure_type: expected one of {0} but got '{1}'".
+            format(list(bases.keys()), arg_type))
+    module, type_name = bases[arg_type]
+    if proxy:
+        type_name += "_proxy"
+    type_name += "_type"
+    if kind != DEFAULT_KIND:
+        module = kind + "_" + module
+        type_name = kind + "_" + type_name
+    return module, type_name
+
 # Classes
 
 
@@ -531,26 +585,49 @@ class DynArgDescriptor03(Descriptor):
                 "In the dynamo0.3 API each meta_arg entry must be of type "
                 "'arg_type', but found '{0}'".format(arg_type.name))
 
+        # Extract the optional precision of the argument. This is given
+        # as precision=PRECISION_NAME and is not counted in the number of
+        # arguments checked below.
+        self._precision = None
+        args = []
+        for arg in arg_type.args:
+            if isinstance(arg, expr.NamedArg) and \
+               arg.name.lower() == "precision":
+                if self._precision:
+                    raise ParseError(
+                        "In the dynamo0.3 API a meta_arg entry may only "
+                        "specify its precision once but found '{0}'".
+                        format(arg_type))
+                self._precision = arg.value.lower()
+                if self._precision not in VALID_PRECISION_NAMES:
+                    raise ParseError(
+                        "In the dynamo0.3 API the precision of a meta_arg "
+                        "entry must be one of {0} but found '{1}' in '{2}'".
+                        format(VALID_PRECISION_NAMES, self._precision,
+                               arg_type))
+            else:
+                args.append(arg)
+
         # We require at least 2 args
-        if len(arg_type.args) < 2:
+        if len(args) < 2:
             raise ParseError(
                 "In the dynamo0.3 API each meta_arg entry must have at least "
-                "2 args, but found '{0}'".format(len(arg_type.args)))
+                "2 args, but found '{0}'".format(len(args)))
 
         # The first arg is the type of field, possibly with a *n appended
         self._vector_size = 1
-        if isinstance(arg_type.args[0], expr.BinaryOperator):
+        if isinstance(args[0], expr.BinaryOperator):
             # We expect 'field_type * n' to have been specified
-            self._type = arg_type.args[0].toks[0].name
-            operator = arg_type.args[0].toks[1]
+            self._type = args[0].toks[0].name
+            operator = args[0].toks[1]
             try:
-                self._vector_size = int(arg_type.args[0].toks[2])
+                self._vector_size = int(args[0].toks[2])
             except TypeError:
                 raise ParseError(
                     "In the dynamo0.3 API vector notation expects the format "
                     "(field*n) where n is an integer, but the following was "
                     "found '{0}' in '{1}'.".
-                    format(str(arg_type.args[0].toks[2]), arg_type))
+                    format(str(args[0].toks[2]), arg_type))
             if self._type not in VALID_ARG_TYPE_NAMES:
                 raise ParseError(
                     "In the dynamo0.3 API the 1st argument of a meta_arg "
@@ -561,7 +638,7 @@ class DynArgDescriptor03(Descriptor):
                 raise ParseError(
                     "In the dynamo0.3 API vector notation is not supported "
                     "for scalar arguments (found '{0}')".
-                    format(arg_type.args[0]))
+                    format(args[0]))
             if operator != "*":
                 raise ParseError(
                     "In the dynamo0.3 API the 1st argument of a meta_arg "
@@ -576,29 +653,29 @@ class DynArgDescriptor03(Descriptor):
                     "but found '{0}' in '{1}'".format(self._vector_size,
                                                       arg_type))
 
-        elif isinstance(arg_type.args[0], expr.FunctionVar):
+        elif isinstance(args[0], expr.FunctionVar):
             # We expect 'field_type' to have been specified
-            if arg_type.args[0].name not in VALID_ARG_TYPE_NAMES:
+            if args[0].name not in VALID_ARG_TYPE_NAMES:
                 raise ParseError(
                     "In the dynamo0.3 API the 1st argument of a "
                     "meta_arg entry should be a valid argument type (one of "
                     "{0}), but found '{1}' in '{2}'".
-                    format(VALID_ARG_TYPE_NAMES, arg_type.args[0].name,
+                    format(VALID_ARG_TYPE_NAMES, args[0].name,
                            arg_type))
-            self._type = arg_type.args[0].name
+            self._type = args[0].name
         else:
             raise ParseError(
                 "Internal error in DynArgDescriptor03.__init__, (1) should "
                 "not get to here")
 
         # The 2nd arg is an access descriptor
-        if arg_type.args[1].name not in VALID_ACCESS_DESCRIPTOR_NAMES:
+        if args[1].name not in VALID_ACCESS_DESCRIPTOR_NAMES:
             raise ParseError(
                 "In the dynamo0.3 API the 2nd argument of a meta_arg entry "
                 "must be a valid access descriptor (one of {0}), but found "
                 "'{1}' in '{2}'".format(VALID_ACCESS_DESCRIPTOR_NAMES,
-                                        arg_type.args[1].name, arg_type))
-        self._access_descriptor = arg_type.args[1]
+                                        args[1].name, arg_type))
+        self._access_descriptor = args[1]
         # Reduction access descriptors are only valid for real scalar arguments
         if self._type != "gh_real" and \
            self._access_descriptor.name in VALID_REDUCTION_NAMES:
@@ -612,38 +689,38 @@ class DynArgDescriptor03(Descriptor):
         mesh = None
         # Fields
         if self._type == "gh_field":
-            if len(arg_type.args) < 3:
+            if len(args) < 3:
                 raise ParseError(
                     "In the dynamo0.3 API each meta_arg entry must have at "
                     "least 3 arguments if its first argument is gh_field, but "
-                    "found {0} in '{1}'".format(len(arg_type.args), arg_type)
+                    "found {0} in '{1}'".format(len(args), arg_type)
                     )
             # There must be at most 4 arguments.
-            if len(arg_type.args) > 4:
+            if len(args) > 4:
                 raise ParseError(
                     "In the dynamo0.3 API each meta_arg entry must have at "
                     "most 4 arguments if its first argument is gh_field, but "
-                    "found {0} in '{1}'".format(len(arg_type.args), arg_type))
+                    "found {0} in '{1}'".format(len(args), arg_type))
             # The 3rd argument must be a function space name
-            if arg_type.args[2].name not in VALID_FUNCTION_SPACE_NAMES:
+            if args[2].name not in VALID_FUNCTION_SPACE_NAMES:
                 raise ParseError(
                     "In the dynamo0.3 API the 3rd argument of a meta_arg "
                     "entry must be a valid function space name if its first "
                     "argument is gh_field (one of {0}), but found '{1}' in "
                     "'{2}".format(VALID_FUNCTION_SPACE_NAMES,
-                                  arg_type.args[2].name, arg_type))
-            self._function_space1 = arg_type.args[2].name
+                                  args[2].name, arg_type))
+            self._function_space1 = args[2].name
 
             # The optional 4th argument is either a stencil specification
             # or a mesh identifier (for inter-grid kernels)
-            if len(arg_type.args) == 4:
+            if len(args) == 4:
                 try:
                     from psyclone.parse import get_stencil, get_mesh
-                    if "stencil" in str(arg_type.args[3]):
-                        stencil = get_stencil(arg_type.args[3],
+                    if "stencil" in str(args[3]):
+                        stencil = get_stencil(args[3],
                                               VALID_STENCIL_TYPES)
-                    elif "mesh" in str(arg_type.args[3]):
-                        mesh = get_mesh(arg_type.args[3], VALID_MESH_TYPES)
+                    elif "mesh" in str(args[3]):
+                        mesh = get_mesh(args[3], VALID_MESH_TYPES)
                     else:
                         raise ParseError("Unrecognised meta-data entry")
                 except ParseError as err:
@@ -683,28 +760,28 @@ class DynArgDescriptor03(Descriptor):
         elif self._type in VALID_OPERATOR_NAMES:
             # we expect 4 arguments with the 3rd and 4th each being a
             # function space
-            if len(arg_type.args) != 4:
+            if len(args) != 4:
                 raise ParseError(
                     "In the dynamo0.3 API each meta_arg entry must have 4 "
                     "arguments if its first argument is gh_operator or "
                     "gh_columnwise_operator, but "
-                    "found {0} in '{1}'".format(len(arg_type.args), arg_type))
-            if arg_type.args[2].name not in VALID_FUNCTION_SPACE_NAMES:
+                    "found {0} in '{1}'".format(len(args), arg_type))
+            if args[2].name not in VALID_FUNCTION_SPACE_NAMES:
                 raise ParseError(
                     "In the dynamo0.3 API the 3rd argument of a meta_arg "
                     "entry must be a valid function space name (one of {0}), "
                     "but found '{1}' in '{2}".
-                    format(VALID_FUNCTION_SPACE_NAMES, arg_type.args[2].name,
+                    format(VALID_FUNCTION_SPACE_NAMES, args[2].name,
                            arg_type))
-            self._function_space1 = arg_type.args[2].name
-            if arg_type.args[3].name not in VALID_FUNCTION_SPACE_NAMES:
+            self._function_space1 = args[2].name
+            if args[3].name not in VALID_FUNCTION_SPACE_NAMES:
                 raise ParseError(
                     "In the dynamo0.3 API the 4th argument of a meta_arg "
                     "entry must be a valid function space name (one of {0}), "
                     "but found '{1}' in '{2}".
-                    format(VALID_FUNCTION_SPACE_NAMES, arg_type.args[2].name,
+                    format(VALID_FUNCTION_SPACE_NAMES, args[2].name,
                            arg_type))
-            self._function_space2 = arg_type.args[3].name
+            self._function_space2 = args[3].name
             # Test allowed accesses for operators
             if self._access_descriptor.name.lower() == "gh_inc":
                 raise ParseError(
@@ -713,11 +790,16 @@ class DynArgDescriptor03(Descriptor):
 
         # Scalars
         elif self._type in VALID_SCALAR_NAMES:
-            if len(arg_type.args) != 2:
+            if self._precision:
+                raise ParseError(
+                    "In the dynamo0.3 API a precision may only be specified "
+                    "for a field or an operator but found '{0}'".
+                    format(arg_type))
+            if len(args) != 2:
                 raise ParseError(
                     "In the dynamo0.3 API each meta_arg entry must have 2 "
                     "arguments if its first argument is gh_{{r,i}}scalar, but "
-                    "found {0} in '{1}'".format(len(arg_type.args), arg_type))
+                    "found {0} in '{1}'".format(len(args), arg_type))
             # Test allowed accesses for scalars (read_only or reduction)
             if self._access_descriptor.name not in ["gh_read"] + \
                VALID_REDUCTION_NAMES:
@@ -739,6 +821,16 @@ class DynArgDescriptor03(Descriptor):
                             self._function_space1, stencil=stencil,
                             mesh=mesh)
 
+    @property
+    def precision(self):
+        '''
+        :returns: the precision of this field or operator argument as \
+                  specified in the meta-data (one of VALID_PRECISION_NAMES) \
+                  or None if it is not specified.
+        :rtype: str
+        '''
+        return self._precision
+
     @property
     def function_space_to(self):
         ''' Return the "to" function space for a gh_operator. This is
@@ -1360,10 +1452,39 @@ class DynamoPSy(PSy):
                                          "operator_proxy_type",
                                          "columnwise_operator_type",
                                          "columnwise_operator_proxy_type"]))
+        # include the infrastructure modules for any fields and operators
+        # that hold data of a kind other than the default
+        kinds = [DEFAULT_KIND]
+        modules = OrderedDict()
+        for invoke in self.invokes.invoke_list:
+            for arg in invoke.psy_unique_vars:
+                if arg.type in VALID_SCALAR_NAMES:
+                    continue
+                kind = invoke.arg_precision(arg.name)
+                if kind == DEFAULT_KIND:
+                    continue
+                if kind not in kinds:
+                    kinds.append(kind)
+                for proxy in [False, True]:
+                    module, datatype = infrastructure_type(
+                        arg.type, kind, proxy=proxy)
+                    types = modules.setdefault(module, [])
+                    if datatype not in types:
+                        types.append(datatype)
+            # the kinds to which the data of arguments is converted
+            for conversion in invoke.schedule.walk(invoke.schedule.children,
+                                                   DynKindConversion):
+                if conversion.arg.precision not in kinds:
+                    kinds.append(conversion.arg.precision)
+        for module, types in modules.items():
+            psy_module.add(UseGen(psy_module, name=module, only=True,
+                                  funcnames=types))
         psy_module.add(UseGen(psy_module, name="constants_mod", only=True,
-                              funcnames=["r_def"]))
+                              funcnames=kinds))
         # add all invoke specific information
         self.invokes.gen_code(psy_module)
+        if Config.get().api_conf("dynamo0.3").cache_basis_functions:
+            self.invokes.gen_invalidate_basis_cache(psy_module)
         # inline kernels where requested
         self.inline(psy_module)
         # Return the root node of the generated code
@@ -1381,6 +1502,36 @@ class DynamoInvokes(Invokes):
             self._0_to_n = DynInvoke(None, None)  # for pyreverse
         Invokes.__init__(self, alg_calls, DynInvoke)
 
+    def gen_invalidate_basis_cache(self, parent):
+        '''
+        Create the subroutine that deallocates the basis/diff-basis
+        arrays cached in the PSy-layer module by the invokes and resets
+        the record of what they were computed for. It must be called
+        from the Algorithm layer whenever a function space or
+        quadrature object for which basis functions may have been
+        cached is modified or destroyed.
+
+        :param parent: the node in the f2pygen AST of the PSy-layer \
+                       module.
+        :type parent: :py:class:`psyclone.f2pygen.ModuleGen`
+        '''
+        from psyclone.f2pygen import SubroutineGen, IfThenGen, \
+            DeallocateGen, AssignGen
+        arrays = set()
+        keys = set()
+        for invoke in self.invoke_list:
+            invoke_arrays, invoke_keys = invoke.evaluators.cache_variables()
+            arrays.update(invoke_arrays)
+            keys.update(invoke_keys)
+        sub = SubroutineGen(parent, name="invalidate_basis_cache")
+        for array in sorted(arrays):
+            dealloc = IfThenGen(sub, "allocated({0})".format(array))
+            sub.add(dealloc)
+            dealloc.add(DeallocateGen(dealloc, [array]))
+        for key in sorted(keys):
+            sub.add(AssignGen(sub, lhs=key, rhs="null()", pointer=True))
+        parent.add(sub)
+
 
 def stencil_extent_value(field):
     '''Returns the content of the stencil extent. This may be a literal
@@ -1882,7 +2033,8 @@ class DynInvokeCMAOperators(object):
             cma_name = self._name_space_manager.create_name(
                 root_name=op_name+"_matrix", context="PSyVars",
                 label=op_name+"_matrix")
-            parent.add(DeclGen(parent, datatype="real", kind="r_def",
+            parent.add(DeclGen(parent, datatype="real",
+                               kind=self._cma_ops[op_name]["arg"].precision,
                                pointer=True,
                                entity_decls=[cma_name+"(:,:,:) => null()"]))
             # Declare the associated integer parameters
@@ -1897,9 +2049,10 @@ class DynInvokeCMAOperators(object):
 
 
 class DynMeshes(object):
-    '''Holds all mesh-related information (including colour maps if
-    required).  If there are no inter-grid kernels then there is only
-    one mesh object required (when colouring or doing distributed memory).
+    '''Holds all mesh-related information (including colour maps and
+    tiling maps if required).  If there are no inter-grid kernels then
+    there is only one mesh object required (when colouring or doing
+    distributed memory).
     However, kernels performing inter-grid operations require multiple mesh
     objects as well as mesh maps and other quantities.
 
@@ -1926,6 +2079,9 @@ class DynMeshes(object):
         self._mesh_names = []
         # Whether or not the associated Invoke requires colourmap information
         self._needs_colourmap = False
+        # Whether or not the associated Invoke requires the map of cells
+        # in coloured tiles
+        self._needs_tilemap = False
         # Keep a reference to the Schedule so we can check for colouring
         # later
         self._schedule = invoke.schedule
@@ -2004,6 +2160,11 @@ class DynMeshes(object):
         in the constructor since colouring is applied by Transformations
         and happens after the Schedule has already been constructed.
         '''
+        # Tiled colouring is not supported for inter-grid kernels so
+        # only the one mesh object is ever required
+        self._needs_tilemap = any(call.is_tiled() for call in
+                                  self._schedule.kern_calls())
+
         for call in [call for call in self._schedule.kern_calls() if
                      call.is_coloured()]:
             # Keep a record of whether or not any kernels (loops) in this
@@ -2028,7 +2189,8 @@ class DynMeshes(object):
                 self._ig_kernels[call.name].colourmap = colour_map
                 self._ig_kernels[call.name].ncolours_var = ncolours
 
-        if not self._mesh_names and self._needs_colourmap:
+        if not self._mesh_names and (self._needs_colourmap or
+                                     self._needs_tilemap):
             # There aren't any inter-grid kernels but we do need colourmap
             # information and that means we'll need a mesh object
             mesh_name = self._name_space_manager.create_name(
@@ -2097,6 +2259,18 @@ class DynMeshes(object):
                                entity_decls=[colour_map+"(:,:)"]))
             parent.add(DeclGen(parent, datatype="integer",
                                entity_decls=[ncolours]))
+        if self._needs_tilemap:
+            # We need the map of the cells in each tile of each colour
+            tile_map = self._name_space_manager.create_name(
+                root_name="tmap", context="PSyVars", label="tmap")
+            ntilecolours = self._name_space_manager.create_name(
+                root_name="ntilecolour", context="PSyVars",
+                label="ntilecolour")
+            parent.add(DeclGen(parent, datatype="integer",
+                               pointer=True,
+                               entity_decls=[tile_map+"(:,:,:)"]))
+            parent.add(DeclGen(parent, datatype="integer",
+                               entity_decls=[ntilecolours]))
 
     def initialise(self, parent):
         '''
@@ -2140,6 +2314,25 @@ class DynMeshes(object):
                 parent.add(AssignGen(parent, pointer=True, lhs=colour_map,
                                      rhs=self._mesh_names[0] +
                                      "%get_colour_map()"))
+            if self._needs_tilemap:
+                parent.add(CommentGen(parent, ""))
+                parent.add(CommentGen(parent, " Get the tiled colourmap"))
+                parent.add(CommentGen(parent, ""))
+                # Look-up variable names for the tile map and number of
+                # colours of tiles
+                tile_map = self._name_space_manager.create_name(
+                    root_name="tmap", context="PSyVars", label="tmap")
+                ntilecolour = self._name_space_manager.create_name(
+                    root_name="ntilecolour", context="PSyVars",
+                    label="ntilecolour")
+                # Get the number of colours of tiles
+                parent.add(AssignGen(
+                    parent, lhs=ntilecolour,
+                    rhs="{0}%get_ntilecolours()".format(self._mesh_names[0])))
+                # Get the map of the cells in each tile of each colour
+                parent.add(AssignGen(parent, pointer=True, lhs=tile_map,
+                                     rhs=self._mesh_names[0] +
+                                     "%get_coloured_tiling_map()"))
             return
 
         parent.add(CommentGen(
@@ -2458,6 +2651,168 @@ class DynInvokeBasisFns(object):
                         datatype=QUADRATURE_TYPE_MAP[shape]["proxy_type"],
                         entity_decls=var_names))
 
+    @property
+    def cached(self):
+        '''
+        :returns: whether the basis/diff-basis arrays are cached in the \
+                  PSy-layer module (see the CACHE_BASIS_FUNCTIONS \
+                  configuration option) rather than being allocated and \
+                  computed every time the invoke is called.
+        :rtype: bool
+        '''
+        return Config.get().api_conf("dynamo0.3").cache_basis_functions
+
+    def _basis_arrays(self):
+        '''
+        :returns: the distinct basis/diff-basis arrays required by this \
+                  invoke. Keys are the names of the arrays, values are \
+                  the dict describing the basis function and the target \
+                  function space (None for quadrature).
+        :rtype: :py:class:`collections.OrderedDict`
+
+        :raises InternalError: if an invalid entry is encountered in the \
+                               self._basis_fns list.
+        '''
+        arrays = OrderedDict()
+        for basis_fn in self._basis_fns:
+            if basis_fn["type"] == "basis":
+                name = "gh_basis"
+            elif basis_fn["type"] == "diff-basis":
+                name = "gh_diff_basis"
+            else:
+                raise InternalError(
+                    "Unrecognised type of basis function: '{0}'. Should be "
+                    "one of 'basis' or 'diff-basis'.".format(basis_fn["type"]))
+            for space in basis_fn["nodal_fspaces"]:
+                op_name = get_fs_operator_name(name, basis_fn["fspace"],
+                                               qr_var=basis_fn["qr_var"],
+                                               on_space=space)
+                if op_name not in arrays:
+                    arrays[op_name] = (basis_fn, space)
+        return arrays
+
+    @staticmethod
+    def _cache_key_names(op_name, space):
+        '''
+        :param str op_name: the name of a cached basis/diff-basis array.
+        :param space: the target function space of an evaluator or None \
+                      for quadrature.
+        :type space: :py:class:`psyclone.dynamo0p3.FunctionSpace` or \
+                     NoneType
+        :returns: the names of the pointers to the function space and \
+                  to the quadrature weights (or the nodes of the target \
+                  function space) for which the array was last computed.
+        :rtype: 2-tuple of str
+        '''
+        if space is None:
+            return op_name + "_fs_key", op_name + "_qr_key"
+        return op_name + "_fs_key", op_name + "_nodes_key"
+
+    def cache_variables(self):
+        '''
+        :returns: the names of the module variables holding the \
+                  basis/diff-basis arrays cached by this invoke and the \
+                  names of the pointers identifying what they were \
+                  computed for. Both lists are empty if basis functions \
+                  are not cached.
+        :rtype: 2-tuple of list of str
+        '''
+        if not self.cached:
+            return [], []
+        arrays = self._basis_arrays()
+        keys = []
+        for op_name, (_, space) in arrays.items():
+            keys.extend(self._cache_key_names(op_name, space))
+        return list(arrays.keys()), keys
+
+    def declare_basis_cache(self, parent):
+        '''
+        Declare the module variables that cache the basis/diff-basis
+        arrays required by this invoke, if basis functions are to be
+        cached.
+
+        :param parent: the node in the f2pygen AST of the PSy-layer \
+                       module.
+        :type parent: :py:class:`psyclone.f2pygen.ModuleGen`
+        '''
+        from psyclone.f2pygen import DeclGen, TypeDeclGen, UseGen
+        if not self.cached or not self._basis_fns:
+            return
+        arrays = []
+        fs_keys = []
+        qr_keys = []
+        nodes_keys = []
+        for op_name, (basis_fn, space) in self._basis_arrays().items():
+            fs_key, point_key = self._cache_key_names(op_name, space)
+            if space is None:
+                ndims = len(qr_basis_alloc_args("", basis_fn))
+                qr_keys.append(point_key + "(:) => null()")
+            else:
+                ndims = 3
+                nodes_keys.append(point_key + "(:,:) => null()")
+            arrays.append(op_name + "(" + ",".join([":"]*ndims) + ")")
+            fs_keys.append(fs_key + " => null()")
+        parent.add(UseGen(parent, name="function_space_mod", only=True,
+                          funcnames=["function_space_type"]))
+        # Declarations are inserted before any existing ones so add them
+        # in reverse order. The nodes of a function space are a rank-2
+        # array and the quadrature weights are rank-1 arrays.
+        for keys in [nodes_keys, qr_keys]:
+            if keys:
+                parent.add(DeclGen(parent, datatype="real", kind="r_def",
+                                   pointer=True, entity_decls=keys))
+        parent.add(TypeDeclGen(parent, datatype="function_space_type",
+                               pointer=True, entity_decls=fs_keys))
+        parent.add(DeclGen(parent, datatype="real", allocatable=True,
+                           kind="r_def", entity_decls=arrays))
+
+    def _cache_block(self, parent, op_name, basis_fn, space, alloc_args):
+        '''
+        Add the block that (re)allocates a cached basis/diff-basis array
+        if it has not yet been computed for the function space and
+        quadrature object (or target function space) of this invoke
+        and that records what it is about to be computed for. The code
+        to compute the array must then be added to the returned block.
+
+        :param parent: the node in the f2pygen AST to which to add the \
+                       block.
+        :type parent: :py:class:`psyclone.f2pygen.SubroutineGen`
+        :param str op_name: the name of the basis/diff-basis array.
+        :param dict basis_fn: the description of the basis function.
+        :param space: the target function space of an evaluator or None \
+                      for quadrature.
+        :type space: :py:class:`psyclone.dynamo0p3.FunctionSpace` or \
+                     NoneType
+        :param alloc_args: the extents of the array.
+        :type alloc_args: list of str
+
+        :returns: the block in which to compute the array.
+        :rtype: :py:class:`psyclone.f2pygen.IfThenGen`
+        '''
+        from psyclone.f2pygen import AllocateGen, AssignGen, \
+            DeallocateGen, IfThenGen
+        fs_key, point_key = self._cache_key_names(op_name, space)
+        fs_target = basis_fn["arg"].proxy_name_indexed + "%" + \
+            basis_fn["arg"].ref_name(basis_fn["fspace"])
+        if space is None:
+            point_target = "weights_xy_" + basis_fn["qr_var"]
+        else:
+            point_target = "nodes_" + space.mangled_name
+        block = IfThenGen(
+            parent, ".not. associated({0}, {1}) .or. "
+            ".not. associated({2}, {3})".format(fs_key, fs_target,
+                                                point_key, point_target))
+        parent.add(block)
+        dealloc = IfThenGen(block, "allocated({0})".format(op_name))
+        block.add(dealloc)
+        dealloc.add(DeallocateGen(dealloc, [op_name]))
+        block.add(AllocateGen(block,
+                              op_name + "(" + ", ".join(alloc_args) + ")"))
+        block.add(AssignGen(block, lhs=fs_key, rhs=fs_target, pointer=True))
+        block.add(AssignGen(block, lhs=point_key, rhs=point_target,
+                            pointer=True))
+        return block
+
     def initialise_basis_fns(self, parent):
         '''
         Create the declarations and assignments required for the
@@ -2523,7 +2878,12 @@ class DynInvokeBasisFns(object):
 
         if self._basis_fns:
             parent.add(CommentGen(parent, ""))
-            parent.add(CommentGen(parent, " Allocate basis/diff-basis arrays"))
+            if self.cached:
+                parent.add(CommentGen(parent, " Look-up dimensions of cached "
+                                      "basis/diff-basis arrays"))
+            else:
+                parent.add(CommentGen(parent,
+                                      " Allocate basis/diff-basis arrays"))
             parent.add(CommentGen(parent, ""))
 
         # Loop over the list of dicts describing each basis function
@@ -2570,6 +2930,10 @@ class DynInvokeBasisFns(object):
                 # We haven't seen a basis with this name before so
                 # need to declare it and add allocate statement
                 op_name_list.append(op_name)
+                if self.cached:
+                    # Cached arrays are declared in the module and
+                    # allocated when they are computed
+                    continue
 
                 # Dimensionality of the basis arrays depends on the
                 # type of quadrature...
@@ -2601,6 +2965,8 @@ class DynInvokeBasisFns(object):
                     # We haven't seen a basis with this name before so
                     # need to declare it and add allocate statement
                     op_name_list.append(op_name)
+                    if self.cached:
+                        continue
 
                     ndf_nodal_name = get_fs_ndf_name(target_space)
                     alloc_args_str = ", ".join(
@@ -2701,7 +3067,10 @@ class DynInvokeBasisFns(object):
     def compute_basis_fns(self, parent):
         '''
         Generates the necessary Fortran to compute the values of
-        any basis/diff-basis arrays required
+        any basis/diff-basis arrays required. If basis functions are
+        cached then each array is only (re)allocated and computed if it
+        was last computed for a different function space or quadrature
+        object (or target function space).
 
         :param parent: Node in the f2pygen AST which will be the parent
                        of the assignments created in this routine
@@ -2758,9 +3127,19 @@ class DynInvokeBasisFns(object):
                             basis_fn["arg"].ref_name(basis_fn["fspace"]),
                             basis_first_dim_name(basis_fn["fspace"]),
                             get_fs_ndf_name(basis_fn["fspace"]), op_name]
+                target = parent
+                if self.cached:
+                    if is_diff_basis:
+                        first_dim = diff_basis_first_dim_name(
+                            basis_fn["fspace"])
+                    else:
+                        first_dim = basis_first_dim_name(basis_fn["fspace"])
+                    target = self._cache_block(
+                        parent, op_name, basis_fn, None,
+                        qr_basis_alloc_args(first_dim, basis_fn))
                 # insert the basis array call
-                parent.add(
-                    CallGen(parent,
+                target.add(
+                    CallGen(target,
                             name=basis_fn["qr_var"]+"%compute_function",
                             args=args))
             elif basis_fn["shape"].lower() == "gh_evaluator":
@@ -2780,13 +3159,26 @@ class DynInvokeBasisFns(object):
                         continue
                     op_name_list.append(op_name)
 
+                    target = parent
+                    if self.cached:
+                        if is_diff_basis:
+                            first_dim = diff_basis_first_dim_name(
+                                basis_fn["fspace"])
+                        else:
+                            first_dim = basis_first_dim_name(
+                                basis_fn["fspace"])
+                        target = self._cache_block(
+                            parent, op_name, basis_fn, space,
+                            [first_dim, get_fs_ndf_name(basis_fn["fspace"]),
+                             get_fs_ndf_name(space)])
+
                     nodal_loop_var = "df_nodal"
                     loop_var_list.add(nodal_loop_var)
 
                     # Loop over dofs of target function space
                     nodal_dof_loop = DoGen(
-                        parent, nodal_loop_var, "1", get_fs_ndf_name(space))
-                    parent.add(nodal_dof_loop)
+                        target, nodal_loop_var, "1", get_fs_ndf_name(space))
+                    target.add(nodal_dof_loop)
 
                     dof_loop_var = "df_" + basis_fn["fspace"].mangled_name
                     loop_var_list.add(dof_loop_var)
@@ -2824,6 +3216,7 @@ class DynInvokeBasisFns(object):
     def deallocate(self, parent):
         '''
         Add code to deallocate all basis/diff-basis function arrays
+        unless they are cached in the PSy-layer module
 
         :param parent: node in the f2pygen AST to which the deallocate
                        calls will be added
@@ -2831,6 +3224,10 @@ class DynInvokeBasisFns(object):
         '''
         from psyclone.f2pygen import CommentGen, DeallocateGen
 
+        if self.cached:
+            # Cached arrays persist until the cache is invalidated
+            return
+
         if self._basis_fns:
             # deallocate all allocated basis function arrays
             parent.add(CommentGen(parent, ""))
@@ -2863,6 +3260,37 @@ class DynInvokeBasisFns(object):
             parent.add(DeallocateGen(parent, sorted(func_space_var_names)))
 
 
+class DynArgumentRegistry(psyGen.ArgumentRegistry):
+    '''
+    Dynamo 0.3 specific registry of the arguments of an Invoke. In
+    addition to the generic indexes it maps the (mangled) name of each
+    function space to the first argument that is on it.
+
+    :param invoke: the Invoke whose arguments are indexed.
+    :type invoke: :py:class:`psyclone.dynamo0p3.DynInvoke`
+    '''
+    def arg_on_space(self, fspace):
+        '''
+        :param fspace: a function space.
+        :type fspace: :py:class:`psyclone.dynamo0p3.FunctionSpace`
+        :returns: the first argument (field or operator) of the calls in \
+                  the Invoke that is on the supplied function space or \
+                  None if there is no such argument.
+        :rtype: :py:class:`psyclone.dynamo0p3.DynKernelArgument`
+        '''
+        def compute():
+            ''' Maps each function space to the first argument on it. '''
+            by_space = {}
+            for call in self._calls:
+                for arg in call.arguments.args:
+                    for function_space in arg.function_spaces:
+                        if function_space:
+                            by_space.setdefault(function_space.mangled_name,
+                                                arg)
+            return by_space
+        return self._cached("spaces", compute).get(fspace.mangled_name)
+
+
 class DynInvoke(Invoke):
     '''The Dynamo specific invoke class. This passes the Dynamo
     specific schedule class to the base class so it creates the one we
@@ -2876,11 +3304,19 @@ class DynInvoke(Invoke):
         :type alg_invocation: :py:class:`psyclone.parse.InvokeCall`
         :param int idx: the position of the invoke in the list of invokes \
                         contained in the Algorithm
+        :raises GenerationError: if a field or operator is written by \
+                                 kernels with different precisions.
+        :raises GenerationError: if a kernel reads a column-wise operator \
+                                 with a precision other than that of \
+                                 the data it holds.
         :raises GenerationError: if integer reductions are required in the \
                                  psy-layer
         '''
         if False:  # pylint: disable=using-constant-test
             self._schedule = DynSchedule(None)  # for pyreverse
+        # The known state of the halos of fields on entry to this
+        # invoke. This must exist before any halo exchanges are added.
+        self._halo_entry_state = {}
         reserved_names_list = []
         reserved_names_list.extend(STENCIL_MAPPING.values())
         reserved_names_list.extend(VALID_STENCIL_DIRECTIONS)
@@ -2888,6 +3324,47 @@ class DynInvoke(Invoke):
                                     "omp_get_max_threads"])
         Invoke.__init__(self, alg_invocation, idx, DynSchedule,
                         reserved_names=reserved_names_list)
+        self._arg_registry = DynArgumentRegistry(self)
+
+        # A field or operator is passed to the PSy layer as a single
+        # object that holds data of a single kind. This is the kind with
+        # which it is written by the kernels in this invoke or, if no
+        # kernel writes to it, the kind with which it is first read. A
+        # kernel that reads it as data of another kind is passed a copy
+        # of its data converted to that kind (see DynKindConversion).
+        # Built-ins are generated in-line and so accept data of any kind.
+        self._kinds = {}
+        read_kinds = {}
+        for call in self.schedule.kern_calls():
+            for arg in call.arguments.args:
+                if arg.text is None or arg.type in VALID_SCALAR_NAMES:
+                    continue
+                if arg.access not in GH_WRITE_ACCESSES:
+                    read_kinds.setdefault(arg.name, arg.precision)
+                    continue
+                kind = self._kinds.setdefault(arg.name, arg.precision)
+                if kind != arg.precision:
+                    raise GenerationError(
+                        "Argument '{0}' of kernel '{1}' in invoke '{2}' is "
+                        "written with precision '{3}' but it is written "
+                        "with precision '{4}' by another kernel of the same "
+                        "invoke. The precision of a field or operator must "
+                        "be the same in every kernel that writes to "
+                        "it.".format(arg.name, call.name, self.name,
+                                     arg.precision, kind))
+        for name, kind in read_kinds.items():
+            self._kinds.setdefault(name, kind)
+        for call in self.schedule.kern_calls():
+            for arg in call.arguments.args:
+                if arg.type == "gh_columnwise_operator" and \
+                   arg.requires_kind_conversion:
+                    raise GenerationError(
+                        "Argument '{0}' of kernel '{1}' in invoke '{2}' has "
+                        "precision '{3}' but it holds data of precision "
+                        "'{4}' in the invoke. Converting the precision of a "
+                        "column-wise operator is not supported.".format(
+                            arg.name, call.name, self.name, arg.precision,
+                            self.arg_precision(arg.name)))
 
         # The baseclass works out the algorithm code's unique argument
         # list and stores it in the self._alg_unique_args
@@ -2939,8 +3416,9 @@ class DynInvoke(Invoke):
         # which have a gh_sum access.
         if Config.get().distributed_memory:
             # halo exchange calls
-            for loop in self.schedule.loops():
-                loop.create_halo_exchanges()
+            self.schedule.create_halo_exchanges()
+            if Config.get().api_conf("dynamo0.3").group_halo_exchanges:
+                self.schedule.group_halo_exchanges()
             # global sum calls
             for loop in self.schedule.loops():
                 for scalar in loop.args_filter(
@@ -2954,6 +3432,14 @@ class DynInvoke(Invoke):
                                 scalar.call.name, scalar.name))
                     global_sum = DynGlobalSum(scalar, parent=loop.parent)
                     loop.parent.children.insert(loop.position+1, global_sum)
+            if Config.get().api_conf("dynamo0.3").group_global_sums:
+                self.schedule.group_global_sums()
+
+        # finally, convert the data of any arguments that are read by
+        # kernels as data of another kind. This is done after any halo
+        # exchanges have been added so that the halos that are read by
+        # a kernel are included in the converted data
+        self.schedule.add_kind_conversions()
 
     def unique_proxy_declarations(self, datatype, access=None):
         ''' Returns a list of all required proxy declarations for the
@@ -2969,25 +3455,49 @@ class DynInvoke(Invoke):
                 "unique_proxy_declarations called with an invalid access "
                 "type. Expected one of '{0}' but got '{1}'".
                 format(VALID_ACCESS_DESCRIPTOR_NAMES, access))
-        declarations = []
-        for call in self.schedule.calls():
-            for arg in call.arguments.args:
-                if not access or arg.access == access:
-                    if arg.text and arg.type == datatype:
-                        if arg.proxy_declaration_name not in declarations:
-                            declarations.append(arg.proxy_declaration_name)
-        return declarations
+        return self._arg_registry.unique_names(
+            datatype, access=access, attribute="proxy_declaration_name")
+
+    def arg_precision(self, name):
+        '''
+        :param str name: the name of a field or operator argument of \
+                         this invoke.
+        :returns: the Fortran kind of the data held by the field or \
+                  operator with the supplied name in the PSy layer. \
+                  Kernels that read it as data of another kind are \
+                  passed a converted copy of its data.
+        :rtype: str
+        '''
+        return self._kinds.get(name, DEFAULT_KIND)
+
+    def _split_by_kind(self, names, attribute="declaration_name"):
+        '''
+        Splits the supplied declarations of field or operator arguments
+        of this invoke according to the kind of the data they hold.
+
+        :param names: declarations of field or operator arguments.
+        :type names: list of str
+        :param str attribute: the name of the argument property that \
+                              gives these declarations.
+        :returns: the declarations of each kind, in the order in which \
+                  the kinds are first encountered.
+        :rtype: :py:class:`collections.OrderedDict`
+        '''
+        kinds = dict((getattr(arg, attribute), self.arg_precision(arg.name))
+                     for arg in self.psy_unique_vars)
+        by_kind = OrderedDict()
+        for name in names:
+            by_kind.setdefault(kinds[name], []).append(name)
+        return by_kind
 
     def arg_for_funcspace(self, fspace):
         ''' Returns an argument object which is on the requested
         function space. Searches through all Kernel calls in this
         invoke. Currently the first argument object that is found is
         used. Throws an exception if no argument exists. '''
-        for kern_call in self.schedule.calls():
-            try:
-                return kern_call.arguments.get_arg_on_space(fspace)
-            except FieldNotFoundError:
-                pass
+        arg = self._arg_registry.arg_on_space(fspace)
+        if arg is not None:
+            return arg
         raise GenerationError(
             "No argument found on '{0}' space".format(fspace.mangled_name))
 
@@ -3033,6 +3543,97 @@ class DynInvoke(Invoke):
                 return field
         return None
 
+    @property
+    def halo_entry_state(self):
+        '''
+        :return: the known state of the halos of fields on entry to this \
+        invoke, indexed by the algorithm-layer name of the field and \
+        its vector index. The state of any other field's halo is unknown.
+        :rtype: dict of (str, int or NoneType): \
+        :py:class:`psyclone.dynamo0p3.HaloState`
+
+        '''
+        return self._halo_entry_state
+
+    def set_halo_entry_state(self, state):
+        '''Sets the known state of the halos of fields on entry to this
+        invoke and removes any halo exchanges (and asynchronous halo
+        exchange starts and ends) that are then known not to be
+        required. Halo exchanges that are then known to be required no
+        longer check whether the halo is dirty at run time.
+
+        :param state: the known state of the halos of fields on entry \
+        to this invoke, as returned by \
+        :py:meth:`psyclone.dynamo0p3.DynInvoke.halo_exit_state` for \
+        the invoke that is called immediately before this one.
+        :type state: dict of (str, int or NoneType): \
+        :py:class:`psyclone.dynamo0p3.HaloState`
+
+        '''
+        self._halo_entry_state = dict(state)
+        schedule = self.schedule
+        for exchange in schedule.walk(schedule.children, DynHaloExchange):
+            if isinstance(exchange, DynHaloExchangeStart) or \
+               exchange.field.backward_write_dependencies():
+                # Only halo exchanges that depend on the state on entry
+                continue
+            required, _ = exchange.required()
+            if required:
+                continue
+            if isinstance(exchange, DynHaloExchangeEnd):
+                for start in schedule.walk(schedule.children,
+                                           DynHaloExchangeStart):
+                    if start._get_hex_end() is exchange:
+                        start.parent.children.remove(start)
+            group = exchange.parent
+            group.children.remove(exchange)
+            if isinstance(group, DynHaloExchangeGroup) and \
+               not group.children:
+                group.parent.children.remove(group)
+
+    def halo_exit_state(self):
+        '''Determines the known state of the halos of fields on exit from
+        this invoke from the state on entry, the halo exchanges and the
+        depths to which fields are written.
+
+        :return: the known state of the halos of fields on exit from \
+        this invoke, indexed by the algorithm-layer name of the field \
+        and its vector index.
+        :rtype: dict of (str, int or NoneType): \
+        :py:class:`psyclone.dynamo0p3.HaloState`
+
+        '''
+        state = dict(self._halo_entry_state)
+        schedule = self.schedule
+        for node in schedule.walk(schedule.children, psyGen.Node):
+            if isinstance(node, DynHaloExchange):
+                if isinstance(node, DynHaloExchangeStart):
+                    # The halo is only clean once the exchange has ended
+                    continue
+                key = _halo_state_key(node.field, node.vector_index)
+                previous = state.get(key) or HaloState(False, 0, False)
+                cleaned = previous.cleaned(
+                    node._compute_halo_read_depth_info())
+                if cleaned.max_depth or cleaned.literal_depth:
+                    # Otherwise all that is known is that a halo
+                    # exchange of an unknown depth has been performed
+                    state[key] = cleaned
+            elif isinstance(node, psyGen.Call):
+                for arg in node.arguments.args:
+                    if arg.type == "gh_field" and \
+                       arg.access in GH_WRITE_ACCESSES:
+                        write = HaloWriteAccess(arg)
+                        written = HaloState(write.max_depth,
+                                            write.literal_depth,
+                                            write.dirty_outer)
+                        if arg.vector_size > 1:
+                            indices = range(1, arg.vector_size+1)
+                        else:
+                            indices = [None]
+                        for idx in indices:
+                            state[_halo_state_key(arg, idx)] = written
+        return state
+
     def gen_code(self, parent):
         '''
         Generates Dynamo specific invocation code (the subroutine
@@ -3097,9 +3698,12 @@ class DynInvoke(Invoke):
                     fort_intent = "inout"
                 else:
                     fort_intent = intent
-                invoke_sub.add(TypeDeclGen(invoke_sub, datatype="field_type",
-                                           entity_decls=fld_args[intent],
-                                           intent=fort_intent))
+                for kind, names in self._split_by_kind(
+                        fld_args[intent]).items():
+                    _, datatype = infrastructure_type("gh_field", kind)
+                    invoke_sub.add(TypeDeclGen(invoke_sub, datatype=datatype,
+                                               entity_decls=names,
+                                               intent=fort_intent))
 
         # Add the subroutine argument declarations for operators that
         # are read or written (operators are always on discontinuous spaces
@@ -3114,10 +3718,13 @@ class DynInvoke(Invoke):
                     fort_intent = "inout"
                 else:
                     fort_intent = intent
-                invoke_sub.add(
-                    TypeDeclGen(invoke_sub, datatype="operator_type",
-                                entity_decls=op_declarations_dict[intent],
-                                intent=fort_intent))
+                for kind, names in self._split_by_kind(
+                        op_declarations_dict[intent]).items():
+                    _, datatype = infrastructure_type("gh_operator", kind)
+                    invoke_sub.add(
+                        TypeDeclGen(invoke_sub, datatype=datatype,
+                                    entity_decls=names,
+                                    intent=fort_intent))
 
         # Add subroutine argument declarations for CMA operators that are
         # read or written (as with normal/LMA operators, they are never 'inc'
@@ -3133,11 +3740,14 @@ class DynInvoke(Invoke):
                     fort_intent = "inout"
                 else:
                     fort_intent = intent
-                invoke_sub.add(
-                    TypeDeclGen(invoke_sub,
-                                datatype="columnwise_operator_type",
-                                entity_decls=cma_op_declarations_dict[intent],
-                                intent=fort_intent))
+                for kind, names in self._split_by_kind(
+                        cma_op_declarations_dict[intent]).items():
+                    _, datatype = infrastructure_type(
+                        "gh_columnwise_operator", kind)
+                    invoke_sub.add(
+                        TypeDeclGen(invoke_sub, datatype=datatype,
+                                    entity_decls=names,
+                                    intent=fort_intent))
 
         # Add the subroutine argument declarations for qr (quadrature
         # rules)
@@ -3166,25 +3776,13 @@ class DynInvoke(Invoke):
                 invoke_sub.add(AssignGen(invoke_sub, lhs=arg.proxy_name,
                                          rhs=arg.name+"%get_proxy()"))
 
-        field_proxy_decs = self.unique_proxy_declarations("gh_field")
-        if len(field_proxy_decs) > 0:
-            invoke_sub.add(
-                TypeDeclGen(invoke_sub,
-                            datatype="field_proxy_type",
-                            entity_decls=field_proxy_decs))
-        op_proxy_decs = self.unique_proxy_declarations("gh_operator")
-        if len(op_proxy_decs) > 0:
-            invoke_sub.add(
-                TypeDeclGen(invoke_sub,
-                            datatype="operator_proxy_type",
-                            entity_decls=op_proxy_decs))
-        cma_op_proxy_decs = self.unique_proxy_declarations(
-            "gh_columnwise_operator")
-        if cma_op_proxy_decs:
-            invoke_sub.add(
-                TypeDeclGen(invoke_sub,
-                            datatype="columnwise_operator_proxy_type",
-                            entity_decls=cma_op_proxy_decs))
+        for arg_type in ["gh_field"] + VALID_OPERATOR_NAMES:
+            proxy_decs = self.unique_proxy_declarations(arg_type)
+            for kind, names in self._split_by_kind(
+                    proxy_decs, attribute="proxy_declaration_name").items():
+                _, datatype = infrastructure_type(arg_type, kind, proxy=True)
+                invoke_sub.add(TypeDeclGen(invoke_sub, datatype=datatype,
+                                           entity_decls=names))
 
         # Initialise the number of layers (if we are calling one or more
         # kernels that iterate over cells)
@@ -3318,6 +3916,7 @@ class DynInvoke(Invoke):
                                    entity_decls=var_list))
 
         # Initialise basis and/or differential-basis functions
+        self.evaluators.declare_basis_cache(parent)
         self.evaluators.initialise_basis_fns(invoke_sub)
 
         # add calls to compute the values of any basis arrays
@@ -3334,6 +3933,11 @@ class DynInvoke(Invoke):
         # add content from the schedule
         self.schedule.gen_code(invoke_sub)
 
+        # Remove any data copied to an OpenACC device from it
+        for directive in self.schedule.walk(self.schedule.children,
+                                            DynACCEnterDataDirective):
+            directive.gen_exit_data(invoke_sub)
+
         # Deallocate any basis arrays
         self.evaluators.deallocate(invoke_sub)
 
@@ -3343,6 +3947,25 @@ class DynInvoke(Invoke):
         parent.add(invoke_sub)
 
 
+def propagate_halo_state(invokes):
+    '''Propagates the known state of the halos of fields from each of
+    the supplied invokes to the next one so that halo exchanges that
+    are then known not to be required are removed and halo exchanges
+    that are known to be required no longer check whether the halo is
+    dirty at run time. The invokes must be called one immediately after
+    the other in the algorithm layer (see
+    :py:meth:`psyclone.algGen.Alg.invoke_sequences`) as otherwise a
+    field may be modified between them. This should be done after any
+    transformations have been applied.
+
+    :param invokes: the invokes in the order in which they are called.
+    :type invokes: :func:`list` of :py:class:`psyclone.dynamo0p3.DynInvoke`
+
+    '''
+    for previous, invoke in zip(invokes, invokes[1:]):
+        invoke.set_halo_entry_state(previous.halo_exit_state())
+
+
 class DynSchedule(Schedule):
     ''' The Dynamo specific schedule class. This passes the Dynamo-
     specific factories for creating kernel and infrastructure calls
@@ -3365,6 +3988,165 @@ class DynSchedule(Schedule):
         for entity in self._children:
             entity.view(indent=indent + 1)
 
+    def create_halo_exchanges(self):
+        '''
+        Adds the halo exchanges required by the loops in this schedule in
+        a single forward pass over the loops. This is equivalent to
+        calling :py:meth:`psyclone.dynamo0p3.DynLoop.create_halo_exchanges`
+        for each loop in turn but, rather than adding each candidate
+        halo exchange and then searching backwards and forwards through
+        the whole schedule to decide whether it is required, the last
+        writer of each field is tracked as the loops are visited. The
+        halo depth left clean by that writer and the halo depths read
+        up to the next writer then determine whether a halo exchange is
+        required, using the same rules as
+        :py:meth:`psyclone.dynamo0p3.DynHaloExchange.required`.
+
+        This is intended for a newly-created schedule that contains only
+        loops. Halo exchanges are updated after a transformation by
+        :py:meth:`psyclone.dynamo0p3.DynLoop.update_halo_exchanges`.
+
+        '''
+        loops = self.loops()
+        # The arguments of the calls in each loop
+        loop_args = [[arg for call in loop.calls()
+                      for arg in call.arguments.args] for loop in loops]
+        # The argument that last wrote to each field (keyed by name) or
+        # None if the field has since been halo exchanged
+        last_writer = {}
+        for idx, loop in enumerate(loops):
+            for halo_field in loop.unique_fields_with_halo_reads():
+                if halo_field.name in last_writer and \
+                   last_writer[halo_field.name] is None:
+                    # The field's halo has already been exchanged
+                    continue
+                # Find the reads of this field from this loop up to (and
+                # including) the next loop that writes to it
+                readers = []
+                for args in loop_args[idx:]:
+                    found_writer = False
+                    for arg in args:
+                        if arg.name == halo_field.name:
+                            if arg.access in GH_READ_ACCESSES:
+                                readers.append(arg)
+                            if arg.access in GH_WRITE_ACCESSES:
+                                found_writer = True
+                                break
+                    if found_writer:
+                        break
+                writer = last_writer.get(halo_field.name)
+                required, _ = _halo_exchange_required(
+                    _create_depth_list([HaloReadAccess(reader)
+                                        for reader in readers]),
+                    HaloWriteAccess(writer) if writer else None)
+                if required:
+                    if halo_field.vector_size > 1:
+                        # the range function below returns values from
+                        # 1 to the vector size which is what we
+                        # require in our Fortran code
+                        indices = range(1, halo_field.vector_size+1)
+                    else:
+                        indices = [None]
+                    for index in indices:
+                        loop.parent.children.insert(
+                            loop.position,
+                            DynHaloExchange(halo_field, parent=loop.parent,
+                                            vector_index=index))
+                    last_writer[halo_field.name] = None
+            # Record the fields written to by this loop. If an argument
+            # is written more than once by a call then the first write
+            # is the one that a later reader depends on.
+            written = set()
+            for arg in loop_args[idx]:
+                if arg.access in GH_WRITE_ACCESSES and \
+                   arg.name not in written:
+                    last_writer[arg.name] = arg
+                    written.add(arg.name)
+
+    def group_halo_exchanges(self):
+        '''
+        Groups together the (synchronous) halo exchanges in this
+        schedule that are only separated from each other by other halo
+        exchanges and that exchange the same depth of halo of fields of
+        the same kind, using
+        :py:class:`psyclone.transformations.Dynamo0p3HaloExchangeGroupTrans`.
+        This is applied after the halo exchanges have been created if
+        GROUP_HALO_EXCHANGES is set in the configuration file.
+
+        '''
+        from psyclone.transformations import Dynamo0p3HaloExchangeGroupTrans
+        group_trans = Dynamo0p3HaloExchangeGroupTrans()
+        exchanges = []
+        for node in self.children[:] + [None]:
+            if isinstance(node, DynHaloExchange) and not \
+               isinstance(node, (DynHaloExchangeStart, DynHaloExchangeEnd)):
+                exchanges.append(node)
+                continue
+            # We have reached the end of a sequence of adjacent halo
+            # exchanges so group those that have the same depth and kind
+            batches = OrderedDict()
+            for exchange in exchanges:
+                key = (exchange._compute_halo_depth(),
+                       exchange.field.psy_precision)
+                batches.setdefault(key, []).append(exchange)
+            for batch in batches.values():
+                if len(batch) > 1:
+                    group_trans.apply(batch)
+            exchanges = []
+
+    def add_kind_conversions(self):
+        '''
+        Adds a :py:class:`psyclone.dynamo0p3.DynKindConversion`
+        immediately before the loop containing each kernel in this
+        schedule for each field or operator that the kernel reads as
+        data of a different kind from the data that it holds in the
+        PSy layer. This is applied after the halo exchanges (if any)
+        have been created.
+
+        '''
+        for call in self.kern_calls():
+            loop = call.parent
+            converted = []
+            for arg in call.arguments.args:
+                if arg.text is None or not arg.requires_kind_conversion:
+                    continue
+                # A kernel that is passed the same argument more than
+                # once only needs one copy of it of each kind
+                if (arg.name, arg.precision) in converted:
+                    continue
+                converted.append((arg.name, arg.precision))
+                loop.parent.children.insert(
+                    loop.position, DynKindConversion(arg, parent=loop.parent))
+
+    def group_global_sums(self):
+        '''
+        Groups together the global sums in this schedule using
+        :py:class:`psyclone.transformations.Dynamo0p3GlobalSumGroupTrans`.
+        Global sums are considered in order and each is added to the
+        current group if all of the global sums already in that group
+        can be delayed until it without breaking any dependencies.
+        Otherwise the current group is completed and a new one is
+        started. This is applied after the global sums have been created
+        if GROUP_GLOBAL_SUMS is set in the configuration file.
+
+        '''
+        from psyclone.transformations import Dynamo0p3GlobalSumGroupTrans
+        group_trans = Dynamo0p3GlobalSumGroupTrans()
+        batch = []
+        for node in self.children[:]:
+            if not isinstance(node, DynGlobalSum) or \
+               isinstance(node, (DynGlobalSumStart, DynGlobalSumEnd)):
+                continue
+            if all(global_sum.is_valid_location(node, position="after")
+                   for global_sum in batch):
+                batch.append(node)
+                continue
+            if len(batch) > 1:
+                group_trans.apply(batch)
+            batch = [node]
+        if len(batch) > 1:
+            group_trans.apply(batch)
+
 
 class DynGlobalSum(GlobalSum):
     '''
@@ -3403,126 +4185,539 @@ class DynGlobalSum(GlobalSum):
         parent.add(AssignGen(parent, lhs=name, rhs=sum_name+"%get_sum()"))
 
 
-def _create_depth_list(halo_info_list):
-    '''Halo exchanges may have more than one dependency. This method
-    simplifies multiple dependencies to remove duplicates and any
-    obvious redundancy. For example, if one dependency is for depth=1
-    and another for depth=2 then we do not need the former as it is
-    covered by the latter. Similarly, if we have a depth=extent+1 and
-    another for depth=extent+2 then we do not need the former as it is
-    covered by the latter. It also takes into account
-    needs_clean_outer, which indicates whether the outermost halo
-    needs to be clean (and therefore whether there is a dependence).
+class DynGlobalSumStart(DynGlobalSum):
+    '''The start of an asynchronous (non-blocking) global sum. The local
+    value of the scalar is passed to the infrastructure, which starts
+    the global reduction and returns without waiting for it to
+    complete. The scalar is therefore specified as having a read
+    access. A global sum start always has a corresponding global sum
+    end (which writes the result back to the scalar) and any
+    computation placed between the two is overlapped with the
+    reduction.
 
-    :param: a list containing halo access information derived from
-    all read fields dependent on this halo exchange
-    :type: :func:`list` of :py:class:`psyclone.dynamo0p3.HaloReadAccess`
-    :return: a list containing halo depth information derived from
-    the halo access information
-    :rtype: :func:`list` of :py:class:`psyclone.dynamo0p3.HaloDepth`
+    :param scalar: the kernel argument for which to perform a global sum
+    :type scalar: :py:class:`psyclone.dynamo0p3.DynKernelArgument`
+    :param parent: the parent node of this node in the Schedule
+    :type parent: :py:class:`psyclone.psyGen.Node`
 
     '''
-    depth_info_list = []
-    # first look to see if all field dependencies are
-    # annexed_only. If so we only care about annexed dofs
-    annexed_only = True
-    for halo_info in halo_info_list:
-        if not (halo_info.annexed_only or
-                (halo_info.literal_depth == 1
-                 and not halo_info.needs_clean_outer)):
-            # There are two cases when we only care about accesses to
-            # annexed dofs. 1) when annexed_only is set and 2) when
-            # the halo depth is 1 but we only depend on annexed dofs
-            # being up-to-date (needs_clean_outer is False)
-            annexed_only = False
-            break
-    if annexed_only:
-        depth_info = HaloDepth()
-        depth_info.set_by_value(max_depth=False, var_depth="",
-                                literal_depth=1, annexed_only=True,
-                                max_depth_m1=False)
-        return [depth_info]
-    # next look to see if one of the field dependencies specifies
-    # a max_depth access. If so the whole halo region is accessed
-    # so we do not need to be concerned with other accesses.
-    max_depth_m1 = False
-    for halo_info in halo_info_list:
-        if halo_info.max_depth:
-            if halo_info.needs_clean_outer:
-                # found a max_depth access so we only need one
-                # HaloDepth entry
-                depth_info = HaloDepth()
-                depth_info.set_by_value(max_depth=True, var_depth="",
-                                        literal_depth=0, annexed_only=False,
-                                        max_depth_m1=False)
-                return [depth_info]
-            # remember that we found a max_depth-1 access
-            max_depth_m1 = True
+    def __init__(self, scalar, parent=None):
+        DynGlobalSum.__init__(self, scalar, parent=parent)
+        # Update the scalar's access appropriately. Here "gh_read"
+        # specifies that the start of a global sum only reads the
+        # (local) value of the scalar.
+        self._scalar.access = "gh_read"
 
-    if max_depth_m1:
-        # we have at least one max_depth-1 access.
-        depth_info = HaloDepth()
-        depth_info.set_by_value(max_depth=False, var_depth="",
-                                literal_depth=0, annexed_only=False,
-                                max_depth_m1=True)
-        depth_info_list.append(depth_info)
+    @property
+    def dag_name(self):
+        ''' Return the name to use in a dag for this node'''
+        return "globalsumstart({0})_{1}".format(self._scalar.name,
+                                                self.position)
 
-    for halo_info in halo_info_list:
-        # go through the halo information associated with each
-        # read dependency, skipping any max_depth-1 accesses
-        if halo_info.max_depth and not halo_info.needs_clean_outer:
-            continue
-        var_depth = halo_info.var_depth
-        literal_depth = halo_info.literal_depth
-        if literal_depth and not halo_info.needs_clean_outer:
-            # decrease depth by 1 if we don't care about the outermost
-            # access
-            literal_depth -= 1
-        match = False
-        # check whether we match with existing depth information
-        for depth_info in depth_info_list:
-            if depth_info.var_depth == var_depth and not match:
-                # this dependence uses the same variable to
-                # specify its depth as an existing one, or both do
-                # not have a variable so we only have a
-                # literal. Therefore we only need to update the
-                # literal value with the maximum of the two
-                # (e.g. var_name,1 and var_name,2 => var_name,2)
-                depth_info.literal_depth = max(
-                    depth_info.literal_depth, literal_depth)
-                match = True
-                break
-        if not match:
-            # no matches were found with existing entries so
-            # create a new one
-            depth_info = HaloDepth()
-            depth_info.set_by_value(max_depth=False, var_depth=var_depth,
-                                    literal_depth=literal_depth,
-                                    annexed_only=False, max_depth_m1=False)
-            depth_info_list.append(depth_info)
-    return depth_info_list
+    @property
+    def coloured_text(self):
+        '''
+        Return a string containing the (coloured) name of this node type
 
+        :return: name of this node type, possibly with colour control codes
+        :rtype: str
 
-class DynHaloExchange(HaloExchange):
+        '''
+        return psyGen.colored("GlobalSumStart",
+                              psyGen.SCHEDULE_COLOUR_MAP["GlobalSum"])
 
-    '''Dynamo specific halo exchange class which can be added to and
-    manipulated in, a schedule
+    def overlapped_calls(self):
+        '''Finds the computation that is performed between this global
+        sum start and its corresponding global sum end and that the
+        global reduction can therefore be overlapped with.
 
-    :param field: the field that this halo exchange will act on
-    :type field: :py:class:`psyclone.dynamo0p3.DynKernelArgument`
-    :param check_dirty: optional argument default True indicating \
-    whether this halo exchange should be subject to a run-time check \
-    for clean/dirty halos.
-    :type check_dirty: bool
-    :param vector_index: optional vector index (default None) to \
-    identify which index of a vector field this halo exchange is \
-    responsible for
-    :type vector_index: int
-    :param parent: optional PSyIRe parent node (default None) of this \
-    object
-    :type parent: :py:class:`psyclone.psyGen.node`
+        :return: the kernel and built-in calls between this global sum \
+        start and the corresponding global sum end
+        :rtype: :func:`list` of :py:class:`psyclone.psyGen.Call`
 
-    '''
+        '''
+        gsum_end = self._get_gsum_end()
+        nodes = self.parent.children[self.position+1:gsum_end.position]
+        return self.walk(nodes, psyGen.Call)
+
+    def _get_gsum_end(self):
+        '''An internal helper routine for this class which finds the global
+        sum end object corresponding to this global sum start object or
+        raises an exception if one is not found.
+
+        :return: the corresponding global sum end object
+        :rtype: :py:class:`psyclone.dynamo0p3.DynGlobalSumEnd`
+        :raises GenerationError: if no matching global sum end is found \
+        or if the first matching global sum that is found is not a \
+        global sum end
+
+        '''
+        for node in self.following():
+            if self.sameParent(node) and isinstance(node, DynGlobalSum) \
+               and node.scalar.name == self._scalar.name:
+                if isinstance(node, DynGlobalSumEnd):
+                    return node
+                raise GenerationError(
+                    "Global sum start for scalar '{0}' should match with a "
+                    "global sum end, but found {1}".format(
+                        self._scalar.name, type(node)))
+        raise GenerationError(
+            "Global sum start for scalar '{0}' has no matching global sum "
+            "end".format(self._scalar.name))
+
+    def gen_code(self, parent):
+        '''Dynamo specific code generation for this class. Each scalar
+        has its own `scalar_type` object as several global sums may be
+        in progress at the same time.
+
+        :param parent: an f2pygen object that will be the parent of \
+        f2pygen objects created in this method
+        :type parent: :py:class:`psyclone.f2pygen.BaseGen`
+
+        '''
+        from psyclone.f2pygen import AssignGen, CallGen, TypeDeclGen, UseGen
+        name = self._scalar.name
+        sum_name = _async_global_sum_name(name)
+        parent.add(UseGen(parent, name="scalar_mod", only=True,
+                          funcnames=["scalar_type"]))
+        parent.add(TypeDeclGen(parent, datatype="scalar_type",
+                               entity_decls=[sum_name]))
+        parent.add(AssignGen(parent, lhs=sum_name+"%value", rhs=name))
+        parent.add(CallGen(parent, name=sum_name+"%start_sum()"))
+
+
+class DynGlobalSumEnd(DynGlobalSum):
+    '''The end of an asynchronous (non-blocking) global sum. This waits
+    for the global reduction begun by the corresponding global sum start
+    to complete and writes the result to the scalar. The scalar is
+    therefore specified as having a readwrite access (as for a
+    synchronous global sum).
+
+    :param scalar: the kernel argument for which to perform a global sum
+    :type scalar: :py:class:`psyclone.dynamo0p3.DynKernelArgument`
+    :param parent: the parent node of this node in the Schedule
+    :type parent: :py:class:`psyclone.psyGen.Node`
+
+    '''
+    @property
+    def dag_name(self):
+        ''' Return the name to use in a dag for this node'''
+        return "globalsumend({0})_{1}".format(self._scalar.name,
+                                              self.position)
+
+    @property
+    def coloured_text(self):
+        '''
+        Return a string containing the (coloured) name of this node type
+
+        :return: name of this node type, possibly with colour control codes
+        :rtype: str
+
+        '''
+        return psyGen.colored("GlobalSumEnd",
+                              psyGen.SCHEDULE_COLOUR_MAP["GlobalSum"])
+
+    def gen_code(self, parent):
+        '''Dynamo specific code generation for this class.
+
+        :param parent: an f2pygen object that will be the parent of \
+        f2pygen objects created in this method
+        :type parent: :py:class:`psyclone.f2pygen.BaseGen`
+
+        '''
+        from psyclone.f2pygen import AssignGen, TypeDeclGen, UseGen
+        name = self._scalar.name
+        sum_name = _async_global_sum_name(name)
+        parent.add(UseGen(parent, name="scalar_mod", only=True,
+                          funcnames=["scalar_type"]))
+        parent.add(TypeDeclGen(parent, datatype="scalar_type",
+                               entity_decls=[sum_name]))
+        parent.add(AssignGen(parent, lhs=name,
+                             rhs=sum_name+"%finish_sum()"))
+
+
+def _async_global_sum_name(scalar_name):
+    '''
+    :param str scalar_name: the name of a scalar that is globally summed.
+    :return: the name of the `scalar_type` object used for the \
+    asynchronous global sum of the scalar.
+    :rtype: str
+
+    '''
+    name_space_manager = NameSpaceFactory().create()
+    return name_space_manager.create_name(
+        root_name="global_sum_"+scalar_name, context="PSyVars",
+        label="async_global_sum_"+scalar_name)
+
+
+class DynGlobalSumGroup(psyGen.Node):
+    '''A group of global sums that are performed with a single call to
+    the infrastructure's `global_sum_group` routine rather than with one
+    global reduction per scalar. Each global reduction is a
+    latency-bound collective operation so batching them reduces the
+    number of these operations. The global sums in the group are the
+    children of this node so the dependence analysis is unchanged.
+
+    :param children: the global sums in this group
+    :type children: :func:`list` of \
+    :py:class:`psyclone.dynamo0p3.DynGlobalSum`
+    :param parent: optional PSyIRe parent node (default None) of this \
+    object
+    :type parent: :py:class:`psyclone.psyGen.node`
+
+    '''
+    def __init__(self, children=None, parent=None):
+        psyGen.Node.__init__(self, children=children, parent=parent)
+        self._text_name = "GlobalSumGroup"
+        self._colour_map_name = "GlobalSum"
+
+    @property
+    def args(self):
+        '''
+        :return: the scalars summed by the global sums in this group. \
+        These determine the dependencies of the group.
+        :rtype: :func:`list` of \
+        :py:class:`psyclone.dynamo0p3.DynKernelArgument`
+
+        '''
+        args = []
+        for global_sum in self.children:
+            args.extend(global_sum.args)
+        return args
+
+    @property
+    def dag_name(self):
+        ''' Return the name to use in a dag for this node '''
+        return "globalsumgroup_{0}".format(self.position)
+
+    @property
+    def coloured_text(self):
+        '''
+        Return a string containing the (coloured) name of this node type
+
+        :return: name of this node type, possibly with colour control codes
+        :rtype: str
+
+        '''
+        return psyGen.colored(
+            self._text_name, psyGen.SCHEDULE_COLOUR_MAP[self._colour_map_name])
+
+    def view(self, indent=0):
+        ''' Class specific view '''
+        print(self.indent(indent) + self.coloured_text +
+              "[nsums={0}]".format(len(self.children)))
+        for entity in self._children:
+            entity.view(indent=indent + 1)
+
+    def gen_code(self, parent):
+        '''Dynamo specific code generation for this class. The scalars
+        are copied into an array which is summed over all processes with
+        a single call before the results are copied back.
+
+        :param parent: an f2pygen object that will be the parent of \
+        f2pygen objects created in this method
+        :type parent: :py:class:`psyclone.f2pygen.BaseGen`
+
+        '''
+        from psyclone.f2pygen import AssignGen, CallGen, DeclGen, UseGen
+        nsums = len(self.children)
+        name_space_manager = NameSpaceFactory().create()
+        values = name_space_manager.create_name(
+            root_name="global_sum_values", context="PSyVars",
+            label="global_sum_values_{0}".format(nsums))
+        parent.add(UseGen(parent, name="scalar_mod", only=True,
+                          funcnames=["global_sum_group"]))
+        parent.add(DeclGen(parent, datatype="real", kind="r_def",
+                           dimension=str(nsums), entity_decls=[values]))
+        names = [global_sum.scalar.name for global_sum in self.children]
+        for idx, name in enumerate(names):
+            parent.add(AssignGen(parent,
+                                 lhs="{0}({1})".format(values, idx+1),
+                                 rhs=name))
+        parent.add(CallGen(parent, name="global_sum_group", args=[values]))
+        for idx, name in enumerate(names):
+            parent.add(AssignGen(parent, lhs=name,
+                                 rhs="{0}({1})".format(values, idx+1)))
+
+
+def _halo_state_key(field, vector_index):
+    '''
+    :param field: a field argument.
+    :type field: :py:class:`psyclone.dynamo0p3.DynKernelArgument`
+    :param vector_index: the vector index of the field or None if it \
+    is not a vector.
+    :type vector_index: int or NoneType
+    :return: the key identifying the (component of the) field in the \
+    algorithm layer when propagating halo state between invokes.
+    :rtype: (str, int or NoneType)
+
+    '''
+    return (field.text.replace(" ", "").lower(), vector_index)
+
+
+def _create_depth_list(halo_info_list):
+    '''Halo exchanges may have more than one dependency. This method
+    simplifies multiple dependencies to remove duplicates and any
+    obvious redundancy. For example, if one dependency is for depth=1
+    and another for depth=2 then we do not need the former as it is
+    covered by the latter. Similarly, if we have a depth=extent+1 and
+    another for depth=extent+2 then we do not need the former as it is
+    covered by the latter. It also takes into account
+    needs_clean_outer, which indicates whether the outermost halo
+    needs to be clean (and therefore whether there is a dependence).
+
+    :param: a list containing halo access information derived from
+    all read fields dependent on this halo exchange
+    :type: :func:`list` of :py:class:`psyclone.dynamo0p3.HaloReadAccess`
+    :return: a list containing halo depth information derived from
+    the halo access information
+    :rtype: :func:`list` of :py:class:`psyclone.dynamo0p3.HaloDepth`
+
+    '''
+    depth_info_list = []
+    # first look to see if all field dependencies are
+    # annexed_only. If so we only care about annexed dofs
+    annexed_only = True
+    for halo_info in halo_info_list:
+        if not (halo_info.annexed_only or
+                (halo_info.literal_depth == 1
+                 and not halo_info.needs_clean_outer)):
+            # There are two cases when we only care about accesses to
+            # annexed dofs. 1) when annexed_only is set and 2) when
+            # the halo depth is 1 but we only depend on annexed dofs
+            # being up-to-date (needs_clean_outer is False)
+            annexed_only = False
+            break
+    if annexed_only:
+        depth_info = HaloDepth()
+        depth_info.set_by_value(max_depth=False, var_depth="",
+                                literal_depth=1, annexed_only=True,
+                                max_depth_m1=False)
+        return [depth_info]
+    # next look to see if one of the field dependencies specifies
+    # a max_depth access. If so the whole halo region is accessed
+    # so we do not need to be concerned with other accesses.
+    max_depth_m1 = False
+    for halo_info in halo_info_list:
+        if halo_info.max_depth:
+            if halo_info.needs_clean_outer:
+                # found a max_depth access so we only need one
+                # HaloDepth entry
+                depth_info = HaloDepth()
+                depth_info.set_by_value(max_depth=True, var_depth="",
+                                        literal_depth=0, annexed_only=False,
+                                        max_depth_m1=False)
+                return [depth_info]
+            # remember that we found a max_depth-1 access
+            max_depth_m1 = True
+
+    if max_depth_m1:
+        # we have at least one max_depth-1 access.
+        depth_info = HaloDepth()
+        depth_info.set_by_value(max_depth=False, var_depth="",
+                                literal_depth=0, annexed_only=False,
+                                max_depth_m1=True)
+        depth_info_list.append(depth_info)
+
+    for halo_info in halo_info_list:
+        # go through the halo information associated with each
+        # read dependency, skipping any max_depth-1 accesses
+        if halo_info.max_depth and not halo_info.needs_clean_outer:
+            continue
+        var_depth = halo_info.var_depth
+        literal_depth = halo_info.literal_depth
+        if literal_depth and not halo_info.needs_clean_outer:
+            # decrease depth by 1 if we don't care about the outermost
+            # access
+            literal_depth -= 1
+        match = False
+        # check whether we match with existing depth information
+        for depth_info in depth_info_list:
+            if depth_info.var_depth == var_depth and not match:
+                # this dependence uses the same variable to
+                # specify its depth as an existing one, or both do
+                # not have a variable so we only have a
+                # literal. Therefore we only need to update the
+                # literal value with the maximum of the two
+                # (e.g. var_name,1 and var_name,2 => var_name,2)
+                depth_info.literal_depth = max(
+                    depth_info.literal_depth, literal_depth)
+                match = True
+                break
+        if not match:
+            # no matches were found with existing entries so
+            # create a new one
+            depth_info = HaloDepth()
+            depth_info.set_by_value(max_depth=False, var_depth=var_depth,
+                                    literal_depth=literal_depth,
+                                    annexed_only=False, max_depth_m1=False)
+            depth_info_list.append(depth_info)
+    return depth_info_list
+
+
+def _halo_exchange_required(required_clean_info, clean_info):
+    '''Determines whether a halo exchange is definitely required (True,
+    True), might be required (True, False) or is definitely not required
+    (False, any) given the halo depths that are read after it and the
+    state of the halo left by the previous writer. See
+    :py:meth:`psyclone.dynamo0p3.DynHaloExchange.required` for details.
+
+    :param required_clean_info: the (aggregated) halo depths that must \
+    be clean for the readers that depend on the halo exchange
+    :type required_clean_info: :func:`list` of \
+    :py:class:`psyclone.dynamo0p3.HaloDepth`
+    :param clean_info: how much of the halo has been cleaned by the \
+    previous writer or None if there is no previous writer
+    :type clean_info: :py:class:`psyclone.dynamo0p3.HaloWriteAccess` \
+    or NoneType
+    :return: whether the halo exchange is (or might be) required and \
+    whether this is known for certain
+    :rtype: (bool, bool)
+
+    '''
+    if Config.get().api_conf("dynamo0.3").compute_annexed_dofs and \
+       len(required_clean_info) == 1 and \
+       required_clean_info[0].annexed_only:
+        # We definitely don't need the halo exchange as we
+        # only read annexed dofs and these are always clean as
+        # they are computed by default when iterating over
+        # dofs and kept up-to-date by redundant computation
+        # when iterating over cells.
+        required = False
+        known = True  # redundant information as it is always known
+        return required, known
+
+    if not clean_info:
+        # this halo exchange has no previous write dependencies so
+        # we do not know the initial state of the halo. This means
+        # that we do not know if we need a halo exchange or not
+        required = True
+        known = False
+        return required, known
+
+    if clean_info.max_depth:
+        if not clean_info.dirty_outer:
+            # all of the halo is cleaned by redundant computation
+            # so halo exchange is not required
+            required = False
+            known = True  # redundant information as it is always known
+        else:
+            # the last level halo is dirty
+            if required_clean_info[0].max_depth:
+                # we know that we need to clean the outermost halo level
+                required = True
+                known = True
+            else:
+                # we don't know whether the halo exchange is
+                # required or not as the reader reads the halo to
+                # a specified depth but we don't know the depth
+                # of the halo
+                required = True
+                known = False
+        return required, known
+
+    # at this point we know that clean_info.max_depth is False
+
+    if not clean_info.literal_depth:
+        # if literal_depth is 0 then the writer does not
+        # redundantly compute so we definitely need the halo
+        # exchange
+        required = True
+        known = True
+        return required, known
+
+    if clean_info.literal_depth == 1 and clean_info.dirty_outer:
+        # the writer redundantly computes in the level 1 halo but
+        # leaves it dirty (although annexed dofs are now clean).
+        if len(required_clean_info) == 1 and \
+           required_clean_info[0].annexed_only:
+            # we definitely don't need the halo exchange as we
+            # only read annexed dofs and these have been made
+            # clean by the redundant computation
+            required = False
+            known = True  # redundant information as it is always known
+        else:
+            # we definitely need the halo exchange as the reader(s)
+            # require the halo to be clean
+            required = True
+            known = True
+        return required, known
+
+    # At this point we know that the writer cleans the halo to a
+    # known (literal) depth through redundant computation. We now
+    # compute this value for use by the logic in the rest of the
+    # routine.
+    clean_depth = clean_info.literal_depth
+    if clean_info.dirty_outer:
+        # outer layer stays dirty
+        clean_depth -= 1
+
+    # If a literal value in any of the required clean halo depths
+    # is greater than the cleaned depth then we definitely need
+    # the halo exchange (as any additional variable depth would
+    # increase the required depth value). We only look at the case
+    # where we have multiple entries as the single entry case is
+    # dealt with separately
+    if len(required_clean_info) > 1:
+        for required_clean in required_clean_info:
+            if required_clean.literal_depth > clean_depth:
+                required = True
+                known = True
+                return required, known
+
+    # The only other case where we know that a halo exchange is
+    # required (or not) is where we read the halo to a known
+    # literal depth. As the read inforation is aggregated, a known
+    # literal depth will mean that there is only one
+    # required_clean_info entry
+    if len(required_clean_info) == 1:
+        # the halo might be read to a fixed literal depth
+        if required_clean_info[0].var_depth or \
+           required_clean_info[0].max_depth:
+            # no it isn't so we might need the halo exchange
+            required = True
+            known = False
+        else:
+            # the halo is read to a fixed literal depth.
+            required_clean_depth = required_clean_info[0].literal_depth
+            if clean_depth < required_clean_depth:
+                # we definitely need this halo exchange
+                required = True
+                known = True
+            else:
+                # we definitely don't need this halo exchange
+                required = False
+                known = True  # redundant information as it is always known
+        return required, known
+
+    # We now know that at least one required_clean entry has a
+    # variable depth and any required_clean fixed depths are less
+    # than the cleaned depth so we may need a halo exchange.
+    required = True
+    known = False
+    return required, known
+
+
+class DynHaloExchange(HaloExchange):
+
+    '''Dynamo specific halo exchange class which can be added to and
+    manipulated in, a schedule
+
+    :param field: the field that this halo exchange will act on
+    :type field: :py:class:`psyclone.dynamo0p3.DynKernelArgument`
+    :param check_dirty: optional argument default True indicating \
+    whether this halo exchange should be subject to a run-time check \
+    for clean/dirty halos.
+    :type check_dirty: bool
+    :param vector_index: optional vector index (default None) to \
+    identify which index of a vector field this halo exchange is \
+    responsible for
+    :type vector_index: int
+    :param parent: optional PSyIRe parent node (default None) of this \
+    object
+    :type parent: :py:class:`psyclone.psyGen.node`
+
+    '''
     def __init__(self, field, check_dirty=True,
                  vector_index=None, parent=None):
         HaloExchange.__init__(self, field, check_dirty=check_dirty,
@@ -3615,18 +4810,28 @@ class DynHaloExchange(HaloExchange):
 
     def _compute_halo_write_info(self):
         '''Determines how much of the halo has been cleaned from any previous
-        redundant computation
-
-        :return: a HaloWriteAccess object containing the required \
-        information, or None if no dependence information is found.
-        :rtype: :py:class:`psyclone.dynamo0p3.HaloWriteAccess` or None
+        redundant computation. If there is no previous writer in the
+        invoke then the state of the halo on entry to the invoke is
+        used if it is known (see
+        :py:meth:`psyclone.dynamo0p3.DynInvoke.set_halo_entry_state`).
+
+        :return: a HaloWriteAccess (or HaloState) object containing the \
+        required information, or None if no dependence information is \
+        found.
+        :rtype: :py:class:`psyclone.dynamo0p3.HaloWriteAccess` or \
+        :py:class:`psyclone.dynamo0p3.HaloState` or None
         :raises GenerationError: if more than one write dependence is \
         found for this halo exchange as this should not be possible
 
         '''
         write_dependencies = self.field.backward_write_dependencies()
         if not write_dependencies:
-            # no write dependence information
+            # no write dependence information so use the state of the
+            # halo on entry to the invoke, if it is known
+            invoke = getattr(self.root, "invoke", None)
+            if isinstance(invoke, DynInvoke):
+                return invoke.halo_entry_state.get(
+                    _halo_state_key(self.field, self.vector_index))
             return None
         if len(write_dependencies) > 1:
             raise GenerationError(
@@ -3680,128 +4885,7 @@ class DynHaloExchange(HaloExchange):
         # no need to test whether we return at least one read
         # dependency as _compute_halo_read_depth_info() raises an
         # exception if none are found
-
-        if Config.get().api_conf("dynamo0.3").compute_annexed_dofs and \
-           len(required_clean_info) == 1 and \
-           required_clean_info[0].annexed_only:
-            # We definitely don't need the halo exchange as we
-            # only read annexed dofs and these are always clean as
-            # they are computed by default when iterating over
-            # dofs and kept up-to-date by redundant computation
-            # when iterating over cells.
-            required = False
-            known = True  # redundant information as it is always known
-            return required, known
-
-        if not clean_info:
-            # this halo exchange has no previous write dependencies so
-            # we do not know the initial state of the halo. This means
-            # that we do not know if we need a halo exchange or not
-            required = True
-            known = False
-            return required, known
-
-        if clean_info.max_depth:
-            if not clean_info.dirty_outer:
-                # all of the halo is cleaned by redundant computation
-                # so halo exchange is not required
-                required = False
-                known = True  # redundant information as it is always known
-            else:
-                # the last level halo is dirty
-                if required_clean_info[0].max_depth:
-                    # we know that we need to clean the outermost halo level
-                    required = True
-                    known = True
-                else:
-                    # we don't know whether the halo exchange is
-                    # required or not as the reader reads the halo to
-                    # a specified depth but we don't know the depth
-                    # of the halo
-                    required = True
-                    known = False
-            return required, known
-
-        # at this point we know that clean_info.max_depth is False
-
-        if not clean_info.literal_depth:
-            # if literal_depth is 0 then the writer does not
-            # redundantly compute so we definitely need the halo
-            # exchange
-            required = True
-            known = True
-            return required, known
-
-        if clean_info.literal_depth == 1 and clean_info.dirty_outer:
-            # the writer redundantly computes in the level 1 halo but
-            # leaves it dirty (although annexed dofs are now clean).
-            if len(required_clean_info) == 1 and \
-               required_clean_info[0].annexed_only:
-                # we definitely don't need the halo exchange as we
-                # only read annexed dofs and these have been made
-                # clean by the redundant computation
-                required = False
-                known = True  # redundant information as it is always known
-            else:
-                # we definitely need the halo exchange as the reader(s)
-                # require the halo to be clean
-                required = True
-                known = True
-            return required, known
-
-        # At this point we know that the writer cleans the halo to a
-        # known (literal) depth through redundant computation. We now
-        # compute this value for use by the logic in the rest of the
-        # routine.
-        clean_depth = clean_info.literal_depth
-        if clean_info.dirty_outer:
-            # outer layer stays dirty
-            clean_depth -= 1
-
-        # If a literal value in any of the required clean halo depths
-        # is greater than the cleaned depth then we definitely need
-        # the halo exchange (as any additional variable depth would
-        # increase the required depth value). We only look at the case
-        # where we have multiple entries as the single entry case is
-        # dealt with separately
-        if len(required_clean_info) > 1:
-            for required_clean in required_clean_info:
-                if required_clean.literal_depth > clean_depth:
-                    required = True
-                    known = True
-                    return required, known
-
-        # The only other case where we know that a halo exchange is
-        # required (or not) is where we read the halo to a known
-        # literal depth. As the read inforation is aggregated, a known
-        # literal depth will mean that there is only one
-        # required_clean_info entry
-        if len(required_clean_info) == 1:
-            # the halo might be read to a fixed literal depth
-            if required_clean_info[0].var_depth or \
-               required_clean_info[0].max_depth:
-                # no it isn't so we might need the halo exchange
-                required = True
-                known = False
-            else:
-                # the halo is read to a fixed literal depth.
-                required_clean_depth = required_clean_info[0].literal_depth
-                if clean_depth < required_clean_depth:
-                    # we definitely need this halo exchange
-                    required = True
-                    known = True
-                else:
-                    # we definitely don't need this halo exchange
-                    required = False
-                    known = True  # redundant information as it is always known
-            return required, known
-
-        # We now know that at least one required_clean entry has a
-        # variable depth and any required_clean fixed depths are less
-        # than the cleaned depth so we may need a halo exchange.
-        required = True
-        known = False
-        return required, known
+        return _halo_exchange_required(required_clean_info, clean_info)
 
     def view(self, indent=0):
         ''' Class specific view  '''
@@ -3931,6 +5015,20 @@ class DynHaloExchangeStart(DynHaloExchange):
         '''
         return self._get_hex_end().required()
 
+    def overlapped_calls(self):
+        '''Finds the computation that is performed between this halo
+        exchange start and its corresponding halo exchange end and that
+        the halo exchange can therefore be overlapped with.
+
+        :return: the kernel and built-in calls between this halo \
+        exchange start and the corresponding halo exchange end
+        :rtype: :func:`list` of :py:class:`psyclone.psyGen.Call`
+
+        '''
+        hex_end = self._get_hex_end()
+        nodes = self.parent.children[self.position+1:hex_end.position]
+        return self.walk(nodes, psyGen.Call)
+
     def _get_hex_end(self):
         '''An internal helper routine for this class which finds the halo
         exchange end object corresponding to this halo exchange start
@@ -4004,6 +5102,248 @@ class DynHaloExchangeEnd(DynHaloExchange):
         self._dag_name = "haloexchangeend"
 
 
+class DynHaloExchangeGroup(psyGen.Node):
+    '''A group of (synchronous) halo exchanges that are performed with a
+    single call to the infrastructure's `halo_exchange_group` routine
+    rather than with one call per field (or vector component). Each
+    exchange is a latency-bound message exchange so batching them
+    reduces the number of messages. The halo exchanges in the group are
+    the children of this node so the dependence analysis and the logic
+    that decides whether a halo exchange is required are unchanged.
+
+    Halo exchanges in a group must exchange the same depth of halo of
+    fields that hold data of the same kind, as the infrastructure
+    provides a separate `halo_exchange_group` routine for each kind. If
+    the depths become different (e.g. because redundant computation is
+    subsequently applied) then one batched call is generated for each
+    depth. If the halo exchanges only might be required then their
+    run-time dirty checks are combined into a single guard.
+
+    :param children: the halo exchanges in this group
+    :type children: :func:`list` of \
+    :py:class:`psyclone.dynamo0p3.DynHaloExchange`
+    :param parent: optional PSyIRe parent node (default None) of this \
+    object
+    :type parent: :py:class:`psyclone.psyGen.node`
+
+    '''
+    def __init__(self, children=None, parent=None):
+        psyGen.Node.__init__(self, children=children, parent=parent)
+        self._text_name = "HaloExchangeGroup"
+        self._colour_map_name = "HaloExchange"
+
+    @property
+    def args(self):
+        '''
+        :return: the fields exchanged by the halo exchanges in this \
+        group. These determine the dependencies of the group.
+        :rtype: :func:`list` of \
+        :py:class:`psyclone.dynamo0p3.DynKernelArgument`
+
+        '''
+        args = []
+        for exchange in self.children:
+            args.extend(exchange.args)
+        return args
+
+    @property
+    def dag_name(self):
+        ''' Return the name to use in a dag for this node '''
+        return "haloexchangegroup_{0}".format(self.position)
+
+    @property
+    def coloured_text(self):
+        '''
+        Return a string containing the (coloured) name of this node type
+
+        :return: name of this node type, possibly with colour control codes
+        :rtype: str
+
+        '''
+        return psyGen.colored(
+            self._text_name, psyGen.SCHEDULE_COLOUR_MAP[self._colour_map_name])
+
+    def view(self, indent=0):
+        ''' Class specific view '''
+        print(self.indent(indent) + self.coloured_text +
+              "[nexchanges={0}]".format(len(self.children)))
+        for entity in self._children:
+            entity.view(indent=indent + 1)
+
+    def gen_code(self, parent):
+        '''Dynamo specific code generation for this class. The halo
+        exchanges are batched by depth and by the kind of the fields.
+        The batched call for fields of the default kind is to
+        `halo_exchange_group` in `field_mod` and for fields of another
+        kind, e.g. r_single, it is to `r_single_halo_exchange_group` in
+        `r_single_field_mod`. If all of the halo exchanges in a batch
+        only might be required then the batched call is guarded by a
+        single check of whether any of their halos are dirty, otherwise
+        it is made unconditionally.
+
+        :param parent: an f2pygen object that will be the parent of \
+        f2pygen objects created in this method
+        :type parent: :py:class:`psyclone.f2pygen.BaseGen`
+
+        '''
+        from psyclone.f2pygen import IfThenGen, CallGen, CommentGen, UseGen
+        batches = OrderedDict()
+        for exchange in self.children:
+            key = (exchange._compute_halo_depth(),
+                   exchange.field.psy_precision)
+            batches.setdefault(key, []).append(exchange)
+        for (depth, kind), exchanges in batches.items():
+            if len(exchanges) == 1:
+                exchanges[0].gen_code(parent)
+                continue
+            proxies = []
+            dirty_checks = []
+            known = False
+            for exchange in exchanges:
+                proxy = exchange.field.proxy_name
+                if exchange.vector_index:
+                    proxy += "({0})".format(exchange.vector_index)
+                proxies.append(proxy)
+                dirty_checks.append("{0}%is_dirty(depth={1})".format(
+                    proxy, depth))
+                if exchange.required()[1]:
+                    known = True
+            module, _ = infrastructure_type("gh_field", kind)
+            routine = "halo_exchange_group"
+            if kind != DEFAULT_KIND:
+                routine = kind + "_" + routine
+            parent.add(UseGen(parent, name=module, only=True,
+                              funcnames=[routine]))
+            if not known:
+                if_then = IfThenGen(parent, " .OR. ".join(dirty_checks))
+                parent.add(if_then)
+                halo_parent = if_then
+            else:
+                halo_parent = parent
+            halo_parent.add(
+                CallGen(halo_parent, name=routine,
+                        args=["(/" + ", ".join(proxies) + "/)",
+                              "depth=" + depth]))
+            parent.add(CommentGen(parent, ""))
+
+
+class DynKindConversion(psyGen.Node):
+    '''Copies the data of a field (or of each component of a field
+    vector) or operator that is read by a kernel as data of a different
+    kind into a PSy-layer array of that kind. The kernel is passed this
+    array in place of the data of the field or operator. The array is
+    (re)allocated on assignment and the copy is made immediately
+    before the loop containing the kernel, after any halo exchanges,
+    so that it holds the current values of the data (including the
+    halos) when the kernel is called.
+
+    :param arg: the kernel argument whose data is converted.
+    :type arg: :py:class:`psyclone.dynamo0p3.DynKernelArgument`
+    :param parent: optional PSyIRe parent node (default None) of this \
+    object
+    :type parent: :py:class:`psyclone.psyGen.node`
+
+    '''
+    def __init__(self, arg, parent=None):
+        psyGen.Node.__init__(self, parent=parent)
+        self._arg = arg
+        self._text_name = "KindConversion"
+        self._colour_map_name = "Assignment"
+
+    @property
+    def arg(self):
+        '''
+        :returns: the kernel argument whose data is converted.
+        :rtype: :py:class:`psyclone.dynamo0p3.DynKernelArgument`
+        '''
+        return self._arg
+
+    @property
+    def dag_name(self):
+        ''' Return the name to use in a dag for this node '''
+        return "kindconversion_{0}".format(self.position)
+
+    @property
+    def coloured_text(self):
+        '''
+        Return a string containing the (coloured) name of this node type
+
+        :return: name of this node type, possibly with colour control codes
+        :rtype: str
+
+        '''
+        return psyGen.colored(
+            self._text_name, psyGen.SCHEDULE_COLOUR_MAP[self._colour_map_name])
+
+    def view(self, indent=0):
+        ''' Class specific view '''
+        print(self.indent(indent) + self.coloured_text +
+              "[arg='{0}', kernel='{1}', kind='{2}']".format(
+                  self._arg.name, self._arg.call.name, self._arg.precision))
+
+    def gen_code(self, parent):
+        '''Dynamo specific code generation for this class.
+
+        :param parent: an f2pygen object that will be the parent of \
+        f2pygen objects created in this method
+        :type parent: :py:class:`psyclone.f2pygen.BaseGen`
+        :raises GenerationError: if this node is within a directive.
+        :raises GenerationError: if the kernel is within an OpenACC \
+                                 directive.
+        :raises GenerationError: if this node does not immediately \
+                                 precede (other kind conversions aside) \
+                                 the node containing the kernel.
+
+        '''
+        from psyclone.f2pygen import AssignGen, CommentGen, DeclGen
+        call = self._arg.call
+        kind = self._arg.precision
+        if self.ancestor(psyGen.Directive):
+            raise GenerationError(
+                "The conversion of argument '{0}' of kernel '{1}' to kind "
+                "'{2}' must not be within a directive.".format(
+                    self._arg.name, call.name, kind))
+        if call.ancestor(psyGen.ACCDirective):
+            raise GenerationError(
+                "The conversion of argument '{0}' of kernel '{1}' to kind "
+                "'{2}' is not supported for a kernel within an OpenACC "
+                "directive.".format(self._arg.name, call.name, kind))
+        node = None
+        for node in self.parent.children[self.position+1:]:
+            if not isinstance(node, DynKindConversion):
+                break
+        if node is None or isinstance(node, DynKindConversion) or not (
+                node is call or call in node.walk(node.children,
+                                                  psyGen.Kern)):
+            raise GenerationError(
+                "The conversion of argument '{0}' of kernel '{1}' to kind "
+                "'{2}' must immediately precede the node containing the "
+                "kernel.".format(self._arg.name, call.name, kind))
+
+        if self._arg.type == "gh_field":
+            component = "%data"
+            dimension = ":"
+        else:
+            component = "%local_stencil"
+            dimension = ":,:,:"
+        if self._arg.vector_size > 1:
+            sources = [("{0}({1}){2}".format(self._arg.proxy_name, idx,
+                                             component),
+                        self._arg.kind_conversion_name(idx))
+                       for idx in range(1, self._arg.vector_size+1)]
+        else:
+            sources = [(self._arg.proxy_name + component,
+                        self._arg.kind_conversion_name())]
+        parent.add(DeclGen(parent, datatype="real", kind=kind,
+                           allocatable=True, dimension=dimension,
+                           entity_decls=[name for _, name in sources]))
+        for source, name in sources:
+            parent.add(AssignGen(parent, lhs=name,
+                                 rhs="REAL({0}, KIND={1})".format(source,
+                                                                  kind)))
+        parent.add(CommentGen(parent, ""))
+
+
 class HaloDepth(object):
     '''Determines how much of the halo a read to a field accesses (the
     halo depth)
@@ -4270,6 +5610,78 @@ class HaloWriteAccess(HaloDepth):
         HaloDepth.set_by_value(self, max_depth, None, depth, False, False)
 
 
+class HaloState(HaloDepth):
+    '''The known state of a field's halo on exit from an invoke (and
+    therefore on entry to the invoke that follows it). This provides
+    the same information as a
+    :py:class:`psyclone.dynamo0p3.HaloWriteAccess` object so it can be
+    used in place of a previous writer when deciding whether a halo
+    exchange is required.
+
+    :param bool max_depth: True if the halo has been written to (or \
+    cleaned) to its full depth and False otherwise
+    :param int literal_depth: the depth of halo that has been written \
+    to (or cleaned) if it is not the full depth
+    :param bool dirty_outer: True if the outermost level of the halo \
+    that has been written to is dirty and False otherwise
+
+    '''
+    def __init__(self, max_depth, literal_depth, dirty_outer):
+        HaloDepth.__init__(self)
+        HaloDepth.set_by_value(self, max_depth, None, literal_depth, False,
+                               False)
+        self._dirty_outer = dirty_outer
+
+    @property
+    def dirty_outer(self):
+        '''
+        :return: True if the outermost level of the halo that has been \
+        written to is dirty and False otherwise
+        :rtype: bool
+
+        '''
+        return self._dirty_outer
+
+    @property
+    def clean_depth(self):
+        '''
+        :return: the depth of halo that is known to be clean or None if \
+        the full depth of the halo is clean
+        :rtype: int or NoneType
+
+        '''
+        if self.max_depth:
+            if self.dirty_outer:
+                # All but the outermost level of the halo are clean but
+                # the depth of the halo is not known
+                return 0
+            return None
+        if self.dirty_outer:
+            return self.literal_depth - 1
+        return self.literal_depth
+
+    def cleaned(self, depth_info):
+        '''Returns the state of the halo after a halo exchange that
+        cleans it for readers with the supplied halo depths.
+
+        :param depth_info: the (aggregated) halo depths read after the \
+        halo exchange
+        :type depth_info: :func:`list` of \
+        :py:class:`psyclone.dynamo0p3.HaloDepth`
+        :return: the state of the halo after the halo exchange
+        :rtype: :py:class:`psyclone.dynamo0p3.HaloState`
+
+        '''
+        if self.clean_depth is None or \
+           any(info.max_depth for info in depth_info):
+            return HaloState(True, 0, False)
+        # A variable depth may be zero so only the literal depths are
+        # known to have been cleaned
+        depth = max([self.clean_depth] +
+                    [info.literal_depth for info in depth_info])
+        return HaloState(False, depth, False)
+
+
 class HaloReadAccess(HaloDepth):
     '''Determines how much of a field's halo is read (the halo depth) and
     additionally the access pattern (the stencil) when a field is
@@ -4348,7 +5760,12 @@ class HaloReadAccess(HaloDepth):
         self._needs_clean_outer = (
             not (field.access.lower() == "gh_inc"
                  and loop.upper_bound_name in ["cell_halo",
-                                               "colour_halo"]))
+                                               "colour_halo",
+                                               "tilecell_halo"]))
+        if loop.upper_bound_name == "inner":
+            # a loop over inner cells never accesses the halo, even
+            # with a stencil, as its depth is chosen to prevent this
+            return
         # now we have the parent loop we can work out what part of the
         # halo this field accesses
         if loop.upper_bound_name in HALO_ACCESS_LOOP_BOUNDS:
@@ -4359,9 +5776,9 @@ class HaloReadAccess(HaloDepth):
             else:
                 # loop redundant computation is to the maximum depth
                 self._max_depth = True
-        elif loop.upper_bound_name == "ncolour":
-            # currenty coloured loops are always transformed from
-            # cell_halo depth 1 loops
+        elif loop.upper_bound_name in ["ncolour", "ntilecell"]:
+            # currenty coloured (and tiled) loops are always transformed
+            # from cell_halo depth 1 loops
             self._literal_depth = 1
         elif loop.upper_bound_name in ["ncells", "nannexed"]:
             if field.descriptor.stencil:
@@ -4452,10 +5869,12 @@ class DynLoop(Loop):
 
         # set our variable name at initialisation as it might be
         # required by other classes before code generation
-        if self._loop_type == "colours":
+        if self._loop_type in ["colours", "tilecolours"]:
             self._variable_name = "colour"
-        elif self._loop_type == "colour":
+        elif self._loop_type in ["colour", "tile"]:
             self._variable_name = "cell"
+        elif self._loop_type == "tiles":
+            self._variable_name = "tile"
         elif self._loop_type == "dofs":
             self._variable_name = self._name_space_manager.\
                 create_name(root_name="df",
@@ -4469,6 +5888,9 @@ class DynLoop(Loop):
         self._lower_bound_index = None
         self._upper_bound_name = None
         self._upper_bound_halo_depth = None
+        # The loop bounds if they have been evaluated on the host ahead
+        # of an OpenACC parallel region
+        self._host_bounds = None
 
     def view(self, indent=0):
         '''Print out a textual representation of this loop. We override this
@@ -4590,6 +6012,22 @@ class DynLoop(Loop):
         self._upper_bound_name = name
         self._upper_bound_halo_depth = index
 
+    @property
+    def lower_bound_name(self):
+        ''' Returns the name of the lower loop bound '''
+        return self._lower_bound_name
+
+    @property
+    def lower_bound_index(self):
+        '''Returns the index of the lower loop bound. This is None unless
+        the lower bound name is "inner" or in HALO_ACCESS_LOOP_BOUNDS
+
+        :return: the index of the lower loop bound
+        :rtype: int
+
+        '''
+        return self._lower_bound_index
+
     @property
     def upper_bound_name(self):
         ''' Returns the name of the upper loop bound '''
@@ -4714,6 +6152,38 @@ class DynLoop(Loop):
                 append = ","+halo_index
             return ("{0}%get_last_halo_cell_per_colour(colour"
                     "{1})".format(mesh, append))
+        elif self._upper_bound_name == "ntilecolours":
+            # Loop over colours of tiles
+            kernels = self.walk(self.children, DynKern)
+            if not kernels:
+                raise InternalError(
+                    "Failed to find a kernel within a loop over colours of "
+                    "tiles.")
+            return kernels[0].ntilecolours_var
+        elif self._upper_bound_name == "ntiles":
+            # Loop over the tiles of a particular colour when DM is
+            # disabled
+            return "{0}%get_last_edge_tile_per_colour(colour)".format(mesh)
+        elif self._upper_bound_name == "tile_halo":
+            # Loop over the tiles of a particular colour when DM is
+            # enabled. As for colour_halo, the depth of the halo is an
+            # optional argument.
+            append = ""
+            if halo_index:
+                append = ","+halo_index
+            return ("{0}%get_last_halo_tile_per_colour(colour"
+                    "{1})".format(mesh, append))
+        elif self._upper_bound_name == "ntilecell":
+            # Loop over the cells of a tile when DM is disabled
+            return ("{0}%get_last_edge_cell_per_colour_and_tile(tile, "
+                    "colour)".format(mesh))
+        elif self._upper_bound_name == "tilecell_halo":
+            # Loop over the cells of a tile when DM is enabled
+            append = ""
+            if halo_index:
+                append = ","+halo_index
+            return ("{0}%get_last_halo_cell_per_colour_and_tile(tile, "
+                    "colour{1})".format(mesh, append))
         elif self._upper_bound_name in ["ndofs", "nannexed"]:
             if Config.get().distributed_memory:
                 if self._upper_bound_name == "ndofs":
@@ -4771,6 +6241,31 @@ class DynLoop(Loop):
             my_mapping = FIELD_ACCESS_MAP
         return Loop.has_inc_arg(self, my_mapping)
 
+    def requires_colouring(self):
+        '''
+        Determines whether this loop over cells must be coloured before
+        it can be parallelised. This is the case if any kernel within it
+        increments a quantity that is shared between neighbouring cells.
+        Kernels that assemble a column-wise (CMA) operator or that form
+        the product of CMA operators only ever update the column of the
+        current cell and so are always race-free. A kernel applying a CMA
+        operator (or its inverse) is only race-free if it writes (rather
+        than increments) its output field, i.e. if the output field is on
+        a discontinuous function space.
+
+        :returns: True if this loop must be coloured in order to be \
+                  parallelised over cells, False otherwise.
+        :rtype: bool
+
+        '''
+        for kern in self.kern_calls():
+            if kern.cma_operation in ["assembly", "matrix-matrix"]:
+                continue
+            for arg in kern.arguments.args:
+                if arg.access.lower() == FIELD_ACCESS_MAP["inc"]:
+                    return True
+        return False
+
     def unique_fields_with_halo_reads(self):
         ''' Returns all fields in this loop that require at least some
         of their halo to be clean to work correctly. '''
@@ -4798,6 +6293,11 @@ class DynLoop(Loop):
         :rtype: bool
 
         '''
+        if self._upper_bound_name == "inner":
+            # a loop over inner cells is created by splitting a loop
+            # so that it only covers the cells whose (stencil) accesses
+            # do not reach the halo or the annexed dofs
+            return False
         if arg.descriptor.stencil:
             if self._upper_bound_name not in ["cell_halo", "ncells"]:
                 raise GenerationError(
@@ -4845,7 +6345,8 @@ class DynLoop(Loop):
 
     def _add_halo_exchange_code(self, halo_field, idx=None):
         '''An internal helper method to add the halo exchange call immediately
-        before this loop using the halo_field argument for the
+        before this loop (and before any conversions of the kind of the
+        data read by its kernels) using the halo_field argument for the
         associated field information and the optional idx argument if
         the field is a vector field.
 
@@ -4866,8 +6367,13 @@ class DynLoop(Loop):
         exchange = DynHaloExchange(halo_field,
                                    parent=self.parent,
                                    vector_index=idx)
-        self.parent.children.insert(self.position,
-                                    exchange)
+        # The halo exchange must also precede any conversions of the
+        # kind of the data that is read by the kernels in this loop
+        position = self.position
+        while position > 0 and isinstance(
+                self.parent.children[position-1], DynKindConversion):
+            position -= 1
+        self.parent.children.insert(position, exchange)
         # check whether this halo exchange has been placed
         # here correctly and if not, remove it.
         required, _ = exchange.required()
@@ -4970,6 +6476,79 @@ class DynLoop(Loop):
                     # or not
                     self._add_halo_exchange(halo_field)
 
+    @property
+    def vectorise_builtins(self):
+        '''
+        :returns: True if this loop is to be generated in a form suitable \
+                  for SIMD vectorisation. This is the case if the \
+                  VECTORISE_BUILTINS configuration option is set and this \
+                  is a loop over dofs that only contains built-ins and is \
+                  not within a directive.
+        :rtype: bool
+
+        '''
+        from psyclone.psyGen import Directive
+        from psyclone.dynamo0p3_builtins import DynBuiltIn
+        if not Config.get().api_conf("dynamo0.3").vectorise_builtins:
+            return False
+        if self._loop_type != "dofs" or self.ancestor(Directive):
+            return False
+        return all(isinstance(call, DynBuiltIn) for call in self.calls())
+
+    def _gen_data_views(self, parent):
+        '''
+        Point local, contiguous pointers at the data of the fields
+        accessed by the built-ins in this loop. Unlike the data
+        components of the field proxies these are known to be
+        unit-stride and are not aliased by the proxies themselves.
+        Each pointer has the kind of the data that the field holds in
+        the PSy layer and the pointers are declared together by kind.
+
+        :param parent: the f2pygen node to which to add the code.
+        :type parent: :py:class:`psyclone.f2pygen.BaseGen`
+
+        '''
+        from psyclone.f2pygen import AssignGen, DeclGen
+        views = OrderedDict()
+        kinds = OrderedDict()
+        for call in self.calls():
+            for arg in call.arguments.args:
+                if arg.type == "gh_field":
+                    view = call.data_view_name(arg)
+                    if view not in views:
+                        views[view] = arg.proxy_name
+                        kinds.setdefault(arg.psy_precision, []).append(view)
+        for kind, kind_views in kinds.items():
+            parent.add(DeclGen(parent, datatype="real", kind=kind,
+                               pointer=True, contiguous=True,
+                               entity_decls=[view + "(:) => null()"
+                                             for view in kind_views]))
+        for view, proxy_name in views.items():
+            parent.add(AssignGen(parent, lhs=view, rhs=proxy_name + "%data",
+                                 pointer=True))
+
+    def _gen_simd_directive(self, parent):
+        '''
+        Add an OpenMP SIMD directive (with a reduction clause for any
+        reductions) immediately before the Fortran loop created for
+        this loop.
+
+        :param parent: the f2pygen node containing the generated loop.
+        :type parent: :py:class:`psyclone.f2pygen.BaseGen`
+
+        '''
+        from psyclone.f2pygen import DirectiveGen, DoGen
+        do_loop = [child for child in parent.children
+                   if isinstance(child, DoGen)][-1]
+        clauses = []
+        for call in self.reductions():
+            clauses.append("reduction({0}:{1})".format(
+                psyGen.REDUCTION_OPERATOR_MAPPING[call.reduction_arg.access],
+                call.reduction_arg.name))
+        parent.add(DirectiveGen(parent, "omp", "begin", "simd",
+                                ", ".join(clauses)),
+                   position=["before", do_loop.root])
+
     def gen_code(self, parent):
         '''Work out the appropriate loop bounds and variable name
         depending on the loop type and then call the base class to
@@ -4979,130 +6558,192 @@ class DynLoop(Loop):
         f2pygen objects created in this method
         :type parent: :py:class:`psyclone.f2pygen.BaseGen`
         :raises GenerationError: if a loop over colours is within an \
-        OpenMP parallel region (as it must be serial)
+        OpenMP parallel region (as it must be serial) and does not \
+        contain an OpenMP do loop
+        :raises GenerationError: if a loop over colours is within an \
+        OpenACC parallel region (as it must be executed on the host)
 
         '''
         # Check that we're not within an OpenMP parallel region if
-        # we are a loop over colours.
-        if self._loop_type == "colours" and self.is_openmp_parallel():
+        # we are a loop over colours, unless every thread executes the
+        # loop over colours and shares the work of the loop over the
+        # cells of each colour.
+        if self._loop_type in ["colours", "tilecolours"] and \
+           self.is_openmp_parallel() and not self.encloses_omp_do():
             raise GenerationError("Cannot have a loop over "
                                   "colours within an OpenMP "
                                   "parallel region.")
+        acc_region = self.ancestor(ACCParallelDirective)
+        if self._loop_type in ["colours", "tilecolours"] and acc_region:
+            raise GenerationError("Cannot have a loop over "
+                                  "colours within an OpenACC "
+                                  "parallel region.")
 
-        # get fortran loop bounds
-        self._start = self._lower_bound_fortran()
-        self._stop = self._upper_bound_fortran()
+        # get fortran loop bounds (unless they have been evaluated on
+        # the host ahead of an OpenACC parallel region)
+        if self._host_bounds:
+            self._start, self._stop = self._host_bounds
+            self._host_bounds = None
+        else:
+            self._start = self._lower_bound_fortran()
+            self._stop = self._upper_bound_fortran()
+        vectorise = self.vectorise_builtins
+        if vectorise:
+            self._gen_data_views(parent)
         Loop.gen_code(self, parent)
+        if vectorise:
+            self._gen_simd_directive(parent)
 
-        if Config.get().distributed_memory and self._loop_type != "colour":
+        if not acc_region:
+            self.gen_mark_halos_clean_dirty(parent)
 
-            # Set halo clean/dirty for all fields that are modified
-            from psyclone.f2pygen import CallGen, CommentGen, DirectiveGen
-            fields = self.unique_modified_args(FIELD_ACCESS_MAP, "gh_field")
+    def gen_host_bounds(self, parent):
+        '''
+        Evaluates the bounds of this loop on the host, ahead of the
+        OpenACC parallel region containing it. The bounds are obtained
+        from the mesh and function-space objects which are not available
+        on the OpenACC device.
 
-            if fields:
-                parent.add(CommentGen(parent, ""))
-                parent.add(CommentGen(parent,
-                                      " Set halos dirty/clean for fields "
-                                      "modified in the above loop"))
-                parent.add(CommentGen(parent, ""))
-                from psyclone.psyGen import OMPParallelDoDirective
-                use_omp_master = False
-                if self.is_openmp_parallel():
-                    if not self.ancestor(OMPParallelDoDirective):
-                        use_omp_master = True
-                        # I am within an OpenMP Do directive so protect
-                        # set_dirty() and set_clean() with OpenMP Master
-                        parent.add(DirectiveGen(parent, "omp", "begin",
-                                                "master", ""))
-                # first set all of the halo dirty unless we are
-                # subsequently going to set all of the halo clean
-                for field in fields:
-                    # The HaloWriteAccess class provides information
-                    # about how the supplied field is accessed within
-                    # its parent loop
-                    hwa = HaloWriteAccess(field)
-                    if not hwa.max_depth or hwa.dirty_outer:
-                        # output set dirty as some of the halo will
-                        # not be set to clean
-                        if field.vector_size > 1:
-                            # the range function below returns values from
-                            # 1 to the vector size which is what we
-                            # require in our Fortran code
-                            for index in range(1, field.vector_size+1):
-                                parent.add(CallGen(parent,
-                                                   name=field.proxy_name +
-                                                   "(" + str(index) +
-                                                   ")%set_dirty()"))
-                        else:
-                            parent.add(CallGen(parent, name=field.proxy_name +
-                                               "%set_dirty()"))
-                # now set appropriate parts of the halo clean where
-                # redundant computation has been performed
-                for field in fields:
-                    # The HaloWriteAccess class provides information
-                    # about how the supplied field is accessed within
-                    # its parent loop
-                    hwa = HaloWriteAccess(field)
-                    if hwa.literal_depth:
-                        # halo access(es) is/are to a fixed depth
-                        halo_depth = hwa.literal_depth
-                        if hwa.dirty_outer:
-                            halo_depth -= 1
-                        if halo_depth > 0:
-                            if field.vector_size > 1:
-                                # the range function below returns
-                                # values from 1 to the vector size
-                                # which is what we require in our
-                                # Fortran code
-                                for index in range(1, field.vector_size+1):
-                                    parent.add(
-                                        CallGen(parent,
-                                                name="{0}({1})%set_clean"
-                                                "({2})".format(
-                                                    field.proxy_name,
-                                                    str(index),
-                                                    halo_depth)))
-                            else:
-                                parent.add(
-                                    CallGen(parent,
-                                            name="{0}%set_clean({1})".
-                                            format(field.proxy_name,
-                                                   halo_depth)))
-                    elif hwa.max_depth:
-                        # halo accesses(s) is/are to the full halo
-                        # depth (-1 if continuous)
-                        halo_depth = "mesh%get_halo_depth()"
-                        if hwa.dirty_outer:
-                            # a continuous field iterating over
-                            # cells leaves the outermost halo
-                            # dirty
-                            halo_depth += "-1"
+        :param parent: the f2pygen node to which to add the code.
+        :type parent: :py:class:`psyclone.f2pygen.BaseGen`
+
+        '''
+        from psyclone.f2pygen import AssignGen, DeclGen
+        bounds = []
+        for root_name, bound in [("loop_start", self._lower_bound_fortran()),
+                                 ("loop_stop", self._upper_bound_fortran())]:
+            if bound.isdigit():
+                bounds.append(bound)
+                continue
+            name = self._name_space_manager.create_name(root_name=root_name)
+            parent.add(DeclGen(parent, datatype="integer",
+                               entity_decls=[name]))
+            parent.add(AssignGen(parent, lhs=name, rhs=bound))
+            bounds.append(name)
+        self._host_bounds = tuple(bounds)
+
+    def gen_mark_halos_clean_dirty(self, parent):
+        '''
+        Generates the code that sets the halos of all fields modified
+        within this loop dirty or clean (when distributed memory is
+        enabled). If the loop is within an OpenACC parallel region then
+        this is called by the region once it has ended.
+
+        :param parent: the f2pygen node to which to add the code.
+        :type parent: :py:class:`psyclone.f2pygen.BaseGen`
+
+        '''
+        if not Config.get().distributed_memory or \
+           self._loop_type in ["colour", "tiles", "tile"]:
+            return
+
+        # Set halo clean/dirty for all fields that are modified
+        from psyclone.f2pygen import CallGen, CommentGen, DirectiveGen
+        fields = self.unique_modified_args(FIELD_ACCESS_MAP, "gh_field")
+
+        if fields:
+            parent.add(CommentGen(parent, ""))
+            parent.add(CommentGen(parent,
+                                  " Set halos dirty/clean for fields "
+                                  "modified in the above loop"))
+            parent.add(CommentGen(parent, ""))
+            from psyclone.psyGen import OMPParallelDoDirective
+            use_omp_master = False
+            if self.is_openmp_parallel():
+                if not self.ancestor(OMPParallelDoDirective):
+                    use_omp_master = True
+                    # I am within an OpenMP Do directive so protect
+                    # set_dirty() and set_clean() with OpenMP Master
+                    parent.add(DirectiveGen(parent, "omp", "begin",
+                                            "master", ""))
+            # first set all of the halo dirty unless we are
+            # subsequently going to set all of the halo clean
+            for field in fields:
+                # The HaloWriteAccess class provides information
+                # about how the supplied field is accessed within
+                # its parent loop
+                hwa = HaloWriteAccess(field)
+                if not hwa.max_depth or hwa.dirty_outer:
+                    # output set dirty as some of the halo will
+                    # not be set to clean
+                    if field.vector_size > 1:
+                        # the range function below returns values from
+                        # 1 to the vector size which is what we
+                        # require in our Fortran code
+                        for index in range(1, field.vector_size+1):
+                            parent.add(CallGen(parent,
+                                               name=field.proxy_name +
+                                               "(" + str(index) +
+                                               ")%set_dirty()"))
+                    else:
+                        parent.add(CallGen(parent, name=field.proxy_name +
+                                           "%set_dirty()"))
+            # now set appropriate parts of the halo clean where
+            # redundant computation has been performed
+            for field in fields:
+                # The HaloWriteAccess class provides information
+                # about how the supplied field is accessed within
+                # its parent loop
+                hwa = HaloWriteAccess(field)
+                if hwa.literal_depth:
+                    # halo access(es) is/are to a fixed depth
+                    halo_depth = hwa.literal_depth
+                    if hwa.dirty_outer:
+                        halo_depth -= 1
+                    if halo_depth > 0:
                         if field.vector_size > 1:
                             # the range function below returns
                             # values from 1 to the vector size
                             # which is what we require in our
                             # Fortran code
                             for index in range(1, field.vector_size+1):
-                                call = CallGen(parent,
-                                               name="{0}({1})%set_clean("
-                                               "{2})".format(
-                                                   field.proxy_name,
-                                                   str(index),
-                                                   halo_depth))
-                                parent.add(call)
+                                parent.add(
+                                    CallGen(parent,
+                                            name="{0}({1})%set_clean"
+                                            "({2})".format(
+                                                field.proxy_name,
+                                                str(index),
+                                                halo_depth)))
                         else:
-                            call = CallGen(parent, name="{0}%set_clean("
-                                           "{1})".format(field.proxy_name,
-                                                         halo_depth))
+                            parent.add(
+                                CallGen(parent,
+                                        name="{0}%set_clean({1})".
+                                        format(field.proxy_name,
+                                               halo_depth)))
+                elif hwa.max_depth:
+                    # halo accesses(s) is/are to the full halo
+                    # depth (-1 if continuous)
+                    halo_depth = "mesh%get_halo_depth()"
+                    if hwa.dirty_outer:
+                        # a continuous field iterating over
+                        # cells leaves the outermost halo
+                        # dirty
+                        halo_depth += "-1"
+                    if field.vector_size > 1:
+                        # the range function below returns
+                        # values from 1 to the vector size
+                        # which is what we require in our
+                        # Fortran code
+                        for index in range(1, field.vector_size+1):
+                            call = CallGen(parent,
+                                           name="{0}({1})%set_clean("
+                                           "{2})".format(
+                                               field.proxy_name,
+                                               str(index),
+                                               halo_depth))
                             parent.add(call)
-
-                if use_omp_master:
-                    # I am within an OpenMP Do directive so protect
-                    # set_dirty() and set_clean() with OpenMP Master
-                    parent.add(DirectiveGen(parent, "omp", "end",
-                                            "master", ""))
-                parent.add(CommentGen(parent, ""))
+                    else:
+                        call = CallGen(parent, name="{0}%set_clean("
+                                       "{1})".format(field.proxy_name,
+                                                     halo_depth))
+                        parent.add(call)
+
+            if use_omp_master:
+                # I am within an OpenMP Do directive so protect
+                # set_dirty() and set_clean() with OpenMP Master
+                parent.add(DirectiveGen(parent, "omp", "end",
+                                        "master", ""))
+            parent.add(CommentGen(parent, ""))
 
 
 class DynKern(Kern):
@@ -5371,6 +7012,38 @@ class DynKern(Kern):
                 root_name="ncolour", context="PSyVars", label="ncolour")
         return ncols
 
+    @property
+    def tilemap(self):
+        '''
+        Getter for the name of the map of the cells in each tile of each
+        colour associated with this kernel call.
+
+        :return: name of the tile map (Fortran array)
+        :rtype: str
+        :raises InternalError: if this kernel is not within a tiled loop.
+        '''
+        if not self.is_tiled():
+            raise InternalError("Kernel '{0}' is not inside a tiled "
+                                "loop.".format(self.name))
+        return self._name_space_manager.create_name(
+            root_name="tmap", context="PSyVars", label="tmap")
+
+    @property
+    def ntilecolours_var(self):
+        '''
+        Getter for the name of the variable holding the number of colours
+        of tiles associated with this kernel call.
+
+        :return: name of the variable holding the number of colours of tiles
+        :rtype: str
+        :raises InternalError: if this kernel is not within a tiled loop.
+        '''
+        if not self.is_tiled():
+            raise InternalError("Kernel '{0}' is not inside a tiled "
+                                "loop.".format(self.name))
+        return self._name_space_manager.create_name(
+            root_name="ntilecolour", context="PSyVars", label="ntilecolour")
+
     @property
     def fs_descriptors(self):
         ''' Returns a list of function space descriptor objects of
@@ -5537,6 +7210,10 @@ class DynKern(Kern):
             # use the current cell index directly. We need to know the name
             # of the variable holding the colour map for this kernel.
             cell_index = self.colourmap + "(colour, cell)"
+        elif self.is_tiled():
+            # Similarly, the cell index of a cell in a tile of a given
+            # colour is looked up using the tile map
+            cell_index = self.tilemap + "(colour, tile, cell)"
         else:
             # This kernel call has not been coloured
             #  - is it OpenMP parallel, i.e. are we a child of
@@ -6019,13 +7696,19 @@ class KernCallArgList(ArgOrdering):
         # 1 to the vector size which is what we
         # require in our Fortran code
         for idx in range(1, argvect.vector_size+1):
-            text = argvect.proxy_name + "(" + str(idx) + ")%data"
+            if argvect.requires_kind_conversion:
+                text = argvect.kind_conversion_name(idx)
+            else:
+                text = argvect.proxy_name + "(" + str(idx) + ")%data"
             self._arglist.append(text)
 
     def field(self, arg):
         '''add the field array associated with the argument 'arg' to the
         argument list'''
-        text = arg.proxy_name + "%data"
+        if arg.requires_kind_conversion:
+            text = arg.kind_conversion_name()
+        else:
+            text = arg.proxy_name + "%data"
         self._arglist.append(text)
 
     def stencil_unknown_extent(self, arg):
@@ -6056,7 +7739,10 @@ class KernCallArgList(ArgOrdering):
         # TODO we should only be including ncell_3d once in the argument
         # list but this adds it for every operator
         self._arglist.append(arg.proxy_name_indexed+"%ncell_3d")
-        self._arglist.append(arg.proxy_name_indexed+"%local_stencil")
+        if arg.requires_kind_conversion:
+            self._arglist.append(arg.kind_conversion_name())
+        else:
+            self._arglist.append(arg.proxy_name_indexed+"%local_stencil")
 
     def cma_operator(self, arg):
         ''' add the CMA operator and associated scalars to the argument
@@ -6253,16 +7939,236 @@ class KernCallArgList(ArgOrdering):
     def _cell_ref_name(self):
         '''
         Utility routine which determines whether to return the cell value
-        or the colourmap lookup value.
+        or the colourmap (or tile map) lookup value.
 
         :returns: the Fortran code needed to access the current cell index.
         :rtype: str
         '''
         if self._kern.is_coloured():
             return self._kern.colourmap + "(colour, cell)"
+        if self._kern.is_tiled():
+            return self._kern.tilemap + "(colour, tile, cell)"
         return "cell"
 
 
+class KernCallAccArgList(KernCallArgList):
+    '''
+    Creates the lists of quantities that must be present on an OpenACC
+    device before kernel "kern" can be called from within an OpenACC
+    parallel region. These are the arrays (and the objects containing
+    them) that are passed to the kernel. Quantities that persist from one
+    call of the PSy layer to the next are returned by `arglist` while
+    those that are re-computed every time the PSy layer is called (basis
+    functions and quadrature weights) are returned by `copyin_list`.
+    Integer scalars that are computed by the PSy layer (such as the number
+    of layers or the number of dofs) are private to each OpenACC thread
+    by default and are therefore not included.
+
+    :param kern: the kernel that is being called.
+    :type kern: :py:class:`psyclone.dynamo0p3.DynKern`
+    '''
+    def __init__(self, kern):
+        KernCallArgList.__init__(self, kern)
+        self._copyin_list = []
+
+    def generate(self):
+        '''
+        Creates the lists of quantities required on the OpenACC device,
+        including the colour map if the kernel is called from within a
+        coloured loop.
+        '''
+        KernCallArgList.generate(self)
+        if self._kern.is_coloured():
+            self._arglist.append(self._kern.colourmap)
+
+    def _add(self, names, copyin=False):
+        '''
+        Adds the supplied names to the appropriate list, ignoring any
+        that are already present.
+
+        :param names: the names of the quantities to add.
+        :type names: list of str
+        :param bool copyin: whether the quantities are re-computed every \
+                            time the PSy layer is called.
+        '''
+        target = self._copyin_list if copyin else self._arglist
+        for name in names:
+            if name not in target:
+                target.append(name)
+
+    def cell_position(self):
+        ''' The cell index is private to each OpenACC thread '''
+
+    def cell_map(self):
+        ''' Add the (whole) cell-map for an inter-grid kernel '''
+        cargs = psyGen.args_filter(self._kern.args,
+                                   arg_meshes=["gh_coarse"])
+        base_name = "cell_map_" + cargs[0].name
+        map_name = self._name_space_manager.create_name(
+            root_name=base_name, context="PSyVars", label=base_name)
+        self._add([map_name])
+
+    def mesh_height(self):
+        ''' The number of layers is private to each OpenACC thread '''
+
+    def mesh_ncell2d(self):
+        ''' The number of columns is private to each OpenACC thread '''
+
+    def field_vector(self, argvect):
+        ''' Add the field-vector proxy and the data array of each of its
+        components '''
+        names = [argvect.proxy_name]
+        for idx in range(1, argvect.vector_size+1):
+            names.append(argvect.proxy_name + "(" + str(idx) + ")%data")
+        self._add(names)
+
+    def field(self, arg):
+        ''' Add the field proxy and its data array '''
+        self._add([arg.proxy_name, arg.proxy_name + "%data"])
+
+    def stencil_unknown_extent(self, arg):
+        ''' The stencil extent is private to each OpenACC thread '''
+
+    def stencil_unknown_direction(self, arg):
+        ''' The stencil direction is private to each OpenACC thread '''
+
+    def stencil(self, arg):
+        ''' Add the (whole) stencil dofmap '''
+        self._add([stencil_dofmap_name(arg)])
+
+    def operator(self, arg):
+        ''' Add the operator proxy and its local-matrix array '''
+        self._add([arg.proxy_name_indexed,
+                   arg.proxy_name_indexed + "%local_stencil"])
+
+    def cma_operator(self, arg):
+        ''' Add the matrix of the CMA operator (its associated integer
+        scalars are private to each OpenACC thread) '''
+        self._add([self._name_space_manager.create_name(
+            root_name=arg.name+"_matrix", context="PSyVars",
+            label=arg.name+"_matrix")])
+
+    def scalar(self, scalar_arg):
+        ''' Add a scalar argument unless it is a literal '''
+        if not scalar_arg.is_literal:
+            self._add([scalar_arg.name])
+
+    def fs_common(self, function_space):
+        ''' The number of dofs per cell is private to each OpenACC
+        thread '''
+
+    def fs_compulsory_field(self, function_space):
+        ''' Add the (whole) dofmap for this function space '''
+        self._add([get_fs_map_name(function_space)])
+
+    def fs_intergrid(self, function_space):
+        '''
+        Add the (whole) dofmap for this function space of an inter-grid
+        kernel.
+
+        :param function_space: the function space for which to add arguments
+        :type function_space: :py:class:`psyclone.dynamo0p3.FunctionSpace`
+        '''
+        self.fs_compulsory_field(function_space)
+
+    def basis(self, function_space):
+        '''
+        Add the basis functions for this function space. These are
+        computed every time the PSy layer is called.
+
+        :param function_space: the function space for which the basis \
+                               function is required.
+        :type function_space: :py:class:`psyclone.dynamo0p3.FunctionSpace`
+        '''
+        start = len(self._arglist)
+        KernCallArgList.basis(self, function_space)
+        self._add(self._arglist[start:], copyin=True)
+        del self._arglist[start:]
+
+    def diff_basis(self, function_space):
+        '''
+        Add the differential basis functions for this function space.
+        These are computed every time the PSy layer is called.
+
+        :param function_space: the function space for which the \
+                               differential basis functions are required.
+        :type function_space: :py:class:`psyclone.dynamo0p3.FunctionSpace`
+        '''
+        start = len(self._arglist)
+        KernCallArgList.diff_basis(self, function_space)
+        self._add(self._arglist[start:], copyin=True)
+        del self._arglist[start:]
+
+    def orientation(self, function_space):
+        '''
+        The orientation of the cells is looked-up on the host inside the
+        loop so is not supported.
+
+        :raises GenerationError: as kernels requiring orientation are not \
+                                 supported within OpenACC regions.
+        '''
+        raise GenerationError(
+            "Kernel '{0}' requires orientation information which is not "
+            "supported within an OpenACC region.".format(self._kern.name))
+
+    def field_bcs_kernel(self, function_space):
+        '''
+        The boundary dofs are looked-up on the host immediately before the
+        loop so are not supported.
+
+        :raises GenerationError: as boundary-condition kernels are not \
+                                 supported within OpenACC regions.
+        '''
+        raise GenerationError(
+            "Kernel '{0}' applies boundary conditions which is not "
+            "supported within an OpenACC region.".format(self._kern.name))
+
+    def operator_bcs_kernel(self, function_space):
+        '''
+        The boundary dofs are looked-up on the host immediately before the
+        loop so are not supported.
+
+        :raises GenerationError: as boundary-condition kernels are not \
+                                 supported within OpenACC regions.
+        '''
+        self.field_bcs_kernel(function_space)
+
+    def quad_rule(self):
+        ''' Add the quadrature weights (the numbers of quadrature points
+        are private to each OpenACC thread) '''
+        self._add([arg for arg in self._kern.qr_args
+                   if arg.startswith("weights")], copyin=True)
+
+    def banded_dofmap(self, function_space):
+        ''' Add the banded dofmap required for CMA operator assembly '''
+        self._add([get_cbanded_map_name(function_space)])
+
+    def indirection_dofmap(self, function_space, operator=None):
+        ''' Add the indirection dofmap required when applying a CMA
+        operator '''
+        self._add([get_cma_indirection_map_name(function_space)])
+
+    @property
+    def arglist(self):
+        '''
+        :returns: the quantities that must be present on the OpenACC \
+                  device and that persist from one call of the PSy layer \
+                  to the next. The generate function must be called first.
+        :rtype: list of str.
+        '''
+        return self._arglist
+
+    @property
+    def copyin_list(self):
+        '''
+        :returns: the quantities that must be copied to the OpenACC \
+                  device every time the PSy layer is called. The generate \
+                  function must be called first.
+        :rtype: list of str.
+        '''
+        return self._copyin_list
+
+
 class KernStubArgList(ArgOrdering):
     '''Creates the argument list required to create and declare the
     required arguments for a kernel subroutine.  The ordering and type
@@ -6285,8 +8191,13 @@ class KernStubArgList(ArgOrdering):
                 "is not yet supported for inter-grid kernels".
                 format(kern.name))
 
+        kinds = [DEFAULT_KIND]
+        for arg in kern.arguments.args:
+            if arg.type not in VALID_SCALAR_NAMES and \
+               arg.precision not in kinds:
+                kinds.append(arg.precision)
         parent.add(UseGen(parent, name="constants_mod", only=True,
-                          funcnames=["r_def"]))
+                          funcnames=kinds))
         self._first_arg = True
         self._first_arg_decl = None
         ArgOrdering.__init__(self, kern)
@@ -6330,7 +8241,7 @@ class KernStubArgList(ArgOrdering):
                     "_v" + str(idx))
             intent = argvect.intent
             decl = DeclGen(self._parent, datatype="real",
-                           kind="r_def", dimension=undf_name,
+                           kind=argvect.precision, dimension=undf_name,
                            intent=intent, entity_decls=[text])
             self._parent.add(decl)
             if self._first_arg:
@@ -6346,7 +8257,7 @@ class KernStubArgList(ArgOrdering):
         text = arg.name + "_" + arg.function_space.mangled_name
         intent = arg.intent
         decl = DeclGen(self._parent, datatype="real",
-                       kind="r_def", dimension=undf_name,
+                       kind=arg.precision, dimension=undf_name,
                        intent=intent, entity_decls=[text])
         self._parent.add(decl)
         if self._first_arg:
@@ -6404,7 +8315,8 @@ class KernStubArgList(ArgOrdering):
         intent = arg.intent
         ndf_name_to = get_fs_ndf_name(arg.function_space_to)
         ndf_name_from = get_fs_ndf_name(arg.function_space_from)
-        self._parent.add(DeclGen(self._parent, datatype="real", kind="r_def",
+        self._parent.add(DeclGen(self._parent, datatype="real",
+                                 kind=arg.precision,
                                  dimension=",".join([ndf_name_to,
                                                      ndf_name_from, size]),
                                  intent=intent, entity_decls=[text]))
@@ -6443,7 +8355,7 @@ class KernStubArgList(ArgOrdering):
         # If this is the first argument in the kernel then keep a
         # note so that we can put subsequent declarations in the
         # correct location
-        decl = DeclGen(self._parent, datatype="real", kind="r_def",
+        decl = DeclGen(self._parent, datatype="real", kind=arg.precision,
                        dimension=",".join([bandwidth,
                                            nrow, "ncell_2d"]),
                        intent=intent, entity_decls=[arg.name])
@@ -7290,6 +9202,68 @@ class DynKernelArguments(Arguments):
 
         return self._raw_arg_list
 
+    def _acc_lists(self):
+        '''
+        :returns: the quantities that persist between calls of the PSy \
+                  layer and those that are re-computed on every call and \
+                  which must be present on an OpenACC device before the \
+                  associated kernel can be launched.
+        :rtype: 2-tuple of list of str
+        '''
+        if isinstance(self._parent_call, psyGen.BuiltIn):
+            # Built-ins are passed only fields and scalars
+            arg_list = []
+            for arg in self._args:
+                if arg.type == "gh_field":
+                    arg_list.extend([arg.proxy_name, arg.proxy_name+"%data"])
+                elif not arg.is_literal:
+                    arg_list.append(arg.name)
+            return arg_list, []
+        create_acc_arg_list = KernCallAccArgList(self._parent_call)
+        create_acc_arg_list.generate()
+        return create_acc_arg_list.arglist, create_acc_arg_list.copyin_list
+
+    @property
+    def acc_args(self):
+        '''
+        :returns: the list of quantities that must be available on an \
+                  OpenACC device before the associated kernel can be \
+                  launched and that persist from one call of the PSy \
+                  layer to the next.
+        :rtype: list of str
+        '''
+        return self._acc_lists()[0]
+
+    @property
+    def acc_copyin_args(self):
+        '''
+        :returns: the list of quantities that are re-computed every time \
+                  the PSy layer is called and that must therefore be \
+                  copied to an OpenACC device on entry to any parallel \
+                  region containing the associated kernel.
+        :rtype: list of str
+        '''
+        return self._acc_lists()[1]
+
+    @property
+    def scalars(self):
+        '''
+        :returns: the names of the (non-literal) scalar arguments of the \
+                  associated kernel.
+        :rtype: list of str
+        '''
+        args = psyGen.args_filter(self._args, arg_types=VALID_SCALAR_NAMES)
+        return [arg.name for arg in args if not arg.is_literal]
+
+    @property
+    def fields(self):
+        '''
+        :returns: the names of the field arguments of the associated kernel.
+        :rtype: list of str
+        '''
+        args = psyGen.args_filter(self._args, arg_types=["gh_field"])
+        return [arg.name for arg in args]
+
 
 class DynKernelArgument(KernelArgument):
     ''' Provides information about individual Dynamo kernel call
@@ -7563,6 +9537,59 @@ class DynKernelArgument(KernelArgument):
         '''
         return self._type in VALID_OPERATOR_NAMES
 
+    @property
+    def precision(self):
+        '''
+        :returns: the Fortran kind of the data held by this field or \
+                  operator argument (as specified by the precision in \
+                  its meta-data) or of this real scalar argument.
+        :rtype: str
+        '''
+        if self._arg.precision:
+            return PRECISION_KINDS[self._arg.precision]
+        return DEFAULT_KIND
+
+    @property
+    def psy_precision(self):
+        '''
+        :returns: the Fortran kind of the data held by this field or \
+                  operator argument in the PSy layer of the invoke. This \
+                  differs from its precision if the kernel reads it as \
+                  data of another kind.
+        :rtype: str
+        '''
+        return self._call.root.invoke.arg_precision(self.name)
+
+    @property
+    def requires_kind_conversion(self):
+        '''
+        :returns: True if this is a field or operator argument that the \
+                  kernel reads as data of a different kind from the data \
+                  that it holds in the PSy layer, False otherwise. The \
+                  kernel is then passed a copy of the data converted to \
+                  the kind given by its precision.
+        :rtype: bool
+        '''
+        if self._type in VALID_SCALAR_NAMES:
+            return False
+        return self.precision != self.psy_precision
+
+    def kind_conversion_name(self, vector_index=None):
+        '''
+        :param int vector_index: the component of a field vector or None.
+        :returns: the name of the PSy-layer array that holds the data of \
+                  this field (or field vector component) or operator \
+                  argument converted to the kind given by its precision.
+        :rtype: str
+        '''
+        name = self.name
+        if vector_index:
+            name += "_{0}".format(vector_index)
+        root_name = "{0}_{1}_data".format(name, self.precision)
+        name_space_manager = NameSpaceFactory().create()
+        return name_space_manager.create_name(
+            root_name=root_name, context="PSyVars", label=root_name)
+
 
 class DynKernCallFactory(object):
     ''' Create the necessary framework for a Dynamo kernel call.
@@ -7588,3 +9615,141 @@ class DynKernCallFactory(object):
 
         # Return the outermost loop
         return cloop
+
+
+def gen_acc_update(parent, direction, args):
+    '''
+    Adds an OpenACC update directive for the data arrays of the supplied
+    field and operator arguments to the f2pygen AST.
+
+    :param parent: the node in the f2pygen AST to which to add the directive.
+    :type parent: :py:class:`psyclone.f2pygen.BaseGen`
+    :param str direction: "device" or "host", the copy of the data to update.
+    :param args: the field and operator arguments whose data to update.
+    :type args: list of :py:class:`psyclone.dynamo0p3.DynKernelArgument`
+    '''
+    from psyclone.f2pygen import DirectiveGen
+    name_space_manager = NameSpaceFactory().create()
+    names = []
+    for arg in args:
+        if arg.type == "gh_field" and arg.vector_size > 1:
+            arg_names = [arg.proxy_name + "(" + str(idx) + ")%data"
+                         for idx in range(1, arg.vector_size+1)]
+        elif arg.type == "gh_field":
+            arg_names = [arg.proxy_name + "%data"]
+        elif arg.type == "gh_operator":
+            arg_names = [arg.proxy_name_indexed + "%local_stencil"]
+        elif arg.type == "gh_columnwise_operator":
+            arg_names = [name_space_manager.create_name(
+                root_name=arg.name+"_matrix", context="PSyVars",
+                label=arg.name+"_matrix")]
+        else:
+            arg_names = []
+        for name in arg_names:
+            if name not in names:
+                names.append(name)
+    if names:
+        parent.add(DirectiveGen(parent, "acc", "begin", "update",
+                                "{0}({1})".format(direction,
+                                                  ",".join(names))))
+
+
+class DynACCParallelDirective(ACCParallelDirective):
+    '''
+    Sub-classes ACCParallelDirective to evaluate the bounds of the loops
+    within the region, which are obtained from objects that are only
+    available on the host, before the region begins. The data of the
+    fields and operators read within the region is updated on the device
+    when the region begins and that of those modified within it is
+    updated on the host (where halo exchanges and any subsequent code
+    are executed) once the region has ended. The halo status of the
+    modified fields is then updated.
+
+    '''
+    def gen_code(self, parent):
+        '''
+        Generate the elements of the f2pygen AST for this Node in the Schedule.
+
+        :param parent: node in the f2pygen AST to which to add node(s).
+        :type parent: :py:class:`psyclone.f2pygen.BaseGen`
+        '''
+        loops = self.walk(self.children, DynLoop)
+        for loop in loops:
+            loop.gen_host_bounds(parent)
+        read_args = []
+        modified_args = []
+        for call in self.calls():
+            for arg in call.arguments.args:
+                if arg.access in ["gh_read", "gh_inc", "gh_readwrite"]:
+                    read_args.append(arg)
+                if arg.access in ["gh_write", "gh_inc", "gh_readwrite"]:
+                    modified_args.append(arg)
+        gen_acc_update(parent, "device", read_args)
+
+        super(DynACCParallelDirective, self).gen_code(parent)
+
+        gen_acc_update(parent, "host", modified_args)
+        for loop in loops:
+            loop.gen_mark_halos_clean_dirty(parent)
+
+
+class DynACCEnterDataDirective(ACCDataDirective):
+    '''
+    Sub-classes ACCDataDirective to provide an API-specific implementation
+    of data_on_device(). The field and operator proxies and the dofmaps
+    are local variables of the PSy layer that are set every time an
+    Invoke is called (possibly with different fields) so the data is
+    copied to the device on every call and removed from it again (see
+    :py:meth:`gen_exit_data`) at the end of the Invoke.
+
+    '''
+    def gen_enter_data(self, parent, var_list):
+        '''
+        Adds the enter data directive that copies the supplied quantities
+        to the device to the f2pygen AST. Unlike the base class, the
+        directive is executed every time that the Invoke is called.
+
+        :param parent: node in the f2pygen AST to which to add node(s).
+        :type parent: :py:class:`psyclone.f2pygen.BaseGen`
+        :param var_list: the quantities to copy to the device.
+        :type var_list: list of str
+        '''
+        from psyclone.f2pygen import DirectiveGen, CommentGen
+        parent.add(CommentGen(parent, " Copy all fields to the device"))
+        parent.add(DirectiveGen(parent, "acc", "begin", "enter data",
+                                "copyin(" + self.list_to_string(var_list) +
+                                ")"))
+        parent.add(CommentGen(parent, ""))
+
+    def gen_exit_data(self, parent):
+        '''
+        Adds the exit data directive that removes the quantities copied to
+        the device by this directive from it to the f2pygen AST. Any data
+        modified on the device has already been updated on the host when
+        the parallel region that modified it ended. The quantities are
+        removed in the reverse of the order in which they were copied so
+        that the data of a field is removed before its proxy.
+
+        :param parent: node in the f2pygen AST to which to add node(s).
+        :type parent: :py:class:`psyclone.f2pygen.BaseGen`
+        '''
+        from psyclone.f2pygen import DirectiveGen, CommentGen
+        var_list = []
+        for pdir in self.walk(self.root.children, ACCParallelDirective):
+            for var in pdir.ref_list:
+                if var not in var_list:
+                    var_list.append(var)
+        parent.add(CommentGen(parent, ""))
+        parent.add(CommentGen(parent, " Remove all fields from the device"))
+        parent.add(DirectiveGen(parent, "acc", "begin", "exit data",
+                                "delete(" +
+                                self.list_to_string(var_list[::-1]) + ")"))
+
+    def data_on_device(self, parent):
+        '''
+        Dynamo 0.3 fields do not record whether or not their data is on an
+        OpenACC device so there is nothing to add to the f2pygen AST.
+
+        :param parent: The node in the f2pygen AST to which to add nodes.
+        :type parent: :py:class:`psyclone.f2pygen.BaseGen`
+        '''
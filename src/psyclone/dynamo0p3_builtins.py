@@ -174,9 +174,29 @@ class DynBuiltIn(BuiltIn):
                 "must be on the same space. However, found spaces {0} for "
                 "arguments to {1}".format(sorted(spaces), self.name))
 
+    def data_view_name(self, arg):
+        '''
+        :param arg: a field argument of this built-in.
+        :type arg: :py:class:`psyclone.dynamo0p3.DynKernelArgument`
+        :returns: the name of the local, contiguous pointer to the data \
+                  of the supplied field that is used when the enclosing \
+                  loop is vectorised.
+        :rtype: str
+        '''
+        return self._name_space_manager.create_name(
+            root_name=arg.name + "_data", context="PSyVars",
+            label=arg.name + "_data")
+
     def array_ref(self, fld_name):
         ''' Returns a string containing the array reference for a
-        proxy with the supplied name '''
+        proxy with the supplied name. If the enclosing loop is to be
+        vectorised then the local pointer to the data of the field is
+        referenced instead. '''
+        if self.parent.vectorise_builtins:
+            for arg in self._arguments.args:
+                if arg.proxy_name == fld_name:
+                    return (self.data_view_name(arg) + "(" +
+                            self._idx_name + ")")
         return fld_name + "%data(" + self._idx_name + ")"
 
     @property
@@ -72,6 +72,99 @@ def index_of_object(alist, obj):
     raise Exception("Object {0} not found in list".format(str(obj)))
 
 
+# Cache of the fparser1 source items (lines and comments) obtained by
+# reading the template Fortran from which each type of statement is created
+_TEMPLATE_ITEMS = {}
+
+
+def template_items(code, strict=True, ignore_comments=True):
+    '''
+    Every f2pygen object creates its fparser1 statement(s) from a fixed
+    piece of template Fortran which is then modified. Reading the template
+    with a new FortranStringReader for every object is a significant part
+    of the cost of generating code so the template is only read once and
+    copies of the resulting source items are returned.
+
+    :param str code: the template Fortran.
+    :param bool strict: whether to read the template in strict free-form.
+    :param bool ignore_comments: whether the reader ignores comments.
+    :returns: new copies of the items (one per line) in the template.
+    :rtype: list of :py:class:`fparser.common.readfortran.Line` or \
+            :py:class:`fparser.common.readfortran.Comment`
+    '''
+    import copy
+    key = (code, strict, ignore_comments)
+    try:
+        items = _TEMPLATE_ITEMS[key]
+    except KeyError:
+        reader = FortranStringReader(code, ignore_comments=ignore_comments)
+        reader.set_format(FortranFormat(True, strict))
+        items = list(reader)
+        _TEMPLATE_ITEMS[key] = items
+    # Line objects provide their own copy method (which gives the copy its
+    # own parse cache), comments do not.
+    return [item.copy() if hasattr(item, "copy") else copy.copy(item)
+            for item in items]
+
+
+def fortran_lines(node, isfix=None):
+    '''
+    Generator yielding the lines of Fortran for the supplied fparser1 node,
+    one line at a time. The lines are identical to those of
+    `node.tofortran(isfix).split("\\n")` but blocks (modules,
+    subroutines, loops etc.) are walked directly so that the text of each
+    block is not built up as an intermediate string.
+
+    :param node: the root of the fparser1 tree to write out.
+    :type node: :py:class:`fparser.common.base_classes.Statement`
+    :param bool isfix: whether to produce fixed-format code (as for \
+                       `tofortran`).
+    :returns: the lines of Fortran (without newline characters).
+    :rtype: generator of str
+    '''
+    from fparser.common.base_classes import BeginStatement
+    from fparser.one.block_statements import BeginSource
+    method = six.get_unbound_function(type(node).tofortran)
+    if method is six.get_unbound_function(BeginStatement.tofortran):
+        prefix = ""
+    elif method is six.get_unbound_function(BeginSource.tofortran):
+        # A BeginSource comments-out its own header line
+        prefix = "C" if isfix else node.get_indent_tab(isfix=isfix) + "!"
+    else:
+        # Any other statement knows how to write itself
+        for line in node.tofortran(isfix=isfix).split("\n"):
+            yield line
+        return
+    construct_name = node.construct_name
+    construct_name = construct_name + ': ' if construct_name else ''
+    yield prefix + node.get_indent_tab(isfix=isfix) + construct_name + \
+        node.tostr()
+    for child in node.content:
+        for line in fortran_lines(child, isfix=isfix):
+            yield line
+
+
+def write_fortran(node, stream, isfix=None):
+    '''
+    Write the Fortran for the supplied fparser1 node to a stream (e.g. an
+    open file or :py:class:`io.StringIO`) without first creating the
+    complete text in memory. The result is identical to
+    `stream.write(node.tofortran(isfix))` (and therefore to
+    `stream.write(str(node))` when `isfix` is not specified).
+
+    :param node: the root of the fparser1 tree to write out.
+    :type node: :py:class:`fparser.common.base_classes.Statement`
+    :param stream: where to write the code.
+    :type stream: file-like object with a `write` method
+    :param bool isfix: whether to produce fixed-format code.
+    '''
+    separator = ""
+    for line in fortran_lines(node, isfix=isfix):
+        stream.write(separator)
+        stream.write(line)
+        separator = "\n"
+
+
 # This section subclasses the f2py comment class so that we can
 # reason about directives
 
@@ -137,7 +230,8 @@ class OMPDirective(Directive):
                          'parallel do').
     '''
     def __init__(self, root, line, position, dir_type):
-        self._types = ["parallel do", "parallel", "do", "master"]
+        self._types = ["parallel do", "parallel", "do", "master", "simd",
+                       "single", "task"]
         self._positions = ["begin", "end"]
 
         super(OMPDirective, self).__init__(root, line, position, dir_type)
@@ -159,7 +253,8 @@ class ACCDirective(Directive):
                          'loop').
     '''
     def __init__(self, root, line, position, dir_type):
-        self._types = ["parallel", "kernels", "enter data", "loop"]
+        self._types = ["parallel", "kernels", "enter data", "exit data",
+                       "loop", "update"]
         self._positions = ["begin", "end"]
 
         super(ACCDirective, self).__init__(root, line, position, dir_type)
@@ -176,6 +271,9 @@ class BaseGen(object):
         self._parent = parent
         self._root = root
         self._children = []
+        # The index in root.content at which each object used as a
+        # "before" or "after" anchor was last found (keyed by id)
+        self._anchor_index = {}
 
     @property
     def parent(self):
@@ -229,7 +327,7 @@ class BaseGen(object):
             index = position[1]
             self.root.content.insert(index, new_object.root)
         elif position[0] == "after":
-            idx = index_of_object(self.root.content, position[1])
+            idx = self._anchor_position(position[1])
             self.root.content.insert(idx+1, new_object.root)
         elif position[0] == "after_index":
             self.root.content.insert(position[1]+1, new_object.root)
@@ -237,18 +335,42 @@ class BaseGen(object):
             self.root.content.insert(position[1], new_object.root)
         elif position[0] == "before":
             try:
-                idx = index_of_object(self.root.content, position[1])
+                idx = self._anchor_position(position[1])
             except Exception as err:
                 print(str(err))
                 raise RuntimeError(
                     "Failed to find supplied object in existing content - "
                     "is it a child of the parent?")
             self.root.content.insert(idx, new_object.root)
+            # The anchor has moved along by one
+            self._anchor_index[id(position[1])] = idx + 1
         else:
             raise Exception("Error: BaseGen:add: internal error, should "
                             "not get to here")
         self.children.append(new_object)
 
+    def _anchor_position(self, anchor):
+        '''
+        Returns the index of the supplied object in the content of the
+        fparser1 node of this object. The index at which an anchor was
+        last found is remembered and checked first so that repeated
+        insertions relative to the same anchor do not have to search the
+        content. The content may be modified directly so a remembered
+        index is only used if the anchor is still found there.
+
+        :param anchor: the object to find.
+        :type anchor: :py:class:`fparser.common.base_classes.Statement`
+        :returns: the index of the anchor in the content.
+        :rtype: int
+        :raises Exception: if the anchor is not in the content.
+        '''
+        content = self.root.content
+        idx = self._anchor_index.get(id(anchor))
+        if idx is None or idx >= len(content) or content[idx] is not anchor:
+            idx = index_of_object(content, anchor)
+            self._anchor_index[id(anchor)] = idx
+        return idx
+
     def previous_loop(self):
         ''' Returns the *last* occurence of a loop in the list of
         siblings of this node '''
@@ -339,6 +461,17 @@ class ProgUnitGen(BaseGen):
     subroutines)'''
     def __init__(self, parent, sub):
         BaseGen.__init__(self, parent, sub)
+        # Registries of the declarations, use statements and implicit
+        # none statement that are children of this program unit. They
+        # allow duplicates to be found without searching the children.
+        # Declared entities are keyed by the kind of declaration and its
+        # type and hold the lower-cased entity names.
+        self._declared = {}
+        # Use statements are keyed by module name and hold the
+        # lower-cased names in the only list or None if there is a
+        # use statement without an only list.
+        self._used = {}
+        self._implicit_none = False
 
     def add(self, content, position=None, bubble_up=False):
         '''
@@ -405,45 +538,18 @@ class ProgUnitGen(BaseGen):
             # position[0] == "auto" so insert in a context sensitive way
             if isinstance(content, BaseDeclGen):
 
-                if isinstance(content, (DeclGen, CharDeclGen)):
-                    # have I already been declared?
-                    for child in self._children:
-                        if isinstance(child, (DeclGen, CharDeclGen)):
-                            # is this declaration the same type as me?
-                            if child.root.name == content.root.name:
-                                # we are modifying the list so we need
-                                # to iterate over a copy
-                                for var_name in content.root.entity_decls[:]:
-                                    for child_name in child.root.entity_decls:
-                                        if var_name.lower() == \
-                                           child_name.lower():
-                                            content.root.entity_decls.\
-                                                remove(var_name)
-                                            if not content.root.entity_decls:
-                                                # return as all variables in
-                                                # this declaration already
-                                                # exist
-                                                return
-                if isinstance(content, TypeDeclGen):
-                    # have I already been declared?
-                    for child in self._children:
-                        if isinstance(child, TypeDeclGen):
-                            # is this declaration the same type as me?
-                            if child.root.selector[1] == \
-                               content.root.selector[1]:
-                                # we are modifying the list so we need
-                                # to iterate over a copy
-                                for var_name in content.root.entity_decls[:]:
-                                    for child_name in child.root.entity_decls:
-                                        if var_name.lower() == \
-                                           child_name.lower():
-                                            content.root.entity_decls.\
-                                                remove(var_name)
-                                            if not content.root.entity_decls:
-                                                # return as all variables in
-                                                # this declaration already
-                                                # exist
-                                                return
+                key = self._declaration_key(content)
+                declared = self._declared.get(key)
+                if declared:
+                    # remove any variables that have already been declared
+                    # with the same type
+                    content.root.entity_decls[:] = [
+                        var_name for var_name in content.root.entity_decls
+                        if var_name.lower() not in declared]
+                    if not content.root.entity_decls:
+                        # return as all variables in this declaration
+                        # already exist
+                        return
 
                 index = 0
                 # skip over any use statements
@@ -464,40 +570,29 @@ class ProgUnitGen(BaseGen):
                     pass
             elif isinstance(content.root, fparser1.statements.Use):
                 # have I already been declared?
-                for child in self._children:
-                    if isinstance(child, UseGen):
-                        if child.root.name == content.root.name:
-                            # found an existing use with the same name
-                            if not child.root.isonly and not \
-                               content.root.isonly:
-                                # both are generic use statements so
-                                # skip this declaration
-                                return
-                            if child.root.isonly and not content.root.isonly:
-                                # new use is generic and existing use
-                                # is specific so we can safely add
-                                pass
-                            if not child.root.isonly and content.root.isonly:
-                                # existing use is generic and new use
-                                # is specific so we can skip this
-                                # declaration
+                if content.root.name in self._used:
+                    only_names = self._used[content.root.name]
+                    if only_names is None:
+                        # existing use is generic so we can skip this
+                        # declaration
+                        return
+                    if not content.root.isonly:
+                        # new use is generic and existing use is
+                        # specific so we can safely add
+                        pass
+                    else:
+                        # remove any names that are already used
+                        new_names = [name for name in content.root.items
+                                     if name.lower() not in only_names]
+                        if len(new_names) < len(content.root.items):
+                            content.root.items[:] = new_names
+                            if not content.root.items:
                                 return
-                            if child.root.isonly and content.root.isonly:
-                                # we are modifying the list so we need
-                                # to iterate over a copy
-                                for new_name in content.root.items[:]:
-                                    for existing_name in child.root.items:
-                                        if existing_name.lower() == \
-                                           new_name.lower():
-                                            content.root.items.remove(new_name)
-                                            if not content.root.items:
-                                                return
                 index = 0
             elif isinstance(content, ImplicitNoneGen):
                 # does implicit none already exist?
-                for child in self._children:
-                    if isinstance(child, ImplicitNoneGen):
-                        return
+                if self._implicit_none:
+                    return
                 # skip over any use statements
                 index = 0
                 index = self._skip_use_and_comments(index)
@@ -505,6 +600,45 @@ class ProgUnitGen(BaseGen):
                 index = len(self.root.content) - 1
             self.root.content.insert(index, content.root)
             self._children.append(content)
+        self._register(content)
+
+    @staticmethod
+    def _declaration_key(content):
+        '''
+        :param content: a declaration.
+        :type content: :py:class:`psyclone.f2pygen.BaseDeclGen`
+        :returns: the key under which the entities declared by the \
+                  supplied declaration are registered. Intrinsic and \
+                  character declarations are distinguished by the name \
+                  of their type, derived-type declarations by their type.
+        :rtype: 2-tuple of (str, str)
+        '''
+        if isinstance(content, TypeDeclGen):
+            return ("type", content.root.selector[1])
+        return ("intrinsic", content.root.name)
+
+    def _register(self, content):
+        '''
+        Records a child that has just been added to this program unit in
+        the registries of declarations, use statements and implicit none.
+
+        :param content: the child that has been added.
+        :type content: :py:class:`psyclone.f2pygen.BaseGen`
+        '''
+        if isinstance(content, (DeclGen, CharDeclGen, TypeDeclGen)):
+            self._declared.setdefault(
+                self._declaration_key(content), set()).update(
+                    var_name.lower()
+                    for var_name in content.root.entity_decls)
+        elif isinstance(content, UseGen):
+            name = content.root.name
+            if not content.root.isonly:
+                self._used[name] = None
+            elif self._used.get(name, set()) is not None:
+                self._used.setdefault(name, set()).update(
+                    item.lower() for item in content.root.items)
+        elif isinstance(content, ImplicitNoneGen):
+            self._implicit_none = True
 
     def _skip_use_and_comments(self, index):
         ''' skip over any use statements and comments in the ast '''
@@ -583,9 +717,7 @@ class CommentGen(BaseGen):
         :type parent: :py:class:`psyclone.f2pygen.BaseGen`
         :param str content: the content of the comment
         '''
-        reader = FortranStringReader("! content\n", ignore_comments=False)
-        reader.set_format(FortranFormat(True, True))  # free form, strict
-        subline = reader.next()
+        subline = template_items("! content\n", ignore_comments=False)[0]
 
         my_comment = Comment(parent.root, subline)
         my_comment.content = content
@@ -612,9 +744,7 @@ class DirectiveGen(BaseGen):
         self._language = language
         self._directive_type = directive_type
 
-        reader = FortranStringReader("! content\n", ignore_comments=False)
-        reader.set_format(FortranFormat(True, True))  # free form, strict
-        subline = reader.next()
+        subline = template_items("! content\n", ignore_comments=False)[0]
 
         if language == "omp":
             my_comment = OMPDirective(parent.root, subline, position,
@@ -653,9 +783,7 @@ class ImplicitNoneGen(BaseGen):
             raise Exception(
                 "The parent of ImplicitNoneGen must be a module or a "
                 "subroutine, but found {0}".format(type(parent)))
-        reader = FortranStringReader("IMPLICIT NONE\n")
-        reader.set_format(FortranFormat(True, True))  # free form, strict
-        subline = reader.next()
+        subline = template_items("IMPLICIT NONE\n")[0]
 
         from fparser.one.typedecl_statements import Implicit
         my_imp_none = Implicit(parent.root, subline)
@@ -675,11 +803,8 @@ class SubroutineGen(ProgUnitGen):
                                   "implicit none" for the body of this
                                   subroutine
         '''
-        reader = FortranStringReader(
+        subline, endsubline = template_items(
             "subroutine vanilla(vanilla_arg)\nend subroutine")
-        reader.set_format(FortranFormat(True, True))  # free form, strict
-        subline = reader.next()
-        endsubline = reader.next()
 
         from fparser.one.block_statements import Subroutine, EndSubroutine
         self._sub = Subroutine(parent.root, subline)
@@ -713,9 +838,7 @@ class CallGen(BaseGen):
         :param str name: the name of the routine to call
         :param list args: list of arguments to pass to the call
         '''
-        reader = FortranStringReader("call vanilla(vanilla_arg)")
-        reader.set_format(FortranFormat(True, True))  # free form, strict
-        myline = reader.next()
+        myline = template_items("call vanilla(vanilla_arg)")[0]
 
         from fparser.one.block_statements import Call
         self._call = Call(parent.root, myline)
@@ -737,9 +860,7 @@ class UseGen(BaseGen):
         :param bool only: whether this USE has an ONLY clause
         :param list funcnames: list of names to follow ONLY clause
         '''
-        reader = FortranStringReader("use kern,only : func1_kern=>func1")
-        reader.set_format(FortranFormat(True, True))  # free form, strict
-        myline = reader.next()
+        myline = template_items("use kern,only : func1_kern=>func1")[0]
         root = parent.root
         from fparser.one.block_statements import Use
         use = Use(root, myline)
@@ -769,9 +890,7 @@ def adduse(name, parent, only=False, funcnames=None):
     :returns: an fparser1 Use object
     :rtype: :py:class:`fparser.one.block_statements.Use`
     '''
-    reader = FortranStringReader("use kern,only : func1_kern=>func1")
-    reader.set_format(FortranFormat(True, True))  # free form, strict
-    myline = reader.next()
+    myline = template_items("use kern,only : func1_kern=>func1")[0]
 
     # find an appropriate place to add in our use statement
     while not isinstance(parent, (fparser1.block_statements.Program, 
@@ -801,9 +920,7 @@ class AllocateGen(BaseGen):
 
         :raises RuntimeError: if `content` is not of correct type
         '''
-        reader = FortranStringReader("allocate(dummy)")
-        reader.set_format(FortranFormat(True, False))  # free form, strict
-        myline = reader.next()
+        myline = template_items("allocate(dummy)", strict=False)[0]
         self._decl = fparser1.statements.Allocate(parent.root, myline)
         if isinstance(content, str):
             self._decl.items = [content]
@@ -827,9 +944,7 @@ class DeallocateGen(BaseGen):
 
         :raises RuntimeError: if `content` is not of correct type
         '''
-        reader = FortranStringReader("deallocate(dummy)")
-        reader.set_format(FortranFormat(True, False))  # free form, strict
-        myline = reader.next()
+        myline = template_items("deallocate(dummy)", strict=False)[0]
         self._decl = fparser1.statements.Deallocate(parent.root, myline)
         if isinstance(content, str):
             self._decl.items = [content]
@@ -862,6 +977,8 @@ class BaseDeclGen(BaseGen):
     :param bool target: whether this declaration has the TARGET attribute
     :param initial_values: Initial value to give each variable.
     :type initial_values: list of str with same no. of elements as entity_decls
+    :param bool contiguous: whether this declaration has the CONTIGUOUS \
+                            attribute
 
     :raises RuntimeError: if no variable names are specified.
     :raises RuntimeError: if the wrong number or type of initial values are \
@@ -876,7 +993,8 @@ class BaseDeclGen(BaseGen):
 
     def __init__(self, parent, datatype="", entity_decls=None, intent="",
                  pointer=False, dimension="", allocatable=False,
-                 save=False, target=False, initial_values=None):
+                 save=False, target=False, initial_values=None,
+                 contiguous=False):
         if entity_decls is None:
             raise RuntimeError(
                 "Cannot create a variable declaration without specifying the "
@@ -929,6 +1047,8 @@ class BaseDeclGen(BaseGen):
             my_attrspec.append("intent({0})".format(intent))
         if pointer:
             my_attrspec.append("pointer")
+        if contiguous:
+            my_attrspec.append("contiguous")
         if target:
             my_attrspec.append("target")
         if allocatable:
@@ -994,6 +1114,8 @@ class DeclGen(BaseDeclGen):
     :param initial_values: Initial value to give each variable.
     :type initial_values: list of str with same no. of elements as \
                           entity_decls.
+    :param bool contiguous: whether this declaration has the CONTIGUOUS \
+                            attribute.
 
     :raises RuntimeError: if datatype is not one of DeclGen.SUPPORTED_TYPES.
 
@@ -1003,7 +1125,8 @@ class DeclGen(BaseDeclGen):
 
     def __init__(self, parent, datatype="", entity_decls=None, intent="",
                  pointer=False, kind="", dimension="", allocatable=False,
-                 save=False, target=False, initial_values=None):
+                 save=False, target=False, initial_values=None,
+                 contiguous=False):
 
         dtype = datatype.lower()
         if dtype not in self.SUPPORTED_TYPES:
@@ -1012,22 +1135,15 @@ class DeclGen(BaseDeclGen):
                 " supported and you specified '{1}'"
                 .format(self.SUPPORTED_TYPES, datatype))
 
-        fort_fmt = FortranFormat(True, False)  # free form, strict
         if dtype == "integer":
-            reader = FortranStringReader("integer :: vanilla")
-            reader.set_format(fort_fmt)
-            myline = reader.next()
+            myline = template_items("integer :: vanilla", strict=False)[0]
             self._decl = fparser1.typedecl_statements.Integer(parent.root,
                                                               myline)
         elif dtype == "real":
-            reader = FortranStringReader("real :: vanilla")
-            reader.set_format(fort_fmt)
-            myline = reader.next()
+            myline = template_items("real :: vanilla", strict=False)[0]
             self._decl = fparser1.typedecl_statements.Real(parent.root, myline)
         elif dtype == "logical":
-            reader = FortranStringReader("logical :: vanilla")
-            reader.set_format(fort_fmt)
-            myline = reader.next()
+            myline = template_items("logical :: vanilla", strict=False)[0]
             self._decl = fparser1.typedecl_statements.Logical(parent.root,
                                                               myline)
         else:
@@ -1048,7 +1164,8 @@ class DeclGen(BaseDeclGen):
                                       dimension=dimension,
                                       allocatable=allocatable, save=save,
                                       target=target,
-                                      initial_values=initial_values)
+                                      initial_values=initial_values,
+                                      contiguous=contiguous)
 
     def _check_initial_values(self, dtype, values):
         '''
@@ -1127,10 +1244,8 @@ class CharDeclGen(BaseDeclGen):
                  pointer=False, kind="", dimension="", allocatable=False,
                  save=False, target=False, length="", initial_values=None):
 
-        reader = FortranStringReader(
-            "character(len=vanilla_len) :: vanilla")
-        reader.set_format(FortranFormat(True, False))
-        myline = reader.next()
+        myline = template_items(
+            "character(len=vanilla_len) :: vanilla", strict=False)[0]
         self._decl = fparser1.typedecl_statements.Character(parent.root,
                                                             myline)
         # Add character- and kind-selectors
@@ -1189,9 +1304,8 @@ class TypeDeclGen(BaseDeclGen):
                  pointer=False, dimension="", allocatable=False,
                  save=False, target=False):
 
-        reader = FortranStringReader("type(vanillatype) :: vanilla")
-        reader.set_format(FortranFormat(True, False))  # free form, strict
-        myline = reader.next()
+        myline = template_items(
+            "type(vanillatype) :: vanilla", strict=False)[0]
 
         self._decl = fparser1.typedecl_statements.Type(parent.root, myline)
         self._decl.selector = ('', datatype)
@@ -1254,13 +1368,9 @@ class SelectionGen(BaseGen):
                                 than a SELECT CASE
         '''
         self._typeselect = typeselect
-        reader = FortranStringReader(
-            "SELECT CASE (x)\nCASE (1)\nCASE DEFAULT\nEND SELECT")
-        reader.set_format(FortranFormat(True, True))  # free form, strict
-        select_line = reader.next()
-        self._case_line = reader.next()
-        self._case_default_line = reader.next()
-        end_select_line = reader.next()
+        (select_line, self._case_line, self._case_default_line,
+         end_select_line) = template_items(
+             "SELECT CASE (x)\nCASE (1)\nCASE DEFAULT\nEND SELECT")
         if self._typeselect:
             select = SelectType(parent.root, select_line)
         else:
@@ -1305,10 +1415,7 @@ class DoGen(BaseGen):
         :param str end: upper-limit of Do loop
         :param str step: increment to use in Do loop
         '''
-        reader = FortranStringReader("do i=1,n\nend do")
-        reader.set_format(FortranFormat(True, True))  # free form, strict
-        doline = reader.next()
-        enddoline = reader.next()
+        doline, enddoline = template_items("do i=1,n\nend do")
         dogen = fparser1.block_statements.Do(parent.root, doline)
         dogen.loopcontrol = variable_name + "=" + start + "," + end
         if step is not None:
@@ -1353,10 +1460,7 @@ class IfThenGen(BaseGen):
         :type parent: :py:class:`psyclone.f2pygen.BaseGen`
         :param str clause: the condition, xx, to evaluate in the if(xx)then
         '''
-        reader = FortranStringReader("if (dummy) then\nend if")
-        reader.set_format(FortranFormat(True, True))  # free form, strict
-        ifthenline = reader.next()
-        endifline = reader.next()
+        ifthenline, endifline = template_items("if (dummy) then\nend if")
 
         my_if = fparser1.block_statements.IfThen(parent.root, ifthenline)
         my_if.expr = clause
@@ -1396,11 +1500,9 @@ class AssignGen(BaseGen):
         :param bool pointer: whether or not this is a pointer assignment
         '''
         if pointer:
-            reader = FortranStringReader("lhs=>rhs")
+            myline = template_items("lhs=>rhs")[0]
         else:
-            reader = FortranStringReader("lhs=rhs")
-        reader.set_format(FortranFormat(True, True))  # free form, strict
-        myline = reader.next()
+            myline = template_items("lhs=rhs")[0]
         if pointer:
             self._assign = fparser1.statements.PointerAssignment(parent.root,
                                                                  myline)
@@ -50,6 +50,8 @@ import argparse
 import sys
 import os
 import traceback
+from fparser.common.base_classes import Statement
+from psyclone.f2pygen import fortran_lines, write_fortran
 from psyclone.parse import parse, ParseError
 from psyclone.psyGen import PSyFactory, GenerationError
 from psyclone.algGen import NoInvokesError
@@ -139,7 +141,8 @@ def generate(filename, api="", kernel_path="", script_name=None,
              line_length=False,
              distributed_memory=None,
              kern_out_path="",
-             kern_naming="multiple"):
+             kern_naming="multiple",
+             merge_invokes=None):
     # pylint: disable=too-many-arguments
     '''Takes a GungHo algorithm specification as input and outputs the
     associated generated algorithm and psy codes suitable for
@@ -170,6 +173,10 @@ def generate(filename, api="", kernel_path="", script_name=None,
                               kernel code.
     :param bool kern_naming: the scheme to use when re-naming transformed \
                              kernels.
+    :param bool merge_invokes: whether invoke calls that are made one \
+                               immediately after another are merged into \
+                               a single invoke. The default is set in the \
+                               config file.
     :return: 2-tuple containing fparser1 ASTs for the algorithm code and \
              the psy code.
     :rtype: (:py:class:`fparser.one.block_statements.BeginSource`, \
@@ -218,14 +225,21 @@ def generate(filename, api="", kernel_path="", script_name=None,
         from psyclone.algGen import Alg
         ast, invoke_info = parse(filename, api=api, invoke_name="invoke",
                                  kernel_path=kernel_path,
-                                 line_length=line_length)
+                                 line_length=line_length,
+                                 merge_invokes=merge_invokes)
         psy = PSyFactory(api, distributed_memory=distributed_memory)\
             .create(invoke_info)
         if script_name is not None:
             handle_script(script_name, psy)
 
         if api not in API_WITHOUT_ALGORITHM:
-            alg_gen = Alg(ast, psy).gen
+            alg = Alg(ast, psy)
+            if api == "dynamo0.3" and distributed_memory and \
+               Config.get().api_conf(api).propagate_halo_state:
+                from psyclone.dynamo0p3 import propagate_halo_state
+                for invokes in alg.invoke_sequences:
+                    propagate_halo_state(invokes)
+            alg_gen = alg.gen
         else:
             alg_gen = None
     except Exception:
@@ -234,6 +248,59 @@ def generate(filename, api="", kernel_path="", script_name=None,
     return alg_gen, psy.gen
 
 
+def code_string(code, line_length=False):
+    '''
+    Returns the generated code as a string.
+
+    :param code: the generated code.
+    :type code: str, None or :py:class:`fparser.common.base_classes.Statement`
+    :param bool line_length: whether to limit the line length to 132 \
+                             characters.
+    :returns: the Fortran code.
+    :rtype: str
+    '''
+    if line_length:
+        return "\n".join(FortLineLength().process_lines(code_lines(code)))
+    return str(code)
+
+
+def code_lines(code):
+    '''
+    :param code: the generated code.
+    :type code: str, None or :py:class:`fparser.common.base_classes.Statement`
+    :returns: the lines of the generated code. An fparser1 tree is \
+              converted one line at a time.
+    :rtype: iterable of str
+    '''
+    if isinstance(code, Statement):
+        return fortran_lines(code)
+    return str(code).split("\n")
+
+
+def write_code(code, stream, line_length=False):
+    '''
+    Writes the generated code to the supplied stream. If the code is an
+    fparser1 tree then it is streamed out line by line (with any long
+    lines wrapped as they are written) rather than being converted to a
+    single string first.
+
+    :param code: the generated code. Anything other than an fparser1 \
+                 tree (e.g. the algorithm code of an API that does not \
+                 have one, which is None) is written as its string.
+    :type code: str, None or :py:class:`fparser.common.base_classes.Statement`
+    :param stream: where to write the code.
+    :type stream: file-like object with a `write` method
+    :param bool line_length: whether to limit the line length to 132 \
+                             characters.
+    '''
+    if line_length:
+        FortLineLength().write(code_lines(code), stream)
+    elif isinstance(code, Statement):
+        write_fortran(code, stream)
+    else:
+        stream.write(str(code))
+
+
 def main(args):
     '''
     Parses and checks the command line arguments, calls the generate
@@ -419,29 +486,23 @@ def main(args):
         print("Stacktrace ...", file=sys.stderr)
         traceback.print_tb(exc_tb, limit=10, file=sys.stderr)
         exit(1)
-    if args.limit:
-        fll = FortLineLength()
-        psy_str = fll.process(str(psy))
-        alg_str = fll.process(str(alg))
-    else:
-        psy_str = str(psy)
-        alg_str = str(alg)
     if args.oalg is not None:
-        my_file = open(args.oalg, "w")
-        my_file.write(alg_str)
-        my_file.close()
+        with open(args.oalg, "w") as my_file:
+            write_code(alg, my_file, line_length=args.limit)
     else:
-        print("Transformed algorithm code:\n%s" % alg_str)
+        print("Transformed algorithm code:\n%s" %
+              code_string(alg, line_length=args.limit))
 
-    if not psy_str:
-        # empty file so do not output anything
+    if not isinstance(psy, Statement) and not str(psy):
+        # empty file so do not output anything (an fparser1 tree is
+        # never empty)
         pass
     elif args.opsy is not None:
-        my_file = open(args.opsy, "w")
-        my_file.write(psy_str)
-        my_file.close()
+        with open(args.opsy, "w") as my_file:
+            write_code(psy, my_file, line_length=args.limit)
     else:
-        print("Generated psy layer code:\n", psy_str)
+        print("Generated psy layer code:\n",
+              code_string(psy, line_length=args.limit))
 
 
 if __name__ == "__main__":
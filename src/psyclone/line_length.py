@@ -11,16 +11,18 @@ to allow the code to conform to the maximum line length limits (132
 for f90 free format is the default)'''
 
 
-def find_break_point(line, max_index, key_list):
-    ''' find the most appropriate break point for a fortran line '''
+def find_break_point(line, max_index, key_list, start=0):
+    ''' find the most appropriate break point for a fortran line. If
+    start is supplied then only the part of the line from that index
+    onwards is considered (and max_index is relative to it) '''
 
     for key in key_list:
-        idx = line.rfind(key, 0, max_index)
-        if idx > 0:
+        idx = line.rfind(key, start, start+max_index)
+        if idx > start:
             return idx+len(key)
     raise Exception(
         "Error in find_break_point. No suitable break point found"
-        " for line '" + line[:max_index] + "' and keys '" +
+        " for line '" + line[start:start+max_index] + "' and keys '" +
         str(key_list) + "'")
 
 
@@ -74,32 +76,69 @@ class FortLineLength(object):
         ''' takes fortran code as a string as input and output fortran
         code as a string with any long lines wrapped appropriately '''
 
-        fortran_out = ""
-        for line in fortran_in.split('\n'):
+        return "\n".join(self.process_lines(fortran_in.split('\n')))
+
+    def process_lines(self, lines):
+        '''
+        Generator that wraps any long lines in the supplied Fortran. The
+        lines are consumed one at a time so the complete code never has
+        to be held in memory.
+
+        :param lines: the lines of Fortran code. Any trailing newline \
+                      characters are ignored.
+        :type lines: iterable of str
+        :returns: the lines of Fortran (without newline characters) with \
+                  any long lines split over several lines.
+        :rtype: generator of str
+        '''
+        for line in lines:
+            line = line.rstrip("\n")
             if len(line) > self._line_length:
-                line_type = self._get_line_type(line)
-
-                c_start = self._cont_start[line_type]
-                c_end = self._cont_end[line_type]
-                key_list = self._key_lists[line_type]
-
-                break_point = find_break_point(
-                    line, self._line_length-len(c_end), key_list)
-                fortran_out += line[:break_point] + c_end + "\n"
-                line = line[break_point:]
-                while len(line) + len(c_start) > self._line_length:
-                    break_point = find_break_point(
-                        line, self._line_length-len(c_end)-len(c_start),
-                        key_list)
-                    fortran_out += c_start + line[:break_point] + c_end + "\n"
-                    line = line[break_point:]
-                if line:
-                    fortran_out += c_start + line + "\n"
+                for wrapped_line in self._wrap(line):
+                    yield wrapped_line
             else:
-                fortran_out += line + "\n"
-
-        # We add an extra newline so remove it when we return
-        return fortran_out[:-1]
+                yield line
+
+    def write(self, lines, stream):
+        '''
+        Writes the supplied Fortran to a stream with any long lines
+        wrapped. The result is the same as writing the string returned by
+        :py:meth:`process` for the same code.
+
+        :param lines: the lines of Fortran code.
+        :type lines: iterable of str
+        :param stream: where to write the code.
+        :type stream: file-like object with a `write` method
+        '''
+        separator = ""
+        for line in self.process_lines(lines):
+            stream.write(separator)
+            stream.write(line)
+            separator = "\n"
+
+    def _wrap(self, line):
+        ''' generator that splits a long line into lines that are no
+        longer than the allowed length, using the continuation characters
+        appropriate to the type of line. The line is not copied while
+        doing so, the start of the remaining text is simply moved on. '''
+        line_type = self._get_line_type(line)
+
+        c_start = self._cont_start[line_type]
+        c_end = self._cont_end[line_type]
+        key_list = self._key_lists[line_type]
+
+        break_point = find_break_point(
+            line, self._line_length-len(c_end), key_list)
+        yield line[:break_point] + c_end
+        start = break_point
+        while len(line) - start + len(c_start) > self._line_length:
+            break_point = find_break_point(
+                line, self._line_length-len(c_end)-len(c_start),
+                key_list, start=start)
+            yield c_start + line[start:break_point] + c_end
+            start = break_point
+        if start < len(line):
+            yield c_start + line[start:]
 
     def _get_line_type(self, line):
         ''' Classes lines into diffrent types. This is required as
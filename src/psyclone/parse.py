@@ -941,9 +941,66 @@ class FileInfo(object):
         return self._calls
 
 
+def adjacent_statements(first, second):
+    '''
+    :param first: a statement in the algorithm code.
+    :type first: :py:class:`fparser.one.statements.Call`
+    :param second: a later statement in the algorithm code.
+    :type second: :py:class:`fparser.one.statements.Call`
+    :returns: whether the second statement immediately follows the \
+              first in the same block, ignoring comments.
+    :rtype: bool
+
+    '''
+    if first.parent is not second.parent:
+        return False
+    content = second.parent.content
+    between = content[content.index(first)+1:content.index(second)]
+    return all(isinstance(stmt, fparser1.statements.Comment)
+               for stmt in between)
+
+
+def merge_adjacent_invokes(invokecalls):
+    '''
+    Merges invoke calls that are made one immediately after another in
+    the algorithm code (ignoring comments) into a single invoke call
+    containing the kernel calls of each of them in order. The
+    algorithm AST is updated to match: the arguments of the merged
+    invoke calls are appended to the first of them and the others are
+    removed. No other code can be executed in between the merged calls
+    so an argument that appears in more than one of them refers to the
+    same data and becomes a single argument of the merged invoke. Named
+    invokes are never merged as their name identifies a distinct
+    PSy-layer subroutine.
+
+    :param invokecalls: the invoke calls in the algorithm code.
+    :type invokecalls: :py:class:`collections.OrderedDict` mapping \
+        :py:class:`fparser.one.statements.Call` to \
+        :py:class:`psyclone.parse.InvokeCall`
+    :returns: the invoke calls after merging.
+    :rtype: :py:class:`collections.OrderedDict`
+
+    '''
+    from collections import OrderedDict
+    merged = OrderedDict()
+    previous = None
+    for statement, invoke in invokecalls.items():
+        if previous is not None and invoke.name is None and \
+           merged[previous].name is None and \
+           adjacent_statements(previous, statement):
+            merged[previous] = InvokeCall(merged[previous].kcalls +
+                                          invoke.kcalls)
+            previous.items = previous.items + statement.items
+            statement.parent.content.remove(statement)
+        else:
+            merged[statement] = invoke
+            previous = statement
+    return merged
+
+
 def parse(alg_filename, api="", invoke_name="invoke", inf_name="inf",
           kernel_path="", line_length=False,
-          distributed_memory=None):
+          distributed_memory=None, merge_invokes=None):
     '''Takes a GungHo algorithm specification as input and outputs an AST of
     this specification and an object containing information about the
     invocation calls in the algorithm specification and any associated kernel
@@ -964,6 +1021,10 @@ def parse(alg_filename, api="", invoke_name="invoke", inf_name="inf",
                              to make sure that it conforms and an
                              error raised if not. The default is
                              False.
+    :param bool merge_invokes: whether invoke calls that are made one \
+        immediately after another are merged into a single invoke (see \
+        :py:func:`psyclone.parse.merge_adjacent_invokes`). Defaults to \
+        the MERGE_INVOKES setting in the configuration file.
     :returns: 2-tuple consisting of the fparser1 AST of the Algorithm file \
               and an object holding details of the invokes found.
     :rtype: :py:class:`fparser.one.block_statements.BeginSource`, \
@@ -1250,6 +1311,10 @@ def parse(alg_filename, api="", invoke_name="invoke", inf_name="inf",
                                    argargs))
             invokecalls[statement] = InvokeCall(statement_kcalls,
                                                 name=invoke_label)
+    if merge_invokes is None:
+        merge_invokes = _config.merge_invokes
+    if merge_invokes:
+        invokecalls = merge_adjacent_invokes(invokecalls)
     return ast, FileInfo(container_name, invokecalls)
 
 
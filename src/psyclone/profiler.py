@@ -137,7 +137,8 @@ class ProfileNode(Node):
     '''This class can be inserted into a schedule to create profiling code.
     '''
 
-    def __init__(self, children=None, parent=None):
+    def __init__(self, children=None, parent=None, region_name=None,
+                 module_name=None):
         '''Constructor for a ProfileNode that is inserted in a schedule.
         Parameters:
             :param children: A list of children nodes for this node.
@@ -145,6 +146,10 @@ class ProfileNode(Node):
             or derived classes.
             :param parent: The parent of this node.
             :type parent: A :py::class::`psyclone.psyGen.Node`.
+            :param str region_name: Optional name of the region. If not \
+            given, the name of the first kernel in the region is used.
+            :param str module_name: Optional name of the module. If not \
+            given, the module of the first kernel in the region is used.
         '''
         Node.__init__(self, children=children, parent=parent)
 
@@ -156,10 +161,11 @@ class ProfileNode(Node):
 
         # Name of the region. In general at constructor time we might not
         # have a parent subroutine or a child for the kernel, so we leave
-        # the name empty for now. The region and module names are set the
-        # first time gen() is called (and then remain unchanged).
-        self._region_name = None
-        self._module_name = None
+        # the name empty for now (unless the caller supplied them). The
+        # region and module names are set the first time gen() is called
+        # (and then remain unchanged).
+        self._region_name = region_name
+        self._module_name = module_name
 
     # -------------------------------------------------------------------------
     def __str__(self):
@@ -170,6 +170,11 @@ def args_filter(arg_list, arg_types=None, arg_accesses=None, arg_meshes=None,
     :returns: list of kernel arguments matching the requirements
     :rtype: list of :py:class:`psyclone.parse.Descriptor`
     '''
+    # Sets make the membership tests below independent of the number
+    # of types/accesses/meshes requested
+    arg_types = set(arg_types) if arg_types else None
+    arg_accesses = set(arg_accesses) if arg_accesses else None
+    arg_meshes = set(arg_meshes) if arg_meshes else None
     arguments = []
     for argument in arg_list:
         if arg_types:
@@ -548,6 +553,102 @@ class NameSpace(object):
             self.add_reserved_name(name)
 
 
+class ArgumentRegistry(object):
+    '''
+    Indexes the arguments passed to the calls in the Schedule of an Invoke
+    so that the queries made while generating the PSy layer (unique
+    declarations by type and access, first access by name etc.) do not
+    each have to search every argument of every call. The results of
+    each query are kept until the calls in the Schedule change (e.g. as
+    the result of a transformation), at which point the registry is
+    rebuilt.
+
+    :param invoke: the Invoke whose arguments are indexed.
+    :type invoke: :py:class:`psyclone.psyGen.Invoke`
+    '''
+    def __init__(self, invoke):
+        self._invoke = invoke
+        # The calls that the current indexes were built from
+        self._calls = None
+        # Non-literal arguments, in the order in which they are passed
+        # to the calls, keyed by argument type
+        self._by_type = {}
+        # Cached results of the queries made of this registry
+        self._cache = {}
+
+    def _update(self):
+        ''' Rebuilds the indexes if the calls in the Schedule have
+        changed since they were last built. '''
+        calls = self._invoke.schedule.calls()
+        if self._calls is not None and len(calls) == len(self._calls) and \
+           all(call is old for call, old in zip(calls, self._calls)):
+            return
+        self._calls = calls
+        self._by_type = {}
+        self._cache = {}
+        for call in calls:
+            for arg in call.arguments.args:
+                if arg.text is not None:
+                    self._by_type.setdefault(arg.type, []).append(arg)
+
+    def _cached(self, key, compute):
+        '''
+        :param key: the key identifying a query.
+        :type key: hashable object
+        :param compute: function that computes the result of the query.
+        :type compute: function with no arguments
+        :returns: the (cached) result of the query.
+        '''
+        self._update()
+        if key not in self._cache:
+            self._cache[key] = compute()
+        return self._cache[key]
+
+    def unique_names(self, datatype, access=None,
+                     attribute="declaration_name"):
+        '''
+        :param str datatype: the type of argument.
+        :param str access: only consider arguments with this access if \
+                           supplied.
+        :param str attribute: the name of the argument property to return.
+        :returns: the unique values of the specified property of the \
+                  non-literal arguments of the specified type (and \
+                  access) in the order in which they are first encountered.
+        :rtype: list of str
+        '''
+        def compute():
+            ''' Searches the arguments of the requested type. '''
+            names = []
+            found = set()
+            for arg in self._by_type.get(datatype, []):
+                if not access or arg.access == access:
+                    name = getattr(arg, attribute)
+                    if name not in found:
+                        found.add(name)
+                        names.append(name)
+            return names
+        # Return a copy as callers are free to modify the list
+        return self._cached(("names", datatype, access, attribute),
+                            compute)[:]
+
+    def first_access(self, arg_name):
+        '''
+        :param str arg_name: the declaration name of an argument.
+        :returns: the first non-literal argument with the supplied name \
+                  or None if there is no such argument.
+        :rtype: :py:class:`psyclone.psyGen.Argument`
+        '''
+        def compute():
+            ''' Maps each name to the first argument that has it. '''
+            first = {}
+            for call in self._calls:
+                for arg in call.arguments.args:
+                    if arg.text is not None:
+                        first.setdefault(arg.declaration_name, arg)
+            return first
+        return self._cached("first", compute).get(arg_name)
+
+
 class Invoke(object):
     ''' Manage an individual invoke call '''
 
@@ -574,6 +675,7 @@ class Invoke(object):
 
         self._name = "invoke"
         self._alg_unique_args = []
+        self._arg_registry = ArgumentRegistry(self)
 
         if alg_invocation is None and idx is None:
             return
@@ -680,27 +782,16 @@ class Invoke(object):
                 "unique_declarations called with an invalid access type. "
                 "Expected one of '{0}' but got '{1}'".
                 format(VALID_ACCESS_DESCRIPTOR_NAMES, access))
-        declarations = []
-        for call in self.schedule.calls():
-            for arg in call.arguments.args:
-                if not access or arg.access == access:
-                    if arg.text is not None:
-                        if arg.type == datatype:
-                            test_name = arg.declaration_name
-                            if test_name not in declarations:
-                                declarations.append(test_name)
-        return declarations
+        return self._arg_registry.unique_names(datatype, access=access)
 
     def first_access(self, arg_name):
         ''' Returns the first argument with the specified name passed to
         a kernel in our schedule '''
-        for call in self.schedule.calls():
-            for arg in call.arguments.args:
-                if arg.text is not None:
-                    if arg.declaration_name == arg_name:
-                        return arg
-        raise GenerationError("Failed to find any kernel argument with name "
-                              "'{0}'".format(arg_name))
+        arg = self._arg_registry.first_access(arg_name)
+        if arg is None:
+            raise GenerationError("Failed to find any kernel argument with "
+                                  "name '{0}'".format(arg_name))
+        return arg
 
     def unique_declns_by_intent(self, datatype):
         '''
@@ -747,20 +838,26 @@ class Invoke(object):
         # Rationalise our lists so that any fields that are updated
         # (have inc or readwrite access) do not appear in the list
         # of those that are only written to
-        for arg in write_args[:]:
-            if arg in inc_args:
-                write_args.remove(arg)
+        inc_names = set(inc_args)
+        write_args = [arg for arg in write_args if arg not in inc_names]
         # Fields that are only ever read by any kernel that
         # accesses them
-        for arg in read_args[:]:
-            if arg in write_args or arg in inc_args:
-                read_args.remove(arg)
+        updated_names = inc_names.union(write_args)
+        read_args = [arg for arg in read_args if arg not in updated_names]
 
         # We will return a dictionary containing as many lists
         # as there are types of intent
         declns = {}
         for intent in FORTRAN_INTENT_NAMES:
             declns[intent] = []
+        # The names already added for each intent
+        added = set()
+
+        def add(intent, name):
+            ''' Adds name to the list for the intent if it is new. '''
+            if (intent, name) not in added:
+                added.add((intent, name))
+                declns[intent].append(name)
 
         for name in inc_args:
             # For every arg that is updated ('inc'd' or readwritten)
@@ -769,11 +866,9 @@ class Invoke(object):
             # intent(out), otherwise it is intent(inout)
             first_arg = self.first_access(name)
             if first_arg.access != MAPPING_ACCESSES["write"]:
-                if name not in declns["inout"]:
-                    declns["inout"].append(name)
+                add("inout", name)
             else:
-                if name not in declns["out"]:
-                    declns["out"].append(name)
+                add("out", name)
 
         for name in write_args:
             # For every argument that is written to by at least one kernel,
@@ -783,16 +878,13 @@ class Invoke(object):
             # do not consider those here.
             first_arg = self.first_access(name)
             if first_arg.access == MAPPING_ACCESSES["read"]:
-                if name not in declns["inout"]:
-                    declns["inout"].append(name)
+                add("inout", name)
             else:
-                if name not in declns["out"]:
-                    declns["out"].append(name)
+                add("out", name)
 
         for name in read_args:
             # Anything we have left must be declared as intent(in)
-            if name not in declns["in"]:
-                declns["in"].append(name)
+            add("in", name)
 
         return declns
 
@@ -1353,11 +1445,14 @@ class Node(object):
         return call_reduction_list
 
     def is_openmp_parallel(self):
-        '''Returns true if this Node is within an OpenMP parallel region.
+        '''Returns true if this Node is within an OpenMP parallel region
+        and is therefore executed by the team of threads. A Node within
+        an OpenMP task is executed by a single thread and so is not
+        considered to be parallel.
 
         '''
         omp_dir = self.ancestor(OMPParallelDirective)
-        if omp_dir:
+        if omp_dir and not self.ancestor(OMPTaskDirective):
             return True
         return False
 
@@ -1669,8 +1764,7 @@ class ACCDataDirective(ACCDirective):
         :param parent: node in the f2pygen AST to which to add node(s).
         :type parent: :py:class:`psyclone.f2pygen.BaseGen`
         '''
-        from psyclone.f2pygen import DeclGen, DirectiveGen, CommentGen, \
-            IfThenGen, AssignGen, CallGen, UseGen
+        from psyclone.f2pygen import CommentGen, CallGen, UseGen
 
         # We must generate a list of all of the fields accessed by
         # OpenACC kernels (calls within an OpenACC parallel directive)
@@ -1687,10 +1781,43 @@ class ACCDataDirective(ACCDirective):
             for var in pdir.ref_list:
                 if var not in var_list:
                     var_list.append(var)
-        # 3. Convert this list of objects into a comma-delimited string
+        # 3. Copy these to the device
+        self.gen_enter_data(parent, var_list)
+
+        # 4. Ensure that any scalars are up-to-date
+        var_list = []
+        for pdir in self._acc_dirs:
+            for var in pdir.scalars:
+                if var not in var_list:
+                    var_list.append(var)
+        if var_list:
+            # We need to 'use' the openacc module in order to access
+            # the OpenACC run-time library
+            parent.add(UseGen(parent, name="openacc", only=True,
+                              funcnames=["acc_update_device"]))
+            parent.add(
+                CommentGen(parent,
+                           " Ensure all scalars on the device are up-to-date"))
+            for var in var_list:
+                parent.add(CallGen(parent, "acc_update_device", [var, "1"]))
+            parent.add(CommentGen(parent, ""))
+
+    def gen_enter_data(self, parent, var_list):
+        '''
+        Adds the enter data directive that copies the supplied quantities
+        to the device to the f2pygen AST. The directive is only executed
+        the first time that the Invoke is called.
+
+        :param parent: node in the f2pygen AST to which to add node(s).
+        :type parent: :py:class:`psyclone.f2pygen.BaseGen`
+        :param var_list: the quantities to copy to the device.
+        :type var_list: list of str
+        '''
+        from psyclone.f2pygen import DeclGen, DirectiveGen, CommentGen, \
+            IfThenGen, AssignGen
         var_str = self.list_to_string(var_list)
 
-        # 4. Declare and initialise a logical variable to keep track of
+        # 1. Declare and initialise a logical variable to keep track of
         #    whether this is the first time we've entered this Invoke
         name_space_manager = NameSpaceFactory().create()
         first_time = name_space_manager.create_name(
@@ -1702,37 +1829,19 @@ class ACCDataDirective(ACCDirective):
         parent.add(CommentGen(parent,
                               " Ensure all fields are on the device and"))
         parent.add(CommentGen(parent, " copy them over if not."))
-        # 5. Put the enter data directive inside an if-block so that we
+        # 2. Put the enter data directive inside an if-block so that we
         #    only ever do it once
         ifthen = IfThenGen(parent, first_time)
         parent.add(ifthen)
         ifthen.add(DirectiveGen(ifthen, "acc", "begin", "enter data",
                                 "copyin("+var_str+")"))
-        # 6. Flag that we have now entered this routine at least once
+        # 3. Flag that we have now entered this routine at least once
         ifthen.add(AssignGen(ifthen, lhs=first_time, rhs=".false."))
-        # 7. Flag that the data is now on the device. This calls down
+        # 4. Flag that the data is now on the device. This calls down
         #    into the API-specific subclass of this class.
         self.data_on_device(ifthen)
         parent.add(CommentGen(parent, ""))
 
-        # 8. Ensure that any scalars are up-to-date
-        var_list = []
-        for pdir in self._acc_dirs:
-            for var in pdir.scalars:
-                if var not in var_list:
-                    var_list.append(var)
-        if var_list:
-            # We need to 'use' the openacc module in order to access
-            # the OpenACC run-time library
-            parent.add(UseGen(parent, name="openacc", only=True,
-                              funcnames=["acc_update_device"]))
-            parent.add(
-                CommentGen(parent,
-                           " Ensure all scalars on the device are up-to-date"))
-            for var in var_list:
-                parent.add(CallGen(parent, "acc_update_device", [var, "1"]))
-            parent.add(CommentGen(parent, ""))
-
     @abc.abstractmethod
     def data_on_device(self, parent):
         '''
@@ -1797,9 +1906,15 @@ class ACCParallelDirective(ACCDirective):
         # "default(present)" means that the compiler is to assume that
         # all data required by the parallel region is already present
         # on the device. If we've made a mistake and it isn't present
-        # then we'll get a run-time error.
+        # then we'll get a run-time error. Any quantities that are
+        # re-computed every time the PSy layer is called are copied in
+        # explicitly.
+        clauses = ["default(present)"]
+        copyin_list = self.copyin_list
+        if copyin_list:
+            clauses.append("copyin(" + self.list_to_string(copyin_list) + ")")
         parent.add(DirectiveGen(parent, "acc", "begin", "parallel",
-                                "default(present)"))
+                                ", ".join(clauses)))
 
         for child in self.children:
             child.gen_code(parent)
@@ -1827,6 +1942,24 @@ class ACCParallelDirective(ACCDirective):
                     variables.append(arg)
         return variables
 
+    @property
+    def copyin_list(self):
+        '''
+        Returns a list of the quantities required by the Kernel call(s)
+        that are children of this directive that are re-computed every
+        time the PSy layer is called and must therefore be copied to the
+        remote device on entry to the parallel region.
+
+        :returns: list of variable names
+        :rtype: list of str
+        '''
+        variables = []
+        for call in self.calls():
+            for arg in call.arguments.acc_copyin_args:
+                if arg not in variables:
+                    variables.append(arg)
+        return variables
+
     @property
     def fields(self):
         '''
@@ -1979,6 +2112,37 @@ class OMPDirective(Directive):
                             result.append(arg.name)
         return result
 
+    def _get_private_list(self):
+        '''
+        Returns the variable names used for any loops within a directive
+        and any variables that have been declared private by a Call
+        within the directive.
+
+        :return: list of variables to declare as thread private.
+        :rtype: list of str
+
+        :raises InternalError: if a Call has local variable(s) but they \
+                               aren't named.
+        '''
+        result = []
+        # get variable names from all loops that are a child of this node
+        for loop in self.loops():
+            # We must allow for implicit loops (e.g. in the NEMO API) that
+            # have no associated variable name
+            if loop.variable_name and \
+               loop.variable_name.lower() not in result:
+                result.append(loop.variable_name.lower())
+        # get variable names from all calls that are a child of this node
+        for call in self.calls():
+            for variable_name in call.local_vars():
+                if variable_name == "":
+                    raise InternalError(
+                        "call '{0}' has a local variable but its "
+                        "name is not set.".format(call.name))
+                if variable_name.lower() not in result:
+                    result.append(variable_name.lower())
+        return result
+
 
 class OMPParallelDirective(OMPDirective):
 
@@ -2044,7 +2208,10 @@ class OMPParallelDirective(OMPDirective):
             else:
                 names.append(name)
 
-        zero_reduction_variables(calls, parent)
+        # Reductions performed within an OpenMP task are initialised
+        # by the task itself
+        zero_reduction_variables(
+            [call for call in calls if call.is_openmp_parallel()], parent)
 
         parent.add(DirectiveGen(parent, "omp", "begin", "parallel",
                                 "default(shared), private({0})".
@@ -2057,9 +2224,12 @@ class OMPParallelDirective(OMPDirective):
             parent.add(AssignGen(parent, lhs=thread_idx,
                                  rhs="omp_get_thread_num()+1"))
 
-        first_type = type(self.children[0])
+        # A loop that encloses an OpenMP do loop (e.g. a loop over
+        # colours) is executed by every thread in the same way as an
+        # OpenMP do loop
+        first_type = self._child_type(self.children[0])
         for child in self.children:
-            if first_type != type(child):
+            if first_type != self._child_type(child):
                 raise NotImplementedError("Cannot correctly generate code"
                                           " for an OpenMP parallel region"
                                           " containing children of "
@@ -2070,42 +2240,29 @@ class OMPParallelDirective(OMPDirective):
 
         if reprod_red_call_list:
             parent.add(CommentGen(parent, ""))
-            parent.add(CommentGen(parent, " sum the partial results "
-                                  "sequentially"))
+            if Config.get().reprod_persistent_buffers:
+                parent.add(CommentGen(parent, " combine the partial "
+                                      "results pairwise"))
+            else:
+                parent.add(CommentGen(parent, " sum the partial results "
+                                      "sequentially"))
             parent.add(CommentGen(parent, ""))
             for call in reprod_red_call_list:
                 call.reduction_sum_loop(parent)
 
-    def _get_private_list(self):
+    @staticmethod
+    def _child_type(child):
         '''
-        Returns the variable names used for any loops within a directive
-        and any variables that have been declared private by a Call
-        within the directive.
-
-        :return: list of variables to declare as thread private.
-        :rtype: list of str
-
-        :raises InternalError: if a Call has local variable(s) but they \
-                               aren't named.
+        :param child: a child of this parallel region.
+        :type child: :py:class:`psyclone.psyGen.Node`
+        :returns: the type of the supplied child, where a loop that \
+                  encloses an orphaned OpenMP do directive is treated \
+                  as an OpenMP do directive.
+        :rtype: type
         '''
-        result = []
-        # get variable names from all loops that are a child of this node
-        for loop in self.loops():
-            # We must allow for implicit loops (e.g. in the NEMO API) that
-            # have no associated variable name
-            if loop.variable_name and \
-               loop.variable_name.lower() not in result:
-                result.append(loop.variable_name.lower())
-        # get variable names from all calls that are a child of this node
-        for call in self.calls():
-            for variable_name in call.local_vars():
-                if variable_name == "":
-                    raise InternalError(
-                        "call '{0}' has a local variable but its "
-                        "name is not set.".format(call.name))
-                if variable_name.lower() not in result:
-                    result.append(variable_name.lower())
-        return result
+        if isinstance(child, Loop) and child.encloses_omp_do():
+            return OMPDoDirective
+        return type(child)
 
     def _not_within_omp_parallel_region(self):
         ''' Check that this Directive is not within any other
@@ -2195,6 +2352,8 @@ class OMPDoDirective(OMPDirective):
             self._reprod = reprod
 
         self._omp_schedule = omp_schedule
+        # Whether the implicit barrier at the end of the loop is removed
+        self._nowait = False
 
         # Call the init method of the base class once we've stored
         # the OpenMP schedule
@@ -2218,8 +2377,12 @@ class OMPDoDirective(OMPDirective):
             reprod = "[reprod={0}]".format(self._reprod)
         else:
             reprod = ""
+        if self._nowait:
+            nowait = "[nowait]"
+        else:
+            nowait = ""
         print(self.indent(indent) + self.coloured_text +
-              "[OMP do]{0}".format(reprod))
+              "[OMP do]{0}{1}".format(reprod, nowait))
 
         for entity in self._children:
             entity.view(indent=indent + 1)
@@ -2239,6 +2402,36 @@ class OMPDoDirective(OMPDirective):
         ''' returns whether reprod has been set for this object or not '''
         return self._reprod
 
+    @property
+    def omp_schedule(self):
+        '''
+        :returns: the OpenMP schedule used by this loop directive.
+        :rtype: str
+        '''
+        return self._omp_schedule
+
+    @property
+    def nowait(self):
+        '''
+        :returns: whether the implicit barrier at the end of this loop \
+                  directive is removed (with a "nowait" clause).
+        :rtype: bool
+        '''
+        return self._nowait
+
+    @nowait.setter
+    def nowait(self, value):
+        '''
+        Set whether the implicit barrier at the end of this loop directive
+        is removed. This is only valid if no subsequent node in the
+        enclosing parallel region depends on the work done by this loop
+        on other threads (see
+        :py:class:`psyclone.transformations.Dynamo0p3OMPNowaitTrans`).
+
+        :param bool value: whether to add a "nowait" clause.
+        '''
+        self._nowait = value
+
     def gen_code(self, parent):
         '''
         Generate the f2pygen AST entries in the Schedule for this OpenMP do
@@ -2279,7 +2472,11 @@ class OMPDoDirective(OMPDirective):
 
         # make sure the directive occurs straight after the loop body
         position = parent.previous_loop()
-        parent.add(DirectiveGen(parent, "omp", "end", "do", ""),
+        if self._nowait:
+            end_options = "nowait"
+        else:
+            end_options = ""
+        parent.add(DirectiveGen(parent, "omp", "end", "do", end_options),
                    position=["after", position])
 
 
@@ -2398,6 +2595,171 @@ class OMPParallelDoDirective(OMPParallelDirective, OMPDoDirective):
         parent.content.insert(start_idx, self._ast)
 
 
+class OMPSingleDirective(OMPDirective):
+    '''
+    Class representing an OpenMP SINGLE directive in the PSyclone AST.
+    The children of this directive are encountered by only one thread
+    of the enclosing parallel region. It is used to create the OpenMP
+    tasks (see :py:class:`psyclone.psyGen.OMPTaskDirective`) that are
+    then executed by the whole team of threads.
+
+    '''
+    @property
+    def dag_name(self):
+        ''' Return the name to use in a dag for this node'''
+        return "OMP_single_" + str(self.abs_position)
+
+    def view(self, indent=0):
+        '''
+        Write out a textual summary of the OpenMP Single Directive and
+        then call the view() method of any children.
+
+        :param int indent: depth of indent for output text.
+        '''
+        print(self.indent(indent) + self.coloured_text + "[OMP single]")
+        for entity in self._children:
+            entity.view(indent=indent + 1)
+
+    def gen_code(self, parent):
+        '''
+        Generate the f2pygen AST entries in the Schedule for this OpenMP
+        single directive.
+
+        :param parent: the parent Node in the Schedule to which to add our \
+                       content.
+        :type parent: sub-class of :py:class:`psyclone.f2pygen.BaseGen`
+        :raises GenerationError: if this "!$omp single" is not enclosed \
+                                 within an OMP Parallel region.
+        '''
+        from psyclone.f2pygen import DirectiveGen
+
+        if not self.ancestor(OMPParallelDirective,
+                             excluding=[OMPParallelDoDirective]):
+            raise GenerationError("OMPSingleDirective must have an "
+                                  "OMPParallelDirective as ancestor")
+
+        parent.add(DirectiveGen(parent, "omp", "begin", "single", ""))
+        for child in self.children:
+            child.gen_code(parent)
+        parent.add(DirectiveGen(parent, "omp", "end", "single", ""))
+
+
+class OMPTaskDirective(OMPDirective):
+    '''
+    Class representing an OpenMP TASK directive in the PSyclone AST. The
+    children of the directive are executed by a single thread as an
+    OpenMP task. The order in which tasks are executed is constrained by
+    "depend" clauses that are constructed from the way in which the
+    arguments of the enclosed kernels, halo exchanges and global sums
+    are accessed, i.e. from the same information that is used to compute
+    the dependencies between the nodes of a Schedule.
+
+    A task containing a halo exchange or a global sum is undeferred
+    (it has an "if(.false.)" clause) so that the thread creating the
+    tasks waits for it to complete before creating any further tasks.
+    All communications are therefore performed in the order in which
+    they appear in the Schedule, whilst independent kernels may still
+    be executed by the other threads.
+
+    '''
+    @property
+    def dag_name(self):
+        ''' Return the name to use in a dag for this node'''
+        return "OMP_task_" + str(self.abs_position)
+
+    def view(self, indent=0):
+        '''
+        Write out a textual summary of the OpenMP Task Directive and then
+        call the view() method of any children.
+
+        :param int indent: depth of indent for output text.
+        '''
+        print(self.indent(indent) + self.coloured_text + "[OMP task]")
+        for entity in self._children:
+            entity.view(indent=indent + 1)
+
+    @property
+    def communicates(self):
+        '''
+        :returns: True if this task contains a halo exchange or a global \
+                  sum, False otherwise.
+        :rtype: bool
+        '''
+        return bool(self.walk(self.children, (HaloExchange, GlobalSum)))
+
+    def _get_depend_lists(self):
+        '''
+        Constructs the lists of variables that are read, written and both
+        read and written by the nodes within this task. Literal arguments
+        are ignored, as are arguments that are supplied by the PSy layer
+        rather than the Algorithm layer (and which are therefore only
+        read).
+
+        :returns: the names of the variables that are only read, only \
+                  written and both read and written within this task.
+        :rtype: 3-tuple of list of str
+        '''
+        read_types = [MAPPING_ACCESSES["read"], MAPPING_ACCESSES["readwrite"],
+                      MAPPING_ACCESSES["inc"]]
+        write_types = [MAPPING_ACCESSES["write"],
+                       MAPPING_ACCESSES["readwrite"],
+                       MAPPING_ACCESSES["inc"], MAPPING_REDUCTIONS["sum"]]
+        names = []
+        reads = set()
+        writes = set()
+        for node in self.walk(self.children, (Call, HaloExchange, GlobalSum)):
+            for arg in node.args:
+                if not isinstance(arg, KernelArgument) or arg.is_literal:
+                    continue
+                if arg.name not in names:
+                    names.append(arg.name)
+                if arg.access in read_types:
+                    reads.add(arg.name)
+                if arg.access in write_types:
+                    writes.add(arg.name)
+        in_list = [name for name in names if name not in writes]
+        out_list = [name for name in names if name not in reads]
+        inout_list = [name for name in names
+                      if name in reads and name in writes]
+        return in_list, out_list, inout_list
+
+    def gen_code(self, parent):
+        '''
+        Generate the f2pygen AST entries in the Schedule for this OpenMP
+        task directive.
+
+        :param parent: the parent Node in the Schedule to which to add our \
+                       content.
+        :type parent: sub-class of :py:class:`psyclone.f2pygen.BaseGen`
+        :raises GenerationError: if this "!$omp task" is not enclosed \
+                                 within an OMP Single region.
+        '''
+        from psyclone.f2pygen import DirectiveGen
+
+        if not self.ancestor(OMPSingleDirective):
+            raise GenerationError("OMPTaskDirective must have an "
+                                  "OMPSingleDirective as ancestor")
+
+        clauses = []
+        private_list = self._get_private_list()
+        if private_list:
+            clauses.append("private({0})".format(
+                self.list_to_string(private_list)))
+        for dep_type, dep_list in zip(["in", "out", "inout"],
+                                      self._get_depend_lists()):
+            if dep_list:
+                clauses.append("depend({0}: {1})".format(
+                    dep_type, self.list_to_string(dep_list)))
+        if self.communicates:
+            clauses.append("if(.false.)")
+
+        parent.add(DirectiveGen(parent, "omp", "begin", "task",
+                                ", ".join(clauses)))
+        for child in self.children:
+            child.gen_code(parent)
+        parent.add(DirectiveGen(parent, "omp", "end", "task", ""))
+
+
 class GlobalSum(Node):
     '''
     Generic Global Sum class which can be added to and manipulated
@@ -2842,14 +3204,14 @@ class Loop(Node):
     def unique_modified_args(self, mapping, arg_type):
         '''Return all unique arguments of type arg_type from Kernels in this
         loop that are modified'''
-        arg_names = []
+        arg_names = set()
         args = []
         for call in self.calls():
             for arg in call.arguments.args:
                 if arg.type.lower() == arg_type:
                     if arg.access.lower() != mapping["read"]:
                         if arg.name not in arg_names:
-                            arg_names.append(arg.name)
+                            arg_names.add(arg.name)
                             args.append(arg)
         return args
 
@@ -2858,7 +3220,7 @@ class Loop(Node):
         are not set then return all arguments. If unique is set to
         True then only return uniquely named arguments'''
         all_args = []
-        all_arg_names = []
+        all_arg_names = set()
         for call in self.calls():
             call_args = args_filter(call.arguments.args, arg_types,
                                     arg_accesses)
@@ -2866,11 +3228,28 @@ class Loop(Node):
                 for arg in call_args:
                     if arg.name not in all_arg_names:
                         all_args.append(arg)
-                        all_arg_names.append(arg.name)
+                        all_arg_names.add(arg.name)
             else:
                 all_args.extend(call_args)
         return all_args
 
+    def encloses_omp_do(self):
+        '''Returns True if this loop contains an OpenMP do directive that
+        is not itself a parallel region. Every thread of an enclosing
+        OpenMP parallel region then executes this loop and shares the
+        work of the enclosed OpenMP do loop, e.g. a loop over colours
+        within a parallel region containing an OpenMP do loop over the
+        cells of each colour.
+
+        :returns: whether this loop contains an orphaned OpenMP do \
+                  directive.
+        :rtype: bool
+        '''
+        for node in self.walk(self.children, OMPDoDirective):
+            if not isinstance(node, OMPParallelDoDirective):
+                return True
+        return False
+
     def gen_code(self, parent):
         '''
         Generate the Fortran Loop and any associated code.
@@ -3085,10 +3464,6 @@ class Call(Node):
         parent.add(AssignGen(parent, lhs=var_name, rhs=zero),
                    position=position)
         if self.reprod_reduction:
-            parent.add(DeclGen(parent, datatype=data_type,
-                               entity_decls=[local_var_name],
-                               allocatable=True, kind=kind_type,
-                               dimension=":,:"))
             nthreads = self._name_space_manager.create_name(
                 root_name="nthreads", context="PSyVars", label="nthreads")
             if Config.get().reprod_pad_size < 1:
@@ -3097,8 +3472,39 @@ class Call(Node):
                     "integer, but it is set to '{1}'.".format(
                         Config.get().filename, Config.get().reprod_pad_size))
             pad_size = str(Config.get().reprod_pad_size)
-            parent.add(AllocateGen(parent, local_var_name + "(" + pad_size +
-                                   "," + nthreads + ")"), position=position)
+            alloc_str = local_var_name + "(" + pad_size + "," + nthreads + ")"
+            if Config.get().reprod_persistent_buffers:
+                # The local reduction array is declared in the module so
+                # that it persists between calls. It is only
+                # (re-)allocated if it does not yet exist or the number
+                # of threads has changed.
+                from psyclone.f2pygen import ModuleGen, IfThenGen, \
+                    DeallocateGen
+                module = parent
+                while not isinstance(module, ModuleGen):
+                    module = module.parent
+                module.add(DeclGen(module, datatype=data_type,
+                                   entity_decls=[local_var_name],
+                                   allocatable=True, kind=kind_type,
+                                   dimension=":,:"))
+                if_allocated = IfThenGen(parent,
+                                         "allocated(" + local_var_name + ")")
+                parent.add(if_allocated, position=position)
+                if_resize = IfThenGen(if_allocated,
+                                      "size({0}, 2) /= {1}".format(
+                                          local_var_name, nthreads))
+                if_allocated.add(if_resize)
+                if_resize.add(DeallocateGen(if_resize, local_var_name))
+                if_new = IfThenGen(parent,
+                                   ".not. allocated(" + local_var_name + ")")
+                parent.add(if_new, position=position)
+                if_new.add(AllocateGen(if_new, alloc_str))
+            else:
+                parent.add(DeclGen(parent, datatype=data_type,
+                                   entity_decls=[local_var_name],
+                                   allocatable=True, kind=kind_type,
+                                   dimension=":,:"))
+                parent.add(AllocateGen(parent, alloc_str), position=position)
             parent.add(AssignGen(parent, lhs=local_var_name,
                                  rhs=zero), position=position)
 
@@ -3125,11 +3531,37 @@ class Call(Node):
                 "reduction_sum_loop(). Expected one of '{1}'".
                 format(reduction_access,
                        list(REDUCTION_OPERATOR_MAPPING.keys())))
-        do_loop = DoGen(parent, thread_idx, "1", nthreads)
-        do_loop.add(AssignGen(do_loop, lhs=var_name, rhs=var_name +
-                              reduction_operator + local_var_ref))
-        parent.add(do_loop)
-        parent.add(DeallocateGen(parent, local_var_name))
+        if Config.get().reprod_persistent_buffers:
+            # Combine the partial results pairwise in a fixed order
+            # (thread 1 with 2, 3 with 4, ... then 1 with 3, ...) so that
+            # the result only depends upon the number of threads. The
+            # local reduction array is kept for the next call.
+            from psyclone.f2pygen import DeclGen
+            level = self._name_space_manager.create_name(
+                root_name="th_lvl", context="PSyVars", label="thread_level")
+            parent.add(DeclGen(parent, datatype="integer",
+                               entity_decls=[level]))
+            stride = "2**" + level
+            tree_loop = DoGen(parent, level, "0",
+                              "bit_size({0})-leadz({0}-1)-1".format(nthreads))
+            parent.add(tree_loop)
+            pair_loop = DoGen(tree_loop, thread_idx, "1",
+                              nthreads + "-" + stride,
+                              step="2**(" + level + "+1)")
+            tree_loop.add(pair_loop)
+            pair_loop.add(AssignGen(
+                pair_loop, lhs=local_var_ref,
+                rhs=local_var_ref + reduction_operator + local_var_name +
+                "(1," + thread_idx + "+" + stride + ")"))
+            parent.add(AssignGen(parent, lhs=var_name,
+                                 rhs=var_name + reduction_operator +
+                                 local_var_name + "(1,1)"))
+        else:
+            do_loop = DoGen(parent, thread_idx, "1", nthreads)
+            do_loop.add(AssignGen(do_loop, lhs=var_name, rhs=var_name +
+                                  reduction_operator + local_var_ref))
+            parent.add(do_loop)
+            parent.add(DeallocateGen(parent, local_var_name))
 
     def _reduction_ref(self, name):
         '''Return the name unchanged if OpenMP is set to be unreproducible, as
@@ -3404,6 +3836,11 @@ class Kern(Call):
         coloured loop '''
         return self.parent.loop_type == "colour"
 
+    def is_tiled(self):
+        ''' Returns true if this kernel is being called from within a
+        loop over the cells of a (coloured) tile '''
+        return self.parent.loop_type == "tile"
+
     @property
     def ast(self):
         '''
@@ -3522,7 +3959,7 @@ class Kern(Call):
         # Generate the Fortran for this transformed kernel, ensuring that
         # we limit the line lengths
         fll = FortLineLength()
-        new_kern_code = fll.process(str(self.ast))
+        kern_lines = str(self.ast).split("\n")
 
         if not fdesc:
             # If we've not got a file descriptor at this point then that's
@@ -3532,7 +3969,7 @@ class Kern(Call):
             with open(os.path.join(Config.get().kernel_output_dir,
                                    new_name), "r") as ffile:
                 kern_code = ffile.read()
-                if kern_code != new_kern_code:
+                if kern_code != "\n".join(fll.process_lines(kern_lines)):
                     raise GenerationError(
                         "A transformed version of this Kernel '{0}' already "
                         "exists in the kernel-output directory ({1}) but is "
@@ -3545,10 +3982,10 @@ class Kern(Call):
                                Config.get().kernel_output_dir,
                                Config.get().kernel_naming))
         else:
-            # Write the modified AST out to file
-            os.write(fdesc, new_kern_code.encode())
-            # Close the new kernel file
-            os.close(fdesc)
+            # Write the modified AST out to file (this also closes the new
+            # kernel file)
+            with os.fdopen(fdesc, "w") as ffile:
+                fll.write(kern_lines, ffile)
 
     def _rename_ast(self, suffix):
         '''
@@ -3740,6 +4177,18 @@ class Arguments(object):
         raise NotImplementedError(
             "Arguments.acc_args must be implemented in sub-class")
 
+    @property
+    def acc_copyin_args(self):
+        '''
+        :returns: the list of quantities that are re-computed every time \
+                  the PSy layer is called and that must therefore be \
+                  copied to an OpenACC device on entry to any parallel \
+                  region containing the associated kernel. By default \
+                  there are none.
+        :rtype: list of str
+        '''
+        return []
+
     @property
     def scalars(self):
         '''
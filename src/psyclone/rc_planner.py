@@ -0,0 +1,535 @@
+# -----------------------------------------------------------------------------
+# BSD 3-Clause License
+#
+# Copyright (c) 2019, Science and Technology Facilities Council
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+# -----------------------------------------------------------------------------
+
+''' This module provides a planner that chooses the depth of redundant
+    computation for the loops of a dynamo0.3 invoke. A simple cost
+    model estimates the time taken by the halo exchanges and by the
+    loops of a schedule, and the redundant-computation choices that
+    minimise the estimated time are applied with
+    :py:class:`psyclone.transformations.Dynamo0p3RedundantComputationTrans`.
+'''
+
+from __future__ import absolute_import
+import itertools
+import math
+from psyclone.psyGen import GenerationError, HaloExchange, Loop, Node
+from psyclone.transformations import TransformationError, \
+    Dynamo0p3RedundantComputationTrans
+
+
+# =============================================================================
+class CostModel(object):
+    '''A simple performance model of a partition of a dynamo0.3 mesh.
+    The partition is assumed to be a square of owned cells so that the
+    number of cells in the first `depth` levels of the halo is
+    4*depth*(side+depth) where side = sqrt(ncells). The cost of a halo
+    exchange is `latency + byte_cost*bytes_per_halo_cell*halo_cells` and
+    the cost of a loop is `cell_cost*ncalls*cells`, where `ncalls` is the
+    number of kernel (or built-in) calls in the loop and `cells` the
+    number of cells it iterates over. Loops over dofs are costed as if
+    they iterated over the cells that own the dofs.
+
+    :param float latency: the fixed cost of a halo exchange.
+    :param float bytes_per_halo_cell: the number of bytes that are \
+                                      exchanged for each halo cell.
+    :param float cell_cost: the cost of one kernel call for one cell.
+    :param float byte_cost: the cost of exchanging one byte.
+    :param int ncells: the number of owned cells in a partition.
+    :param int halo_depth: the depth of the halo of the mesh. This is the \
+                           largest depth of redundant computation that \
+                           is considered and is also assumed for \
+                           accesses to the full halo and for stencils \
+                           whose extent is only known at run time.
+
+    :raises GenerationError: if any of the costs is negative.
+    :raises GenerationError: if ncells or halo_depth is not a positive \
+                             integer.
+    '''
+    def __init__(self, latency, bytes_per_halo_cell, cell_cost,
+                 byte_cost=1.0, ncells=10000, halo_depth=2):
+        for name, value in [("latency", latency),
+                            ("bytes_per_halo_cell", bytes_per_halo_cell),
+                            ("cell_cost", cell_cost),
+                            ("byte_cost", byte_cost)]:
+            if value < 0:
+                raise GenerationError(
+                    "CostModel: {0} must not be negative but got "
+                    "'{1}'".format(name, value))
+        for name, value in [("ncells", ncells), ("halo_depth", halo_depth)]:
+            if not isinstance(value, int) or value < 1:
+                raise GenerationError(
+                    "CostModel: {0} must be a positive integer but got "
+                    "'{1}'".format(name, value))
+        self._latency = latency
+        self._bytes_per_halo_cell = bytes_per_halo_cell
+        self._cell_cost = cell_cost
+        self._byte_cost = byte_cost
+        self._ncells = ncells
+        self._halo_depth = halo_depth
+        self._side = math.sqrt(ncells)
+
+    @property
+    def halo_depth(self):
+        ''' :returns: the depth of the halo of the mesh.
+        :rtype: int '''
+        return self._halo_depth
+
+    def halo_cells(self, depth):
+        '''
+        :param int depth: a depth of halo.
+        :returns: the number of cells in the first `depth` levels of the \
+                  halo.
+        :rtype: float
+        '''
+        return 4.0*depth*(self._side + depth)
+
+    def inner_cells(self, depth):
+        '''
+        :param int depth: a depth of inner halo.
+        :returns: the number of owned cells that are more than `depth` \
+                  cells from the edge of the partition.
+        :rtype: float
+        '''
+        return max(self._side - 2.0*depth, 0.0)**2
+
+    def _cells_before(self, loop):
+        '''
+        :param loop: a loop.
+        :type loop: :py:class:`psyclone.dynamo0p3.DynLoop`
+        :returns: the number of cells that precede the first cell of \
+                  the loop.
+        :rtype: float
+        '''
+        name = loop.lower_bound_name
+        index = loop.lower_bound_index
+        if name == "inner":
+            return self.inner_cells(index + 1)
+        if name == "ncells":
+            return self.inner_cells(1)
+        if name == "cell_halo":
+            return self._ncells + self.halo_cells(index - 1)
+        return 0.0
+
+    def _cells_to(self, loop):
+        '''
+        :param loop: a loop.
+        :type loop: :py:class:`psyclone.dynamo0p3.DynLoop`
+        :returns: the number of cells up to and including the last cell \
+                  of the loop.
+        :rtype: float
+        '''
+        from psyclone.dynamo0p3 import HALO_ACCESS_LOOP_BOUNDS
+        name = loop.upper_bound_name
+        if name == "inner":
+            return self.inner_cells(loop.upper_bound_halo_depth)
+        if name in HALO_ACCESS_LOOP_BOUNDS:
+            return self._ncells + self.halo_cells(
+                loop.upper_bound_halo_depth or self._halo_depth)
+        return self._ncells
+
+    def loop_cost(self, loop):
+        '''
+        :param loop: a loop containing kernel or built-in calls. A loop \
+                     over colours (or over colours of tiles or over the \
+                     tiles of a colour) has no cost of its own as it is \
+                     accounted for by the loop over cells that it \
+                     contains.
+        :type loop: :py:class:`psyclone.dynamo0p3.DynLoop`
+        :returns: the estimated cost of the loop.
+        :rtype: float
+        '''
+        if loop.loop_type in ["colours", "tilecolours", "tiles"]:
+            return 0.0
+        cells = self._cells_to(loop) - self._cells_before(loop)
+        return self._cell_cost * len(loop.calls()) * cells
+
+    def exchange_depth(self, exchange):
+        '''
+        :param exchange: a halo exchange.
+        :type exchange: :py:class:`psyclone.dynamo0p3.DynHaloExchange`
+        :returns: the depth of halo that the halo exchange is assumed \
+                  to exchange.
+        :rtype: int
+        '''
+        depth = 0
+        for info in exchange._compute_halo_read_depth_info():
+            if info.max_depth:
+                value = self._halo_depth
+            elif info.max_depth_m1:
+                value = self._halo_depth - 1
+            elif info.var_depth:
+                value = self._halo_depth
+            else:
+                value = info.literal_depth
+            depth = max(depth, value)
+        return depth
+
+    def exchange_cost(self, exchange):
+        '''
+        :param exchange: a halo exchange.
+        :type exchange: :py:class:`psyclone.dynamo0p3.DynHaloExchange`
+        :returns: the estimated cost of the halo exchange.
+        :rtype: float
+        '''
+        return self._latency + self._byte_cost * self._bytes_per_halo_cell \
+            * self.halo_cells(self.exchange_depth(exchange))
+
+    def estimate(self, schedule):
+        '''Estimates the time taken by a schedule. A halo exchange that
+        might not be required (as determined by a run-time check) is
+        costed as if it is required. An asynchronous halo exchange is
+        costed once (for its start) and no account is taken of any
+        overlap with computation.
+
+        :param schedule: the schedule to estimate the time of.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :returns: the estimated time.
+        :rtype: float
+        '''
+        from psyclone.dynamo0p3 import DynHaloExchangeEnd
+        time = 0.0
+        for exchange in schedule.walk(schedule.children, HaloExchange):
+            if not isinstance(exchange, DynHaloExchangeEnd):
+                time += self.exchange_cost(exchange)
+        for loop in schedule.walk(schedule.children, Loop):
+            time += self.loop_cost(loop)
+        return time
+
+
+# =============================================================================
+class RedundantComputationPlan(object):
+    '''The result of applying a
+    :py:class:`psyclone.rc_planner.RedundantComputationPlanner` to a
+    schedule.
+
+    :param list choices: (loop, old depth, new depth) for each loop whose \
+                         depth of redundant computation has been changed \
+                         (a depth of 0 means no redundant computation).
+    :param list removed: descriptions of the halo exchanges that have \
+                         been removed.
+    :param list added: descriptions of the halo exchanges that have been \
+                       added or whose depth has changed.
+    :param float time_before: the estimated time of the original schedule.
+    :param float time_after: the estimated time of the planned schedule.
+    :param float extra_work: the estimated cost of the additional \
+                             (redundant) computation.
+    '''
+    def __init__(self, choices, removed, added, time_before, time_after,
+                 extra_work):
+        self.choices = choices
+        self.removed = removed
+        self.added = added
+        self.time_before = time_before
+        self.time_after = time_after
+        self.extra_work = extra_work
+
+    def report(self):
+        '''
+        :returns: a description of the redundant computation that has \
+                  been added, the halo exchanges that have been removed \
+                  or added and the estimated times.
+        :rtype: str
+        '''
+        lines = []
+        for loop, old_depth, new_depth in self.choices:
+            lines.append("Loop over '{0}' ({1}): redundant computation "
+                         "depth {2} -> {3}".format(
+                             loop.field_name,
+                             ", ".join(call.name for call in loop.calls()),
+                             old_depth, new_depth))
+        for description in self.removed:
+            lines.append("Removed halo exchange of " + description)
+        for description in self.added:
+            lines.append("Added halo exchange of " + description)
+        lines.append("Extra computation: {0:g}".format(self.extra_work))
+        lines.append("Estimated time: {0:g} -> {1:g}".format(
+            self.time_before, self.time_after))
+        return "\n".join(lines)
+
+
+# =============================================================================
+class RedundantComputationPlanner(object):
+    '''Chooses the depth of redundant computation for each loop of a
+    dynamo0.3 schedule so as to minimise the time estimated by a
+    :py:class:`psyclone.rc_planner.CostModel`. Each loop to which
+    redundant computation can be applied may be left unchanged or may
+    compute redundantly to any greater depth (up to the depth of the
+    halo). Removing a halo exchange often requires several loops to be
+    changed together, each change on its own increasing the estimated
+    time, so if there are no more than `max_evaluations` combinations of
+    choices they are all evaluated and the best one is applied.
+    Otherwise a steepest descent is used: the single change that
+    reduces the estimated time the most is applied and this is repeated
+    until no change reduces the estimated time. For example:
+
+    >>> from psyclone.rc_planner import CostModel, \\
+    ...     RedundantComputationPlanner
+    >>> model = CostModel(latency=1.0e-5, bytes_per_halo_cell=8.0*40,
+    ...                   cell_cost=1.0e-8, byte_cost=1.0e-10,
+    ...                   ncells=96*96, halo_depth=2)
+    >>> plan = RedundantComputationPlanner(model).apply(schedule)
+    >>> print(plan.report())
+
+    Loops that contain a reduction and loops that can not be
+    transformed (e.g. because directives have already been added) are
+    left unchanged.
+
+    :param cost_model: the cost model used to estimate times.
+    :type cost_model: :py:class:`psyclone.rc_planner.CostModel`
+    :param int max_evaluations: the largest number of combinations of \
+                                choices for which every combination is \
+                                evaluated.
+    '''
+    def __init__(self, cost_model, max_evaluations=1000):
+        self._cost_model = cost_model
+        self._max_evaluations = max_evaluations
+        self._trans = Dynamo0p3RedundantComputationTrans()
+
+    @staticmethod
+    def _depth(loop):
+        '''
+        :param loop: a loop.
+        :type loop: :py:class:`psyclone.dynamo0p3.DynLoop`
+        :returns: the depth of redundant computation of the loop (0 if \
+                  there is none).
+        :rtype: int
+        '''
+        from psyclone.dynamo0p3 import HALO_ACCESS_LOOP_BOUNDS
+        if loop.upper_bound_name in HALO_ACCESS_LOOP_BOUNDS:
+            return loop.upper_bound_halo_depth
+        return 0
+
+    def _options(self, schedule):
+        '''
+        :param schedule: the schedule being planned.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :returns: each loop in the schedule whose depth of redundant \
+                  computation can be increased, with the valid new depths.
+        :rtype: list of (:py:class:`psyclone.dynamo0p3.DynLoop`, list of \
+                int)
+        '''
+        options = []
+        for loop in schedule.walk(schedule.children, Loop):
+            if loop.loop_type == "colours" or \
+               any(call.is_reduction for call in loop.calls()):
+                continue
+            depth = self._depth(loop)
+            if depth is None:
+                # Already computing to the full depth of the halo
+                continue
+            depths = []
+            for new_depth in range(depth+1, self._cost_model.halo_depth+1):
+                try:
+                    self._trans._validate(loop, new_depth)
+                except TransformationError:
+                    continue
+                depths.append(new_depth)
+            if depths:
+                options.append((loop, depths))
+        return options
+
+    @staticmethod
+    def _save(schedule):
+        '''
+        :param schedule: a schedule.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :returns: the children of each node of the schedule and the upper \
+                  bound of each loop, from which the schedule can be \
+                  restored after a redundant computation transformation.
+        :rtype: 2-tuple of lists
+        '''
+        nodes = [schedule] + schedule.walk(schedule.children, Node)
+        children = [(node, node.children[:]) for node in nodes]
+        bounds = [(loop, loop.upper_bound_name, loop.upper_bound_halo_depth)
+                  for loop in schedule.walk(schedule.children, Loop)]
+        return children, bounds
+
+    @staticmethod
+    def _restore(state):
+        '''Restores a schedule to a state returned by `_save`.
+
+        :param state: the saved state of the schedule.
+        :type state: 2-tuple of lists
+        '''
+        children, bounds = state
+        for node, node_children in children:
+            node.children[:] = node_children
+        for loop, name, depth in bounds:
+            loop.set_upper_bound(name, depth)
+
+    @staticmethod
+    def _describe(exchange):
+        '''
+        :param exchange: a halo exchange.
+        :type exchange: :py:class:`psyclone.dynamo0p3.DynHaloExchange`
+        :returns: the field (and vector component) and depth of the halo \
+                  exchange.
+        :rtype: str
+        '''
+        field_id = exchange.field.name
+        if exchange.vector_index:
+            field_id += "({0})".format(exchange.vector_index)
+        return "'{0}' (depth={1})".format(field_id,
+                                          exchange._compute_halo_depth())
+
+    def _trial(self, schedule, changes):
+        '''Estimates the time of the supplied schedule with the supplied
+        changes made to it and then restores the schedule.
+
+        :param schedule: the schedule being planned.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :param changes: the loops to transform and their new depths.
+        :type changes: list of (:py:class:`psyclone.dynamo0p3.DynLoop`, \
+                       int)
+        :returns: the estimated time or None if the changes can not be \
+                  made together.
+        :rtype: float or NoneType
+        '''
+        state = self._save(schedule)
+        try:
+            for loop, depth in changes:
+                self._trans.apply(loop, depth)
+            time = self._cost_model.estimate(schedule)
+        except TransformationError:
+            time = None
+        self._restore(state)
+        return time
+
+    def _exhaustive(self, schedule, options, time):
+        '''Evaluates every combination of the supplied options and makes
+        the changes of the one with the smallest estimated time if that
+        is smaller than the supplied time.
+
+        :param schedule: the schedule being planned.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :param options: each loop with its valid new depths.
+        :type options: list of (:py:class:`psyclone.dynamo0p3.DynLoop`, \
+                       list of int)
+        :param float time: the estimated time of the schedule.
+        :returns: the estimated time of the transformed schedule.
+        :rtype: float
+        '''
+        best = []
+        loops = [loop for loop, _ in options]
+        for choice in itertools.product(*[[None] + depths
+                                          for _, depths in options]):
+            changes = [(loop, depth) for loop, depth in zip(loops, choice)
+                       if depth]
+            if not changes:
+                continue
+            trial_time = self._trial(schedule, changes)
+            if trial_time is not None and trial_time < time:
+                best = changes
+                time = trial_time
+        for loop, depth in best:
+            self._trans.apply(loop, depth)
+        return time
+
+    def _descent(self, schedule, time):
+        '''Repeatedly makes the single change of depth that reduces the
+        estimated time the most until no change reduces it.
+
+        :param schedule: the schedule being planned.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :param float time: the estimated time of the schedule.
+        :returns: the estimated time of the transformed schedule.
+        :rtype: float
+        '''
+        while True:
+            best = None
+            for loop, depths in self._options(schedule):
+                for depth in depths:
+                    trial_time = self._trial(schedule, [(loop, depth)])
+                    if trial_time is not None and trial_time < time:
+                        best = (loop, depth)
+                        time = trial_time
+            if best is None:
+                return time
+            self._trans.apply(*best)
+
+    def apply(self, schedule):
+        '''Searches for and applies the redundant computation that
+        minimises the estimated time of the supplied schedule.
+
+        :param schedule: the schedule to transform.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :returns: a description of the changes that have been made.
+        :rtype: :py:class:`psyclone.rc_planner.RedundantComputationPlan`
+        :raises GenerationError: if the supplied node is not a dynamo0.3 \
+                                 schedule.
+        '''
+        from psyclone.dynamo0p3 import DynSchedule, DynHaloExchangeEnd
+        if not isinstance(schedule, DynSchedule):
+            raise GenerationError(
+                "RedundantComputationPlanner: the supplied node must be a "
+                "dynamo0.3 schedule but found '{0}'".format(type(schedule)))
+        model = self._cost_model
+
+        def exchanges():
+            ''' :returns: the halo exchanges and their descriptions. '''
+            return [(exchange, self._describe(exchange)) for exchange in
+                    schedule.walk(schedule.children, HaloExchange)
+                    if not isinstance(exchange, DynHaloExchangeEnd)]
+
+        loops = schedule.walk(schedule.children, Loop)
+        old_depths = [self._depth(loop) for loop in loops]
+        work_before = sum(model.loop_cost(loop) for loop in loops)
+        exchanges_before = exchanges()
+        time_before = model.estimate(schedule)
+
+        options = self._options(schedule)
+        combinations = 1
+        for _, depths in options:
+            combinations *= len(depths) + 1
+        if combinations <= self._max_evaluations:
+            time = self._exhaustive(schedule, options, time_before)
+        else:
+            time = self._descent(schedule, time_before)
+
+        choices = [(loop, old_depth, self._depth(loop)) for loop, old_depth
+                   in zip(loops, old_depths)
+                   if self._depth(loop) != old_depth]
+        # A halo exchange has been removed if it is no longer in the
+        # schedule and added if it is new or its depth has changed
+        before = dict((id(exchange), description)
+                      for exchange, description in exchanges_before)
+        after = exchanges()
+        after_ids = set(id(exchange) for exchange, _ in after)
+        removed = [description for exchange, description in exchanges_before
+                   if id(exchange) not in after_ids]
+        added = [description for exchange, description in after
+                 if before.get(id(exchange)) != description]
+        work_after = sum(model.loop_cost(loop) for loop in loops)
+        return RedundantComputationPlan(choices, removed, added, time_before,
+                                        time, work_after - work_before)
@@ -429,3 +429,85 @@ def test_zero_invoke_dynamo0p1():
             os.path.join(os.path.dirname(os.path.abspath(__file__)),
                          "test_files", "dynamo0p1", "missing_invokes.f90"),
             api="dynamo0.1")
+
+
+def test_invoke_sequences():
+    ''' Check that the invokes that are called one immediately after
+    another (ignoring comments) in the same block are found. '''
+    from psyclone.algGen import Alg
+    from psyclone.parse import parse
+    from psyclone.psyGen import PSyFactory
+    ast, info = parse(os.path.join(BASE_PATH,
+                                   "3.5_multi_invokes_halo_state.f90"),
+                      api="dynamo0.3")
+    psy = PSyFactory("dynamo0.3").create(info)
+    alg = Alg(ast, psy)
+    invokes = psy.invokes.invoke_list
+    assert alg.invoke_sequences == [invokes[0:2], [invokes[2]],
+                                    [invokes[3]]]
+    # The sequences are still available once the invoke calls have
+    # been re-written
+    gen = str(alg.gen)
+    assert "CALL invoke_1_testkern_type(a, f3, f1, f2, m2)" in gen
+    assert alg.invoke_sequences == [invokes[0:2], [invokes[2]],
+                                    [invokes[3]]]
+
+
+def test_merge_invokes():
+    ''' Check that invokes that are called one immediately after another
+    (ignoring comments) in the same block are merged into a single
+    invoke when requested and that their arguments are unified. '''
+    alg, psy = generate(os.path.join(BASE_PATH,
+                                     "3.5_multi_invokes_halo_state.f90"),
+                        api="dynamo0.3", merge_invokes=True)
+    gen = str(alg)
+    assert gen.count("CALL invoke") == 3
+    assert ("    CALL invoke_0(a, f1, f2, m1, m2, f3)\n"
+            "    ! This invoke reads the halos of f1, f2 and m2\n"
+            "\n"
+            "    IF (flag) THEN\n"
+            "      CALL invoke_1_testkern_type(a, f1, f2, m1, m2)\n"
+            "    END IF \n"
+            "    CALL invoke_2_testkern_type(a, f1, f2, m1, m2)\n") in gen
+    gen = str(psy)
+    assert "SUBROUTINE invoke_0(a, f1, f2, m1, m2, f3)" in gen
+    assert "TYPE(field_type), intent(inout) :: f1, f3" in gen
+    assert ("CALL testkern_code(nlayers, a, f1_proxy%data, f2_proxy%data, "
+            "m1_proxy%data, m2_proxy%data" in gen)
+    assert ("CALL testkern_code(nlayers, a, f3_proxy%data, f1_proxy%data, "
+            "f2_proxy%data, m2_proxy%data" in gen)
+
+
+def test_merge_invokes_named_and_config(monkeypatch):
+    ''' Check that invokes are merged by default if MERGE_INVOKES is set
+    in the configuration file and that named invokes are not merged. '''
+    from psyclone.configuration import Config
+    from psyclone.parse import parse
+    monkeypatch.setattr(Config.get(), "_merge_invokes", True)
+    _, info = parse(os.path.join(BASE_PATH,
+                                 "3.5_multi_invokes_halo_state.f90"),
+                    api="dynamo0.3")
+    assert len(info.calls) == 3
+    assert len(list(info.calls.values())[0].kcalls) == 2
+    _, info = parse(os.path.join(BASE_PATH,
+                                 "3.5_multi_invokes_halo_state.f90"),
+                    api="dynamo0.3", merge_invokes=False)
+    assert len(info.calls) == 4
+    _, info = parse(os.path.join(BASE_PATH,
+                                 "3.2_multi_functions_multi_named_invokes."
+                                 "f90"),
+                    api="dynamo0.3")
+    assert [invoke.name for invoke in info.calls.values()] == \
+        ["invoke_my_first", "invoke_my_second"]
+
+
+def test_merge_invokes_gocean():
+    ''' Check that adjacent invokes are also merged for the GOcean API. '''
+    alg, psy = generate(os.path.join(os.path.dirname(os.path.abspath(
+        __file__)), "test_files", "gocean1p0",
+                                     "test12_two_invokes_two_kernels.f90"),
+                        api="gocean1.0", merge_invokes=True)
+    assert str(alg).count("CALL invoke") == 1
+    assert "CALL invoke_0(cu_fld, p_fld, u_fld, cv_fld, v_fld)" in str(alg)
+    assert "SUBROUTINE invoke_0(cu_fld, p_fld, u_fld, cv_fld, v_fld)" in \
+        str(psy)
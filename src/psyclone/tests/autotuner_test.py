@@ -0,0 +1,261 @@
+# -----------------------------------------------------------------------------
+# BSD 3-Clause License
+#
+# Copyright (c) 2019, Science and Technology Facilities Council
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+# -----------------------------------------------------------------------------
+
+''' Module containing tests for the empirical autotuner '''
+
+from __future__ import absolute_import
+
+import os
+import pytest
+
+from psyclone.autotuner import Autotuner, Recipe, main, parse_timings, \
+    script_text, search_space
+from psyclone.generator import generate
+from psyclone.profiler import ProfileNode
+from psyclone.psyGen import GenerationError, Loop, OMPParallelDoDirective
+from psyclone_test_utils import get_invoke
+
+API = "dynamo0.3"
+BASE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         "test_files", "dynamo0p3")
+
+TIMING_OUTPUT = (
+    " ===========================================\n"
+    " module::region            \tcount\t\tsum\t\t\tmin\t\taverage\t\t\tmax\n"
+    " autotune::invoke_0        10\t 1.50000000\t 0.100000001\t"
+    " 0.150000006\t 0.200000003\n"
+    " autotune::invoke_1:kern   2\t 3.00000000\t 1.00000000\t"
+    " 1.50000000\t 2.00000000\n"
+    " psy_mod::other            1\t 9.00000000\t 9.00000000\t"
+    " 9.00000000\t 9.00000000\n"
+    " ===========================================\n")
+
+
+def test_recipe_errors():
+    ''' Check that invalid recipes are rejected. '''
+    with pytest.raises(GenerationError) as err:
+        Recipe(omp_schedule="fast")
+    assert "OpenMP schedule must be one of" in str(err.value)
+    with pytest.raises(GenerationError) as err:
+        Recipe(redundant_depth=0)
+    assert "redundant_depth must be a positive integer" in str(err.value)
+    with pytest.raises(GenerationError) as err:
+        Recipe(redundant_depth="1")
+    assert "redundant_depth must be a positive integer" in str(err.value)
+
+
+def test_recipe_repr_eq():
+    ''' Check that the representation of a recipe can be used to
+    re-create it and that equality is based on the settings. '''
+    recipe = Recipe(omp_schedule="dynamic,4", colour=True, fuse=False,
+                    redundant_depth=2)
+    # pylint: disable=eval-used
+    assert eval(repr(recipe)) == recipe
+    assert recipe != Recipe(omp_schedule="dynamic,4", colour=True)
+    assert recipe.omp_schedule == "dynamic,4"
+    assert recipe.colour
+    assert not recipe.fuse
+    assert recipe.redundant_depth == 2
+
+
+def test_search_space():
+    ''' Check the creation of the search space. '''
+    recipes = search_space()
+    # Serial plus five OpenMP schedules, each with colour and fuse on/off
+    assert len(recipes) == 24
+    assert len(set(recipes)) == 24
+    recipes = search_space(omp_schedules=[None, "static"], colour=(True,),
+                           fuse=(False,), redundant_depths=(None, 1, 1))
+    assert recipes == [Recipe(colour=True),
+                       Recipe(colour=True, redundant_depth=1),
+                       Recipe(omp_schedule="static", colour=True),
+                       Recipe(omp_schedule="static", colour=True,
+                              redundant_depth=1)]
+
+
+@pytest.mark.parametrize("dist_mem", [False, True])
+def test_recipe_apply_colour_omp(dist_mem):
+    ''' Check that colouring and OpenMP are applied to all loops
+    and that the profile region is named after the invoke. '''
+    from psyclone.parse import parse
+    from psyclone.psyGen import PSyFactory
+    _, info = parse(os.path.join(BASE_PATH, "4.6_multikernel_invokes.f90"),
+                    api=API)
+    psy = PSyFactory(API, distributed_memory=dist_mem).create(info)
+    schedule = Recipe(omp_schedule="guided", colour=True).apply(
+        psy.invokes.invoke_list[0].schedule, profile=True)
+    assert isinstance(schedule.children[0], ProfileNode)
+    loops = [node for node in schedule.walk(schedule.children, Loop)
+             if node.loop_type == "colours"]
+    assert len(loops) == 2
+    for loop in loops:
+        assert isinstance(loop.children[0], OMPParallelDoDirective)
+    code = str(psy.gen)
+    assert "CALL ProfileStart(\"autotune\", \"invoke_0\", profile)" in code
+    assert "schedule(guided)" in code
+
+
+def test_recipe_apply_skips_invalid():
+    ''' Check that OpenMP is skipped for loops that require colouring
+    when colouring is disabled. '''
+    psy, invoke = get_invoke("4.6_multikernel_invokes.f90", API, idx=0)
+    schedule = Recipe(omp_schedule="static").apply(invoke.schedule)
+    assert not schedule.walk(schedule.children, OMPParallelDoDirective)
+    assert "omp parallel do" not in str(psy.gen)
+
+
+def test_recipe_apply_fuse_redundant():
+    ''' Check that loops are fused and that redundant computation is
+    applied. '''
+    from psyclone.parse import parse
+    from psyclone.psyGen import PSyFactory
+    _, info = parse(os.path.join(BASE_PATH, "4_multikernel_invokes.f90"),
+                    api=API)
+    psy = PSyFactory(API, distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    schedule = Recipe(fuse=True).apply(schedule)
+    loops = [node for node in schedule.children if isinstance(node, Loop)]
+    assert len(loops) == 1
+    assert len(loops[0].children) == 2
+
+    _, info = parse(os.path.join(BASE_PATH, "1_single_invoke.f90"),
+                    api=API)
+    psy = PSyFactory(API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    schedule = Recipe(redundant_depth=2).apply(schedule)
+    assert schedule.walk(schedule.children, Loop)[0].upper_bound_halo_depth \
+        == 2
+
+
+def test_parse_timings():
+    ''' Check that the output of the simple_timing library is parsed. '''
+    timings = parse_timings(TIMING_OUTPUT)
+    assert timings == {"invoke_0": 1.5}
+    assert parse_timings(TIMING_OUTPUT, module_name="psy_mod") == \
+        {"other": 9.0}
+    assert parse_timings("no timing here") == {}
+
+
+def test_script_text(tmpdir):
+    ''' Check that the created script can be used by the generator. '''
+    script = os.path.join(str(tmpdir), "tuned_trans.py")
+    with open(script, "w") as sfile:
+        sfile.write(script_text(
+            {"invoke_0": Recipe(omp_schedule="dynamic", colour=True)}))
+    _, psy = generate(os.path.join(BASE_PATH, "4.6_multikernel_invokes.f90"),
+                      api=API, script_name=script)
+    code = str(psy)
+    assert "schedule(dynamic)" in code
+    assert "ProfileStart" not in code
+
+
+def test_autotuner(tmpdir):
+    ''' Check the complete tuning cycle using shell commands that emulate
+    the build and run steps. The 'run' is faster when the PSy layer
+    contains a dynamic OpenMP schedule. '''
+    work_dir = str(tmpdir)
+    run_cmd = ("if grep -q 'schedule(dynamic)' psy.f90; then t=1.0; "
+               "else t=2.0; fi; "
+               "echo \" autotune::invoke_0  1  $t  $t  $t  $t\"")
+    with pytest.raises(GenerationError) as err:
+        Autotuner("alg.f90", "true", run_cmd, "alg.f90", "psy.f90",
+                  repeat=0)
+    assert "number of repeats must be at least 1" in str(err.value)
+    tuner = Autotuner(os.path.join(BASE_PATH, "4.6_multikernel_invokes.f90"),
+                      "true", run_cmd, os.path.join(work_dir, "alg.f90"),
+                      os.path.join(work_dir, "psy.f90"), work_dir=work_dir,
+                      repeat=2)
+    best = tuner.tune(search_space(omp_schedules=["static", "dynamic"],
+                                   colour=(True,), fuse=(False,)))
+    assert best == {"invoke_0": (Recipe(omp_schedule="dynamic", colour=True),
+                                 1.0)}
+    assert len(tuner.results) == 2
+    assert os.path.isfile(os.path.join(work_dir, "alg.f90"))
+
+    # A failing build is reported and the recipe ignored
+    tuner = Autotuner(os.path.join(BASE_PATH, "4.6_multikernel_invokes.f90"),
+                      "false", run_cmd, os.path.join(work_dir, "alg.f90"),
+                      os.path.join(work_dir, "psy.f90"), work_dir=work_dir)
+    assert tuner.tune([Recipe()]) == {}
+    with pytest.raises(GenerationError) as err:
+        tuner.evaluate(Recipe())
+    assert "command 'false' failed with exit status 1" in str(err.value)
+
+
+def test_autotuner_removes_scripts(tmpdir, monkeypatch):
+    ''' Check that the temporary directory holding the transformation
+    script of each variant is removed, even if generation fails. '''
+    import tempfile
+    work_dir = str(tmpdir.mkdir("work"))
+    temp_dir = str(tmpdir.mkdir("temp"))
+    monkeypatch.setattr(tempfile, "tempdir", temp_dir)
+    tuner = Autotuner(os.path.join(BASE_PATH, "4.6_multikernel_invokes.f90"),
+                      "true", "true", os.path.join(work_dir, "alg.f90"),
+                      os.path.join(work_dir, "psy.f90"), work_dir=work_dir)
+    tuner.generate(Recipe())
+    assert os.listdir(temp_dir) == []
+    tuner = Autotuner(os.path.join(BASE_PATH, "does_not_exist.f90"),
+                      "true", "true", os.path.join(work_dir, "alg.f90"),
+                      os.path.join(work_dir, "psy.f90"), work_dir=work_dir)
+    with pytest.raises(IOError):
+        tuner.generate(Recipe())
+    assert os.listdir(temp_dir) == []
+
+
+def test_main(tmpdir, capsys):
+    ''' Check the command-line interface. '''
+    work_dir = str(tmpdir)
+    alg_file = os.path.join(BASE_PATH, "4.6_multikernel_invokes.f90")
+    script = os.path.join(work_dir, "best.py")
+    args = [alg_file, "--build", "true", "--workdir", work_dir,
+            "-oalg", os.path.join(work_dir, "alg.f90"),
+            "-opsy", os.path.join(work_dir, "psy.f90"),
+            "--schedules", "none:dynamic,2", "-o", script]
+    run = "echo ' autotune::invoke_0 1 0.5 0.5 0.5 0.5'"
+    main(args + ["--run", run])
+    out, _ = capsys.readouterr()
+    assert "Best recipe per invoke:" in out
+    assert "invoke_0: Recipe(omp_schedule=None" in out
+    with open(script) as sfile:
+        assert "'invoke_0': Recipe(" in sfile.read()
+
+    with pytest.raises(SystemExit):
+        main(args + ["--run", "true"])
+    _, err = capsys.readouterr()
+    assert "No timing information was obtained" in err
+
+    with pytest.raises(SystemExit):
+        main(args + ["--run", "true", "--depths", "one"])
+    _, err = capsys.readouterr()
+    assert "invalid literal" in err
@@ -0,0 +1,117 @@
+# -----------------------------------------------------------------------------
+# BSD 3-Clause License
+#
+# Copyright (c) 2019, Science and Technology Facilities Council
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+# -----------------------------------------------------------------------------
+
+''' Stand-alone benchmark of PSy-layer code generation for the largest
+dynamo0p3 test invokes. It is not run as part of the test suite. Run it
+with:
+
+    python codegen_benchmark.py [repeats]
+
+For each Algorithm file the time taken to create the f2pygen/fparser1
+tree (psy.gen), to convert it to a string with str() and to write it with
+the streaming :py:func:`psyclone.f2pygen.write_fortran` is reported. The
+streaming writer is also checked to produce identical output. '''
+
+from __future__ import absolute_import, print_function
+import os
+import sys
+import timeit
+from six import StringIO
+
+# The dynamo0p3 test Algorithm files that produce the largest PSy layers
+LARGEST_INVOKES = ["4.10_multi_position_named_invokes.f90",
+                   "3.2_multi_functions_multi_named_invokes.f90",
+                   "4.5.2_multikernel_invokes.f90",
+                   "14.3_halo_readers_all_fs.f90"]
+BASE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                         "test_files", "dynamo0p3")
+
+
+def benchmark(filename, repeats):
+    '''
+    Benchmark the generation of the PSy layer for one Algorithm file.
+
+    :param str filename: the Algorithm file (relative to BASE_PATH).
+    :param int repeats: how many times to repeat each measurement.
+    :returns: the best time for tree creation, str() and write_fortran \
+              and the size of the generated code.
+    :rtype: 4-tuple of (float, float, float, int)
+    :raises RuntimeError: if the two back ends do not produce identical \
+                          output.
+    '''
+    from psyclone.f2pygen import write_fortran
+    from psyclone.parse import parse
+    from psyclone.psyGen import PSyFactory
+
+    _, info = parse(os.path.join(BASE_PATH, filename), api="dynamo0.3")
+
+    def create():
+        ''' Create the PSy layer and its f2pygen/fparser1 tree. '''
+        return PSyFactory("dynamo0.3").create(info).gen
+
+    def stream(ast):
+        ''' Write the tree to an in-memory buffer. '''
+        buf = StringIO()
+        write_fortran(ast, buf)
+        return buf.getvalue()
+
+    ast = create()
+    code = str(ast)
+    if stream(ast) != code:
+        raise RuntimeError("write_fortran and str() differ for '{0}'".
+                           format(filename))
+    t_gen = min(timeit.repeat(create, number=1, repeat=repeats))
+    t_str = min(timeit.repeat(lambda: str(ast), number=1, repeat=repeats))
+    t_stream = min(timeit.repeat(lambda: stream(ast), number=1,
+                                 repeat=repeats))
+    return t_gen, t_str, t_stream, len(code)
+
+
+def main(args):
+    '''
+    Run the benchmark and print a summary table.
+
+    :param list args: optional number of repeats.
+    '''
+    repeats = int(args[0]) if args else 5
+    print("{0:45s} {1:>8s} {2:>10s} {3:>10s} {4:>10s}".format(
+        "algorithm", "chars", "gen (s)", "str (s)", "stream (s)"))
+    for filename in LARGEST_INVOKES:
+        t_gen, t_str, t_stream, size = benchmark(filename, repeats)
+        print("{0:45s} {1:8d} {2:10.4f} {3:10.4f} {4:10.4f}".format(
+            filename, size, t_gen, t_str, t_stream))
+
+
+if __name__ == "__main__":
+    main(sys.argv[1:])
@@ -59,8 +59,15 @@ DEFAULTSTUBAPI = dynamo0.3
 DISTRIBUTED_MEMORY = true
 REPRODUCIBLE_REDUCTIONS = false
 REPROD_PAD_SIZE = 8
+REPROD_PERSISTENT_BUFFERS = false
+MERGE_INVOKES = false
 [dynamo0.3]
 COMPUTE_ANNEXED_DOFS = false
+GROUP_HALO_EXCHANGES = false
+GROUP_GLOBAL_SUMS = false
+PROPAGATE_HALO_STATE = false
+CACHE_BASIS_FUNCTIONS = false
+VECTORISE_BUILTINS = false
 '''
 
 
@@ -90,7 +97,14 @@ def teardown_function():
 @pytest.fixture(scope="module",
                 params=["DISTRIBUTED_MEMORY",
                         "REPRODUCIBLE_REDUCTIONS",
-                        "COMPUTE_ANNEXED_DOFS"])
+                        "REPROD_PERSISTENT_BUFFERS",
+                        "MERGE_INVOKES",
+                        "COMPUTE_ANNEXED_DOFS",
+                        "GROUP_HALO_EXCHANGES",
+                        "GROUP_GLOBAL_SUMS",
+                        "PROPAGATE_HALO_STATE",
+                        "CACHE_BASIS_FUNCTIONS",
+                        "VECTORISE_BUILTINS"])
 def bool_entry(request):
     '''
     Parameterised fixture that will cause a test that has it as an
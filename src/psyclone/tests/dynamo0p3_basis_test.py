@@ -1766,3 +1766,122 @@ def test_diff_basis_unsupp_space():
         _ = kernel.gen_stub
     assert 'Unsupported space for differential basis function' \
         in str(excinfo.value)
+
+
+def test_cached_basis_fns(tmpdir, f90, f90flags, monkeypatch):
+    ''' Check that basis and differential basis functions for both
+    quadrature and evaluators are kept in the PSy-layer module and only
+    recomputed when they were computed for a different function space
+    or quadrature object if CACHE_BASIS_FUNCTIONS is True. '''
+    from psyclone.configuration import Config
+    dyn_config = Config.get().api_conf(API)
+    monkeypatch.setattr(dyn_config, "_cache_basis_functions", True)
+    _, invoke_info = parse(os.path.join(BASE_PATH, "6.2_qr_eval_invoke.f90"),
+                           api=API)
+    psy = PSyFactory(API, distributed_memory=False).create(invoke_info)
+    assert psy.invokes.invoke_list[0].evaluators.cached
+    gen_code = str(psy.gen)
+
+    if TEST_COMPILE:
+        # Test that generated code compiles
+        assert code_compiles(API, psy, tmpdir, f90, f90flags)
+
+    assert (
+        "    USE function_space_mod, ONLY: function_space_type\n" in gen_code)
+    assert (
+        "    IMPLICIT NONE\n"
+        "    REAL(KIND=r_def), allocatable :: basis_w0_on_w0(:,:,:), "
+        "diff_basis_w1_on_w0(:,:,:), basis_w1_qr(:,:,:,:), "
+        "diff_basis_w2_qr(:,:,:,:), basis_w3_qr(:,:,:,:), "
+        "diff_basis_w3_qr(:,:,:,:)\n"
+        "    TYPE(function_space_type), pointer :: basis_w0_on_w0_fs_key => "
+        "null(), diff_basis_w1_on_w0_fs_key => null(), basis_w1_qr_fs_key "
+        "=> null(), diff_basis_w2_qr_fs_key => null(), basis_w3_qr_fs_key "
+        "=> null(), diff_basis_w3_qr_fs_key => null()\n"
+        "    REAL(KIND=r_def), pointer :: basis_w1_qr_qr_key(:) => null(), "
+        "diff_basis_w2_qr_qr_key(:) => null(), basis_w3_qr_qr_key(:) => "
+        "null(), diff_basis_w3_qr_qr_key(:) => null()\n"
+        "    REAL(KIND=r_def), pointer :: basis_w0_on_w0_nodes_key(:,:) => "
+        "null(), diff_basis_w1_on_w0_nodes_key(:,:) => null()\n"
+        "    CONTAINS\n" in gen_code)
+    # The arrays are not declared, allocated or deallocated locally
+    assert "REAL(KIND=r_def), allocatable ::" not in \
+        gen_code.split("CONTAINS")[1]
+    assert gen_code.count(" ALLOCATE (") == 6
+    assert gen_code.count("DEALLOCATE (") == 12
+    assert "Deallocate basis arrays" not in gen_code
+    assert "      ! Look-up dimensions of cached basis/diff-basis arrays\n" \
+        in gen_code
+
+    # Evaluator
+    assert (
+        "      IF (.not. associated(diff_basis_w1_on_w0_fs_key, "
+        "f1_proxy%vspace) .or. .not. associated(diff_basis_w1_on_w0_nodes_key"
+        ", nodes_w0)) THEN\n"
+        "        IF (allocated(diff_basis_w1_on_w0)) THEN\n"
+        "          DEALLOCATE (diff_basis_w1_on_w0)\n"
+        "        END IF \n"
+        "        ALLOCATE (diff_basis_w1_on_w0(diff_dim_w1, ndf_w1, "
+        "ndf_w0))\n"
+        "        diff_basis_w1_on_w0_fs_key => f1_proxy%vspace\n"
+        "        diff_basis_w1_on_w0_nodes_key => nodes_w0\n"
+        "        DO df_nodal=1,ndf_w0\n"
+        "          DO df_w1=1,ndf_w1\n"
+        "            diff_basis_w1_on_w0(:,df_w1,df_nodal) = f1_proxy%vspace"
+        "%call_function(DIFF_BASIS,df_w1,nodes_w0(:,df_nodal))\n"
+        "          END DO \n"
+        "        END DO \n"
+        "      END IF \n" in gen_code)
+    # Quadrature
+    assert (
+        "      IF (.not. associated(basis_w3_qr_fs_key, m2_proxy%vspace) .or. "
+        ".not. associated(basis_w3_qr_qr_key, weights_xy_qr)) THEN\n"
+        "        IF (allocated(basis_w3_qr)) THEN\n"
+        "          DEALLOCATE (basis_w3_qr)\n"
+        "        END IF \n"
+        "        ALLOCATE (basis_w3_qr(dim_w3, ndf_w3, np_xy_qr, np_z_qr))\n"
+        "        basis_w3_qr_fs_key => m2_proxy%vspace\n"
+        "        basis_w3_qr_qr_key => weights_xy_qr\n"
+        "        CALL qr%compute_function(BASIS, m2_proxy%vspace, dim_w3, "
+        "ndf_w3, basis_w3_qr)\n"
+        "      END IF \n" in gen_code)
+    # The routine to invalidate the cache
+    assert (
+        "    SUBROUTINE invalidate_basis_cache()\n"
+        "      IF (allocated(basis_w0_on_w0)) THEN\n"
+        "        DEALLOCATE (basis_w0_on_w0)\n"
+        "      END IF \n" in gen_code)
+    assert (
+        "      diff_basis_w3_qr_qr_key => null()\n"
+        "    END SUBROUTINE invalidate_basis_cache\n" in gen_code)
+
+
+def test_cached_basis_fns_multi_invoke(monkeypatch):
+    ''' Check that invokes that require basis functions with the same
+    names share the cached arrays and that nothing is cached if
+    CACHE_BASIS_FUNCTIONS is False. '''
+    from psyclone.configuration import Config
+    _, invoke_info = parse(
+        os.path.join(BASE_PATH, "3.1_multi_functions_multi_invokes.f90"),
+        api=API)
+    psy = PSyFactory(API, distributed_memory=True).create(invoke_info)
+    invoke = psy.invokes.invoke_list[1]
+    assert not invoke.evaluators.cached
+    assert invoke.evaluators.cache_variables() == ([], [])
+    gen_code = str(psy.gen)
+    assert "invalidate_basis_cache" not in gen_code
+    assert "_key" not in gen_code
+
+    dyn_config = Config.get().api_conf(API)
+    monkeypatch.setattr(dyn_config, "_cache_basis_functions", True)
+    arrays, keys = invoke.evaluators.cache_variables()
+    assert arrays == ["basis_w1_qr", "diff_basis_w2_qr", "basis_w3_qr",
+                      "diff_basis_w3_qr"]
+    assert keys[:2] == ["basis_w1_qr_fs_key", "basis_w1_qr_qr_key"]
+    assert len(keys) == 8
+    gen_code = str(psy.gen)
+    assert gen_code.count("allocatable ::") == 1
+    assert gen_code.count("IF (.not. associated(basis_w1_qr_fs_key, "
+                          "f1_proxy%vspace)") == 2
+    assert gen_code.count("SUBROUTINE invalidate_basis_cache") == 2
+    assert gen_code.count("basis_w1_qr_fs_key => null()") == 2
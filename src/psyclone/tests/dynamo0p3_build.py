@@ -47,6 +47,7 @@ BASE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)),
 # be compiled.
 INFRASTRUCTURE_PATH = os.path.join(BASE_PATH, "infrastructure")
 INFRASTRUCTURE_MODULES = ["constants_mod",
+                          "scalar_mod",
                           "linked_list_data_mod",
                           "argument_mod",
                           "kernel_mod",
@@ -56,10 +57,12 @@ INFRASTRUCTURE_MODULES = ["constants_mod",
                           "stencil_dofmap_mod",
                           "function_space_mod",
                           "field_mod",
+                          "r_single_field_mod",
                           "abstract_quadrature_mod",
                           "quadrature_rule_mod",
                           "quadrature_xyz_mod",
                           "quadrature_xyoz_mod",
                           "quadrature_xoyoz_mod",
                           "quadrature_mod",
-                          "operator_mod"]
+                          "operator_mod",
+                          "r_single_operator_mod"]
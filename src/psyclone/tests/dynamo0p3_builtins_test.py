@@ -2562,6 +2562,127 @@ def test_multi_builtin_single_invoke(monkeypatch, annexed, dist_mem):
             "      END DO \n") in code
 
 
+# ------------- Vectorised built-ins ---------------------------------------- #
+
+
+def test_vectorise_builtins_reduction(tmpdir, f90, f90flags, monkeypatch,
+                                      dist_mem):
+    ''' Test that we generate contiguous pointers to the field data and an
+    OpenMP SIMD directive with a reduction clause for a loop containing
+    a reduction built-in when VECTORISE_BUILTINS is True '''
+    api_config = Config.get().api_conf(API)
+    monkeypatch.setattr(api_config, "_vectorise_builtins", True)
+    _, invoke_info = parse(os.path.join(BASE_PATH,
+                                        "15.9.1_X_innerproduct_Y_builtin.f90"),
+                           api=API)
+    psy = PSyFactory(API, distributed_memory=dist_mem).create(invoke_info)
+    code = str(psy.gen)
+    print(code)
+    assert ("      REAL(KIND=r_def), pointer, contiguous :: "
+            "f1_data(:) => null(), f2_data(:) => null()\n") in code
+    if dist_mem:
+        upper_bound = "f1_proxy%vspace%get_last_dof_owned()"
+    else:
+        upper_bound = "undf_any_space_1_f1"
+    assert (
+        "      f1_data => f1_proxy%data\n"
+        "      f2_data => f2_proxy%data\n"
+        "      !\n"
+        "      ! Zero summation variables\n"
+        "      !\n"
+        "      asum = 0.0_r_def\n"
+        "      !\n"
+        "      !$omp simd reduction(+:asum)\n"
+        "      DO df=1," + upper_bound + "\n"
+        "        asum = asum+f1_data(df)*f2_data(df)\n"
+        "      END DO \n") in code
+    assert "%data(df)" not in code
+
+    # The infrastructure for the global sum is not available so we
+    # can only check compilation without distributed memory
+    if TEST_COMPILE and not dist_mem:
+        assert code_compiles(API, psy, tmpdir, f90, f90flags)
+
+
+def test_vectorise_builtins_multi(monkeypatch):
+    ''' Test that the pointers to the field data are declared once but
+    are set before every loop when VECTORISE_BUILTINS is True and an
+    invoke contains more than one built-in '''
+    api_config = Config.get().api_conf(API)
+    monkeypatch.setattr(api_config, "_vectorise_builtins", True)
+    _, invoke_info = parse(
+        os.path.join(BASE_PATH,
+                     "15.17.2_one_standard_builtin_one_reduction.f90"),
+        api=API)
+    psy = PSyFactory(API, distributed_memory=False).create(invoke_info)
+    code = str(psy.gen)
+    print(code)
+    assert code.count("contiguous :: f1_data(:) => null()") == 1
+    assert (
+        "      f1_data => f1_proxy%data\n"
+        "      !$omp simd\n"
+        "      DO df=1,undf_any_space_1_f1\n"
+        "        f1_data(df) = bvalue*f1_data(df)\n"
+        "      END DO \n"
+        "      f1_data => f1_proxy%data\n") in code
+    assert (
+        "      !$omp simd reduction(+:asum)\n"
+        "      DO df=1,undf_any_space_1_f1\n"
+        "        asum = asum+f1_data(df)\n"
+        "      END DO \n") in code
+
+
+def test_vectorise_builtins_precision(tmpdir, f90, f90flags, monkeypatch,
+                                      dist_mem):
+    ''' Test that the pointers to the field data have the kind of the
+    data held by the fields in the PSy layer (which may differ between
+    fields) when VECTORISE_BUILTINS is True '''
+    api_config = Config.get().api_conf(API)
+    monkeypatch.setattr(api_config, "_vectorise_builtins", True)
+    _, invoke_info = parse(os.path.join(BASE_PATH,
+                                        "23.4_mixed_precision_builtins.f90"),
+                           api=API)
+    psy = PSyFactory(API, distributed_memory=dist_mem).create(invoke_info)
+    code = str(psy.gen)
+    print(code)
+    assert ("      REAL(KIND=r_single), pointer, contiguous :: "
+            "f1_data(:) => null()\n") in code
+    assert ("      REAL(KIND=r_def), pointer, contiguous :: "
+            "f3_data(:) => null()\n") in code
+    assert (
+        "      f1_data => f1_proxy%data\n"
+        "      f3_data => f3_proxy%data\n"
+        "      !$omp simd\n") in code
+    assert "        f1_data(df) = f1_data(df) + f3_data(df)\n" in code
+
+    if TEST_COMPILE:
+        assert code_compiles(API, psy, tmpdir, f90, f90flags)
+
+
+def test_vectorise_builtins_omp(monkeypatch):
+    ''' Test that a built-in within an OpenMP directive is generated in
+    the usual way when VECTORISE_BUILTINS is True '''
+    from psyclone.transformations import DynamoOMPParallelLoopTrans
+    api_config = Config.get().api_conf(API)
+    monkeypatch.setattr(api_config, "_vectorise_builtins", True)
+    _, invoke_info = parse(os.path.join(BASE_PATH,
+                                        "15.1.1_X_plus_Y_builtin.f90"),
+                           api=API)
+    psy = PSyFactory(API, distributed_memory=False).create(invoke_info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    assert schedule.children[0].vectorise_builtins
+    otrans = DynamoOMPParallelLoopTrans()
+    schedule, _ = otrans.apply(schedule.children[0])
+    assert not schedule.children[0].children[0].vectorise_builtins
+    psy.invokes.invoke_list[0].schedule = schedule
+    code = str(psy.gen)
+    print(code)
+    assert "contiguous" not in code
+    assert "omp simd" not in code
+    assert ("        f3_proxy%data(df) = f1_proxy%data(df) + "
+            "f2_proxy%data(df)\n") in code
+
+
 # ------------- Invalid built-in with an integer scalar reduction ----------- #
 
 
@@ -427,3 +427,222 @@ def test_gh_inc_max(tmpdir, f90, f90flags, monkeypatch, annexed):
     # f1 halo exchange should be depth max
     haloex = schedule.children[haloidx]
     check(haloex, "mesh%get_halo_depth()")
+
+
+def test_group_halo_exchanges(tmpdir, f90, f90flags, monkeypatch):
+    '''If GROUP_HALO_EXCHANGES is True, then adjacent halo exchanges of
+    the same depth are grouped once the halo exchanges have been
+    created. If any of the halo exchanges in a group is known to be
+    required then the batched halo exchange is not guarded by a check
+    of whether the halos are dirty.
+
+    '''
+    from psyclone.dynamo0p3 import DynHaloExchangeGroup
+    config = Config.get()
+    dyn_config = config.api_conf(API)
+    monkeypatch.setattr(dyn_config, "_group_halo_exchanges", True)
+
+    # Adjacent halo exchanges of different depths are grouped by depth
+    _, info = parse(os.path.join(BASE_PATH, "14.4_halo_vector.f90"),
+                    api=API)
+    psy = PSyFactory(API).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    assert len(schedule.children) == 3
+    for group, name, depth in [(schedule.children[0], "f1", "1"),
+                               (schedule.children[1], "f2", "f2_extent+1")]:
+        assert isinstance(group, DynHaloExchangeGroup)
+        for idx, haloex in enumerate(group.children):
+            assert isinstance(haloex, DynHaloExchange)
+            assert haloex.field.name == name
+            assert haloex.vector_index == idx + 1
+            assert haloex._compute_halo_depth() == depth
+    assert isinstance(schedule.children[2], DynLoop)
+
+    # The halo exchanges for f1 and f2 are known to be required
+    _, info = parse(os.path.join(BASE_PATH, "14.7_halo_annexed.f90"),
+                    api=API)
+    psy = PSyFactory(API).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    group = schedule.children[2]
+    assert isinstance(group, DynHaloExchangeGroup)
+    assert [haloex.required() for haloex in group.children] == \
+        [(True, True), (True, True), (True, False)]
+    result = str(psy.gen)
+    assert (
+        "      CALL f2_proxy%set_dirty()\n"
+        "      !\n"
+        "      CALL halo_exchange_group((/f1_proxy, f2_proxy, m1_proxy/), "
+        "depth=1)\n"
+        "      !\n") in result
+    assert "is_dirty" not in result
+    if utils.TEST_COMPILE:
+        # If compilation testing has been enabled
+        # (--compile --f90="<compiler_name>" flags to py.test)
+        assert utils.code_compiles(API, psy, tmpdir, f90, f90flags)
+
+
+def test_group_halo_exchanges_kinds(tmpdir, f90, f90flags, monkeypatch):
+    '''If GROUP_HALO_EXCHANGES is True, then adjacent halo exchanges of
+    fields that hold data of different kinds are grouped by kind and
+    each group uses the batched halo exchange for that kind.
+
+    '''
+    from psyclone.dynamo0p3 import DynHaloExchangeGroup
+    config = Config.get()
+    dyn_config = config.api_conf(API)
+    monkeypatch.setattr(dyn_config, "_group_halo_exchanges", True)
+
+    _, info = parse(os.path.join(BASE_PATH, "23.2_mixed_precision_halo.f90"),
+                    api=API)
+    psy = PSyFactory(API).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    assert len(schedule.children) == 3
+    for group, names in [(schedule.children[0], ["f1", "f2"]),
+                         (schedule.children[1], ["m1", "m2"])]:
+        assert isinstance(group, DynHaloExchangeGroup)
+        assert [haloex.field.name for haloex in group.children] == names
+    result = str(psy.gen)
+    assert "USE field_mod, ONLY: halo_exchange_group\n" in result
+    assert ("USE r_single_field_mod, ONLY: r_single_halo_exchange_group\n"
+            in result)
+    assert (
+        "      IF (f1_proxy%is_dirty(depth=1) .OR. "
+        "f2_proxy%is_dirty(depth=1)) THEN\n"
+        "        CALL r_single_halo_exchange_group((/f1_proxy, f2_proxy/), "
+        "depth=1)\n"
+        "      END IF \n"
+        "      !\n"
+        "      IF (m1_proxy%is_dirty(depth=1) .OR. "
+        "m2_proxy%is_dirty(depth=1)) THEN\n"
+        "        CALL halo_exchange_group((/m1_proxy, m2_proxy/), depth=1)\n"
+        "      END IF \n") in result
+    if utils.TEST_COMPILE:
+        # If compilation testing has been enabled
+        # (--compile --f90="<compiler_name>" flags to py.test)
+        assert utils.code_compiles(API, psy, tmpdir, f90, f90flags)
+
+    # Halo exchanges of the same depth of fields of different kinds are
+    # not grouped
+    _, info = parse(os.path.join(BASE_PATH, "23.0_mixed_precision.f90"),
+                    api=API)
+    psy = PSyFactory(API).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    assert [type(node) for node in schedule.children] == \
+        [DynHaloExchange, DynHaloExchange, DynLoop]
+    result = str(psy.gen)
+    assert "halo_exchange_group" not in result
+    assert "CALL f1_proxy%halo_exchange(depth=1)" in result
+    assert "CALL f2_proxy%halo_exchange(depth=1)" in result
+    if utils.TEST_COMPILE:
+        assert utils.code_compiles(API, psy, tmpdir, f90, f90flags)
+
+
+def test_halo_exit_state():
+    ''' Check the known state of the halos of fields on exit from an
+    invoke, with and without a known state on entry. '''
+    from psyclone.dynamo0p3 import HaloState
+    _, info = parse(os.path.join(BASE_PATH,
+                                 "3.5_multi_invokes_halo_state.f90"),
+                    api=API)
+    psy = PSyFactory(API).create(info)
+    invoke = psy.invokes.invoke_list[0]
+    assert invoke.halo_entry_state == {}
+    state = invoke.halo_exit_state()
+    assert sorted(state.keys()) == [("f1", None), ("f2", None),
+                                    ("m1", None), ("m2", None)]
+    # f1 is written to the level-1 halo which is left dirty
+    assert state[("f1", None)].clean_depth == 0
+    assert state[("f1", None)].dirty_outer
+    # the other fields have had their level-1 halos exchanged
+    for name in ["f2", "m1", "m2"]:
+        assert state[(name, None)].clean_depth == 1
+    # The state of a field that is not accessed passes through and a
+    # deeper clean halo is kept
+    entry = {("f3", None): HaloState(True, 0, False),
+             ("m1", None): HaloState(False, 2, False)}
+    invoke.set_halo_entry_state(entry)
+    state = invoke.halo_exit_state()
+    assert state[("f3", None)].clean_depth is None
+    assert state[("m1", None)].clean_depth == 2
+    assert state[("m2", None)].clean_depth == 1
+
+
+def test_propagate_halo_state(tmpdir, f90, f90flags, monkeypatch):
+    '''If PROPAGATE_HALO_STATE is True, then the known state of the
+    halos on exit from an invoke is used by the invoke that is called
+    immediately after it. Halo exchanges that are then known not to be
+    required are removed and halo exchanges that are then known to be
+    required do not check whether the halo is dirty.
+
+    '''
+    from psyclone.generator import generate
+    filename = os.path.join(BASE_PATH, "3.5_multi_invokes_halo_state.f90")
+    _, psy = generate(filename, api=API)
+    result = str(psy)
+    assert result.count("CALL f1_proxy%halo_exchange(depth=1)") == 1
+    assert result.count("is_dirty") == 12
+
+    config = Config.get()
+    dyn_config = config.api_conf(API)
+    monkeypatch.setattr(dyn_config, "_propagate_halo_state", True)
+    _, psy = generate(filename, api=API)
+    result = str(psy)
+    invoke_1 = result[result.index("SUBROUTINE invoke_1_testkern_type"):
+                      result.index("END SUBROUTINE invoke_1_testkern_type")]
+    # f1 was left dirty by the previous invoke and the halos of f2 and
+    # m2 were cleaned by it
+    assert (
+        "      ! Call kernels and communication routines\n"
+        "      !\n"
+        "      CALL f1_proxy%halo_exchange(depth=1)\n"
+        "      !\n"
+        "      DO cell=1,mesh%get_last_halo_cell(1)\n") in invoke_1
+    assert "is_dirty" not in invoke_1
+    # The remaining invokes are not called immediately after another
+    # invoke so they are unchanged
+    assert result.count("is_dirty") == 9
+    if utils.TEST_COMPILE:
+        # If compilation testing has been enabled
+        # (--compile --f90="<compiler_name>" flags to py.test)
+        from psyclone.algGen import Alg
+        from psyclone.dynamo0p3 import propagate_halo_state
+        ast, info = parse(filename, api=API)
+        psy = PSyFactory(API).create(info)
+        for invokes in Alg(ast, psy).invoke_sequences:
+            propagate_halo_state(invokes)
+        assert str(psy.gen) == result
+        assert utils.code_compiles(API, psy, tmpdir, f90, f90flags)
+
+    # Nothing is changed without distributed memory
+    _, psy = generate(filename, api=API, distributed_memory=False)
+    assert "halo_exchange" not in str(psy)
+
+
+def test_propagate_halo_state_async():
+    ''' Check that asynchronous and grouped halo exchanges that are
+    known not to be required are removed. '''
+    from psyclone.dynamo0p3 import DynHaloExchangeGroup, \
+        DynHaloExchangeStart, propagate_halo_state
+    from psyclone.transformations import Dynamo0p3AsyncHaloExchangeTrans, \
+        Dynamo0p3HaloExchangeGroupTrans
+    _, info = parse(os.path.join(BASE_PATH,
+                                 "3.5_multi_invokes_halo_state.f90"),
+                    api=API)
+    psy = PSyFactory(API, distributed_memory=True).create(info)
+    invokes = psy.invokes.invoke_list[0:2]
+    schedule = invokes[1].schedule
+    # f1, f2 and m2 halo exchanges
+    assert len(schedule.children) == 4
+    Dynamo0p3AsyncHaloExchangeTrans().apply(schedule.children[1])
+    Dynamo0p3HaloExchangeGroupTrans().apply(
+        [schedule.children[0], schedule.children[3]])
+    assert isinstance(schedule.children[0], DynHaloExchangeGroup)
+    assert isinstance(schedule.children[1], DynHaloExchangeStart)
+    propagate_halo_state(invokes)
+    assert len(schedule.children) == 2
+    group = schedule.children[0]
+    assert isinstance(group, DynHaloExchangeGroup)
+    assert len(group.children) == 1
+    assert group.children[0].field.name == "f1"
+    assert group.children[0].required() == (True, True)
+    assert isinstance(schedule.children[1], DynLoop)
@@ -287,6 +287,303 @@ def test_ad_op_type_too_many_args():
     assert 'meta_arg entry must have 4 arguments' in str(excinfo.value)
 
 
+def test_ad_precision():
+    ''' Tests that the optional precision of a field or operator
+    argument is captured from the meta-data and does not count towards
+    the number of arguments of the meta_arg entry. '''
+    fparser.logging.disable(fparser.logging.CRITICAL)
+    code = CODE.replace("arg_type(gh_field,gh_write,w1)",
+                        "arg_type(gh_field,gh_write,w1,"
+                        "precision=gh_r_single)", 1)
+    code = code.replace("arg_type(gh_operator,gh_read, w2, w2)",
+                        "arg_type(gh_operator,gh_read, w2, w2, "
+                        "precision=GH_R_DOUBLE)", 1)
+    ast = fpapi.parse(code, ignore_comments=False)
+    metadata = DynKernMetadata(ast, name="testkern_qr_type")
+    descriptors = metadata.arg_descriptors
+    assert descriptors[1].precision == "gh_r_single"
+    assert descriptors[2].precision is None
+    assert descriptors[3].precision == "gh_r_double"
+    assert descriptors[0].precision is None
+
+
+def test_ad_precision_errors():
+    ''' Tests that an error is raised if the precision in the meta-data
+    is invalid, is given more than once or is given for a scalar. '''
+    fparser.logging.disable(fparser.logging.CRITICAL)
+    name = "testkern_qr_type"
+    code = CODE.replace("arg_type(gh_field,gh_write,w1)",
+                        "arg_type(gh_field,gh_write,w1,precision=gh_r_half)",
+                        1)
+    ast = fpapi.parse(code, ignore_comments=False)
+    with pytest.raises(ParseError) as excinfo:
+        _ = DynKernMetadata(ast, name=name)
+    assert ("the precision of a meta_arg entry must be one of ['gh_r_def', "
+            "'gh_r_single', 'gh_r_double'] but found 'gh_r_half'"
+            in str(excinfo.value))
+    code = CODE.replace("arg_type(gh_field,gh_write,w1)",
+                        "arg_type(gh_field,gh_write,w1,precision=gh_r_single,"
+                        "precision=gh_r_def)", 1)
+    ast = fpapi.parse(code, ignore_comments=False)
+    with pytest.raises(ParseError) as excinfo:
+        _ = DynKernMetadata(ast, name=name)
+    assert ("a meta_arg entry may only specify its precision once"
+            in str(excinfo.value))
+    code = CODE.replace("arg_type(gh_real, gh_read)",
+                        "arg_type(gh_real, gh_read, precision=gh_r_single)",
+                        1)
+    ast = fpapi.parse(code, ignore_comments=False)
+    with pytest.raises(ParseError) as excinfo:
+        _ = DynKernMetadata(ast, name=name)
+    assert ("a precision may only be specified for a field or an operator"
+            in str(excinfo.value))
+
+
+def test_infrastructure_type():
+    ''' Tests the names of the infrastructure modules and types that
+    hold fields and operators of different kinds. '''
+    from psyclone.dynamo0p3 import infrastructure_type
+    assert infrastructure_type("gh_field") == ("field_mod", "field_type")
+    assert (infrastructure_type("gh_columnwise_operator", proxy=True) ==
+            ("operator_mod", "columnwise_operator_proxy_type"))
+    assert (infrastructure_type("gh_operator", "r_single") ==
+            ("r_single_operator_mod", "r_single_operator_type"))
+    assert (infrastructure_type("gh_field", "r_double", proxy=True) ==
+            ("r_double_field_mod", "r_double_field_proxy_type"))
+    with pytest.raises(InternalError) as excinfo:
+        _ = infrastructure_type("gh_real")
+    assert "but got 'gh_real'" in str(excinfo.value)
+
+
+def test_mixed_precision_gen(dist_mem):
+    ''' Tests that fields and operators holding data of a non-default
+    kind are declared using the infrastructure types for that kind. '''
+    _, invoke_info = parse(os.path.join(BASE_PATH,
+                                        "23.0_mixed_precision.f90"),
+                           api=TEST_API)
+    psy = PSyFactory(TEST_API,
+                     distributed_memory=dist_mem).create(invoke_info)
+    code = str(psy.gen)
+    assert "USE constants_mod, ONLY: r_def, r_single\n" in code
+    assert ("USE r_single_field_mod, ONLY: r_single_field_type, "
+            "r_single_field_proxy_type\n" in code)
+    assert ("USE r_single_operator_mod, ONLY: r_single_operator_type, "
+            "r_single_operator_proxy_type\n" in code)
+    assert "USE field_mod, ONLY: field_type, field_proxy_type\n" in code
+    assert "TYPE(r_single_field_type), intent(inout) :: f1\n" in code
+    assert "TYPE(field_type), intent(in) :: f2\n" in code
+    assert "TYPE(r_single_operator_type), intent(in) :: op1\n" in code
+    assert "TYPE(r_single_operator_proxy_type) op1_proxy\n" in code
+    assert "TYPE(field_proxy_type) f2_proxy\n" in code
+    assert "TYPE(r_single_field_proxy_type) f1_proxy\n" in code
+
+
+def test_mixed_precision_error():
+    ''' Tests that an error is raised if a field is written to by kernels
+    that expect it to hold data of different kinds. '''
+    _, invoke_info = parse(os.path.join(BASE_PATH,
+                                        "23.1_mixed_precision_error.f90"),
+                           api=TEST_API)
+    with pytest.raises(GenerationError) as excinfo:
+        _ = PSyFactory(TEST_API).create(invoke_info)
+    assert ("Argument 'f1' of kernel 'testkern_code' in invoke 'invoke_0' "
+            "is written with precision 'r_def' but it is written with "
+            "precision 'r_single' by another kernel of the same invoke"
+            in str(excinfo.value))
+
+
+def test_mixed_precision_convert(tmpdir, f90, f90flags, dist_mem):
+    ''' Tests that a kernel that reads a field or an operator as data of
+    a different kind from the data it holds in the PSy layer is passed
+    a copy of the data converted to that kind. '''
+    from psyclone.dynamo0p3 import DynKindConversion
+    _, invoke_info = parse(os.path.join(BASE_PATH,
+                                        "23.3_mixed_precision_convert.f90"),
+                           api=TEST_API)
+    psy = PSyFactory(TEST_API,
+                     distributed_memory=dist_mem).create(invoke_info)
+    invoke = psy.invokes.invoke_list[0]
+    schedule = invoke.schedule
+    # f2 is only read and is first read as r_def. op1 is written as r_def.
+    assert invoke.arg_precision("f2") == "r_def"
+    assert invoke.arg_precision("op1") == "r_def"
+    assert invoke.arg_precision("f3") == "r_single"
+    conversions = schedule.walk(schedule.children, DynKindConversion)
+    assert [(conv.arg.name, conv.arg.call.name, conv.arg.precision)
+            for conv in conversions] == \
+        [("f2", "testkern_precision_2_code", "r_single"),
+         ("op1", "testkern_precision_code", "r_single")]
+    for conv in conversions:
+        loop = schedule.children[conv.position+1]
+        assert isinstance(loop, DynLoop)
+        assert loop.children[0] is conv.arg.call
+    code = str(psy.gen)
+    assert "USE constants_mod, ONLY: r_def, r_single\n" in code
+    assert "TYPE(field_type), intent(in) :: f2, m1, m2, chi(3)\n" in code
+    assert "TYPE(operator_type), intent(inout) :: op1\n" in code
+    assert ("REAL(KIND=r_single), allocatable, dimension(:,:,:) :: "
+            "op1_r_single_data\n" in code)
+    assert ("REAL(KIND=r_single), allocatable, dimension(:) :: "
+            "f2_r_single_data\n" in code)
+    assert ("      f2_r_single_data = REAL(f2_proxy%data, KIND=r_single)\n"
+            "      !\n"
+            "      DO cell=1,") in code
+    assert ("CALL testkern_precision_2_code(nlayers, a, f3_proxy%data, "
+            "f2_r_single_data, m1_proxy%data, m2_proxy%data, " in code)
+    assert ("      op1_r_single_data = REAL(op1_proxy%local_stencil, "
+            "KIND=r_single)\n"
+            "      !\n"
+            "      DO cell=1,") in code
+    assert ("CALL testkern_precision_code(cell, nlayers, a, f3_proxy%data, "
+            "m2_proxy%data, op1_proxy%ncell_3d, op1_r_single_data, " in code)
+    # Kernels that read the data with the kind it holds are unchanged
+    assert ("CALL testkern_code(nlayers, a, f1_proxy%data, f2_proxy%data, "
+            in code)
+    assert ("CALL testkern_operator_orient_code(cell, nlayers, "
+            "op1_proxy%ncell_3d, op1_proxy%local_stencil, " in code)
+    if TEST_COMPILE:
+        # If compilation testing has been enabled (--compile flag
+        # to py.test)
+        assert code_compiles(TEST_API, psy, tmpdir, f90, f90flags)
+
+
+def test_mixed_precision_convert_vector(monkeypatch):
+    ''' Tests that each component of a field vector that is read by a
+    kernel as data of a different kind is converted. '''
+    _, invoke_info = parse(os.path.join(BASE_PATH,
+                                        "10.2_operator_orient.f90"),
+                           api=TEST_API)
+    psy = PSyFactory(TEST_API).create(invoke_info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    kernel = schedule.kern_calls()[0]
+    chi = kernel.arguments.args[1]
+    assert not chi.requires_kind_conversion
+    # The kernel now reads chi as single-precision data
+    monkeypatch.setattr(chi.descriptor, "_precision", "gh_r_single")
+    assert chi.requires_kind_conversion
+    assert chi.psy_precision == "r_def"
+    schedule.add_kind_conversions()
+    code = str(psy.gen)
+    assert "USE constants_mod, ONLY: r_def, r_single\n" in code
+    assert ("REAL(KIND=r_single), allocatable, dimension(:) :: "
+            "chi_1_r_single_data, chi_2_r_single_data, chi_3_r_single_data\n"
+            in code)
+    assert ("      chi_1_r_single_data = REAL(chi_proxy(1)%data, "
+            "KIND=r_single)\n"
+            "      chi_2_r_single_data = REAL(chi_proxy(2)%data, "
+            "KIND=r_single)\n"
+            "      chi_3_r_single_data = REAL(chi_proxy(3)%data, "
+            "KIND=r_single)\n"
+            "      !\n"
+            "      DO cell=1,") in code
+    assert ("mm_w1_proxy%local_stencil, chi_1_r_single_data, "
+            "chi_2_r_single_data, chi_3_r_single_data, ndf_w1, " in code)
+
+
+def test_mixed_precision_convert_errors(monkeypatch):
+    ''' Tests the errors raised when converting the data of a kernel
+    argument to a different kind. '''
+    from psyclone.dynamo0p3 import DynKindConversion
+    from psyclone.psyGen import OMPParallelDirective
+    from psyclone.transformations import OMPParallelTrans, \
+        Dynamo0p3ColourTrans, DynamoOMPParallelLoopTrans, ACCParallelTrans, \
+        ACCDataTrans
+    filename = os.path.join(BASE_PATH, "23.3_mixed_precision_convert.f90")
+    _, invoke_info = parse(filename, api=TEST_API)
+    psy = PSyFactory(TEST_API,
+                     distributed_memory=False).create(invoke_info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    conversion = schedule.children[1]
+    assert isinstance(conversion, DynKindConversion)
+    # The conversion must immediately precede the loop containing the
+    # kernel
+    schedule.children.insert(0, schedule.children.pop(1))
+    with pytest.raises(GenerationError) as excinfo:
+        _ = psy.gen
+    assert ("The conversion of argument 'f2' of kernel "
+            "'testkern_precision_2_code' to kind 'r_single' must "
+            "immediately precede the node containing the kernel"
+            in str(excinfo.value))
+    schedule.children.insert(1, schedule.children.pop(0))
+    schedule.children.append(schedule.children.pop(1))
+    with pytest.raises(GenerationError) as excinfo:
+        _ = psy.gen
+    assert "must immediately precede the node" in str(excinfo.value)
+    schedule.children.insert(1, schedule.children.pop())
+    # The conversion must not be within a directive
+    schedule, _ = OMPParallelTrans().apply(schedule.children[2])
+    directive = schedule.children[2]
+    assert isinstance(directive, OMPParallelDirective)
+    schedule.children.remove(conversion)
+    directive.children.insert(0, conversion)
+    conversion.parent = directive
+    with pytest.raises(GenerationError) as excinfo:
+        _ = psy.gen
+    assert ("The conversion of argument 'f2' of kernel "
+            "'testkern_precision_2_code' to kind 'r_single' must not be "
+            "within a directive" in str(excinfo.value))
+
+    # A kernel in a parallel loop over colours is passed the converted
+    # data
+    _, invoke_info = parse(filename, api=TEST_API)
+    psy = PSyFactory(TEST_API,
+                     distributed_memory=False).create(invoke_info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    schedule, _ = Dynamo0p3ColourTrans().apply(schedule.children[5])
+    DynamoOMPParallelLoopTrans().apply(schedule.children[5].children[0])
+    code = str(psy.gen)
+    assert ("      op1_r_single_data = REAL(op1_proxy%local_stencil, "
+            "KIND=r_single)\n"
+            "      !\n"
+            "      DO colour=1,ncolour\n"
+            "        !$omp parallel do") in code
+
+    # A kernel that is passed converted data can not be within an
+    # OpenACC region
+    ptrans = ACCParallelTrans()
+    _, invoke_info = parse(filename, api=TEST_API)
+    psy = PSyFactory(TEST_API,
+                     distributed_memory=False).create(invoke_info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    schedule, _ = ptrans.apply(schedule.children[5])
+    schedule, _ = ACCDataTrans().apply(schedule)
+    with pytest.raises(GenerationError) as excinfo:
+        _ = psy.gen
+    assert ("The conversion of argument 'op1' of kernel "
+            "'testkern_precision_code' to kind 'r_single' is not supported "
+            "for a kernel within an OpenACC directive" in str(excinfo.value))
+
+    # The data of a column-wise operator can not be converted
+    _, invoke_info = parse(os.path.join(BASE_PATH,
+                                        "20.5_multi_cma_invoke.f90"),
+                           api=TEST_API)
+    call = list(invoke_info.calls.values())[0].kcalls[1]
+    monkeypatch.setattr(call.ktype.arg_descriptors[2], "_precision",
+                        "gh_r_single")
+    with pytest.raises(GenerationError) as excinfo:
+        _ = PSyFactory(TEST_API, distributed_memory=True).create(invoke_info)
+    assert ("Argument 'cma_op1' of kernel 'columnwise_op_app_kernel_code' in "
+            "invoke 'invoke_0' has precision 'r_single' but it holds data of "
+            "precision 'r_def' in the invoke. Converting the precision of a "
+            "column-wise operator is not supported" in str(excinfo.value))
+
+
+def test_mixed_precision_stub_gen():
+    ''' Tests that kernel stubs declare fields and operators with the
+    kind given by their precision. '''
+    result = generate(os.path.join(BASE_PATH, "testkern_precision_mod.F90"),
+                      api=TEST_API)
+    code = str(result)
+    assert "USE constants_mod, ONLY: r_def, r_single\n" in code
+    assert "REAL(KIND=r_def), intent(in) :: rscalar_1\n" in code
+    assert ("REAL(KIND=r_single), intent(inout), dimension(undf_w1) :: "
+            "field_2_w1\n" in code)
+    assert ("REAL(KIND=r_def), intent(in), dimension(undf_w3) :: "
+            "field_3_w3\n" in code)
+    assert ("REAL(KIND=r_single), intent(in), dimension(ndf_w1,ndf_w1,"
+            "op_4_ncell_3d) :: op_4\n" in code)
+
+
 def test_ad_op_type_wrong_3rd_arg():
     ''' Tests that an error is raised when the 3rd entry in the operator
     descriptor metadata is invalid. '''
@@ -2160,6 +2457,35 @@ def test_dyninvoke_arg_for_fs():
         in str(excinfo.value)
 
 
+def test_dyninvoke_arg_registry():
+    ''' tests that the queries of the arguments of a DynInvoke reflect
+    changes to the calls in its schedule and that the lists they return
+    can be modified by the caller '''
+    _, invoke_info = parse(os.path.join(BASE_PATH,
+                                        "4.4_multikernel_invokes.f90"),
+                           api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(invoke_info)
+    invoke = psy.invokes.invoke_list[0]
+    scalars = invoke.unique_declarations("gh_integer")
+    assert scalars == ["a", "b"]
+    scalars.append("c")
+    assert invoke.unique_declarations("gh_integer") == ["a", "b"]
+    assert invoke.unique_declarations("gh_integer", access="gh_read") == \
+        ["a", "b"]
+    assert invoke.first_access("a").call is invoke.schedule.calls()[0]
+    fspace = invoke.schedule.calls()[0].arguments.args[0].function_spaces[0]
+    assert invoke.arg_for_funcspace(fspace).declaration_name == "op"
+    # Remove the first loop (and therefore its kernel)
+    del invoke.schedule.children[0]
+    assert invoke.unique_declarations("gh_integer") == ["b"]
+    assert invoke.unique_declns_by_intent("gh_integer")["in"] == ["b"]
+    assert invoke.first_access("op").call is invoke.schedule.calls()[0]
+    with pytest.raises(GenerationError) as excinfo:
+        invoke.first_access("a")
+    assert "Failed to find any kernel argument with name 'a'" \
+        in str(excinfo.value)
+
+
 def test_kernel_specific(tmpdir, f90, f90flags):
     ''' Test that a call to enforce boundary conditions is *not* added
     following a call to the matrix_vector_kernel_type kernel. Boundary
@@ -4292,6 +4618,42 @@ def test_halo_exchange_inc(monkeypatch, annexed):
         assert result.count("halo_exchange") == 7
 
 
+@pytest.mark.parametrize("annexed", [False, True])
+@pytest.mark.parametrize("alg_file", ["4.6_multikernel_invokes.f90",
+                                      "14.3_halo_readers_all_fs.f90",
+                                      "14.4_halo_vector.f90",
+                                      "14.9_halo_different_stencils.f90",
+                                      "14.13_halo_inc_to_inc.f90",
+                                      "14.14_halo_inc_times3.f90"])
+def test_schedule_create_halo_exchanges(monkeypatch, annexed, alg_file):
+    ''' Test that the halo exchanges added by the single pass in
+    DynSchedule.create_halo_exchanges() are the same as those added by
+    calling DynLoop.create_halo_exchanges() for each loop in turn. '''
+    from psyclone.dynamo0p3 import DynHaloExchange
+    config = Config.get()
+    dyn_config = config.api_conf("dynamo0.3")
+    monkeypatch.setattr(dyn_config, "_compute_annexed_dofs", annexed)
+    _, invoke_info = parse(os.path.join(BASE_PATH, alg_file), api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(invoke_info)
+    schedule = psy.invokes.invoke_list[0].schedule
+
+    def summary():
+        ''' Return the halo exchanges and loops in the schedule. '''
+        return [(node.field.name, node.vector_index)
+                if isinstance(node, DynHaloExchange) else node
+                for node in schedule.children
+                if isinstance(node, (DynHaloExchange, DynLoop))]
+    expected = summary()
+    assert [node for node in schedule.children
+            if isinstance(node, DynHaloExchange)]
+    for node in schedule.children[:]:
+        if isinstance(node, DynHaloExchange):
+            schedule.children.remove(node)
+    for loop in schedule.loops():
+        loop.create_halo_exchanges()
+    assert summary() == expected
+
+
 def test_no_halo_exchange_for_operator():
     ''' Test that no halo exchange is generated before a kernel that reads
     from an operator '''
@@ -6124,11 +6486,10 @@ def test_dynkernargs_unexpect_stencil_extent():
 
 def test_unsupported_halo_read_access():
     '''This test checks that we raise an error if the halo_read_access
-    method finds an upper bound other than halo or ncells. The
-    particular issue at the moment is that if inner is specified we do
-    not know whether the stencil accesses the halo or not. However,
-    this limitation is not going to affect anyone until we add in loop
-    iteration space splitting transformations.
+    method finds an upper bound other than halo, ncells or inner for a
+    stencil access. A loop over inner cells never accesses the halo as
+    it is only created by splitting a loop so that the stencil accesses
+    do not reach the halo.
     '''
     # create a valid loop with a stencil access
     _, invoke_info = parse(
@@ -6142,12 +6503,14 @@ def test_unsupported_halo_read_access():
     kernel = loop.children[0]
     stencil_arg = kernel.arguments.args[1]
     loop.set_upper_bound("inner", 1)
+    assert not loop._halo_read_access(stencil_arg)
+    loop.set_upper_bound("colour_halo", 1)
     # call our method
     with pytest.raises(GenerationError) as err:
         _ = loop._halo_read_access(stencil_arg)
     assert ("Loop bounds other than cell_halo and ncells are currently "
             "unsupported for kernels with stencil accesses. Found "
-            "'inner'." in str(err))
+            "'colour_halo'." in str(err))
 
 
 def test_dynglobalsum_unsupported_scalar():
@@ -45,13 +45,21 @@ from psyclone.psyGen import PSyFactory, GenerationError, InternalError
 from psyclone.transformations import TransformationError, \
     OMPParallelTrans, \
     Dynamo0p3ColourTrans, \
+    Dynamo0p3TiledColourTrans, \
     Dynamo0p3OMPLoopTrans, \
     DynamoOMPParallelLoopTrans, \
     DynamoLoopFuseTrans, \
     KernelModuleInlineTrans, \
     MoveTrans, \
     Dynamo0p3RedundantComputationTrans, \
-    Dynamo0p3AsyncHaloExchangeTrans
+    Dynamo0p3AsyncHaloExchangeTrans, \
+    Dynamo0p3AsyncHaloExchangeOverlapTrans, \
+    Dynamo0p3HaloExchangeGroupTrans, \
+    Dynamo0p3LoopSplitTrans, \
+    Dynamo0p3AutoLoopFuseTrans, \
+    Dynamo0p3GlobalSumGroupTrans, \
+    Dynamo0p3AsyncGlobalSumTrans, \
+    Dynamo0p3AsyncGlobalSumOverlapTrans
 from psyclone.configuration import Config
 from psyclone_test_utils import TEST_COMPILE, code_compiles
 
@@ -424,6 +432,158 @@ def test_colour_str():
     assert cstr == "Split a Dynamo 0.3 loop over cells into colours"
 
 
+def test_tiled_colour_name_str():
+    ''' Test the name property and str method of the
+    Dynamo0p3TiledColourTrans class. '''
+    ctrans = Dynamo0p3TiledColourTrans()
+    assert ctrans.name == "Dynamo0p3TiledColourTrans"
+    assert (str(ctrans) == "Split a Dynamo 0.3 loop over cells into colours "
+            "of tiles of cells")
+
+
+def test_tiled_colour_trans(capsys, dist_mem):
+    '''Test the tiled colouring transformation of a single loop when
+    distributed memory is both off and on. '''
+    _, info = parse(os.path.join(BASE_PATH, "1_single_invoke.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    index = 3 if dist_mem else 0
+    schedule, _ = Dynamo0p3TiledColourTrans().apply(
+        schedule.children[index])
+    colours_loop = schedule.children[index]
+    assert colours_loop.loop_type == "tilecolours"
+    assert colours_loop.upper_bound_name == "ntilecolours"
+    tiles_loop = colours_loop.children[0]
+    assert tiles_loop.loop_type == "tiles"
+    tile_loop = tiles_loop.children[0]
+    assert tile_loop.loop_type == "tile"
+    kern = tile_loop.children[0]
+    assert kern.is_tiled()
+    assert not kern.is_coloured()
+    assert kern.tilemap == "tmap"
+    assert kern.ntilecolours_var == "ntilecolour"
+    schedule.view()
+    result, _ = capsys.readouterr()
+    assert "Loop[type='tilecolours'" in result
+    if dist_mem:
+        assert "upper_bound='tile_halo(1)'" in result
+        assert "upper_bound='tilecell_halo(1)'" in result
+    else:
+        assert "upper_bound='ntiles'" in result
+        assert "upper_bound='ntilecell'" in result
+
+    gen = str(psy.gen).lower()
+    assert "      integer, pointer :: tmap(:,:,:)\n" in gen
+    assert ("      ntilecolour = mesh%get_ntilecolours()\n"
+            "      tmap => mesh%get_coloured_tiling_map()\n") in gen
+    assert "cmap" not in gen
+    if dist_mem:
+        assert (
+            "      do colour=1,ntilecolour\n"
+            "        do tile=1,mesh%get_last_halo_tile_per_colour(colour,1)\n"
+            "          do cell=1,mesh%get_last_halo_cell_per_colour_and_tile("
+            "tile, colour,1)\n") in gen
+        # The halos are set dirty after the outermost loop
+        assert (
+            "        end do \n"
+            "      end do \n"
+            "      !\n"
+            "      ! set halos dirty/clean for fields modified in the "
+            "above loop\n"
+            "      !\n"
+            "      call f1_proxy%set_dirty()\n") in gen
+        assert gen.count("set_dirty()") == 1
+    else:
+        assert (
+            "      do colour=1,ntilecolour\n"
+            "        do tile=1,mesh%get_last_edge_tile_per_colour(colour)\n"
+            "          do cell=1,mesh%get_last_edge_cell_per_colour_and_tile("
+            "tile, colour)\n") in gen
+    assert (
+        "call testkern_code(nlayers, a, f1_proxy%data, f2_proxy%data, "
+        "m1_proxy%data, m2_proxy%data, ndf_w1, undf_w1, "
+        "map_w1(:,tmap(colour, tile, cell)), ndf_w2, undf_w2, "
+        "map_w2(:,tmap(colour, tile, cell)), ndf_w3, undf_w3, "
+        "map_w3(:,tmap(colour, tile, cell)))" in gen)
+
+
+def test_tiled_colour_trans_omp(dist_mem):
+    '''Test that the loop over the tiles of a colour can be parallelised
+    with OpenMP but that the loop over colours of tiles and the loop
+    over the cells of a tile can not. '''
+    from psyclone.dynamo0p3 import DynLoop
+    # The kernel in this example has an argument with INC access
+    _, info = parse(os.path.join(BASE_PATH, "11_any_space.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    loop = schedule.walk(schedule.children, DynLoop)[0]
+    index = loop.position
+    schedule, _ = Dynamo0p3TiledColourTrans().apply(loop)
+    colours_loop = schedule.children[index]
+    otrans = DynamoOMPParallelLoopTrans()
+    with pytest.raises(TransformationError) as err:
+        otrans.apply(colours_loop)
+    assert ("loop is over colours and must be computed serially"
+            in str(err.value))
+    with pytest.raises(TransformationError) as err:
+        otrans.apply(colours_loop.children[0].children[0])
+    assert "Colouring is required" in str(err.value)
+    with pytest.raises(TransformationError) as err:
+        Dynamo0p3OMPLoopTrans().apply(colours_loop.children[0].children[0])
+    assert "Colouring is required" in str(err.value)
+    schedule, _ = otrans.apply(colours_loop.children[0])
+    gen = str(psy.gen).lower()
+    assert (
+        "      do colour=1,ntilecolour\n"
+        "        !$omp parallel do default(shared), private(tile,cell), "
+        "schedule(static)\n"
+        "        do tile=1,") in gen
+    assert "(:,tmap(colour, tile, cell))" in gen
+    # A loop over colours of tiles can not be within an OpenMP region
+    schedule, _ = OMPParallelTrans().apply(colours_loop)
+    with pytest.raises(GenerationError) as err:
+        _ = psy.gen
+    assert ("Cannot have a loop over colours within an OpenMP parallel "
+            "region" in str(err.value))
+
+
+def test_tiled_colour_trans_errors(dist_mem):
+    '''Test that the tiled colouring transformation rejects the same
+    loops as the colouring transformation and also rejects loops
+    containing inter-grid kernels. '''
+    from psyclone.dynamo0p3 import DynLoop
+    _, info = parse(os.path.join(BASE_PATH, "15.1.1_X_plus_Y_builtin.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    ctrans = Dynamo0p3TiledColourTrans()
+    with pytest.raises(TransformationError) as err:
+        ctrans.apply(schedule)
+    assert "The supplied node is not a loop" in str(err.value)
+    with pytest.raises(TransformationError) as err:
+        ctrans.apply(schedule.children[0])
+    assert "Only loops over cells may be coloured" in str(err.value)
+    _, info = parse(os.path.join(BASE_PATH, "22.0_intergrid_prolong.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    loop = schedule.walk(schedule.children, DynLoop)[0]
+    with pytest.raises(TransformationError) as err:
+        ctrans.apply(loop)
+    assert ("cannot currently be applied to nodes which have inter-grid "
+            "kernels as children" in str(err.value))
+    # Kernels that are not tiled have no tile map
+    kern = loop.children[0]
+    with pytest.raises(InternalError) as err:
+        _ = kern.tilemap
+    assert "is not inside a tiled loop" in str(err.value)
+    with pytest.raises(InternalError) as err:
+        _ = kern.ntilecolours_var
+    assert "is not inside a tiled loop" in str(err.value)
+
+
 def test_omp_colour_trans(tmpdir, f90, f90flags, dist_mem):
     '''Test the OpenMP transformation applied to a coloured loop. We test
     when distributed memory is on or off. '''
@@ -588,6 +748,65 @@ def test_omp_colouring_needed(monkeypatch, annexed):
         assert "Colouring is required" in str(excinfo.value)
 
 
+def test_cma_requires_colouring(dist_mem):
+    '''Test that DynLoop.requires_colouring() knows that loops containing
+    CMA assembly, matrix-matrix or apply (onto a discontinuous space)
+    kernels are race-free while those applying a CMA operator to a
+    field on a continuous space are not. '''
+    expected = [("20.0_cma_assembly.f90", False),
+                ("20.3_cma_assembly_field.f90", False),
+                ("20.2_cma_matrix_matrix.f90", False),
+                ("20.1.2_cma_apply_disc.f90", False),
+                ("20.1_cma_apply.f90", True)]
+    for fname, colour in expected:
+        _, info = parse(os.path.join(BASE_PATH, fname), api=TEST_API)
+        psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+        schedule = psy.invokes.invoke_list[0].schedule
+        loop = schedule.loops()[0]
+        assert loop.requires_colouring() is colour
+
+
+def test_omp_cma_no_colouring(dist_mem):
+    '''Test that loops containing CMA assembly and matrix-matrix kernels
+    may be parallelised over cells with OpenMP without colouring and
+    that a CMA apply onto a continuous space is still rejected. '''
+    from psyclone.transformations import OMPParallelTrans
+    otrans = DynamoOMPParallelLoopTrans()
+    for fname, kname in [("20.0_cma_assembly.f90",
+                          "columnwise_op_asm_kernel_code"),
+                         ("20.2_cma_matrix_matrix.f90",
+                          "columnwise_op_mul_kernel_code")]:
+        _, info = parse(os.path.join(BASE_PATH, fname), api=TEST_API)
+        psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+        schedule = psy.invokes.invoke_list[0].schedule
+        schedule, _ = otrans.apply(schedule.loops()[0])
+        code = str(psy.gen)
+        assert "!$omp parallel do default(shared), private(cell)" in code
+        assert "CALL {0}(cell, ".format(kname) in code
+        assert "colour" not in code
+
+    # Orphaned OpenMP do within a parallel region
+    _, info = parse(os.path.join(BASE_PATH, "20.0_cma_assembly.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    schedule, _ = Dynamo0p3OMPLoopTrans().apply(schedule.loops()[0])
+    schedule, _ = OMPParallelTrans().apply(schedule.loops()[0].parent)
+    code = str(psy.gen)
+    assert "!$omp do schedule(static)" in code
+    assert "CALL columnwise_op_asm_kernel_code(cell, " in code
+
+    # Applying a CMA operator to a field on a continuous space increments
+    # dofs shared between cells and so still requires colouring
+    _, info = parse(os.path.join(BASE_PATH, "20.1_cma_apply.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    with pytest.raises(TransformationError) as excinfo:
+        otrans.apply(schedule.loops()[0])
+    assert "Colouring is required" in str(excinfo.value)
+
+
 def test_check_seq_colours_omp_parallel_do(monkeypatch, annexed):
     '''Test that we raise an error if the user attempts to apply an OpenMP
     PARALLEL DO transformation to a loop over colours (since any such
@@ -3475,6 +3694,72 @@ def test_reprod_builtins_red_then_usual_do(monkeypatch, annexed):
                 "      DEALLOCATE (l_asum)\n") in result
 
 
+def test_reprod_persistent_buffers(tmpdir, f90, f90flags, monkeypatch):
+    '''test that the local reduction arrays used by reproducible OpenMP
+    reductions are declared in the PSy-layer module, are only
+    (re-)allocated when required and are combined using a pairwise
+    tree when REPROD_PERSISTENT_BUFFERS is True.
+
+    '''
+    monkeypatch.setattr(Config.get(), "_reprod_persistent_buffers", True)
+    _, invoke_info = parse(
+        os.path.join(BASE_PATH, "15.19.1_three_builtins_two_reductions.f90"),
+        api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(invoke_info)
+    invoke = psy.invokes.invoke_list[0]
+    schedule = invoke.schedule
+    otrans = Dynamo0p3OMPLoopTrans()
+    rtrans = OMPParallelTrans()
+    for child in schedule.children:
+        schedule, _ = otrans.apply(child, reprod=True)
+    schedule, _ = rtrans.apply(schedule.children)
+    invoke.schedule = schedule
+    result = str(psy.gen)
+    print(result)
+    assert (
+        "    IMPLICIT NONE\n"
+        "    REAL(KIND=r_def), allocatable, dimension(:,:) :: l_bsum\n"
+        "    REAL(KIND=r_def), allocatable, dimension(:,:) :: l_asum\n"
+        "    CONTAINS\n") in result
+    assert result.count("dimension(:,:) :: l_asum") == 1
+    assert "      INTEGER th_lvl\n" in result
+    assert (
+        "      asum = 0.0_r_def\n"
+        "      IF (allocated(l_asum)) THEN\n"
+        "        IF (size(l_asum, 2) /= nthreads) THEN\n"
+        "          DEALLOCATE (l_asum)\n"
+        "        END IF \n"
+        "      END IF \n"
+        "      IF (.not. allocated(l_asum)) THEN\n"
+        "        ALLOCATE (l_asum(8,nthreads))\n"
+        "      END IF \n"
+        "      l_asum = 0.0_r_def\n") in result
+    assert (
+        "      !$omp end parallel\n"
+        "      !\n"
+        "      ! combine the partial results pairwise\n"
+        "      !\n"
+        "      DO th_lvl=0,bit_size(nthreads)-leadz(nthreads-1)-1\n"
+        "        DO th_idx=1,nthreads-2**th_lvl,2**(th_lvl+1)\n"
+        "          l_asum(1,th_idx) = l_asum(1,th_idx)+"
+        "l_asum(1,th_idx+2**th_lvl)\n"
+        "        END DO \n"
+        "      END DO \n"
+        "      asum = asum+l_asum(1,1)\n"
+        "      DO th_lvl=0,bit_size(nthreads)-leadz(nthreads-1)-1\n"
+        "        DO th_idx=1,nthreads-2**th_lvl,2**(th_lvl+1)\n"
+        "          l_bsum(1,th_idx) = l_bsum(1,th_idx)+"
+        "l_bsum(1,th_idx+2**th_lvl)\n"
+        "        END DO \n"
+        "      END DO \n"
+        "      bsum = bsum+l_bsum(1,1)\n") in result
+    assert "DEALLOCATE (l_asum)\n      global" not in result
+    assert result.count("DEALLOCATE") == 2
+
+    if TEST_COMPILE:
+        assert code_compiles(TEST_API, psy, tmpdir, f90, f90flags)
+
+
 def test_repr_bltins_red_then_usual_fuse_do(monkeypatch, annexed):
     '''test that we generate a correct reproducible OpenMP do reduction
     for two different loop-fused builtins, first a reduction then
@@ -6757,125 +7042,1013 @@ def test_intergrid_err(dist_mem):
     assert expected_err in str(excinfo)
 
 
-def test_no_acc():
+def test_acc_data_parallel_loop(tmpdir, f90, f90flags, dist_mem):
     '''
-    Check that attempting to add any sort of OpenACC directive to a
-    dynamo0p3 Schedule causes an error.
+    Check that we can put a dynamo0p3 loop within an OpenACC parallel
+    region and data region. The data must be copied to the device on
+    every call and removed from it at the end of the invoke. The loop
+    bounds must be evaluated on the host, the data read/written within
+    the region must be updated on the device/host and the halo status of
+    the modified fields must be updated once the region has ended.
 
     '''
     from psyclone.transformations import ACCDataTrans, ACCLoopTrans, \
         ACCParallelTrans
-    accdt = ACCDataTrans()
-    accpt = ACCParallelTrans()
-    acclt = ACCLoopTrans()
+    _, info = parse(os.path.join(BASE_PATH, "1_single_invoke.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    loop = schedule.loops()[0]
+    schedule, _ = ACCParallelTrans().apply(loop)
+    schedule, _ = ACCLoopTrans().apply(loop)
+    schedule, _ = ACCDataTrans().apply(schedule)
+    code = str(psy.gen)
 
-    _, info = parse(os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                                 "test_files", "dynamo0p3",
-                                 "1_single_invoke.f90"),
+    # The data must be copied to the device on every call as the proxies
+    # and dofmaps are local variables of the PSy layer
+    assert "first_time" not in code
+    assert ("      ! Copy all fields to the device\n"
+            "      !$acc enter data copyin(a,f1_proxy,f1_proxy%data,"
+            "f2_proxy,f2_proxy%data,m1_proxy,m1_proxy%data,m2_proxy,"
+            "m2_proxy%data,map_w1,map_w2,map_w3)\n" in code)
+    assert ("      ! Remove all fields from the device\n"
+            "      !$acc exit data delete(map_w3,map_w2,map_w1,m2_proxy%data,"
+            "m2_proxy,m1_proxy%data,m1_proxy,f2_proxy%data,f2_proxy,"
+            "f1_proxy%data,f1_proxy,a)\n"
+            "      !\n"
+            "    END SUBROUTINE invoke_0_testkern_type\n" in code)
+    assert "      CALL acc_update_device(a, 1)\n" in code
+    assert "      INTEGER loop_stop\n" in code
+    if dist_mem:
+        upper_bound = "mesh%get_last_halo_cell(1)"
+    else:
+        upper_bound = "f1_proxy%vspace%get_ncell()"
+    assert ("      loop_stop = {0}\n"
+            "      !$acc update device(f2_proxy%data,m1_proxy%data,"
+            "m2_proxy%data)\n"
+            "      !$acc parallel default(present)\n"
+            "      !$acc loop independent\n"
+            "      DO cell=1,loop_stop\n".format(upper_bound) in code)
+    end_region = ("      END DO \n"
+                  "      !$acc end parallel\n"
+                  "      !$acc update host(f1_proxy%data)\n")
+    assert end_region in code
+    if dist_mem:
+        assert ("      !$acc update host(f1_proxy%data)\n"
+                "      !\n"
+                "      ! Set halos dirty/clean for fields modified in the "
+                "above loop\n"
+                "      !\n"
+                "      CALL f1_proxy%set_dirty()\n" in code)
+    else:
+        assert "set_dirty" not in code
+
+    if TEST_COMPILE:
+        # If compilation testing has been enabled
+        # (--compile --f90="<compiler_name>" flags to py.test)
+        assert code_compiles("dynamo0.3", psy, tmpdir, f90, f90flags)
+
+
+def test_acc_colouring(tmpdir, f90, f90flags, dist_mem):
+    '''
+    Check that an OpenACC parallel region may be placed around the loop
+    over the cells of a single colour (but not around the loop over
+    colours) and that the colour map is then copied to the device.
+
+    '''
+    from psyclone.transformations import ACCDataTrans, ACCLoopTrans, \
+        ACCParallelTrans
+    _, info = parse(os.path.join(BASE_PATH, "4.6_multikernel_invokes.f90"),
                     api=TEST_API)
-    psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
-    sched = psy.invokes.get('invoke_0_testkern_type').schedule
+    psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    ptrans = ACCParallelTrans()
+    ltrans = ACCLoopTrans()
 
-    with pytest.raises(NotImplementedError) as err:
-        _ = accdt.apply(sched)
-    assert ("ACCDataDirective not implemented for a schedule of type "
-            in str(err))
+    # The kernels have an argument with INC access so the loops must be
+    # coloured before an OpenACC loop directive can be applied
+    with pytest.raises(TransformationError) as err:
+        ltrans.apply(schedule.loops()[0])
+    assert ("Error in ACCLoopTrans transformation. The kernel has an "
+            "argument with INC access. Colouring is required."
+            in str(err.value))
 
-    with pytest.raises(NotImplementedError) as err:
-        _ = accpt.apply(sched.children)
-    assert ("OpenACC parallel regions are currently only supported for "
-            "the gocean 1.0 API" in str(err))
+    ctrans = Dynamo0p3ColourTrans()
+    for loop in schedule.loops():
+        schedule, _ = ctrans.apply(loop)
+    colours_loops = [loop for loop in schedule.loops()
+                     if loop.loop_type == "colours"]
+    with pytest.raises(TransformationError) as err:
+        ptrans.apply(colours_loops[0])
+    assert ("Error in ACCParallelTrans transformation. Loops over colours "
+            "or tiles must be executed on the host" in str(err.value))
+    with pytest.raises(TransformationError) as err:
+        ltrans.apply(colours_loops[0])
+    assert "The target loop is over colours" in str(err.value)
 
-    with pytest.raises(NotImplementedError) as err:
-        _ = acclt.apply(sched.children[0])
-    assert ("OpenACC loop transformations are currently only supported for "
-            "the gocean 1.0 API" in str(err))
+    for loop in colours_loops:
+        schedule, _ = ptrans.apply(loop.children[0])
+        schedule, _ = ltrans.apply(loop.children[0].children[0])
+    schedule, _ = ACCDataTrans().apply(schedule)
+    code = str(psy.gen)
 
+    assert ("map_w2,map_w3,map_w0,cmap,f_proxy,f_proxy%data)\n" in code)
+    assert ("      DO colour=1,ncolour\n"
+            "        loop_stop = mesh%get_last_" in code)
+    assert ("        !$acc loop independent\n"
+            "        DO cell=1,loop_stop\n" in code)
+    assert ("        !$acc end parallel\n"
+            "        !$acc update host(a_proxy%data)\n"
+            "      END DO \n" in code)
 
-def test_no_ocl():
-    ''' Check that attempting to apply an OpenCL transformation to a Dynamo
-    Schedule raises the expected error. '''
-    from psyclone.transformations import OCLTrans
-    _, info = parse(os.path.join(os.path.dirname(os.path.abspath(__file__)),
-                                 "test_files", "dynamo0p3",
-                                 "1_single_invoke.f90"),
+    if TEST_COMPILE:
+        # If compilation testing has been enabled
+        # (--compile --f90="<compiler_name>" flags to py.test)
+        assert code_compiles("dynamo0.3", psy, tmpdir, f90, f90flags)
+
+
+def test_acc_colours_loop_in_region():
+    '''
+    Check that we raise the expected error if a loop over colours ends
+    up within an OpenACC parallel region (by colouring a loop after it
+    has been put in the region).
+
+    '''
+    from psyclone.transformations import ACCDataTrans, ACCParallelTrans
+    _, info = parse(os.path.join(BASE_PATH, "11_any_space.f90"),
                     api=TEST_API)
     psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
-    sched = psy.invokes.get('invoke_0_testkern_type').schedule
-    trans = OCLTrans()
-    with pytest.raises(TransformationError) as err:
-        _ = trans.apply(sched)
-    assert ("OpenCL generation is currently only supported for the GOcean "
-            "API but got a Schedule of type:" in str(err))
+    schedule = psy.invokes.invoke_list[0].schedule
+    loop = schedule.loops()[0]
+    schedule, _ = ACCParallelTrans().apply(loop)
+    schedule, _ = ACCDataTrans().apply(schedule)
+    schedule, _ = Dynamo0p3ColourTrans().apply(loop)
+    with pytest.raises(GenerationError) as err:
+        _ = psy.gen
+    assert ("Cannot have a loop over colours within an OpenACC parallel "
+            "region." in str(err.value))
 
 
-def test_async_hex_wrong_node():
-    '''Test that we raise the expected exception if an asynchronous halo
-    exchange transformation is applied to a node that is not a halo
-    exchange.
+def test_acc_basis_copyin(dist_mem):
+    '''
+    Check that basis functions and quadrature weights, which are
+    re-computed every time the PSy layer is called, are copied to the
+    device on entry to the parallel region rather than in the data region.
 
     '''
-    from psyclone.psyGen import Loop
-    node = Loop()
-    ahex = Dynamo0p3AsyncHaloExchangeTrans()
-    with pytest.raises(TransformationError) as err:
-        _, _ = ahex.apply(node)
-    assert "node must be a synchronous halo exchange" in str(err.value)
+    from psyclone.transformations import ACCDataTrans, ACCParallelTrans
+    _, info = parse(os.path.join(BASE_PATH, "1.1.0_single_invoke_xyoz_qr.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    schedule, _ = ACCParallelTrans().apply(schedule.loops()[0])
+    schedule, _ = ACCDataTrans().apply(schedule)
+    code = str(psy.gen)
+    assert ("!$acc enter data copyin(f1_proxy,f1_proxy%data,f2_proxy,"
+            "f2_proxy%data,m1_proxy,m1_proxy%data,a,m2_proxy,m2_proxy%data,"
+            "istp,map_w1,map_w2,map_w3)\n" in code)
+    assert ("      !$acc parallel default(present), copyin(basis_w1_qr,"
+            "diff_basis_w2_qr,basis_w3_qr,diff_basis_w3_qr,weights_xy_qr,"
+            "weights_z_qr)\n" in code)
 
 
-def test_async_hex_name():
-    ''' Name test for the Dynamo0p3AsyncHaloExchangeTrans class. '''
-    ahex = Dynamo0p3AsyncHaloExchangeTrans()
-    assert ahex.name == "Dynamo0p3AsyncHaloExchangeTrans"
+def test_acc_builtins(dist_mem):
+    '''
+    Check that built-ins may be executed on an OpenACC device (literal
+    scalar arguments are not copied to the device) but that reductions
+    are rejected.
 
+    '''
+    from psyclone.transformations import ACCDataTrans, ACCLoopTrans, \
+        ACCParallelTrans
+    _, info = parse(os.path.join(BASE_PATH,
+                                 "15.17.2_one_standard_builtin_one_"
+                                 "reduction.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    loops = schedule.loops()
+    for trans in [ACCParallelTrans(), ACCLoopTrans()]:
+        with pytest.raises(TransformationError) as err:
+            trans.apply(loops[1])
+        assert ("Kernel 'sum_x' performs a reduction which is not yet "
+                "supported on an OpenACC device" in str(err.value))
+    schedule, _ = ACCParallelTrans().apply(loops[0])
+    schedule, _ = ACCDataTrans().apply(schedule)
+    code = str(psy.gen)
+    assert ("!$acc enter data copyin(bvalue,f1_proxy,f1_proxy%data)\n"
+            in code)
+    assert "CALL acc_update_device(bvalue, 1)\n" in code
 
-def test_async_hex_str():
-    ''' String test for the Dynamo0p3AsyncHaloExchangeTrans class. '''
-    ahex = Dynamo0p3AsyncHaloExchangeTrans()
-    assert (str(ahex) == "Changes a synchronous halo exchange into an "
-            "asynchronous one.")
+    _, info = parse(os.path.join(BASE_PATH,
+                                 "15.12.3_single_pointwise_builtin.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    loop = schedule.loops()[0]
+    schedule, _ = ACCParallelTrans().apply(loop)
+    schedule, _ = ACCLoopTrans().apply(loop)
+    schedule, _ = ACCDataTrans().apply(schedule)
+    code = str(psy.gen)
+    assert "!$acc enter data copyin(f1_proxy,f1_proxy%data)\n" in code
+    assert "acc_update_device" not in code
+    assert ("      !$acc parallel default(present)\n"
+            "      !$acc loop independent\n"
+            "      DO df=1,loop_stop\n"
+            "        f1_proxy%data(df) = 0.0\n"
+            "      END DO \n"
+            "      !$acc end parallel\n"
+            "      !$acc update host(f1_proxy%data)\n" in code)
+
+
+def test_acc_unsupported_kernels():
+    '''
+    Check that kernels requiring orientation information or applying
+    boundary conditions and inter-grid kernels are rejected by the
+    OpenACC transformations.
 
+    '''
+    from psyclone.transformations import ACCLoopTrans, ACCParallelTrans
+    for name, expected in [
+            ("9_orientation.f90", "requires orientation information"),
+            ("12.2_enforce_bc_kernel.f90", "applies boundary conditions"),
+            ("12.4_enforce_op_bc_kernel.f90", "applies boundary conditions"),
+            ("22.0_intergrid_prolong.f90", "inter-grid kernels")]:
+        _, info = parse(os.path.join(BASE_PATH, name), api=TEST_API)
+        psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+        schedule = psy.invokes.invoke_list[0].schedule
+        loop = schedule.loops()[0]
+        for trans in [ACCParallelTrans(), ACCLoopTrans()]:
+            with pytest.raises(TransformationError) as err:
+                trans.apply(loop)
+            assert expected in str(err.value)
+
+
+def test_kern_call_acc_arg_list():
+    '''
+    Check the lists of quantities required on an OpenACC device for
+    kernels with field-vector, stencil, operator and CMA arguments and
+    for inter-grid kernels.
 
-def test_async_hex(tmpdir, f90, f90flags):
-    '''Test that we can convert a synchronous halo exchange to an
-    asynchronous one using the Dynamo0p3AsyncHaloExchangeTrans transformation.
+    '''
+    from psyclone.dynamo0p3 import KernCallAccArgList
+    expected = {
+        "8_vector_field.f90": (
+            ["f1_proxy", "f1_proxy%data", "chi_proxy", "chi_proxy(1)%data",
+             "chi_proxy(2)%data", "chi_proxy(3)%data", "f2_proxy",
+             "f2_proxy%data", "map_w0"], []),
+        "19.1_single_stencil.f90": (
+            ["f1_proxy", "f1_proxy%data", "f2_proxy", "f2_proxy%data",
+             "f2_stencil_dofmap", "f3_proxy", "f3_proxy%data", "f4_proxy",
+             "f4_proxy%data", "map_w1", "map_w2", "map_w3"], []),
+        "20.1_cma_apply.f90": (
+            ["field_a_proxy", "field_a_proxy%data", "field_b_proxy",
+             "field_b_proxy%data", "cma_op1_matrix",
+             "map_any_space_1_field_a",
+             "cma_indirection_map_any_space_1_field_a",
+             "map_any_space_2_field_b",
+             "cma_indirection_map_any_space_2_field_b"], []),
+        "22.0_intergrid_prolong.f90": (
+            ["cell_map_field2", "field1_proxy", "field1_proxy%data",
+             "field2_proxy", "field2_proxy%data", "map_w1",
+             "map_w2"], []),
+        "10_operator.f90": (
+            ["mm_w0_proxy", "mm_w0_proxy%local_stencil", "chi_proxy",
+             "chi_proxy(1)%data", "chi_proxy(2)%data", "chi_proxy(3)%data",
+             "a", "map_w0"],
+            ["basis_w0_qr", "diff_basis_w0_qr", "weights_xy_qr",
+             "weights_z_qr"])}
+    for name in expected:
+        _, info = parse(os.path.join(BASE_PATH, name), api=TEST_API)
+        psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+        kern = psy.invokes.invoke_list[0].schedule.calls()[0]
+        create_acc_arg_list = KernCallAccArgList(kern)
+        create_acc_arg_list.generate()
+        assert create_acc_arg_list.arglist == expected[name][0]
+        assert create_acc_arg_list.copyin_list == expected[name][1]
+        assert kern.arguments.acc_args == expected[name][0]
+        assert kern.arguments.acc_copyin_args == expected[name][1]
+
+    # Kernels requiring orientation information or applying boundary
+    # conditions are not supported
+    for name in ["9_orientation.f90", "12.2_enforce_bc_kernel.f90",
+                 "12.4_enforce_op_bc_kernel.f90"]:
+        _, info = parse(os.path.join(BASE_PATH, name), api=TEST_API)
+        psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+        kern = psy.invokes.invoke_list[0].schedule.calls()[0]
+        with pytest.raises(GenerationError) as err:
+            KernCallAccArgList(kern).generate()
+        assert ("which is not supported within an OpenACC region"
+                in str(err.value))
+
+
+def test_acc_routine_trans(tmpdir, monkeypatch):
+    '''
+    Check that a dynamo0p3 kernel that is called from within an OpenACC
+    parallel region can be transformed with ACCRoutineTrans.
 
     '''
-    _, invoke_info = parse(os.path.join(
-        os.path.dirname(os.path.abspath(__file__)),
-        "test_files", "dynamo0p3",
-        "1_single_invoke.f90"),
-                           api=TEST_API)
-    psy = PSyFactory(TEST_API, distributed_memory=True).create(invoke_info)
+    from psyclone.transformations import ACCDataTrans, ACCLoopTrans, \
+        ACCParallelTrans, ACCRoutineTrans
+    config = Config.get()
+    monkeypatch.setattr(config, "_kernel_output_dir", str(tmpdir))
+    _, info = parse(os.path.join(BASE_PATH, "1_single_invoke.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
     schedule = psy.invokes.invoke_list[0].schedule
-    f2_hex = schedule.children[0]
-    ahex_trans = Dynamo0p3AsyncHaloExchangeTrans()
-    schedule, _ = ahex_trans.apply(f2_hex)
-    result = str(psy.gen)
-    assert (
-        "      ! Call kernels and communication routines\n"
-        "      !\n"
-        "      IF (f2_proxy%is_dirty(depth=1)) THEN\n"
-        "        CALL f2_proxy%halo_exchange_start(depth=1)\n"
-        "      END IF \n"
-        "      !\n"
-        "      IF (f2_proxy%is_dirty(depth=1)) THEN\n"
-        "        CALL f2_proxy%halo_exchange_finish(depth=1)\n"
-        "      END IF \n"
-        "      !\n") in result
+    loop = schedule.loops()[0]
+    schedule, _ = ACCParallelTrans().apply(loop)
+    schedule, _ = ACCLoopTrans().apply(loop)
+    schedule, _ = ACCDataTrans().apply(schedule)
+    _, _ = ACCRoutineTrans().apply(loop.children[0])
+    code = str(psy.gen)
+    assert "CALL testkern_0_code(nlayers, a, f1_proxy%data" in code
+    with open(os.path.join(str(tmpdir), "testkern_0_mod.f90")) as ffile:
+        assert "!$acc routine\n" in ffile.read()
+
+
+def test_omp_task_trans(tmpdir, f90, f90flags, dist_mem):
+    '''
+    Check that OMPTaskTrans creates an OpenMP parallel region containing
+    a single region in which each node is a task with depend clauses
+    given by the accesses of its arguments. Halo exchanges must be
+    undeferred tasks and no colouring is required.
+
+    '''
+    from psyclone.transformations import OMPTaskTrans
+    _, info = parse(os.path.join(BASE_PATH, "4.6_multikernel_invokes.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    schedule, _ = OMPTaskTrans().apply(schedule.children)
+    assert len(schedule.children) == 1
+    code = str(psy.gen)
+
+    assert ("      !$omp parallel default(shared), private(cell)\n"
+            "      !$omp single\n"
+            "      !$omp task " in code)
+    assert ("      !$omp end task\n"
+            "      !$omp end single\n"
+            "      !$omp end parallel\n" in code)
+    assert code.count("!$omp task ") == code.count("!$omp end task\n")
+    assert ("      !$omp task private(cell), depend(in: b,istp,rdt,d,e), "
+            "depend(inout: a)\n"
+            "      DO cell=1," in code)
+    assert ("      !$omp task private(cell), depend(in: b,istp,rdt,d,e), "
+            "depend(inout: f)\n" in code)
+    assert "omp master" not in code
+    if dist_mem:
+        assert code.count("!$omp task ") == 9
+        assert ("      !$omp task depend(inout: e), if(.false.)\n"
+                "      IF (e_proxy(3)%is_dirty(depth=1)) THEN\n" in code)
+        # The halos are marked as dirty within the task that updates
+        # the field
+        assert ("      CALL a_proxy%set_dirty()\n"
+                "      !\n"
+                "      !$omp end task\n"
+                "      !$omp task depend(inout: f), if(.false.)\n" in code)
+    else:
+        assert code.count("!$omp task ") == 2
+        assert "if(.false.)" not in code
 
     if TEST_COMPILE:
-        # If compilation testing has been enabled (--compile flag
-        # to py.test)
+        # If compilation testing has been enabled
+        # (--compile --f90="<compiler_name>" flags to py.test)
         assert code_compiles("dynamo0.3", psy, tmpdir, f90, f90flags)
 
 
-def test_async_hex_move_1(tmpdir, f90, f90flags):
-    '''Test that we can convert a synchronous halo exchange to an
-    asynchronous one using the Dynamo0p3AsyncHaloExchangeTrans
-    transformation and then move them to new valid locations. In this
-    case we move them before and after other halo exchanges
-    respectively.
+def test_omp_task_colouring():
+    '''
+    Check that a coloured loop may be executed as an OpenMP task (the
+    loop over colours is serial within the task).
+
+    '''
+    from psyclone.transformations import OMPTaskTrans
+    _, info = parse(os.path.join(BASE_PATH, "11_any_space.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    schedule, _ = Dynamo0p3ColourTrans().apply(schedule.children[0])
+    schedule, _ = OMPTaskTrans().apply(schedule.children[0])
+    code = str(psy.gen)
+    assert ("      !$omp parallel default(shared), private(colour,cell)\n"
+            "      !$omp single\n"
+            "      !$omp task private(colour,cell), depend(in: rdt,b,c), "
+            "depend(inout: a)\n"
+            "      DO colour=1,ncolour\n" in code)
+
+
+def test_omp_task_reduction():
+    '''
+    Check that a reduction variable is zeroed within the task that
+    performs the reduction and that the subsequent global sum is an
+    undeferred task that depends upon it.
+
+    '''
+    from psyclone.transformations import OMPTaskTrans
+    _, info = parse(os.path.join(BASE_PATH,
+                                 "15.17.2_one_standard_builtin_one_"
+                                 "reduction.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    schedule, _ = OMPTaskTrans().apply(schedule.children)
+    code = str(psy.gen)
+    assert ("      !$omp task private(df), depend(in: bvalue), "
+            "depend(inout: f1)\n" in code)
+    assert ("      !$omp task private(df), depend(in: f1), "
+            "depend(out: asum)\n"
+            "      !\n"
+            "      ! Zero summation variables\n"
+            "      !\n"
+            "      asum = 0.0_r_def\n" in code)
+    assert code.count("asum = 0.0_r_def") == 1
+    assert ("      !$omp task depend(inout: asum), if(.false.)\n"
+            "      global_sum%value = asum\n"
+            "      asum = global_sum%get_sum()\n"
+            "      !$omp end task\n" in code)
+
+
+def test_omp_task_trans_errors():
+    ''' Check that OMPTaskTrans rejects invalid nodes. '''
+    from psyclone.transformations import OMPTaskTrans
+    ttrans = OMPTaskTrans()
+    assert str(ttrans) == ("Execute nodes as OpenMP tasks within an OpenMP "
+                           "parallel region")
+    _, info = parse(os.path.join(BASE_PATH, "4_multikernel_invokes.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+
+    with pytest.raises(TransformationError) as err:
+        ttrans.apply(schedule)
+    assert ("A OMPTaskTrans transformation cannot be applied to a "
+            "Schedule" in str(err.value))
+    with pytest.raises(TransformationError) as err:
+        ttrans.apply("invalid")
+    assert "have been passed an object of type" in str(err.value)
+    with pytest.raises(TransformationError) as err:
+        ttrans.apply([schedule.children[1], schedule.children[0]])
+    assert "Children are not consecutive children" in str(err.value)
+
+    schedule, _ = Dynamo0p3OMPLoopTrans().apply(schedule.children[0])
+    with pytest.raises(TransformationError) as err:
+        ttrans.apply(schedule.children)
+    assert ("the nodes to be executed as tasks must not contain any OpenMP "
+            "or OpenACC directives" in str(err.value))
+    schedule, _ = OMPParallelTrans().apply(schedule.children[0])
+    with pytest.raises(TransformationError) as err:
+        ttrans.apply(schedule.children[0].children[0].children[0])
+    assert ("cannot create OpenMP tasks within another OpenMP region"
+            in str(err.value))
+
+    # Only the dynamo0.3 API is supported
+    _, info = parse(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 "test_files", "gocean1p0",
+                                 "single_invoke_three_kernels.f90"),
+                    api="gocean1.0")
+    psy = PSyFactory("gocean1.0", distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    with pytest.raises(NotImplementedError) as err:
+        ttrans.apply(schedule.children)
+    assert ("OpenMP tasks are currently only supported for the dynamo0.3 "
+            "API" in str(err.value))
+
+
+def _omp_region(name, dist_mem, omp_schedule="static"):
+    '''
+    Creates the PSy object for the supplied dynamo0.3 algorithm file with
+    an OpenMP do directive around every loop and an OpenMP parallel
+    region around all of them.
+
+    :param str name: the name of the algorithm file.
+    :param bool dist_mem: whether distributed memory is enabled.
+    :param str omp_schedule: the OpenMP schedule of the loops.
+    :returns: the PSy object and the OpenMP parallel region.
+    :rtype: (:py:class:`psyclone.dynamo0p3.DynamoPSy`, \
+             :py:class:`psyclone.psyGen.OMPParallelDirective`)
+    '''
+    from psyclone.psyGen import OMPDoDirective
+    _, info = parse(os.path.join(BASE_PATH, name), api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    otrans = Dynamo0p3OMPLoopTrans(omp_schedule=omp_schedule)
+    for loop in schedule.loops():
+        schedule, _ = otrans.apply(loop)
+    nodes = [node for node in schedule.children
+             if isinstance(node, OMPDoDirective)]
+    schedule, _ = OMPParallelTrans().apply(nodes)
+    return psy, nodes[0].parent
+
+
+def test_omp_nowait_independent(capsys, tmpdir, f90, f90flags, dist_mem):
+    ''' Check that Dynamo0p3OMPNowaitTrans removes the barriers between
+    OpenMP do loops that do not depend on one another and the barrier
+    at the end of the parallel region. '''
+    from psyclone.transformations import Dynamo0p3OMPNowaitTrans
+    psy, region = _omp_region("15.14.2_multiple_set_kernels.f90", dist_mem)
+    schedule = psy.invokes.invoke_list[0].schedule
+    trans = Dynamo0p3OMPNowaitTrans()
+    assert str(trans) == ("Removes the barriers at the end of OpenMP do "
+                          "loops that are not required")
+    assert trans.name == "Dynamo0p3OMPNowaitTrans"
+    _, _ = trans.apply(schedule)
+    assert all(loop.nowait for loop in region.children)
+    assert trans.removed == [["setval_c"]] * 3
+    assert trans.kept == []
+    assert trans.report() == (
+        "Removed the barrier after the loop calling setval_c\n"
+        "Removed the barrier after the loop calling setval_c\n"
+        "Removed the barrier after the loop calling setval_c (end of the "
+        "parallel region)")
+    schedule.view()
+    out, _ = capsys.readouterr()
+    assert "[OMP do][nowait]" in out
+    code = str(psy.gen)
+    assert code.count("!$omp end do nowait\n") == 3
+    assert "!$omp end do\n" not in code
+    if dist_mem:
+        assert ("      !$omp end do nowait\n"
+                "      !\n"
+                "      ! Set halos dirty/clean for fields modified in the "
+                "above loop\n"
+                "      !\n"
+                "      !$omp master\n"
+                "      CALL f1_proxy%set_dirty()\n" in code)
+
+    if TEST_COMPILE:
+        # If compilation testing has been enabled
+        # (--compile --f90="<compiler_name>" flags to py.test)
+        assert code_compiles("dynamo0.3", psy, tmpdir, f90, f90flags)
+
+
+def test_omp_nowait_dependence():
+    ''' Check that Dynamo0p3OMPNowaitTrans keeps the barrier after a loop
+    over cells that writes to a field that is read by the following loop
+    and that it may be applied to a single parallel region. '''
+    from psyclone.transformations import Dynamo0p3OMPNowaitTrans
+    psy, region = _omp_region("19.14_two_stencils_same_field.f90", False)
+    trans = Dynamo0p3OMPNowaitTrans()
+    _, _ = trans.apply(region)
+    assert [loop.nowait for loop in region.children] == [False, True]
+    assert trans.kept == [
+        (["testkern_stencil_code"], ["testkern_stencil_depth_code"],
+         "'f1_w1' is accessed with 'gh_write' by the first loop and with "
+         "'gh_read' by the second loop")]
+    code = str(psy.gen)
+    assert ("      END DO \n"
+            "      !$omp end do\n"
+            "      !$omp do schedule(static)\n" in code)
+    assert ("      END DO \n"
+            "      !$omp end do nowait\n"
+            "      !$omp end parallel\n" in code)
+
+
+def test_omp_nowait_dofs():
+    ''' Check that loops over the same dofs with a static schedule do not
+    need a barrier between them even if they access the same field but
+    that a reduction does, as does a non-static schedule. '''
+    from psyclone.transformations import Dynamo0p3OMPNowaitTrans
+    trans = Dynamo0p3OMPNowaitTrans()
+    # inc_a_times_X(bvalue, f1) followed by sum_X(asum, f1)
+    _, region = _omp_region(
+        "15.17.2_one_standard_builtin_one_reduction.f90", False)
+    _, _ = trans.apply(region)
+    assert [loop.nowait for loop in region.children] == [True, True]
+    _, region = _omp_region(
+        "15.17.2_one_standard_builtin_one_reduction.f90", False,
+        omp_schedule="dynamic")
+    _, _ = trans.apply(region)
+    assert [loop.nowait for loop in region.children] == [False, True]
+    assert trans.kept[0][2] == ("'f1' is accessed with 'gh_inc' by the first "
+                                "loop and with 'gh_read' by the second loop")
+
+    # setval_c(f1, asum), sum_X(asum, f1), setval_c(f1, asum)
+    _, region = _omp_region("15.14.3_sum_setval_field_builtin.f90", False)
+    _, _ = trans.apply(region)
+    assert [loop.nowait for loop in region.children] == [False, False, True]
+    assert trans.report() == (
+        "Kept the barrier after the loop calling setval_c as the loop "
+        "calling sum_x depends on it: it performs a reduction into 'asum' "
+        "which is read by the first loop\n"
+        "Kept the barrier after the loop calling sum_x as the loop calling "
+        "setval_c depends on it: it uses the result of the reduction into "
+        "'asum'\n"
+        "Removed the barrier after the loop calling setval_c (end of the "
+        "parallel region)")
+
+
+def test_omp_nowait_since_barrier():
+    ''' Check that a dependence on any of the loops since the previous
+    barrier (rather than just on the preceding loop) keeps the barrier. '''
+    from psyclone.transformations import Dynamo0p3OMPNowaitTrans
+    # X_innerproduct_Y(asum, f1, f2), inc_a_times_X(b, f1) and
+    # inc_a_times_X(asum, f1)
+    _, region = _omp_region("15.18.1_builtins_reduction_fuse_error.f90",
+                            False)
+    trans = Dynamo0p3OMPNowaitTrans()
+    _, _ = trans.apply(region)
+    assert [loop.nowait for loop in region.children] == [True, False, True]
+    assert trans.kept == [
+        (["inc_a_times_x"], ["inc_a_times_x"],
+         "it uses the result of the reduction into 'asum'")]
+
+
+def test_omp_nowait_errors():
+    ''' Check that Dynamo0p3OMPNowaitTrans rejects invalid nodes and leaves
+    regions that contain other nodes unchanged. '''
+    from psyclone.transformations import Dynamo0p3OMPNowaitTrans
+    trans = Dynamo0p3OMPNowaitTrans()
+    with pytest.raises(TransformationError) as err:
+        trans.apply("invalid")
+    assert ("The supplied node must be a dynamo0.3 schedule or an OpenMP "
+            "parallel region but found" in str(err.value))
+
+    _, info = parse(os.path.join(BASE_PATH, "1_single_invoke.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    schedule, _ = DynamoOMPParallelLoopTrans().apply(schedule.children[0])
+    with pytest.raises(TransformationError) as err:
+        trans.apply(schedule.children[0])
+    assert "must be a dynamo0.3 schedule or an OpenMP" in str(err.value)
+    # An OpenMP parallel do is not a region that this transformation
+    # considers
+    _, _ = trans.apply(schedule)
+    assert trans.report() == ""
+
+    # A region containing something other than OpenMP do loops
+    _, info = parse(os.path.join(BASE_PATH, "1_single_invoke.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    schedule, _ = OMPParallelTrans().apply(schedule.children[0])
+    _, _ = trans.apply(schedule)
+    assert trans.removed == []
+
+    _, info = parse(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 "test_files", "gocean1p0",
+                                 "single_invoke_three_kernels.f90"),
+                    api="gocean1.0")
+    psy = PSyFactory("gocean1.0", distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    with pytest.raises(TransformationError) as err:
+        trans.apply(schedule)
+    assert "must be a dynamo0.3 schedule" in str(err.value)
+
+
+def _omp_parallel_loops(name, dist_mem):
+    '''
+    Creates the PSy object for the supplied dynamo0.3 algorithm file,
+    colours every loop that requires it and parallelises every loop
+    (or the loop over the cells of each colour) with an OpenMP parallel
+    do directive.
+
+    :param str name: the name of the algorithm file.
+    :param bool dist_mem: whether distributed memory is enabled.
+    :returns: the PSy object.
+    :rtype: :py:class:`psyclone.dynamo0p3.DynamoPSy`
+    '''
+    from psyclone.dynamo0p3 import DynLoop
+    _, info = parse(os.path.join(BASE_PATH, name), api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=dist_mem).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    otrans = DynamoOMPParallelLoopTrans()
+    for loop in schedule.loops():
+        if loop.loop_type == "" and loop.has_inc_arg(
+                {"inc": "gh_inc"}):
+            schedule, _ = Dynamo0p3ColourTrans().apply(loop)
+    for node in schedule.children:
+        if isinstance(node, DynLoop):
+            if node.loop_type == "colours":
+                schedule, _ = otrans.apply(node.children[0])
+            else:
+                schedule, _ = otrans.apply(node)
+    return psy
+
+
+def test_omp_region_merge(tmpdir, f90, f90flags, dist_mem):
+    ''' Check that OMPParallelRegionMergeTrans encloses consecutive OpenMP
+    parallel do loops within a single parallel region. '''
+    from psyclone.psyGen import OMPParallelDirective, OMPDoDirective
+    from psyclone.transformations import OMPParallelRegionMergeTrans
+    psy = _omp_parallel_loops("15.14.2_multiple_set_kernels.f90", dist_mem)
+    schedule = psy.invokes.invoke_list[0].schedule
+    trans = OMPParallelRegionMergeTrans()
+    assert str(trans) == ("Merges the OpenMP parallel regions of "
+                          "consecutive parallel loops")
+    assert trans.name == "OMPParallelRegionMergeTrans"
+    _, _ = trans.apply(schedule)
+    assert len(schedule.children) == 1
+    region = schedule.children[0]
+    assert type(region) is OMPParallelDirective
+    assert all(type(child) is OMPDoDirective for child in region.children)
+    assert trans.merged == [["setval_c"] * 3]
+    assert trans.split == []
+    assert trans.report() == ("Created an OpenMP parallel region enclosing "
+                              "the loops calling setval_c, setval_c, "
+                              "setval_c")
+    code = str(psy.gen)
+    assert code.count("!$omp parallel default(shared), private(df)\n") == 1
+    assert code.count("!$omp do schedule(static)\n") == 3
+    assert "parallel do" not in code
+    if dist_mem:
+        assert ("      !$omp end do\n"
+                "      !\n"
+                "      ! Set halos dirty/clean for fields modified in the "
+                "above loop\n"
+                "      !\n"
+                "      !$omp master\n"
+                "      CALL f1_proxy%set_dirty()\n" in code)
+
+    if TEST_COMPILE:
+        # If compilation testing has been enabled
+        # (--compile --f90="<compiler_name>" flags to py.test)
+        assert code_compiles("dynamo0.3", psy, tmpdir, f90, f90flags)
+
+
+def test_omp_region_merge_colours(tmpdir, f90, f90flags, dist_mem):
+    ''' Check that OMPParallelRegionMergeTrans moves the parallel region
+    outside a loop over colours, that it merges it with the preceding
+    loop over dofs and that a halo exchange splits the region. '''
+    from psyclone.transformations import OMPParallelRegionMergeTrans
+    # setval_c(f1, 0) followed by a kernel with INC access to f1
+    psy = _omp_parallel_loops("14.12_halo_wdofs_to_inc.f90", dist_mem)
+    schedule = psy.invokes.invoke_list[0].schedule
+    trans = OMPParallelRegionMergeTrans()
+    _, _ = trans.apply(schedule)
+    code = str(psy.gen)
+    if dist_mem:
+        # The halo exchange of f1 ends the group so the loop over dofs
+        # is left unchanged
+        assert trans.merged == [["testkern_w0_code"]]
+        assert code.count("!$omp parallel do default(shared)") == 1
+        assert ("      !$omp parallel default(shared), private(colour,cell)\n"
+                "      DO colour=1,ncolour\n"
+                "        !$omp do schedule(static)\n"
+                "        DO cell=1,mesh%get_last_halo_cell_per_colour("
+                "colour,1)\n" in code)
+        assert ("        !$omp end do\n"
+                "      END DO \n"
+                "      !\n"
+                "      ! Set halos dirty/clean for fields modified in the "
+                "above loop\n"
+                "      !\n"
+                "      !$omp master\n"
+                "      CALL f1_proxy%set_dirty()\n"
+                "      !$omp end master\n"
+                "      !\n"
+                "      !$omp end parallel\n" in code)
+    else:
+        assert trans.merged == [["setval_c", "testkern_w0_code"]]
+        assert "parallel do" not in code
+        assert ("      !$omp parallel default(shared), "
+                "private(df,colour,cell)\n"
+                "      !$omp do schedule(static)\n"
+                "      DO df=1,undf_any_space_1_f1\n"
+                "        f1_proxy%data(df) = 0\n"
+                "      END DO \n"
+                "      !$omp end do\n"
+                "      DO colour=1,ncolour\n"
+                "        !$omp do schedule(static)\n"
+                "        DO cell=1,mesh%get_last_edge_cell_per_colour("
+                "colour)\n" in code)
+        assert ("        !$omp end do\n"
+                "      END DO \n"
+                "      !$omp end parallel\n" in code)
+
+    if TEST_COMPILE:
+        # If compilation testing has been enabled
+        # (--compile --f90="<compiler_name>" flags to py.test)
+        assert code_compiles("dynamo0.3", psy, tmpdir, f90, f90flags)
+
+
+def test_omp_region_merge_reductions():
+    ''' Check that OMPParallelRegionMergeTrans splits a group of loops
+    before a loop that performs a reduction into a variable accessed by
+    a preceding loop or that uses the result of a reproducible reduction
+    but not before a loop that uses the result of another reduction. '''
+    from psyclone.transformations import OMPParallelRegionMergeTrans
+    trans = OMPParallelRegionMergeTrans()
+    # setval_c(f1, asum), sum_X(asum, f1), setval_c(f1, asum)
+    psy = _omp_parallel_loops("15.14.3_sum_setval_field_builtin.f90", False)
+    schedule = psy.invokes.invoke_list[0].schedule
+    _, _ = trans.apply(schedule)
+    assert trans.merged == [["sum_x", "setval_c"]]
+    assert trans.report() == (
+        "Created an OpenMP parallel region enclosing the loops calling "
+        "sum_x, setval_c\n"
+        "Did not merge the loop calling sum_x with the preceding loop "
+        "calling setval_c: it performs a reduction into 'asum' which is "
+        "accessed by a preceding loop")
+    code = str(psy.gen)
+    assert ("      !$omp end parallel do\n"
+            "      !\n"
+            "      ! Zero summation variables\n"
+            "      !\n"
+            "      asum = 0.0_r_def\n"
+            "      !\n"
+            "      !$omp parallel default(shared), private(df)\n"
+            "      !$omp do schedule(static), reduction(+:asum)\n" in code)
+
+    # X_innerproduct_Y(asum, f1, f2), inc_a_times_X(b, f1) and
+    # inc_a_times_X(asum, f1)
+    psy = _omp_parallel_loops("15.18.1_builtins_reduction_fuse_error.f90",
+                              False)
+    schedule = psy.invokes.invoke_list[0].schedule
+    _, _ = trans.apply(schedule)
+    assert trans.merged == [["x_innerproduct_y", "inc_a_times_x",
+                             "inc_a_times_x"]]
+    assert trans.split == []
+
+    # The result of a reproducible reduction is only available after the
+    # end of the parallel region
+    _, info = parse(os.path.join(BASE_PATH,
+                                 "15.18.1_builtins_reduction_fuse_error.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    otrans = Dynamo0p3OMPLoopTrans()
+    for loop in schedule.loops():
+        schedule, _ = otrans.apply(loop, reprod=True)
+        schedule, _ = OMPParallelTrans().apply(loop.parent)
+    _, _ = trans.apply(schedule)
+    assert trans.merged == [["x_innerproduct_y", "inc_a_times_x"]]
+    assert trans.split == [
+        (["inc_a_times_x"], ["inc_a_times_x"],
+         "it uses the result of the reproducible reduction into 'asum'")]
+    code = str(psy.gen)
+    assert ("      !$omp end parallel\n"
+            "      !\n"
+            "      ! sum the partial results sequentially\n"
+            "      !\n"
+            "      DO th_idx=1,nthreads\n"
+            "        asum = asum+l_asum(1,th_idx)\n"
+            "      END DO \n"
+            "      DEALLOCATE (l_asum)\n"
+            "      !$omp parallel default(shared), private(df)\n" in code)
+
+
+def test_omp_region_merge_existing_region():
+    ''' Check that OMPParallelRegionMergeTrans merges an existing parallel
+    region with a following parallel loop and restores the barrier at
+    the end of the last loop of the region, that it leaves a single
+    parallel loop unchanged and that a serial loop splits the group. '''
+    from psyclone.psyGen import OMPParallelDirective, \
+        OMPParallelDoDirective
+    from psyclone.transformations import OMPParallelRegionMergeTrans, \
+        Dynamo0p3OMPNowaitTrans
+    _, info = parse(os.path.join(BASE_PATH,
+                                 "15.14.2_multiple_set_kernels.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    loops = schedule.loops()
+    for loop in loops[:2]:
+        schedule, _ = Dynamo0p3OMPLoopTrans().apply(loop)
+    schedule, _ = OMPParallelTrans().apply(schedule.children[:2])
+    schedule, _ = Dynamo0p3OMPNowaitTrans().apply(schedule)
+    schedule, _ = DynamoOMPParallelLoopTrans().apply(loops[2])
+    assert [loop.parent.nowait for loop in loops[:2]] == [True, True]
+    trans = OMPParallelRegionMergeTrans()
+    _, _ = trans.apply(schedule)
+    assert len(schedule.children) == 1
+    assert [loop.parent.nowait for loop in loops] == [True, False, False]
+    assert all(loop.parent.parent is schedule.children[0] for loop in loops)
+
+    # A single parallel loop and a serial loop
+    _, info = parse(os.path.join(BASE_PATH,
+                                 "15.14.2_multiple_set_kernels.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    loops = schedule.loops()
+    schedule, _ = DynamoOMPParallelLoopTrans().apply(loops[0])
+    schedule, _ = DynamoOMPParallelLoopTrans().apply(loops[2])
+    _, _ = trans.apply(schedule)
+    assert trans.merged == []
+    assert trans.report() == ""
+    assert type(loops[0].parent) is OMPParallelDoDirective
+    assert loops[1].parent is schedule
+    assert type(loops[2].parent) is OMPParallelDoDirective
+    # A region containing a serial loop is not merged
+    schedule, _ = OMPParallelTrans().apply(schedule.children[1])
+    schedule, _ = DynamoOMPParallelLoopTrans().apply(loops[0])
+    _, _ = trans.apply(schedule)
+    assert trans.merged == []
+    assert type(loops[1].parent) is OMPParallelDirective
+
+
+def test_omp_region_merge_errors():
+    ''' Check that OMPParallelRegionMergeTrans rejects nodes that are not
+    a schedule and schedules from unsupported APIs. '''
+    from psyclone.transformations import OMPParallelRegionMergeTrans
+    trans = OMPParallelRegionMergeTrans()
+    _, info = parse(os.path.join(BASE_PATH, "1_single_invoke.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    with pytest.raises(TransformationError) as err:
+        trans.apply(schedule.children[0])
+    assert ("Error in OMPParallelRegionMergeTrans transformation. The "
+            "supplied node must be a schedule but found" in str(err.value))
+
+    _, info = parse(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 "test_files", "dynamo0p1",
+                                 "algorithm", "1_single_function.f90"),
+                    api="dynamo0.1")
+    psy = PSyFactory("dynamo0.1").create(info)
+    with pytest.raises(NotImplementedError) as err:
+        trans.apply(psy.invokes.invoke_list[0].schedule)
+    assert ("The OMPParallelRegionMergeTrans transformation is currently "
+            "only supported for the dynamo0.3 and gocean1.0 APIs"
+            in str(err.value))
+
+
+def test_no_ocl():
+    ''' Check that attempting to apply an OpenCL transformation to a Dynamo
+    Schedule raises the expected error. '''
+    from psyclone.transformations import OCLTrans
+    _, info = parse(os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 "test_files", "dynamo0p3",
+                                 "1_single_invoke.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+    sched = psy.invokes.get('invoke_0_testkern_type').schedule
+    trans = OCLTrans()
+    with pytest.raises(TransformationError) as err:
+        _ = trans.apply(sched)
+    assert ("OpenCL generation is currently only supported for the GOcean "
+            "API but got a Schedule of type:" in str(err))
+
+
+def test_async_hex_wrong_node():
+    '''Test that we raise the expected exception if an asynchronous halo
+    exchange transformation is applied to a node that is not a halo
+    exchange.
+
+    '''
+    from psyclone.psyGen import Loop
+    node = Loop()
+    ahex = Dynamo0p3AsyncHaloExchangeTrans()
+    with pytest.raises(TransformationError) as err:
+        _, _ = ahex.apply(node)
+    assert "node must be a synchronous halo exchange" in str(err.value)
+
+
+def test_async_hex_name():
+    ''' Name test for the Dynamo0p3AsyncHaloExchangeTrans class. '''
+    ahex = Dynamo0p3AsyncHaloExchangeTrans()
+    assert ahex.name == "Dynamo0p3AsyncHaloExchangeTrans"
+
+
+def test_async_hex_str():
+    ''' String test for the Dynamo0p3AsyncHaloExchangeTrans class. '''
+    ahex = Dynamo0p3AsyncHaloExchangeTrans()
+    assert (str(ahex) == "Changes a synchronous halo exchange into an "
+            "asynchronous one.")
+
+
+def test_async_hex(tmpdir, f90, f90flags):
+    '''Test that we can convert a synchronous halo exchange to an
+    asynchronous one using the Dynamo0p3AsyncHaloExchangeTrans transformation.
+
+    '''
+    _, invoke_info = parse(os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        "test_files", "dynamo0p3",
+        "1_single_invoke.f90"),
+                           api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(invoke_info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    f2_hex = schedule.children[0]
+    ahex_trans = Dynamo0p3AsyncHaloExchangeTrans()
+    schedule, _ = ahex_trans.apply(f2_hex)
+    result = str(psy.gen)
+    assert (
+        "      ! Call kernels and communication routines\n"
+        "      !\n"
+        "      IF (f2_proxy%is_dirty(depth=1)) THEN\n"
+        "        CALL f2_proxy%halo_exchange_start(depth=1)\n"
+        "      END IF \n"
+        "      !\n"
+        "      IF (f2_proxy%is_dirty(depth=1)) THEN\n"
+        "        CALL f2_proxy%halo_exchange_finish(depth=1)\n"
+        "      END IF \n"
+        "      !\n") in result
+
+    if TEST_COMPILE:
+        # If compilation testing has been enabled (--compile flag
+        # to py.test)
+        assert code_compiles("dynamo0.3", psy, tmpdir, f90, f90flags)
+
+
+def test_async_hex_move_1(tmpdir, f90, f90flags):
+    '''Test that we can convert a synchronous halo exchange to an
+    asynchronous one using the Dynamo0p3AsyncHaloExchangeTrans
+    transformation and then move them to new valid locations. In this
+    case we move them before and after other halo exchanges
+    respectively.
 
     '''
     _, invoke_info = parse(os.path.join(
@@ -7358,19 +8531,308 @@ def test_vector_async_halo_exchange(tmpdir, f90, f90flags):
         assert code_compiles("dynamo0.3", psy, tmpdir, f90, f90flags)
 
 
-def test_async_halo_exchange_nomatch1():
-    '''Test that an exception is raised if an asynchronous halo exchange
-    start matches with something other than the expected halo exchange
-    end.
+def test_async_hex_overlap_errors():
+    '''Name, string and error tests for the
+    Dynamo0p3AsyncHaloExchangeOverlapTrans class. '''
+    overlap_trans = Dynamo0p3AsyncHaloExchangeOverlapTrans()
+    assert overlap_trans.name == "Dynamo0p3AsyncHaloExchangeOverlapTrans"
+    assert (str(overlap_trans) == "Moves asynchronous halo exchange starts "
+            "as early and ends as late as possible.")
+    _, info = parse(os.path.join(BASE_PATH, "1_single_invoke.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    with pytest.raises(TransformationError) as err:
+        overlap_trans.apply(schedule.children[0])
+    assert ("Supplied node must be a dynamo0.3 schedule but found "
+            "'<class 'psyclone.dynamo0p3.DynHaloExchange'>'"
+            in str(err.value))
+
+
+def test_async_hex_overlap(tmpdir, f90, f90flags):
+    '''Test that the Dynamo0p3AsyncHaloExchangeOverlapTrans
+    transformation moves asynchronous halo exchange starts as early and
+    ends as late as the dependencies allow and that it reports the
+    computation that each asynchronous halo exchange overlaps.
 
     '''
-    _, info = parse(os.path.join(
-        BASE_PATH, "8.3_multikernel_invokes_vector.f90"),
+    from psyclone.dynamo0p3 import DynLoop, DynHaloExchangeStart, \
+        DynHaloExchangeEnd
+    _, info = parse(os.path.join(BASE_PATH, "4.8_multikernel_invokes.f90"),
                     api=TEST_API)
     psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
     schedule = psy.invokes.invoke_list[0].schedule
+    ahex_trans = Dynamo0p3AsyncHaloExchangeTrans()
+    for hex_node in schedule.walk(schedule.children, psyGen.HaloExchange):
+        ahex_trans.apply(hex_node)
+    overlap_trans = Dynamo0p3AsyncHaloExchangeOverlapTrans()
+    schedule, _ = overlap_trans.apply(schedule)
+
+    def check(node, node_type, name):
+        ''' Check the type and field of a halo exchange. '''
+        assert isinstance(node, node_type)
+        field_id = node.field.name
+        if node.vector_index:
+            field_id += "({0})".format(node.vector_index)
+        assert field_id == name
+
+    # The starts of the halo exchanges for the fields that are not
+    # modified before they are read are moved to the start of the
+    # schedule, keeping their order
+    for idx, name in enumerate(["f", "c", "d", "a", "e(1)", "g"]):
+        check(schedule.children[idx], DynHaloExchangeStart, name)
+    # The ends are moved to immediately before the first loop that
+    # reads the field
+    for idx, name in enumerate(["f", "c", "d"]):
+        check(schedule.children[6+idx], DynHaloExchangeEnd, name)
+    check(schedule.children[19], DynHaloExchangeEnd, "g")
+    assert isinstance(schedule.children[20], DynLoop)
+    # The start of the halo exchange for field 'b' can not be moved
+    # before the loop that modifies b
+    assert isinstance(schedule.children[17], DynLoop)
+    check(schedule.children[18], DynHaloExchangeStart, "b")
+    check(schedule.children[21], DynHaloExchangeEnd, "b")
+
+    report = overlap_trans.overlap_report(schedule).split("\n")
+    assert len(report) == 9
+    assert report[0] == "Halo exchange of 'f' (depth=1) overlaps 0 call(s)"
+    assert report[5] == ("Halo exchange of 'g' (depth=1) overlaps 3 call(s): "
+                         "testkern_code, testkern_code, ru_code")
+    assert report[8] == ("Halo exchange of 'b' (depth=1) overlaps 1 call(s): "
+                         "ru_code")
+    assert [len(hex_start.overlapped_calls()) for hex_start in
+            schedule.walk(schedule.children, DynHaloExchangeStart)] == \
+        [0, 0, 0, 2, 2, 3, 0, 0, 1]
+
+    # Applying the transformation again has no effect
+    nodes = schedule.children[:]
+    overlap_trans.apply(schedule)
+    assert schedule.children == nodes
 
-    # create vector halo exchanges after the first loop by performing
+    if TEST_COMPILE:
+        # If compilation testing has been enabled (--compile flag
+        # to py.test)
+        assert code_compiles("dynamo0.3", psy, tmpdir, f90, f90flags)
+
+
+def test_loop_split_errors(monkeypatch):
+    '''Test that the Dynamo0p3LoopSplitTrans transformation raises the
+    expected exceptions for loops that it does not support.
+
+    '''
+    split_trans = Dynamo0p3LoopSplitTrans()
+    assert split_trans.name == "Dynamo0p3LoopSplitTrans"
+    assert str(split_trans) == ("Splits a loop over cells into a loop over "
+                                "inner cells and a loop over the remaining "
+                                "cells.")
+    _, info = parse(os.path.join(BASE_PATH, "1_single_invoke_w3.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+
+    # not a loop
+    with pytest.raises(TransformationError) as excinfo:
+        split_trans.apply(schedule.children[0])
+    assert ("Supplied node must be a dynamo0.3 loop but found "
+            "'<class 'psyclone.dynamo0p3.DynHaloExchange'>'"
+            in str(excinfo.value))
+
+    # not distributed memory
+    config = Config.get()
+    monkeypatch.setattr(config, "distributed_memory", False)
+    with pytest.raises(TransformationError) as excinfo:
+        split_trans.apply(schedule.children[3])
+    assert ("Loops can only be split when distributed memory is enabled"
+            in str(excinfo.value))
+    monkeypatch.setattr(config, "distributed_memory", True)
+
+    # not within the schedule
+    otrans = DynamoOMPParallelLoopTrans()
+    otrans.apply(schedule.children[3])
+    with pytest.raises(TransformationError) as excinfo:
+        split_trans.apply(schedule.children[3].children[0])
+    assert ("The loop must be an immediate child of the schedule but its "
+            "parent is '<class 'psyclone.psyGen.OMPParallelDoDirective'>'"
+            in str(excinfo.value))
+
+    # no halo reads
+    _, info = parse(os.path.join(BASE_PATH,
+                                 "1_single_invoke_w3_only_vector.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    with pytest.raises(TransformationError) as excinfo:
+        split_trans.apply(schedule.children[0])
+    assert ("The loop does not read any halo data so there is no "
+            "communication to overlap with" in str(excinfo.value))
+
+    # variable stencil extent
+    _, info = parse(os.path.join(BASE_PATH, "19.1_single_stencil.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    with pytest.raises(TransformationError) as excinfo:
+        split_trans.apply(schedule.children[3])
+    assert ("The stencil extent of field 'f2' in kernel "
+            "'testkern_stencil_code' is only known at run time"
+            in str(excinfo.value))
+
+    # a loop over dofs
+    _, info = parse(os.path.join(BASE_PATH, "15.1.1_X_plus_Y_builtin.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    with pytest.raises(TransformationError) as excinfo:
+        split_trans.apply(schedule.children[0])
+    assert ("Only loops over cells may be split but this loop is over "
+            "'dofs'" in str(excinfo.value))
+
+    # inter-grid kernel
+    _, info = parse(os.path.join(BASE_PATH, "22.0_intergrid_prolong.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    with pytest.raises(TransformationError) as excinfo:
+        split_trans.apply(schedule.children[1])
+    assert ("The loop must only contain (non inter-grid) kernel calls but "
+            "found '<class 'psyclone.dynamo0p3.DynKern'>'"
+            in str(excinfo.value))
+
+    _, info = parse(os.path.join(BASE_PATH, "4.8_multikernel_invokes.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+
+    # a field that is modified and halo exchanged
+    with pytest.raises(TransformationError) as excinfo:
+        split_trans.apply(schedule.children[11])
+    assert ("Field 'g' is modified within the loop and requires a halo "
+            "exchange before it" in str(excinfo.value))
+
+    # a loop that has already been split
+    split_trans.apply(schedule.children[3])
+    with pytest.raises(TransformationError) as excinfo:
+        split_trans.apply(schedule.children[0])
+    assert ("The loop must iterate from the first cell to 'ncells' or "
+            "'cell_halo' but found 'start' to 'inner'" in str(excinfo.value))
+    with pytest.raises(TransformationError) as excinfo:
+        split_trans.apply(schedule.children[4])
+    assert ("found 'ncells' to 'cell_halo'. Has it already been split?"
+            in str(excinfo.value))
+
+
+def test_loop_split():
+    '''Test that the Dynamo0p3LoopSplitTrans transformation splits a loop
+    with a stencil access into a loop over the inner cells, placed before
+    the halo exchanges, and a loop over the remaining cells.
+
+    '''
+    from psyclone.dynamo0p3 import DynLoop, DynHaloExchange, HaloReadAccess
+    _, info = parse(os.path.join(BASE_PATH, "19.4_single_stencil_literal.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    loop = schedule.children[3]
+    split_trans = Dynamo0p3LoopSplitTrans()
+    schedule, _ = split_trans.apply(loop)
+
+    inner_loop = schedule.children[0]
+    assert isinstance(inner_loop, DynLoop)
+    for node in schedule.children[1:4]:
+        assert isinstance(node, DynHaloExchange)
+    assert schedule.children[4] is loop
+    # The stencil of extent 1 on a continuous field requires an inner
+    # halo depth of 2
+    assert inner_loop.lower_bound_name == "start"
+    assert inner_loop.upper_bound_name == "inner"
+    assert inner_loop.upper_bound_halo_depth == 2
+    assert loop.lower_bound_name == "inner"
+    assert loop.lower_bound_index == 1
+    assert loop.upper_bound_name == "cell_halo"
+    # The inner loop contains a copy of the kernel call
+    kernel = inner_loop.children[0]
+    assert kernel is not loop.children[0]
+    assert kernel.name == loop.children[0].name
+    assert kernel.parent is inner_loop
+    for arg in kernel.arguments.args:
+        assert arg.call is kernel
+        assert not inner_loop._halo_read_access(arg)
+    assert not HaloReadAccess(kernel.arguments.args[1]).literal_depth
+    # The halo exchanges still depend on the (second) loop
+    assert schedule.children[1]._compute_halo_depth() == "2"
+
+    code = str(psy.gen)
+    assert (
+        "      DO cell=1,mesh%get_last_inner_cell(2)\n"
+        "        !\n"
+        "        CALL testkern_stencil_code(") in code
+    assert (
+        "      IF (f2_proxy%is_dirty(depth=2)) THEN\n"
+        "        CALL f2_proxy%halo_exchange(depth=2)\n") in code
+    assert ("      DO cell=mesh%get_last_inner_cell(2)+1,"
+            "mesh%get_last_halo_cell(1)\n") in code
+    assert code.index("get_last_inner_cell(2)\n") < \
+        code.index("halo_exchange(depth=2)") < \
+        code.index("get_last_inner_cell(2)+1")
+
+
+def test_loop_split_async(tmpdir, f90, f90flags):
+    '''Test that the loop over inner cells created by the
+    Dynamo0p3LoopSplitTrans transformation is placed between the start
+    and the end of asynchronous halo exchanges and that a halo depth of
+    1 gives a loop over the owned cells that starts after the inner
+    cells.
+
+    '''
+    from psyclone.dynamo0p3 import DynLoop, DynHaloExchangeStart, \
+        DynHaloExchangeEnd
+    _, info = parse(os.path.join(BASE_PATH, "1_single_invoke.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    ahex_trans = Dynamo0p3AsyncHaloExchangeTrans()
+    for hex_node in schedule.walk(schedule.children, psyGen.HaloExchange):
+        ahex_trans.apply(hex_node)
+    loop = schedule.children[-1]
+    split_trans = Dynamo0p3LoopSplitTrans()
+    split_trans.apply(loop)
+    # The starts stay where they are, the inner loop is inserted before
+    # the first end
+    assert isinstance(schedule.children[0], DynHaloExchangeStart)
+    assert isinstance(schedule.children[1], DynLoop)
+    assert isinstance(schedule.children[2], DynHaloExchangeEnd)
+    assert schedule.children[-1] is loop
+    assert loop.lower_bound_name == "ncells"
+    overlap_trans = Dynamo0p3AsyncHaloExchangeOverlapTrans()
+    overlap_trans.apply(schedule)
+    assert [len(hex_start.overlapped_calls()) for hex_start in
+            schedule.walk(schedule.children, DynHaloExchangeStart)] == \
+        [1, 1, 1]
+
+    code = str(psy.gen)
+    assert "DO cell=1,mesh%get_last_inner_cell(1)\n" in code
+    assert ("DO cell=mesh%get_last_inner_cell(1)+1,"
+            "mesh%get_last_halo_cell(1)\n") in code
+
+    if TEST_COMPILE:
+        # If compilation testing has been enabled (--compile flag
+        # to py.test)
+        assert code_compiles("dynamo0.3", psy, tmpdir, f90, f90flags)
+
+
+def test_async_halo_exchange_nomatch1():
+    '''Test that an exception is raised if an asynchronous halo exchange
+    start matches with something other than the expected halo exchange
+    end.
+
+    '''
+    _, info = parse(os.path.join(
+        BASE_PATH, "8.3_multikernel_invokes_vector.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+
+    # create vector halo exchanges after the first loop by performing
     # redundant computation
     rc_trans = Dynamo0p3RedundantComputationTrans()
     rc_trans.apply(schedule.children[4], depth=2)
@@ -7424,3 +8886,653 @@ def test_async_halo_exchange_nomatch2():
         _ = hex_start._get_hex_end()
     assert ("Halo exchange start for field 'f1' has no matching halo "
             "exchange end") in str(excinfo.value)
+
+
+def test_hex_group_name_str():
+    ''' Name and string test for the Dynamo0p3HaloExchangeGroupTrans
+    class. '''
+    group_trans = Dynamo0p3HaloExchangeGroupTrans()
+    assert group_trans.name == "Dynamo0p3HaloExchangeGroupTrans"
+    assert (str(group_trans) == "Groups synchronous halo exchanges into a "
+            "single batched halo exchange.")
+
+
+def test_hex_group_errors():
+    '''Test that we raise the expected exceptions if the halo exchange
+    group transformation is applied to invalid nodes.
+
+    '''
+    from psyclone.dynamo0p3 import DynHaloExchange
+    _, info = parse(os.path.join(BASE_PATH, "4.8_multikernel_invokes.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    group_trans = Dynamo0p3HaloExchangeGroupTrans()
+    with pytest.raises(TransformationError) as err:
+        group_trans.apply(schedule.children[0])
+    assert "must be a list of at least two halo exchanges" in str(err.value)
+    with pytest.raises(TransformationError) as err:
+        group_trans.apply(schedule.children[0:1])
+    assert "must be a list of at least two halo exchanges" in str(err.value)
+    with pytest.raises(TransformationError) as err:
+        group_trans.apply(schedule.children[2:4])
+    assert ("Supplied nodes must be synchronous halo exchanges but found "
+            "'<class 'psyclone.dynamo0p3.DynLoop'>'" in str(err.value))
+    # Halo exchanges separated by a loop
+    with pytest.raises(TransformationError) as err:
+        group_trans.apply([schedule.children[0], schedule.children[5]])
+    assert ("must only be separated by other halo exchanges but found "
+            "'<class 'psyclone.dynamo0p3.DynLoop'>'" in str(err.value))
+    # Halo exchanges with different depths
+    rc_trans = Dynamo0p3RedundantComputationTrans()
+    rc_trans.apply(schedule.children[9], depth=2)
+    with pytest.raises(TransformationError) as err:
+        group_trans.apply(schedule.children[0:2])
+    assert ("must exchange the same depth of halo but found depths "
+            "['1', '2']" in str(err.value))
+    # Halo exchanges of fields of different kinds
+    _, info = parse(os.path.join(BASE_PATH, "23.0_mixed_precision.f90"),
+                    api=TEST_API)
+    mixed_psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    mixed_schedule = mixed_psy.invokes.invoke_list[0].schedule
+    with pytest.raises(TransformationError) as err:
+        group_trans.apply(mixed_schedule.children[0:2])
+    assert ("must exchange fields of the same kind but found kinds "
+            "['r_def', 'r_single']" in str(err.value))
+    # Halo exchanges may be separated by other halo exchanges
+    group_trans.apply([schedule.children[0], schedule.children[2]])
+    with pytest.raises(TransformationError) as err:
+        group_trans.apply([schedule.children[0].children[0],
+                           schedule.children[1]])
+    assert ("halo exchange for field 'f' is already part of a halo "
+            "exchange group" in str(err.value))
+    other = DynHaloExchange(schedule.children[1].field)
+    with pytest.raises(TransformationError) as err:
+        group_trans.apply([schedule.children[1], other])
+    assert "must have the same parent" in str(err.value)
+    # A halo exchange in a group can not be made asynchronous and an
+    # asynchronous halo exchange can not be grouped
+    ahex_trans = Dynamo0p3AsyncHaloExchangeTrans()
+    with pytest.raises(TransformationError) as err:
+        ahex_trans.apply(schedule.children[0].children[0])
+    assert ("halo exchange for field 'f' is part of a halo exchange "
+            "group" in str(err.value))
+    ahex_trans.apply(schedule.children[6])
+    with pytest.raises(TransformationError) as err:
+        group_trans.apply(schedule.children[5:7])
+    assert ("Supplied nodes must be synchronous halo exchanges but found "
+            "'<class 'psyclone.dynamo0p3.DynHaloExchangeStart'>'"
+            in str(err.value))
+
+
+def test_hex_group(tmpdir, f90, f90flags, capsys):
+    '''Test that we can group synchronous halo exchanges using the
+    Dynamo0p3HaloExchangeGroupTrans transformation and that the group
+    is still correct after redundant computation changes the depth of
+    some of its halo exchanges.
+
+    '''
+    from psyclone.dynamo0p3 import DynHaloExchangeGroup
+    _, info = parse(os.path.join(BASE_PATH, "1_single_invoke.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    group_trans = Dynamo0p3HaloExchangeGroupTrans()
+    # The halo exchanges do not need to be supplied in order
+    schedule, _ = group_trans.apply([schedule.children[2],
+                                     schedule.children[0],
+                                     schedule.children[1]])
+    assert len(schedule.children) == 2
+    group = schedule.children[0]
+    assert isinstance(group, DynHaloExchangeGroup)
+    assert [hex.field.name for hex in group.children] == ["f2", "m1", "m2"]
+    assert all(hex.parent is group for hex in group.children)
+    assert [arg.name for arg in group.args] == ["f2", "m1", "m2"]
+    assert group.dag_name == "haloexchangegroup_0"
+    assert schedule.children[1].backward_dependence() is group
+    group.view()
+    result, _ = capsys.readouterr()
+    assert "HaloExchangeGroup[nexchanges=3]" in result
+    assert "    HaloExchange[field='m1', type='region', depth=1" in result
+    result = str(psy.gen)
+    assert "USE field_mod, ONLY: halo_exchange_group" in result
+    assert (
+        "      IF (f2_proxy%is_dirty(depth=1) .OR. "
+        "m1_proxy%is_dirty(depth=1) .OR. m2_proxy%is_dirty(depth=1)) THEN\n"
+        "        CALL halo_exchange_group((/f2_proxy, m1_proxy, m2_proxy/), "
+        "depth=1)\n"
+        "      END IF \n"
+        "      !\n"
+        "      DO cell=1,mesh%get_last_halo_cell(1)\n") in result
+    if TEST_COMPILE:
+        # If compilation testing has been enabled (--compile flag
+        # to py.test)
+        assert code_compiles("dynamo0.3", psy, tmpdir, f90, f90flags)
+
+    # Redundant computation changes the depth of all of the halo
+    # exchanges in the group
+    rc_trans = Dynamo0p3RedundantComputationTrans()
+    rc_trans.apply(schedule.children[1], depth=2)
+    assert len(group.children) == 3
+    result = str(psy.gen)
+    assert (
+        "      IF (f2_proxy%is_dirty(depth=2) .OR. "
+        "m1_proxy%is_dirty(depth=2) .OR. m2_proxy%is_dirty(depth=2)) THEN\n"
+        "        CALL halo_exchange_group((/f2_proxy, m1_proxy, m2_proxy/), "
+        "depth=2)\n") in result
+
+
+def test_hex_group_batches(tmpdir, f90, f90flags):
+    '''Test the code generated for a halo exchange group whose halo
+    exchanges no longer exchange the same depth of halo.
+
+    '''
+    _, info = parse(os.path.join(BASE_PATH, "4.8_multikernel_invokes.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    group_trans = Dynamo0p3HaloExchangeGroupTrans()
+    group_trans.apply(schedule.children[0:3])
+    # Redundant computation in the third loop increases the depth of
+    # the halo exchange for field 'c'
+    rc_trans = Dynamo0p3RedundantComputationTrans()
+    rc_trans.apply(schedule.children[7], depth=2)
+    assert len(schedule.children[0].children) == 3
+    result = str(psy.gen)
+    assert (
+        "      IF (f_proxy%is_dirty(depth=1) .OR. "
+        "d_proxy%is_dirty(depth=1)) THEN\n"
+        "        CALL halo_exchange_group((/f_proxy, d_proxy/), depth=1)\n"
+        "      END IF \n"
+        "      !\n"
+        "      IF (c_proxy%is_dirty(depth=2)) THEN\n"
+        "        CALL c_proxy%halo_exchange(depth=2)\n"
+        "      END IF \n"
+        "      !\n"
+        "      DO cell=1,mesh%get_last_halo_cell(1)\n") in result
+    if TEST_COMPILE:
+        # If compilation testing has been enabled (--compile flag
+        # to py.test)
+        assert code_compiles("dynamo0.3", psy, tmpdir, f90, f90flags)
+
+
+def test_kind_conversion_trans(tmpdir, f90, f90flags):
+    '''Test that a halo exchange added by redundant computation precedes
+    the conversion of the kind of the data read by the kernel in the
+    loop and that a conversion can not be put in a parallel region or
+    executed as a task.
+
+    '''
+    from psyclone.dynamo0p3 import DynHaloExchange, DynKindConversion
+    from psyclone.transformations import OMPTaskTrans
+    _, info = parse(os.path.join(BASE_PATH,
+                                 "23.3_mixed_precision_convert.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    conversion = schedule.children[11]
+    assert isinstance(conversion, DynKindConversion)
+    assert conversion.dag_name == "kindconversion_11"
+    # Redundant computation into the level 2 halo requires a new halo
+    # exchange for f3 which must be added before the conversion
+    rc_trans = Dynamo0p3RedundantComputationTrans()
+    rc_trans.apply(schedule.children[12], depth=2)
+    haloex = schedule.children[11]
+    assert isinstance(haloex, DynHaloExchange)
+    assert haloex.field.name == "f3"
+    assert schedule.children[12] is conversion
+    with pytest.raises(TransformationError) as err:
+        OMPParallelTrans().apply(schedule.children[12:14])
+    assert ("A conversion of the kind of a kernel argument within a "
+            "parallel region is not supported" in str(err.value))
+    with pytest.raises(TransformationError) as err:
+        OMPTaskTrans().apply(schedule.children[12:14])
+    assert ("Error in OMPTaskTrans transformation: a conversion of the kind "
+            "of a kernel argument can not be executed as a task"
+            in str(err.value))
+
+    # An existing halo exchange whose depth is increased remains before
+    # the conversion
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    rc_trans.apply(schedule.children[6], depth=2)
+    assert isinstance(schedule.children[5], DynKindConversion)
+    result = str(psy.gen)
+    assert (
+        "      IF (f2_proxy%is_dirty(depth=2)) THEN\n"
+        "        CALL f2_proxy%halo_exchange(depth=2)\n"
+        "      END IF \n" in result)
+    assert (
+        "      f2_r_single_data = REAL(f2_proxy%data, KIND=r_single)\n"
+        "      !\n"
+        "      DO cell=1,mesh%get_last_halo_cell(2)\n"
+        "        !\n"
+        "        CALL testkern_precision_2_code(nlayers, a, f3_proxy%data, "
+        "f2_r_single_data, m1_proxy%data" in result)
+    if TEST_COMPILE:
+        # If compilation testing has been enabled (--compile flag
+        # to py.test)
+        assert code_compiles("dynamo0.3", psy, tmpdir, f90, f90flags)
+
+
+def test_auto_loop_fuse_builtins(tmpdir, f90, f90flags):
+    '''Check that Dynamo0p3AutoLoopFuseTrans fuses consecutive loops
+    over dofs that call built-ins which access a field with the same
+    name (and are therefore known to be on the same space) and that it
+    reports why other loops are not fused.
+
+    '''
+    _, info = parse(os.path.join(BASE_PATH,
+                                 "15.14.1_multi_aX_plus_Y_builtin.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    trans = Dynamo0p3AutoLoopFuseTrans()
+    assert str(trans) == ("Fuses all groups of consecutive loops that can "
+                          "legally be fused")
+    assert trans.name == "Dynamo0p3AutoLoopFuseTrans"
+    trans.apply(schedule)
+    assert len(schedule.children) == 1
+    assert len(schedule.children[0].children) == 7
+    assert trans.fused == [["ax_plus_y"]*7]
+    assert not trans.rejected
+    assert trans.report() == "Fused 7 loops calling " + \
+        ", ".join(["ax_plus_y"]*7)
+    result = str(psy.gen)
+    assert result.count("DO df=") == 1
+    assert ("        f2_proxy%data(df) = a*f1_proxy%data(df) + "
+            "f3_proxy%data(df)\n"
+            "        f2_1_proxy%data(df) = a*f1_proxy%data(df) + "
+            "f3_proxy%data(df)\n" in result)
+    if TEST_COMPILE:
+        assert code_compiles(TEST_API, psy, tmpdir, f90, f90flags)
+
+    # The loop that reads the result of a reduction is not fused and
+    # the following loops do not access a field with the same name
+    _, info = parse(os.path.join(BASE_PATH,
+                                 "15.19.1_three_builtins_two_reductions.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    trans.apply(schedule)
+    assert len(schedule.children) == 3
+    assert not trans.fused
+    assert len(trans.rejected) == 2
+    assert trans.rejected[0][:2] == (["x_innerproduct_y"],
+                                     ["inc_a_times_x"])
+    assert ("Cannot fuse loops as the first loop has a reduction and the "
+            "second loop reads the result of the reduction"
+            in trans.rejected[0][2])
+    assert ("Did not fuse the loop calling sum_x with the preceding loop "
+            "calling inc_a_times_x: Transformation Error: "
+            "DynamoLoopFuseTrans. One or more of the iteration spaces is "
+            "unknown ('any_space')" in trans.report())
+    # Unless the spaces are asserted to be the same
+    trans.apply(schedule, same_space=True)
+    assert len(schedule.children) == 2
+    assert trans.fused == [["inc_a_times_x", "sum_x"]]
+
+
+def test_auto_loop_fuse_kernels():
+    '''Check that Dynamo0p3AutoLoopFuseTrans does not fuse loops over
+    cells if that breaks a dependence between them and that a
+    colouring loop or any other node ends a group of loops.
+
+    '''
+    _, info = parse(os.path.join(BASE_PATH, "4.8_multikernel_invokes.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    trans = Dynamo0p3AutoLoopFuseTrans()
+    trans.apply(schedule)
+    assert [len(loop.children) for loop in schedule.children] == [2, 2, 1]
+    assert trans.fused == [["testkern_code", "testkern_code"],
+                           ["ru_code", "ru_code"]]
+    assert trans.rejected[0][:2] == (["testkern_code", "testkern_code"],
+                                     ["ru_code"])
+    assert ("Field 'b' is accessed with 'gh_write' by the first loop and "
+            "with 'gh_inc' by the second loop and it is (or may be) on a "
+            "continuous function space." in trans.rejected[0][2])
+    assert ("Field 'b' is accessed with 'gh_inc' by the first loop and "
+            "with 'gh_read' by the second loop" in trans.rejected[1][2])
+
+    # A coloured loop ends a group
+    _, info = parse(os.path.join(BASE_PATH, "4.8_multikernel_invokes.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    Dynamo0p3ColourTrans().apply(schedule.children[1])
+    trans.apply(schedule)
+    assert [len(loop.children) for loop in schedule.children] == \
+        [1, 1, 2, 1]
+    assert trans.fused == [["ru_code", "ru_code"]]
+    assert len(trans.rejected) == 1
+
+    with pytest.raises(TransformationError) as excinfo:
+        trans.apply(schedule.children[0])
+    assert ("The supplied node must be a dynamo0.3 schedule"
+            in str(excinfo.value))
+
+
+def test_auto_loop_fuse_dependencies(monkeypatch):
+    '''Check the rules that decide whether fusing two loops over cells
+    breaks a dependence between them.
+
+    '''
+    _, info = parse(os.path.join(BASE_PATH, "4.8_multikernel_invokes.f90"),
+                    api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    check = Dynamo0p3AutoLoopFuseTrans._check_dependencies
+    loop1, loop2 = schedule.children[2:4]
+    # The two loops only share fields that they both read or
+    # increment
+    check(loop1, loop2)
+    # A field on a continuous space is written
+    arg = loop2.children[0].arguments.args[4]
+    assert arg.name == "c"
+    monkeypatch.setattr(arg, "_access", "gh_write")
+    with pytest.raises(TransformationError) as excinfo:
+        check(loop1, loop2)
+    assert ("Field 'c' is accessed with 'gh_read' by the first loop and "
+            "with 'gh_write' by the second loop and it is (or may be) on a "
+            "continuous function space." in str(excinfo.value))
+    # A written field is accessed with a stencil
+    monkeypatch.setattr(arg, "_stencil", object())
+    with pytest.raises(TransformationError) as excinfo:
+        check(loop1, loop2)
+    assert ("Field 'c' is accessed with 'gh_read' by the first loop and "
+            "with 'gh_write' by the second loop and it is accessed with a "
+            "stencil." in str(excinfo.value))
+    # Loops over dofs access only the dof they compute
+    monkeypatch.setattr(loop1, "_loop_type", "dofs")
+    check(loop1, loop2)
+
+
+def test_gsum_group_name_str():
+    ''' Name and string test for the Dynamo0p3GlobalSumGroupTrans
+    class. '''
+    group_trans = Dynamo0p3GlobalSumGroupTrans()
+    assert group_trans.name == "Dynamo0p3GlobalSumGroupTrans"
+    assert (str(group_trans) == "Groups global sums into a single batched "
+            "global reduction.")
+
+
+def test_gsum_group_errors():
+    '''Test that we raise the expected exceptions if the global sum
+    group transformation is applied to invalid nodes or if a global sum
+    can not be delayed until the last global sum in the group.
+
+    '''
+    from psyclone.dynamo0p3 import DynGlobalSum
+    _, info = parse(
+        os.path.join(BASE_PATH, "15.19.1_three_builtins_two_reductions.f90"),
+        api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    group_trans = Dynamo0p3GlobalSumGroupTrans()
+    with pytest.raises(TransformationError) as err:
+        group_trans.apply(schedule.children[1])
+    assert "must be a list of at least two global sums" in str(err.value)
+    with pytest.raises(TransformationError) as err:
+        group_trans.apply(schedule.children[0:2])
+    assert ("Supplied nodes must be global sums but found "
+            "'<class 'psyclone.dynamo0p3.DynLoop'>'" in str(err.value))
+    # The second loop updates asum so its global sum can not be delayed
+    with pytest.raises(TransformationError) as err:
+        group_trans.apply([schedule.children[1], schedule.children[4]])
+    assert ("The global sum of 'asum' cannot be delayed until the global "
+            "sum of 'bsum' as 'asum' is accessed in between."
+            in str(err.value))
+    other = DynGlobalSum(schedule.children[4].scalar)
+    with pytest.raises(TransformationError) as err:
+        group_trans.apply([schedule.children[4], other])
+    assert "must have the same parent" in str(err.value)
+
+
+def test_gsum_group(capsys, tmpdir, f90, f90flags):
+    '''Test that we can group global sums using the
+    Dynamo0p3GlobalSumGroupTrans transformation, that the group is
+    placed at the position of the last of them and that the generated
+    code compiles.
+
+    '''
+    _, info = parse(
+        os.path.join(BASE_PATH,
+                     "15.16.1_two_different_builtin_reductions.f90"),
+        api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    group_trans = Dynamo0p3GlobalSumGroupTrans()
+    schedule, _ = group_trans.apply([schedule.children[3],
+                                     schedule.children[1]])
+    assert len(schedule.children) == 3
+    group = schedule.children[2]
+    assert group.dag_name == "globalsumgroup_2"
+    assert [gsum.scalar.name for gsum in group.children] == ["asum", "bsum"]
+    assert [arg.name for arg in group.args] == ["asum", "bsum"]
+    assert all(gsum.parent is group for gsum in group.children)
+    # The loop that computes bsum has no dependence on the global sum
+    # of asum any more
+    assert schedule.children[1].forward_dependence() is group
+    schedule.view()
+    result, _ = capsys.readouterr()
+    assert "GlobalSumGroup[nsums=2]" in result
+    with pytest.raises(TransformationError) as err:
+        group_trans.apply([group.children[0], group.children[1]])
+    assert ("global sum of 'asum' is already part of a global sum group"
+            in str(err.value))
+    code = str(psy.gen)
+    print(code)
+    assert "      USE scalar_mod, ONLY: global_sum_group\n" in code
+    assert ("      REAL(KIND=r_def), dimension(2) :: "
+            "global_sum_values\n") in code
+    assert (
+        "      DO df=1,f1_proxy%vspace%get_last_dof_owned()\n"
+        "        bsum = bsum+f1_proxy%data(df)\n"
+        "      END DO \n"
+        "      global_sum_values(1) = asum\n"
+        "      global_sum_values(2) = bsum\n"
+        "      CALL global_sum_group(global_sum_values)\n"
+        "      asum = global_sum_values(1)\n"
+        "      bsum = global_sum_values(2)\n") in code
+    assert "global_sum%get_sum()" not in code
+    if TEST_COMPILE:
+        # If compilation testing has been enabled (--compile flag
+        # to py.test)
+        assert code_compiles("dynamo0.3", psy, tmpdir, f90, f90flags)
+
+
+def test_group_global_sums_config(monkeypatch):
+    '''Test that global sums are grouped when they are created if
+    GROUP_GLOBAL_SUMS is set, unless an intervening loop accesses the
+    summed scalar.
+
+    '''
+    from psyclone.dynamo0p3 import DynGlobalSum, DynGlobalSumGroup
+    api_config = Config.get().api_conf(TEST_API)
+    monkeypatch.setattr(api_config, "_group_global_sums", True)
+    _, info = parse(
+        os.path.join(BASE_PATH,
+                     "15.16.1_two_different_builtin_reductions.f90"),
+        api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    assert isinstance(schedule.children[2], DynGlobalSumGroup)
+    assert len(schedule.children[2].children) == 2
+    # In each of these the second loop reads (or updates) the scalar
+    # reduced by the first so the global sums must be kept apart
+    for name in ["15.19.1_three_builtins_two_reductions.f90",
+                 "15.15.1_two_same_builtin_reductions.f90"]:
+        _, info = parse(os.path.join(BASE_PATH, name), api=TEST_API)
+        psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+        schedule = psy.invokes.invoke_list[0].schedule
+        assert not schedule.walk(schedule.children, DynGlobalSumGroup)
+        assert len(schedule.walk(schedule.children, DynGlobalSum)) == 2
+
+
+def test_async_gsum_name_str():
+    ''' Name and string tests for the Dynamo0p3AsyncGlobalSumTrans and
+    Dynamo0p3AsyncGlobalSumOverlapTrans classes. '''
+    agsum_trans = Dynamo0p3AsyncGlobalSumTrans()
+    assert agsum_trans.name == "Dynamo0p3AsyncGlobalSumTrans"
+    assert (str(agsum_trans) == "Changes a synchronous global sum into an "
+            "asynchronous one.")
+    overlap_trans = Dynamo0p3AsyncGlobalSumOverlapTrans()
+    assert overlap_trans.name == "Dynamo0p3AsyncGlobalSumOverlapTrans"
+    assert (str(overlap_trans) == "Moves asynchronous global sum ends as "
+            "late as possible.")
+
+
+def test_async_gsum_errors():
+    '''Test that we raise the expected exceptions if the asynchronous
+    global sum transformations are applied to invalid nodes and if a
+    global sum start has no matching global sum end.
+
+    '''
+    from psyclone.dynamo0p3 import DynGlobalSumStart
+    _, info = parse(
+        os.path.join(BASE_PATH,
+                     "15.16.1_two_different_builtin_reductions.f90"),
+        api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    agsum_trans = Dynamo0p3AsyncGlobalSumTrans()
+    with pytest.raises(TransformationError) as err:
+        agsum_trans.apply(schedule.children[0])
+    assert ("Supplied node must be a synchronous global sum but found "
+            "'<class 'psyclone.dynamo0p3.DynLoop'>'" in str(err.value))
+    agsum_trans.apply(schedule.children[1])
+    with pytest.raises(TransformationError) as err:
+        agsum_trans.apply(schedule.children[1])
+    assert ("must be a synchronous global sum but found '<class "
+            "'psyclone.dynamo0p3.DynGlobalSumStart'>'" in str(err.value))
+    # Asynchronous global sums can not be grouped
+    with pytest.raises(TransformationError) as err:
+        Dynamo0p3GlobalSumGroupTrans().apply([schedule.children[2],
+                                              schedule.children[4]])
+    assert "Supplied nodes must be global sums but found" in str(err.value)
+    with pytest.raises(TransformationError) as err:
+        Dynamo0p3AsyncGlobalSumOverlapTrans().apply(schedule.children[0])
+    assert ("Supplied node must be a dynamo0.3 schedule but found"
+            in str(err.value))
+    # A global sum start must be followed by a matching global sum end
+    start = DynGlobalSumStart(schedule.children[4].scalar,
+                              parent=schedule)
+    schedule.addchild(start, index=4)
+    with pytest.raises(GenerationError) as err:
+        start.overlapped_calls()
+    assert ("Global sum start for scalar 'bsum' should match with a global "
+            "sum end, but found <class 'psyclone.dynamo0p3.DynGlobalSum'>"
+            in str(err.value))
+    schedule.children.remove(schedule.children[5])
+    with pytest.raises(GenerationError) as err:
+        start.overlapped_calls()
+    assert ("Global sum start for scalar 'bsum' has no matching global sum "
+            "end" in str(err.value))
+
+
+def test_async_gsum_group_error():
+    '''Test that we raise the expected exception if we try to make a
+    global sum that is part of a global sum group asynchronous.
+
+    '''
+    _, info = parse(
+        os.path.join(BASE_PATH,
+                     "15.16.1_two_different_builtin_reductions.f90"),
+        api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    Dynamo0p3GlobalSumGroupTrans().apply([schedule.children[1],
+                                          schedule.children[3]])
+    with pytest.raises(TransformationError) as err:
+        Dynamo0p3AsyncGlobalSumTrans().apply(
+            schedule.children[2].children[0])
+    assert ("Supplied global sum of 'asum' is part of a global sum group"
+            in str(err.value))
+
+
+def test_async_gsum(capsys):
+    '''Test that we can split global sums into global sum starts and
+    ends, that the Dynamo0p3AsyncGlobalSumOverlapTrans transformation
+    moves each end as late as the dependencies allow and that the
+    expected code is generated.
+
+    '''
+    from psyclone.dynamo0p3 import DynLoop, DynGlobalSum, \
+        DynGlobalSumStart, DynGlobalSumEnd
+    _, info = parse(
+        os.path.join(BASE_PATH,
+                     "15.16.1_two_different_builtin_reductions.f90"),
+        api=TEST_API)
+    psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    agsum_trans = Dynamo0p3AsyncGlobalSumTrans()
+    for gsum in schedule.walk(schedule.children, DynGlobalSum):
+        agsum_trans.apply(gsum)
+    assert len(schedule.children) == 6
+    start = schedule.children[1]
+    end = schedule.children[2]
+    assert isinstance(start, DynGlobalSumStart)
+    assert isinstance(end, DynGlobalSumEnd)
+    assert start.scalar.access == "gh_read"
+    assert end.scalar.access == "gh_readwrite"
+    assert start.dag_name == "globalsumstart(asum)_1"
+    assert end.dag_name == "globalsumend(asum)_2"
+    # The start depends on the loop computing the local sum and the
+    # end depends on the start
+    assert start.backward_dependence() is schedule.children[0]
+    assert end.backward_dependence() is start
+    assert start.overlapped_calls() == []
+
+    overlap_trans = Dynamo0p3AsyncGlobalSumOverlapTrans()
+    overlap_trans.apply(schedule)
+    assert isinstance(schedule.children[2], DynLoop)
+    assert schedule.children[4] is end
+    assert isinstance(schedule.children[5], DynGlobalSumEnd)
+    assert ([call.name for call in start.overlapped_calls()] ==
+            ["sum_x"])
+    assert (overlap_trans.overlap_report(schedule) ==
+            "Global sum of 'asum' overlaps 1 call(s): sum_x\n"
+            "Global sum of 'bsum' overlaps 0 call(s)")
+    schedule.view()
+    result, _ = capsys.readouterr()
+    assert "GlobalSumStart[scalar='asum']" in result
+    assert "GlobalSumEnd[scalar='bsum']" in result
+
+    code = str(psy.gen)
+    print(code)
+    assert "      USE scalar_mod, ONLY: scalar_type\n" in code
+    assert "      TYPE(scalar_type) global_sum_bsum\n" in code
+    assert "      TYPE(scalar_type) global_sum_asum\n" in code
+    assert (
+        "      END DO \n"
+        "      global_sum_asum%value = asum\n"
+        "      CALL global_sum_asum%start_sum()\n") in code
+    assert (
+        "      global_sum_bsum%value = bsum\n"
+        "      CALL global_sum_bsum%start_sum()\n"
+        "      asum = global_sum_asum%finish_sum()\n"
+        "      bsum = global_sum_bsum%finish_sum()\n") in code
+    assert "get_sum()" not in code
+
+
+def test_async_gsum_dependence():
+    '''Test that the Dynamo0p3AsyncGlobalSumOverlapTrans transformation
+    does not move the end of a global sum past a loop that reads (or
+    updates) the summed scalar.
+
+    '''
+    from psyclone.dynamo0p3 import DynGlobalSum, DynGlobalSumEnd
+    for name in ["15.19.1_three_builtins_two_reductions.f90",
+                 "15.15.1_two_same_builtin_reductions.f90"]:
+        _, info = parse(os.path.join(BASE_PATH, name), api=TEST_API)
+        psy = PSyFactory(TEST_API, distributed_memory=True).create(info)
+        schedule = psy.invokes.invoke_list[0].schedule
+        agsum_trans = Dynamo0p3AsyncGlobalSumTrans()
+        for gsum in schedule.walk(schedule.children, DynGlobalSum):
+            agsum_trans.apply(gsum)
+        Dynamo0p3AsyncGlobalSumOverlapTrans().apply(schedule)
+        assert isinstance(schedule.children[2], DynGlobalSumEnd)
+        assert schedule.children[2].forward_dependence() is \
+            schedule.children[3]
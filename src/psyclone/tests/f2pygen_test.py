@@ -250,6 +250,36 @@ def test_add_before():
     assert "DO it=1,10" in lines[5]
 
 
+def test_add_before_after_repeated():
+    ''' Check that repeatedly adding code before and after the same
+    object preserves the order in which it is added, including when the
+    content of the parent is modified directly in between. '''
+    module = ModuleGen(name="testmodule")
+    subroutine = SubroutineGen(module, name="testsubroutine")
+    module.add(subroutine)
+    loop = DoGen(subroutine, "it", "1", "10")
+    subroutine.add(loop)
+    for name in ["first", "second"]:
+        subroutine.add(CallGen(subroutine, name),
+                       position=["before", loop.root])
+    subroutine.add(CallGen(subroutine, "last"),
+                   position=["after", loop.root])
+    subroutine.add(CallGen(subroutine, "middle"),
+                   position=["after", loop.root])
+    # Insert a statement without going through add()
+    subroutine.root.content.insert(0, CommentGen(subroutine, " hi").root)
+    subroutine.add(CallGen(subroutine, "third"),
+                   position=["before", loop.root])
+    lines = str(module.root).splitlines()
+    assert "! hi" in lines[4]
+    assert "CALL first" in lines[5]
+    assert "CALL second" in lines[6]
+    assert "CALL third" in lines[7]
+    assert "DO it=1,10" in lines[8]
+    assert "CALL middle" in lines[10]
+    assert "CALL last" in lines[11]
+
+
 def test_mod_vanilla():
     ''' Check that we can create a basic, vanilla module '''
     module = ModuleGen()
@@ -898,6 +928,35 @@ def test_progunit_multiple_use3():
     assert funcnames == ["c", "d"]
 
 
+def test_progunitgen_registry_explicit_position():
+    '''Check that declarations and use statements that are added at an
+    explicit position are taken into account when removing duplicates
+    and that names are compared without regard to case.'''
+    module = ModuleGen(name="testmodule")
+    sub = SubroutineGen(module, name="testsubroutine")
+    module.add(sub)
+    sub.add(DeclGen(sub, datatype="integer", entity_decls=["Cell"]),
+            position=["append"])
+    sub.add(UseGen(sub, name="fred", only=True, funcnames=["Astaire"]),
+            position=["first"])
+    sub.add(DeclGen(sub, datatype="integer", entity_decls=["cell", "df"]))
+    sub.add(DeclGen(sub, datatype="real", entity_decls=["cell"]))
+    sub.add(UseGen(sub, name="fred", only=True,
+                   funcnames=["astaire", "rogers"]))
+    sub.add(UseGen(sub, name="fred", only=True, funcnames=["ROGERS"]))
+    assert count_lines(sub.root, "INTEGER cell") == 0
+    assert count_lines(sub.root, "INTEGER df") == 1
+    assert count_lines(sub.root, "REAL cell") == 1
+    assert count_lines(sub.root, "USE fred, ONLY: rogers") == 1
+    assert count_lines(sub.root, "USE fred") == 2
+    # A generic use statement means no further use of the same module
+    # is required
+    sub.add(UseGen(sub, name="fred"))
+    sub.add(UseGen(sub, name="fred", only=True, funcnames=["kelly"]))
+    assert count_lines(sub.root, "USE fred") == 3
+    assert "kelly" not in str(sub.root)
+
+
 def test_adduse_empty_only():
     ''' Test that the adduse module method works correctly when we specify
     that we want it to be specific but then don't provide a list of
@@ -1063,6 +1122,22 @@ def test_decl_target(tmpdir, f90, f90flags):
     assert string_compiles(gen, tmpdir, f90, f90flags)
 
 
+def test_decl_contiguous(tmpdir, f90, f90flags):
+    ''' Check that we can declare array pointers with the contiguous
+    attribute '''
+    module = ModuleGen(name="testmodule")
+    sub = SubroutineGen(module, name="testsubroutine")
+    module.add(sub)
+    sub.add(DeclGen(sub, datatype="real", pointer=True, contiguous=True,
+                    entity_decls=["rptr(:) => null()"]))
+    sub.add(DeclGen(sub, datatype="integer", pointer=True,
+                    entity_decls=["iptr(:)"]))
+    gen = str(module.root).lower()
+    assert "real, pointer, contiguous :: rptr(:) => null()" in gen
+    assert "integer, pointer :: iptr(:)" in gen
+    assert string_compiles(gen, tmpdir, f90, f90flags)
+
+
 def test_decl_initial_vals(tmpdir, f90, f90flags):
     ''' Check that we can specify initial values for a declaration '''
     module = ModuleGen(name="testmodule")
@@ -1437,3 +1512,47 @@ def test_basegen_previous_loop_no_loop():
     with pytest.raises(RuntimeError) as err:
         sub.previous_loop()
     assert "no loop found - there is no previous loop" in str(err)
+
+
+def test_template_items():
+    ''' Check that template_items returns new copies of the items read
+    from the template each time it is called. '''
+    from psyclone.f2pygen import template_items
+    first = template_items("do i=1,n\nend do")
+    second = template_items("do i=1,n\nend do")
+    assert len(first) == 2
+    assert first[0].line == "do i=1,n"
+    assert first[1].line == "end do"
+    assert first[0] is not second[0]
+    assert first[0].parse_cache is not second[0].parse_cache
+    comment = template_items("! content\n", ignore_comments=False)
+    assert comment[0].comment == "! content"
+    assert comment[0] is not template_items("! content\n",
+                                            ignore_comments=False)[0]
+
+
+def test_write_fortran():
+    ''' Check that the streaming writer produces the same code as
+    str() for a tree containing nested blocks, comments and directives. '''
+    from six import StringIO
+    from psyclone.f2pygen import fortran_lines, write_fortran
+    module = ModuleGen(name="testmodule")
+    sub = SubroutineGen(module, name="testsub", args=["a"])
+    module.add(sub)
+    sub.add(DeclGen(sub, datatype="integer", entity_decls=["a", "i"]))
+    sub.add(CommentGen(sub, " a comment"))
+    sub.add(DirectiveGen(sub, "omp", "begin", "parallel do", ""))
+    dogen = DoGen(sub, "i", "1", "10")
+    sub.add(dogen)
+    ifgen = IfThenGen(dogen, "a > 1")
+    dogen.add(ifgen)
+    ifgen.add(AssignGen(ifgen, lhs="a", rhs="a+i"))
+    sub.add(DirectiveGen(sub, "omp", "end", "parallel do", ""))
+    code = str(module.root)
+    assert list(fortran_lines(module.root)) == code.split("\n")
+    buf = StringIO()
+    write_fortran(module.root, buf)
+    assert buf.getvalue() == code
+    # A single statement is written using its own tofortran() method
+    assert list(fortran_lines(ifgen.children[0].root)) == \
+        [ifgen.children[0].root.tofortran()]
@@ -865,3 +865,44 @@ def test_main_include_path(capsys):
           '-I', str(inc_path2)])
     stdout, _ = capsys.readouterr()
     assert "some_fake_mpi_handle" in stdout
+
+
+def test_main_write_files_streamed(tmpdir):
+    '''Tests that the algorithm and psy files written by main() (which
+    streams the code to file) are identical to the generated code, with
+    and without line-length limiting.'''
+    from psyclone.line_length import FortLineLength
+    alg_filename = (os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 "test_files", "dynamo0p3",
+                                 "3.1_multi_functions_multi_invokes.f90"))
+    alg, psy = generate(alg_filename, api="dynamo0.3")
+    alg_out = os.path.join(str(tmpdir), "alg.f90")
+    psy_out = os.path.join(str(tmpdir), "psy.f90")
+    main([alg_filename, '-api', 'dynamo0.3', '-oalg', alg_out,
+          '-opsy', psy_out])
+    with open(alg_out) as alg_file:
+        assert alg_file.read() == str(alg)
+    with open(psy_out) as psy_file:
+        assert psy_file.read() == str(psy)
+    main([alg_filename, '-api', 'dynamo0.3', '-oalg', alg_out,
+          '-opsy', psy_out, '-l'])
+    with open(psy_out) as psy_file:
+        assert psy_file.read() == FortLineLength().process(str(psy))
+
+
+def test_main_write_files_nemo(tmpdir):
+    '''Tests that main() writes the files for the nemo API, which has no
+    algorithm code (the algorithm code is None) and whose psy code is
+    not an fparser1 tree, with and without line-length limiting.'''
+    alg_filename = (os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 "nemo", "test_files", "explicit_do.f90"))
+    _, psy = generate(alg_filename, api="nemo")
+    alg_out = os.path.join(str(tmpdir), "alg.f90")
+    psy_out = os.path.join(str(tmpdir), "psy.f90")
+    for args in [[], ['-l']]:
+        main([alg_filename, '-api', 'nemo', '-oalg', alg_out,
+              '-opsy', psy_out] + args)
+        with open(alg_out) as alg_file:
+            assert alg_file.read() == "None"
+        with open(psy_out) as psy_file:
+            assert psy_file.read() == str(psy)
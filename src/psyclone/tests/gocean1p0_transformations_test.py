@@ -47,7 +47,7 @@ from psyclone.transformations import TransformationError, \
     GOConstLoopBoundsTrans, LoopFuseTrans, GOLoopSwapTrans, \
     OMPParallelTrans, GOceanOMPParallelLoopTrans, \
     GOceanOMPLoopTrans, KernelModuleInlineTrans, GOceanLoopFuseTrans, \
-    ACCParallelTrans, ACCDataTrans, ACCLoopTrans
+    ACCParallelTrans, ACCDataTrans, ACCLoopTrans, OMPParallelRegionMergeTrans
 from psyclone.generator import GenerationError
 from psyclone_test_utils import count_lines, get_invoke
 
@@ -561,6 +561,30 @@ def test_omp_region_before_loops_trans():
     assert omp_do_idx - omp_region_idx == 1
 
 
+def test_omp_region_merge_trans():
+    ''' Test that the OpenMP parallel region merging transformation
+    encloses consecutive OpenMP parallel do loops within a single
+    parallel region. '''
+    psy, invoke = get_invoke("single_invoke_three_kernels.f90", API, idx=0)
+    schedule = invoke.schedule
+
+    ompl = GOceanOMPParallelLoopTrans()
+    for child in schedule.children:
+        schedule, _ = ompl.apply(child)
+
+    mtrans = OMPParallelRegionMergeTrans()
+    schedule, _ = mtrans.apply(schedule)
+    invoke.schedule = schedule
+
+    assert mtrans.merged == [["compute_cu_code", "compute_cv_code",
+                              "time_smooth_code"]]
+    gen = str(psy.gen).lower()
+    assert gen.count("!$omp parallel default(shared), private(j,i)") == 1
+    assert gen.count("!$omp do schedule(static)") == 3
+    assert gen.count("!$omp end do") == 3
+    assert "parallel do" not in gen
+
+
 def test_omp_region_after_loops_trans():
     ''' Test of the OpenMP PARALLEL region transformation where we
     do the loop transformations before the region transformation '''
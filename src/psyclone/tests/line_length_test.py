@@ -112,6 +112,21 @@ def test_wrapped():
     assert output_file == EXPECTED_OUTPUT, "output and expected output differ "
 
 
+def test_wrapped_streamed():
+    ''' Tests that wrapping an iterable of lines (with or without
+    newline characters) and writing them to a stream produces the same
+    result as processing the file as a string '''
+    from six import StringIO
+    fll = FortLineLength(line_length=30)
+    # Iterating over a file does not give a final, empty line
+    assert INPUT_FILE.endswith("\n")
+    lines = fll.process_lines(StringIO(INPUT_FILE))
+    assert "\n".join(lines) + "\n" == EXPECTED_OUTPUT
+    stream = StringIO()
+    fll.write(INPUT_FILE.split("\n"), stream)
+    assert stream.getvalue() == EXPECTED_OUTPUT
+
+
 def test_wrapped_lower():
     ''' Tests that a lower case file whose lines are longer than the
     specified line length is wrapped appropriately by the
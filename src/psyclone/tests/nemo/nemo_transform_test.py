@@ -176,6 +176,28 @@ def test_omp_parallel_errs():
             str(err))
 
 
+def test_acc_not_implemented():
+    ''' Check that the OpenACC transformations raise the expected error
+    for the NEMO API. '''
+    from psyclone.transformations import ACCDataTrans, ACCLoopTrans, \
+        ACCParallelTrans
+    _, invoke_info = parse(os.path.join(BASE_PATH, "explicit_do.f90"),
+                           api=API, line_length=False)
+    psy = PSyFactory(API, distributed_memory=False).create(invoke_info)
+    schedule = psy.invokes.get('explicit_do').schedule
+    with pytest.raises(NotImplementedError) as err:
+        ACCDataTrans().apply(schedule)
+    assert "ACCDataDirective not implemented for a schedule" in str(err.value)
+    with pytest.raises(NotImplementedError) as err:
+        ACCParallelTrans().apply(schedule.children[0])
+    assert ("OpenACC parallel regions are currently only supported for the "
+            "gocean 1.0 and dynamo0.3 APIs" in str(err.value))
+    with pytest.raises(NotImplementedError) as err:
+        ACCLoopTrans().apply(schedule.children[0])
+    assert ("OpenACC loop transformations are currently only supported for "
+            "the gocean 1.0 and dynamo0.3 APIs" in str(err.value))
+
+
 def test_omp_do_children_err():
     ''' Tests that we raise the expected error when an OpenMP parallel do
     directive has more than one child. '''
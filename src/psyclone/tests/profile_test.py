@@ -574,6 +574,21 @@ def test_transform_errors(capsys):
            "and the loop(s) to which it applies!" in str(excinfo)
 
 
+# -----------------------------------------------------------------------------
+def test_transform_region_name():
+    '''Tests that the region and module names can be set explicitly
+    when applying the profile region transformation.'''
+
+    psy, invoke = get_invoke("test27_loop_swap.f90", "gocean1.0",
+                             name="invoke_loop1")
+    schedule = invoke.schedule
+    prt = ProfileRegionTrans()
+    prt.apply(schedule.children, region_name="my_region",
+              module_name="my_module")
+    code = str(psy.gen)
+    assert 'CALL ProfileStart("my_module", "my_region", profile)' in code
+
+
 # -----------------------------------------------------------------------------
 def test_omp_transform():
     '''Tests that the profiling transform works correctly with OMP
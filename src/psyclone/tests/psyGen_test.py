@@ -1955,6 +1955,45 @@ def test_omp_dag_names():
     assert directive.dag_name == "directive_1"
 
 
+def test_omp_task_directives(capsys):
+    ''' Check the view() methods and dag names of the OpenMP single and
+    task directives and that we raise the expected errors if they are
+    not within an OpenMP parallel and single region, respectively. '''
+    from psyclone.psyGen import OMPSingleDirective, OMPTaskDirective, \
+        colored, SCHEDULE_COLOUR_MAP
+    from psyclone.transformations import OMPTaskTrans
+    _, info = parse(os.path.join(BASE_PATH, "1_single_invoke.f90"),
+                    api="dynamo0.3")
+    psy = PSyFactory("dynamo0.3", distributed_memory=False).create(info)
+    schedule = psy.invokes.invoke_list[0].schedule
+    schedule, _ = OMPTaskTrans().apply(schedule.children[0])
+    single = schedule.children[0].children[0]
+    task = single.children[0]
+    assert single.dag_name == "OMP_single_2"
+    assert task.dag_name == "OMP_task_3"
+    schedule.view()
+    out, _ = capsys.readouterr()
+    directive = colored("Directive", SCHEDULE_COLOUR_MAP["Directive"])
+    assert ("    " + directive + "[OMP parallel]\n"
+            "        " + directive + "[OMP single]\n"
+            "            " + directive + "[OMP task]\n"
+            "                " + colored("Loop", SCHEDULE_COLOUR_MAP["Loop"])
+            in out)
+
+    # A task must be within a single region
+    orphan = OMPTaskDirective(parent=schedule, children=[task.children[0]])
+    with pytest.raises(GenerationError) as err:
+        orphan.gen_code(None)
+    assert ("OMPTaskDirective must have an OMPSingleDirective as ancestor"
+            in str(err.value))
+    # A single region must be within a parallel region
+    orphan = OMPSingleDirective(parent=schedule, children=[task])
+    with pytest.raises(GenerationError) as err:
+        orphan.gen_code(None)
+    assert ("OMPSingleDirective must have an OMPParallelDirective as "
+            "ancestor" in str(err.value))
+
+
 def test_acc_dag_names():
     ''' Check that we generate the correct dag names for ACC parallel,
     ACC enter-data and ACC loop directive Nodes '''
@@ -0,0 +1,224 @@
+# -----------------------------------------------------------------------------
+# BSD 3-Clause License
+#
+# Copyright (c) 2019, Science and Technology Facilities Council
+# All rights reserved.
+#
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+#
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+#
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+#
+# * Neither the name of the copyright holder nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+#
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS
+# "AS IS" AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT
+# LIMITED TO, THE IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS
+# FOR A PARTICULAR PURPOSE ARE DISCLAIMED. IN NO EVENT SHALL THE
+# COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE FOR ANY DIRECT, INDIRECT,
+# INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL DAMAGES (INCLUDING,
+# BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR SERVICES;
+# LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+# CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT
+# LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN
+# ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+# -----------------------------------------------------------------------------
+
+''' Module containing tests for the redundant computation planner '''
+
+from __future__ import absolute_import
+
+import pytest
+
+from psyclone.psyGen import GenerationError, HaloExchange, Loop
+from psyclone.rc_planner import CostModel, RedundantComputationPlanner
+from psyclone.transformations import Dynamo0p3ColourTrans, \
+    Dynamo0p3TiledColourTrans, DynamoOMPParallelLoopTrans
+from psyclone_test_utils import get_invoke
+
+API = "dynamo0.3"
+
+
+def model(latency):
+    ''' :returns: a cost model of a small partition with the supplied
+    halo exchange latency. '''
+    return CostModel(latency=latency, bytes_per_halo_cell=8.0,
+                     cell_cost=1.0, byte_cost=0.01, ncells=100,
+                     halo_depth=3)
+
+
+def test_cost_model_errors():
+    ''' Check that invalid cost model parameters are rejected. '''
+    with pytest.raises(GenerationError) as err:
+        CostModel(latency=-1.0, bytes_per_halo_cell=8.0, cell_cost=1.0)
+    assert ("CostModel: latency must not be negative but got '-1.0'"
+            in str(err.value))
+    with pytest.raises(GenerationError) as err:
+        CostModel(latency=1.0, bytes_per_halo_cell=8.0, cell_cost=1.0,
+                  byte_cost=-2)
+    assert "byte_cost must not be negative" in str(err.value)
+    with pytest.raises(GenerationError) as err:
+        CostModel(latency=1.0, bytes_per_halo_cell=8.0, cell_cost=1.0,
+                  ncells=0)
+    assert ("CostModel: ncells must be a positive integer but got '0'"
+            in str(err.value))
+    with pytest.raises(GenerationError) as err:
+        CostModel(latency=1.0, bytes_per_halo_cell=8.0, cell_cost=1.0,
+                  halo_depth=1.5)
+    assert "halo_depth must be a positive integer" in str(err.value)
+
+
+def test_cost_model_estimate():
+    ''' Check the cost of loops and halo exchanges. '''
+    cost_model = model(100.0)
+    assert cost_model.halo_depth == 3
+    # A 10x10 partition
+    assert cost_model.halo_cells(1) == 44.0
+    assert cost_model.halo_cells(2) == 96.0
+    assert cost_model.inner_cells(1) == 64.0
+    assert cost_model.inner_cells(6) == 0.0
+    _, invoke = get_invoke("1_single_invoke.f90", API, idx=0)
+    schedule = invoke.schedule
+    loop = schedule.children[-1]
+    exchanges = schedule.walk(schedule.children, HaloExchange)
+    assert len(exchanges) == 3
+    assert cost_model.exchange_depth(exchanges[1]) == 1
+    assert cost_model.exchange_cost(exchanges[1]) == \
+        pytest.approx(100.0 + 0.08*44.0)
+    assert cost_model.loop_cost(loop) == 144.0
+    assert cost_model.estimate(schedule) == pytest.approx(
+        144.0 + 3*(100.0 + 0.08*44.0))
+    loop.set_upper_bound("cell_halo", 2)
+    assert cost_model.loop_cost(loop) == 196.0
+    loop.set_upper_bound("ncells")
+    assert cost_model.loop_cost(loop) == 100.0
+
+
+def test_cost_model_tiled_loop():
+    ''' Check that only the loop over the cells of a tile contributes
+    to the cost of a tiled loop nest. '''
+    cost_model = model(100.0)
+    _, invoke = get_invoke("1_single_invoke.f90", API, idx=0)
+    schedule = invoke.schedule
+    schedule, _ = Dynamo0p3TiledColourTrans().apply(schedule.children[-1])
+    colours_loop = schedule.children[-1]
+    tiles_loop = colours_loop.children[0]
+    assert cost_model.loop_cost(colours_loop) == 0.0
+    assert cost_model.loop_cost(tiles_loop) == 0.0
+    assert cost_model.loop_cost(tiles_loop.children[0]) == 144.0
+    # Redundant computation can not be applied to tiled loops
+    planner = RedundantComputationPlanner(model(1000.0))
+    assert not planner._options(schedule)
+
+
+def test_planner_not_schedule():
+    ''' Check that the planner rejects anything other than a dynamo0.3
+    schedule. '''
+    _, invoke = get_invoke("1_single_invoke.f90", API, idx=0)
+    with pytest.raises(GenerationError) as err:
+        RedundantComputationPlanner(model(1.0)).apply(
+            invoke.schedule.children[0])
+    assert ("the supplied node must be a dynamo0.3 schedule"
+            in str(err.value))
+
+
+def test_planner_no_change():
+    ''' Check that nothing is changed when halo exchanges are cheap. '''
+    psy, invoke = get_invoke("4.8_multikernel_invokes.f90", API, idx=0)
+    schedule = invoke.schedule
+    before = str(psy.gen)
+    plan = RedundantComputationPlanner(model(1.0)).apply(schedule)
+    assert not plan.choices
+    assert not plan.removed
+    assert not plan.added
+    assert plan.extra_work == 0.0
+    assert plan.time_before == plan.time_after
+    assert str(psy.gen) == before
+    assert plan.report() == ("Extra computation: 0\n"
+                             "Estimated time: 760.68 -> 760.68")
+
+
+def test_planner_exhaustive():
+    ''' Check that the planner finds a combination of changes that
+    removes a halo exchange when no single change reduces the
+    estimated time. '''
+    psy, invoke = get_invoke("4.8_multikernel_invokes.f90", API, idx=0)
+    schedule = invoke.schedule
+    plan = RedundantComputationPlanner(model(1000.0)).apply(schedule)
+    loops = schedule.walk(schedule.children, Loop)
+    assert [loop.upper_bound_halo_depth for loop in loops] == \
+        [1, 2, 2, 1, 1]
+    assert [(loop, old, new) for loop, old, new in plan.choices] == \
+        [(loops[1], 1, 2), (loops[2], 1, 2)]
+    assert plan.removed == ["'b' (depth=1)"]
+    assert "'f' (depth=2)" in plan.added
+    assert "'e(3)' (depth=2)" in plan.added
+    assert "'g' (depth=1)" not in plan.added
+    assert plan.time_after < plan.time_before
+    assert plan.extra_work == pytest.approx(104.0)
+    report = plan.report()
+    assert ("Loop over 'b' (testkern_code): redundant computation depth "
+            "1 -> 2" in report)
+    assert "Removed halo exchange of 'b' (depth=1)" in report
+    assert "Estimated time: 9751.68 -> 8881.28" in report
+    code = str(psy.gen)
+    assert "CALL b_proxy%halo_exchange" not in code
+    assert "CALL f_proxy%halo_exchange(depth=2)" in code
+
+    # The steepest descent does not find the combination
+    psy, invoke = get_invoke("4.8_multikernel_invokes.f90", API, idx=0)
+    plan = RedundantComputationPlanner(
+        model(1000.0), max_evaluations=1).apply(invoke.schedule)
+    assert not plan.choices
+
+
+def test_planner_descent():
+    ''' Check that the steepest descent is used when there are too many
+    combinations of choices and that it stops when no single change
+    reduces the estimated time. '''
+    psy, invoke = get_invoke("15.1.2_builtin_and_normal_kernel_invoke.f90",
+                             API, idx=0)
+    plan = RedundantComputationPlanner(
+        model(1000.0), max_evaluations=1).apply(invoke.schedule)
+    assert [(old, new) for _, old, new in plan.choices] == [(0, 1)]
+    assert plan.removed == ["'f2' (depth=1)"]
+    assert not plan.added
+    assert plan.extra_work == pytest.approx(44.0)
+    assert "CALL f2_proxy%halo_exchange" not in str(psy.gen)
+
+    # Every combination is evaluated by default and a better one found
+    _, invoke = get_invoke("15.1.2_builtin_and_normal_kernel_invoke.f90",
+                           API, idx=0)
+    best = RedundantComputationPlanner(model(1000.0)).apply(invoke.schedule)
+    assert len(best.choices) == 4
+    assert best.time_after < plan.time_after
+
+
+def test_planner_skips():
+    ''' Check that loops with a reduction or with directives are left
+    unchanged. '''
+    _, invoke = get_invoke("15.15.1_two_same_builtin_reductions.f90",
+                           API, idx=0)
+    planner = RedundantComputationPlanner(model(1000.0))
+    assert not planner._options(invoke.schedule)
+
+    _, invoke = get_invoke("4.8_multikernel_invokes.f90", API, idx=0)
+    schedule = invoke.schedule
+    ctrans = Dynamo0p3ColourTrans()
+    otrans = DynamoOMPParallelLoopTrans()
+    for loop in schedule.walk(schedule.children, Loop):
+        schedule, _ = ctrans.apply(loop)
+    for loop in schedule.walk(schedule.children, Loop):
+        if loop.loop_type == "colour":
+            schedule, _ = otrans.apply(loop)
+    assert not planner._options(schedule)
+    plan = planner.apply(schedule)
+    assert not plan.choices
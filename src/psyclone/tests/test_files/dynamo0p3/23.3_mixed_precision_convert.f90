@@ -0,0 +1,60 @@
+!-------------------------------------------------------------------------------
+! BSD 3-Clause License
+!
+! Copyright (c) 2019, Science and Technology Facilities Council
+! All rights reserved.
+!
+! Redistribution and use in source and binary forms, with or without
+! modification, are permitted provided that the following conditions are met:
+!
+! * Redistributions of source code must retain the above copyright notice, this
+!   list of conditions and the following disclaimer.
+!
+! * Redistributions in binary form must reproduce the above copyright notice,
+!   this list of conditions and the following disclaimer in the documentation
+!   and/or other materials provided with the distribution.
+!
+! * Neither the name of the copyright holder nor the names of its
+!   contributors may be used to endorse or promote products derived from
+!   this software without specific prior written permission.
+!
+! THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+! AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+! IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE ARE
+! DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS BE LIABLE
+! FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY, OR CONSEQUENTIAL
+! DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF SUBSTITUTE GOODS OR
+! SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS INTERRUPTION) HOWEVER
+! CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER IN CONTRACT, STRICT LIABILITY,
+! OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE) ARISING IN ANY WAY OUT OF THE USE
+! OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF SUCH DAMAGE.
+! -----------------------------------------------------------------------------
+! Author: A. R. Porter, STFC Daresbury Lab
+
+program mixed_precision_convert
+
+  ! Description: single invoke in which a field and an operator are
+  ! read by kernels that expect them to hold data of different
+  ! precisions
+  use testkern,                        only: testkern_type
+  use testkern_precision_mod,          only: testkern_precision_type
+  use testkern_precision_2_mod,        only: testkern_precision_2_type
+  use testkern_operator_orient_mod,    only: testkern_operator_orient_type
+  use inf,                             only: r_single_field_type, &
+                                             field_type, operator_type
+  use quadrature_xyoz_mod,             only: quadrature_xyoz_type
+  implicit none
+  type(r_single_field_type)  :: f3
+  type(field_type)           :: f1, f2, m1, m2, chi(3)
+  type(operator_type)        :: op1
+  type(quadrature_xyoz_type) :: qr
+  real(r_def)                :: a
+
+  call invoke(                                      &
+       testkern_type(a, f1, f2, m1, m2),            &
+       testkern_precision_2_type(a, f3, f2, m1, m2), &
+       testkern_operator_orient_type(op1, chi, qr), &
+       testkern_precision_type(a, f3, m2, op1)      &
+          )
+
+end program mixed_precision_convert
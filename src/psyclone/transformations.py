@@ -132,6 +132,61 @@ def check_intergrid(node):
                 "kernel.".format(kern.name))
 
 
+def check_dynamo_acc(node_list, trans_name):
+    '''
+    Utility function to check that the supplied nodes of a Dynamo 0.3
+    Schedule can be executed on an OpenACC device.
+
+    :param node_list: the nodes to check.
+    :type node_list: list of :py:class:`psyclone.psyGen.Node`
+    :param str trans_name: the name of the transformation being applied.
+
+    :raises TransformationError: if any of the nodes are or contain a \
+                                 loop over colours or tiles.
+    :raises TransformationError: if any of the nodes contain a kernel \
+                                 that performs a reduction, requires \
+                                 orientation information or applies \
+                                 boundary conditions.
+    '''
+    from psyclone.psyGen import Loop, Call
+    from psyclone.dynamo0p3 import DynKern
+    loops = [node for node in node_list if isinstance(node, Loop)]
+    calls = [node for node in node_list if isinstance(node, Call)]
+    for node in node_list:
+        check_intergrid(node)
+        loops.extend(node.walk(node.children, Loop))
+        calls.extend(node.walk(node.children, Call))
+    for loop in loops:
+        if loop.loop_type in ["colours", "tilecolours", "tiles", "tile"]:
+            raise TransformationError(
+                "Error in {0} transformation. Loops over colours or tiles "
+                "must be executed on the host: apply the transformation to "
+                "the loop over the cells of a single colour instead.".
+                format(trans_name))
+    for call in calls:
+        if call.is_reduction:
+            raise TransformationError(
+                "Error in {0} transformation. Kernel '{1}' performs a "
+                "reduction which is not yet supported on an OpenACC "
+                "device.".format(trans_name, call.name))
+        if not isinstance(call, DynKern):
+            continue
+        if call.name.lower() in ["enforce_bc_code",
+                                 "enforce_operator_bc_code"]:
+            raise TransformationError(
+                "Error in {0} transformation. Kernel '{1}' applies boundary "
+                "conditions which is not yet supported on an OpenACC "
+                "device.".format(trans_name, call.name))
+        for unique_fs in call.arguments.unique_fss:
+            if call.fs_descriptors.exists(unique_fs) and \
+               call.fs_descriptors.get_descriptor(
+                   unique_fs).requires_orientation:
+                raise TransformationError(
+                    "Error in {0} transformation. Kernel '{1}' requires "
+                    "orientation information which is not yet supported on "
+                    "an OpenACC device.".format(trans_name, call.name))
+
+
 class LoopFuseTrans(Transformation):
     ''' Provides a loop-fuse transformation.
         For example:
@@ -376,6 +431,247 @@ class DynamoLoopFuseTrans(LoopFuseTrans):
                                       format(err))
 
 
+class Dynamo0p3AutoLoopFuseTrans(Transformation):
+    '''Fuses every maximal group of consecutive loops in a Dynamo 0.3
+    schedule that can legally be fused, e.g. the loops over dofs of a
+    sequence of built-ins. Each loop is fused with the preceding (and
+    possibly already fused) loop if :py:class:`DynamoLoopFuseTrans`
+    accepts the pair and if fusing them does not break a dependence
+    between them (see :py:meth:`_check_dependencies`). Only loops over
+    cells or dofs that are children of the schedule are considered so,
+    for instance, loops that have been coloured or parallelised are
+    left unchanged and anything else (such as a halo exchange or a
+    global sum) ends a group. For example:
+
+    >>> from psyclone.parse import parse
+    >>> from psyclone.psyGen import PSyFactory
+    >>> api = "dynamo0.3"
+    >>> ast, invokeInfo = parse("file.f90", api=api)
+    >>> psy=PSyFactory(api).create(invokeInfo)
+    >>> schedule = psy.invokes.get('invoke_0').schedule
+    >>>
+    >>> from psyclone.transformations import Dynamo0p3AutoLoopFuseTrans
+    >>> trans = Dynamo0p3AutoLoopFuseTrans()
+    >>> new_schedule, memento = trans.apply(schedule)
+    >>> print(trans.report())
+    >>> new_schedule.view()
+
+    '''
+    def __init__(self):
+        # The names of the kernels in each group of loops that has been
+        # fused by the last application of this transformation
+        self._fused = []
+        # The names of the kernels in each pair of consecutive loops
+        # that could not be fused, with the reason why
+        self._rejected = []
+
+    def __str__(self):
+        return ("Fuses all groups of consecutive loops that can legally be "
+                "fused")
+
+    @property
+    def name(self):
+        '''
+        :returns: the name of this transformation as a string.
+        :rtype: str
+        '''
+        return "Dynamo0p3AutoLoopFuseTrans"
+
+    @property
+    def fused(self):
+        '''
+        :returns: the names of the kernels in each group of loops that \
+                  was fused by the last application of this \
+                  transformation.
+        :rtype: :func:`list` of :func:`list` of str
+        '''
+        return self._fused
+
+    @property
+    def rejected(self):
+        '''
+        :returns: the names of the kernels in the first and second loop \
+                  of each pair of consecutive loops that could not be \
+                  fused by the last application of this transformation, \
+                  together with the reason.
+        :rtype: :func:`list` of 3-tuples (:func:`list` of str, \
+                :func:`list` of str, str)
+        '''
+        return self._rejected
+
+    def report(self):
+        '''
+        :returns: a description of the loops that were fused by the \
+                  last application of this transformation and of why \
+                  other consecutive loops were not.
+        :rtype: str
+        '''
+        lines = []
+        for names in self._fused:
+            lines.append("Fused {0} loops calling {1}".format(
+                len(names), ", ".join(names)))
+        for first, second, reason in self._rejected:
+            lines.append(
+                "Did not fuse the loop calling {0} with the preceding loop "
+                "calling {1}: {2}".format(", ".join(second),
+                                          ", ".join(first), reason))
+        return "\n".join(lines)
+
+    @staticmethod
+    def _kernel_names(loop):
+        '''
+        :param loop: a loop.
+        :type loop: :py:class:`psyclone.dynamo0p3.DynLoop`
+        :returns: the names of the kernels called in the supplied loop.
+        :rtype: :func:`list` of str
+        '''
+        return [call.name for call in loop.calls()]
+
+    @staticmethod
+    def _same_space(node1, node2):
+        '''All of the fields passed to a built-in must be on the same
+        function space so two loops over dofs that only call built-ins
+        are known to iterate over the same function space if they
+        access a field with the same name, even if that space is
+        unknown ('any_space').
+
+        :param node1: the first loop.
+        :type node1: :py:class:`psyclone.dynamo0p3.DynLoop`
+        :param node2: the second loop.
+        :type node2: :py:class:`psyclone.dynamo0p3.DynLoop`
+        :returns: whether the loops are known to iterate over the same \
+                  function space.
+        :rtype: bool
+        '''
+        from psyclone.psyGen import BuiltIn
+        for node in [node1, node2]:
+            if node.loop_type != "dofs" or \
+               not all(isinstance(call, BuiltIn) for call in node.calls()):
+                return False
+        names = set(arg.name for arg in
+                    node1.args_filter(arg_types=["gh_field"]))
+        return any(arg.name in names for arg in
+                   node2.args_filter(arg_types=["gh_field"]))
+
+    @staticmethod
+    def _check_dependencies(node1, node2):
+        '''Checks that fusing the two supplied loops does not break a
+        dependence between them. A loop over dofs only accesses the
+        dof that it is computing so loops over dofs may always be
+        fused in this respect. A loop over cells also accesses the
+        dofs it shares with neighbouring cells (if a field is on a
+        continuous function space) and the dofs of neighbouring cells
+        (if a field is accessed with a stencil). Therefore, if one of
+        the loops writes to a field that the other loop accesses, they
+        may only be fused if neither of them accesses the field with a
+        stencil and if the field is on a discontinuous function space
+        (or both loops increment it).
+
+        :param node1: the first loop.
+        :type node1: :py:class:`psyclone.dynamo0p3.DynLoop`
+        :param node2: the second loop.
+        :type node2: :py:class:`psyclone.dynamo0p3.DynLoop`
+        :raises TransformationError: if fusing the loops would break a \
+                                     dependence between them.
+        '''
+        from psyclone.dynamo0p3 import GH_WRITE_ACCESSES
+        if node1.loop_type == "dofs":
+            return
+        for arg1 in node1.args_filter(arg_types=["gh_field"]):
+            for arg2 in node2.args_filter(arg_types=["gh_field"]):
+                if arg1.name != arg2.name:
+                    continue
+                if arg1.access not in GH_WRITE_ACCESSES and \
+                   arg2.access not in GH_WRITE_ACCESSES:
+                    continue
+                if arg1.stencil or arg2.stencil:
+                    reason = "it is accessed with a stencil"
+                elif arg1.access == "gh_inc" and arg2.access == "gh_inc":
+                    continue
+                elif not (arg1.discontinuous and arg2.discontinuous):
+                    reason = ("it is (or may be) on a continuous function "
+                              "space")
+                else:
+                    continue
+                raise TransformationError(
+                    "Error in Dynamo0p3AutoLoopFuse transformation. Field "
+                    "'{0}' is accessed with '{1}' by the first loop and "
+                    "with '{2}' by the second loop and {3}.".format(
+                        arg1.name, arg1.access, arg2.access, reason))
+
+    def apply(self, schedule, same_space=False):
+        '''Fuses every maximal group of consecutive loops over cells or
+        dofs in the supplied schedule that can legally be fused. The
+        optional same_space flag is passed on to
+        :py:class:`DynamoLoopFuseTrans` and asserts that an unknown
+        iteration space (i.e. any_space) matches the other iteration
+        space. This is set at the users own risk. The loops that were
+        fused and the reasons why other consecutive loops were not are
+        available from :py:meth:`report` (and from the
+        :py:attr:`fused` and :py:attr:`rejected` properties).
+
+        :param schedule: the schedule whose loops are to be fused.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :param bool same_space: whether unknown iteration spaces are \
+                                assumed to match.
+        :returns: Tuple of the modified schedule and a record of the \
+                  transformation.
+        :rtype: (:py:class:`psyclone.psyGen.Schedule`, \
+                :py:class:`psyclone.undoredo.Memento`)
+        :raises TransformationError: if the supplied node is not a \
+                                     dynamo0.3 schedule.
+        '''
+        from psyclone.dynamo0p3 import DynSchedule, DynLoop
+        if not isinstance(schedule, DynSchedule):
+            raise TransformationError(
+                "Error in Dynamo0p3AutoLoopFuse transformation. The supplied "
+                "node must be a dynamo0.3 schedule but found '{0}'.".format(
+                    type(schedule)))
+
+        # create a memento of the schedule and the proposed transformation
+        keep = Memento(schedule, self, [schedule])
+
+        self._fused = []
+        self._rejected = []
+        fuse_trans = DynamoLoopFuseTrans()
+        # The loop into which subsequent loops are fused and the names
+        # of the kernels in each of the loops fused into it
+        group = None
+        names = []
+        # Take a copy of the children as fused loops are removed
+        for node in list(schedule.children):
+            if not isinstance(node, DynLoop) or \
+               node.loop_type not in ["", "dofs"]:
+                # This node ends the group
+                if len(names) > 1:
+                    self._fused.append(names)
+                group = None
+                names = []
+                continue
+            node_names = self._kernel_names(node)
+            if group:
+                try:
+                    self._check_dependencies(group, node)
+                    fuse_trans.apply(
+                        group, node,
+                        same_space=same_space or self._same_space(group,
+                                                                  node))
+                    names.extend(node_names)
+                    continue
+                except TransformationError as err:
+                    self._rejected.append(
+                        (self._kernel_names(group), node_names,
+                         err.value))
+                    if len(names) > 1:
+                        self._fused.append(names)
+            group = node
+            names = list(node_names)
+        if len(names) > 1:
+            self._fused.append(names)
+
+        return schedule, keep
+
+
 @six.add_metaclass(abc.ABCMeta)
 class ParallelLoopTrans(Transformation):
 
@@ -434,7 +730,7 @@ class ParallelLoopTrans(Transformation):
                 "not a loop")
         # Check we are not a sequential loop
         # TODO add a list of loop types that are sequential
-        if node.loop_type == 'colours':
+        if node.loop_type in ['colours', 'tilecolours']:
             raise TransformationError("Error in "+self.name+" transformation. "
                                       "The target loop is over colours and "
                                       "must be computed serially.")
@@ -765,16 +1061,29 @@ class ACCLoopTrans(ParallelLoopTrans):
         :param node: the proposed target of the !$acc loop directive.
         :type node: :py:class:`psyclone.psyGen.Node`.
         :param int collapse: number of loops to collapse or None.
-        :raises NotImplementedError: if an API other than GOcean 1.0 is \
-                                     being used.
+        :raises NotImplementedError: if an API other than GOcean 1.0 or \
+                                     Dynamo 0.3 is being used.
+        :raises TransformationError: if a Dynamo 0.3 loop cannot be \
+                                     executed on an OpenACC device or \
+                                     requires colouring.
         '''
         from psyclone.gocean1p0 import GOSchedule
+        from psyclone.dynamo0p3 import DynSchedule
         sched = node.root
-        if not isinstance(sched, GOSchedule):
+        if not isinstance(sched, (GOSchedule, DynSchedule)):
             raise NotImplementedError(
                 "OpenACC loop transformations are currently only supported "
-                "for the gocean 1.0 API")
+                "for the gocean 1.0 and dynamo0.3 APIs")
         super(ACCLoopTrans, self)._validate(node, collapse)
+        if isinstance(sched, DynSchedule):
+            check_dynamo_acc([node], self.name)
+            # If the loop is not already coloured then check whether or not
+            # it should be
+            if node.loop_type != "colour" and node.requires_colouring():
+                raise TransformationError(
+                    "Error in {0} transformation. The kernel has an argument"
+                    " with INC access. Colouring is required.".
+                    format(self.name))
 
     def apply(self, node, collapse=None, independent=True):
         '''
@@ -849,7 +1158,7 @@ class OMPParallelLoopTrans(OMPLoopTrans):
                                       "node is not a loop.".format(self.name))
 
         # Check we are not a sequential loop
-        if node.loop_type == 'colours':
+        if node.loop_type in ['colours', 'tilecolours']:
             raise TransformationError("Error in "+self.name+" transformation. "
                                       "The requested loop is over colours and "
                                       "must be computed serially.")
@@ -937,10 +1246,12 @@ class DynamoOMPParallelLoopTrans(OMPParallelLoopTrans):
 
         # If the loop is not already coloured then check whether or not
         # it should be. If the field space is discontinuous then we don't
-        # need to worry about colouring.
+        # need to worry about colouring. Loops containing CMA assembly or
+        # matrix-matrix kernels are race-free and never need colouring.
         from psyclone.dynamo0p3 import DISCONTINUOUS_FUNCTION_SPACES
         if node.field_space.orig_name not in DISCONTINUOUS_FUNCTION_SPACES:
-            if node.loop_type is not 'colour' and node.has_inc_arg():
+            if node.loop_type not in ['colour', 'tiles'] and \
+               node.requires_colouring():
                 raise TransformationError(
                     "Error in {0} transformation. The kernel has an "
                     "argument with INC access. Colouring is required.".
@@ -1027,7 +1338,8 @@ class Dynamo0p3OMPLoopTrans(OMPLoopTrans):
 
         # If the loop is not already coloured then check whether or not
         # it should be
-        if node.loop_type is not 'colour' and node.has_inc_arg():
+        if node.loop_type not in ['colour', 'tiles'] and \
+           node.requires_colouring():
             raise TransformationError(
                 "Error in {0} transformation. The kernel has an argument"
                 " with INC access. Colouring is required.".
@@ -1036,6 +1348,237 @@ class Dynamo0p3OMPLoopTrans(OMPLoopTrans):
         return OMPLoopTrans.apply(self, node, reprod=reprod)
 
 
+class Dynamo0p3OMPNowaitTrans(Transformation):
+    '''Removes the implicit barrier at the end of each OpenMP do loop
+    within the OpenMP parallel regions of a Dynamo 0.3 schedule unless a
+    subsequent loop in the region depends upon it. The barrier at the
+    end of a loop is kept if the following loop accesses a field or
+    operator that one of the loops since the previous barrier writes to
+    (or vice versa), or if it reads the result of a reduction. The only
+    exception is a pair of loops over the same dofs with a static
+    schedule: the same thread then computes the same dofs in both loops
+    so there is no dependence between iterations on different threads.
+    The barrier at the end of the last loop in a region is always
+    removed as the end of the region is itself a barrier. For example:
+
+    >>> from psyclone.parse import parse
+    >>> from psyclone.psyGen import PSyFactory
+    >>> api = "dynamo0.3"
+    >>> ast, invokeInfo = parse("file.f90", api=api)
+    >>> psy=PSyFactory(api).create(invokeInfo)
+    >>> schedule = psy.invokes.get('invoke_0').schedule
+    >>>
+    >>> from psyclone.transformations import Dynamo0p3OMPLoopTrans, \\
+    >>>     OMPParallelTrans, Dynamo0p3OMPNowaitTrans
+    >>> for loop in schedule.loops():
+    >>>     schedule, _ = Dynamo0p3OMPLoopTrans().apply(loop)
+    >>> schedule, _ = OMPParallelTrans().apply(schedule.children)
+    >>> trans = Dynamo0p3OMPNowaitTrans()
+    >>> new_schedule, memento = trans.apply(schedule)
+    >>> print(trans.report())
+
+    '''
+    def __init__(self):
+        # The names of the kernels in each loop whose barrier was removed
+        # by the last application of this transformation
+        self._removed = []
+        # The names of the kernels in each loop whose barrier was kept
+        # and in the following loop, with the reason why
+        self._kept = []
+        # A description of each barrier, in the order of the loops
+        self._report = []
+
+    def __str__(self):
+        return ("Removes the barriers at the end of OpenMP do loops that are "
+                "not required")
+
+    @property
+    def name(self):
+        '''
+        :returns: the name of this transformation as a string.
+        :rtype: str
+        '''
+        return "Dynamo0p3OMPNowaitTrans"
+
+    @property
+    def removed(self):
+        '''
+        :returns: the names of the kernels in each loop whose barrier \
+                  was removed by the last application of this \
+                  transformation.
+        :rtype: :func:`list` of :func:`list` of str
+        '''
+        return self._removed
+
+    @property
+    def kept(self):
+        '''
+        :returns: the names of the kernels in each loop whose barrier \
+                  was kept by the last application of this \
+                  transformation and in the following loop, together \
+                  with the reason.
+        :rtype: :func:`list` of 3-tuples (:func:`list` of str, \
+                :func:`list` of str, str)
+        '''
+        return self._kept
+
+    def report(self):
+        '''
+        :returns: a description of the barriers that were removed by \
+                  the last application of this transformation and of \
+                  why the others were kept.
+        :rtype: str
+        '''
+        return "\n".join(self._report)
+
+    @staticmethod
+    def _same_iterations(node1, node2):
+        '''Two OpenMP do loops with a static schedule and the same number
+        of iterations assign the same iterations to the same threads.
+        Loops over dofs only access the dof that they are computing so,
+        if they access the same field, they iterate over the same dofs.
+
+        :param node1: the first OpenMP do directive.
+        :type node1: :py:class:`psyclone.psyGen.OMPDoDirective`
+        :param node2: the second OpenMP do directive.
+        :type node2: :py:class:`psyclone.psyGen.OMPDoDirective`
+        :returns: whether the loops are known to compute the same dofs \
+                  on the same threads.
+        :rtype: bool
+        '''
+        loop1 = node1.children[0]
+        loop2 = node2.children[0]
+        return (node1.omp_schedule == "static" and
+                node2.omp_schedule == "static" and
+                loop1.loop_type == "dofs" and loop2.loop_type == "dofs" and
+                loop1.upper_bound_name == loop2.upper_bound_name and
+                loop1.upper_bound_halo_depth == loop2.upper_bound_halo_depth)
+
+    def _dependence(self, node1, node2):
+        '''Checks whether the second OpenMP do loop depends on work that
+        the first one performs on other threads, i.e. whether one of
+        them writes to an argument that the other one accesses.
+
+        :param node1: the first OpenMP do directive.
+        :type node1: :py:class:`psyclone.psyGen.OMPDoDirective`
+        :param node2: the second OpenMP do directive.
+        :type node2: :py:class:`psyclone.psyGen.OMPDoDirective`
+        :returns: the reason why there is a dependence or None if there \
+                  is not one.
+        :rtype: str or NoneType
+        '''
+        from psyclone.dynamo0p3 import GH_WRITE_ACCESSES, \
+            VALID_SCALAR_NAMES, VALID_REDUCTION_NAMES
+        for arg1 in node1.args:
+            for arg2 in node2.args:
+                if arg1.name != arg2.name or arg1.is_literal:
+                    continue
+                if arg1.access not in GH_WRITE_ACCESSES and \
+                   arg2.access not in GH_WRITE_ACCESSES:
+                    continue
+                if arg1.type in VALID_SCALAR_NAMES:
+                    # A scalar can only be written by a reduction
+                    if arg1.access in VALID_REDUCTION_NAMES:
+                        return ("it uses the result of the reduction into "
+                                "'{0}'".format(arg1.name))
+                    return ("it performs a reduction into '{0}' which is "
+                            "read by the first loop".format(arg1.name))
+                if self._same_iterations(node1, node2):
+                    continue
+                return ("'{0}' is accessed with '{1}' by the first loop "
+                        "and with '{2}' by the second loop".format(
+                            arg1.name, arg1.access, arg2.access))
+        return None
+
+    def apply(self, node):
+        '''Removes the barriers that are not required at the end of the
+        OpenMP do loops within the supplied OpenMP parallel region or
+        within all of the OpenMP parallel regions of the supplied
+        schedule. Regions that contain anything other than OpenMP do
+        loops are left unchanged. The barriers that were removed and the
+        reasons why the others were kept are available from
+        :py:meth:`report` (and from the :py:attr:`removed` and
+        :py:attr:`kept` properties).
+
+        :param node: the schedule or OpenMP parallel region to transform.
+        :type node: :py:class:`psyclone.dynamo0p3.DynSchedule` or \
+                    :py:class:`psyclone.psyGen.OMPParallelDirective`
+        :returns: Tuple of the modified schedule and a record of the \
+                  transformation.
+        :rtype: (:py:class:`psyclone.psyGen.Schedule`, \
+                :py:class:`psyclone.undoredo.Memento`)
+        :raises TransformationError: if the supplied node is not a \
+                                     dynamo0.3 schedule or an OpenMP \
+                                     parallel region within one.
+        '''
+        from psyclone.psyGen import OMPParallelDirective, OMPDoDirective, \
+            OMPParallelDoDirective
+        from psyclone.dynamo0p3 import DynSchedule
+        if isinstance(node, OMPParallelDirective) and \
+           not isinstance(node, OMPParallelDoDirective):
+            regions = [node]
+        elif isinstance(node, DynSchedule):
+            regions = [region for region in
+                       node.walk(node.children, OMPParallelDirective)
+                       if not isinstance(region, OMPParallelDoDirective)]
+        else:
+            regions = None
+        if regions is None or not isinstance(node.root, DynSchedule):
+            raise TransformationError(
+                "Error in {0} transformation. The supplied node must be a "
+                "dynamo0.3 schedule or an OpenMP parallel region but found "
+                "'{1}'.".format(self.name, type(node)))
+
+        schedule = node.root
+        # create a memento of the schedule and the proposed transformation
+        keep = Memento(schedule, self, [schedule])
+
+        self._removed = []
+        self._kept = []
+        self._report = []
+        for region in regions:
+            loops = region.children
+            if not all(isinstance(child, OMPDoDirective) for child in loops):
+                continue
+            for idx, loop in enumerate(loops):
+                names = [call.name for call in loop.calls()]
+                # The loops executed since the previous barrier
+                if idx == 0 or not loops[idx-1].nowait:
+                    pending = []
+                pending.append(loop)
+                if idx == len(loops) - 1:
+                    # The end of the parallel region is a barrier
+                    loop.nowait = True
+                    self._removed.append(names)
+                    self._report.append(
+                        "Removed the barrier after the loop calling {0} "
+                        "(end of the parallel region)".format(
+                            ", ".join(names)))
+                    continue
+                following = loops[idx+1]
+                following_names = [call.name for call in following.calls()]
+                reason = None
+                for node1 in pending:
+                    reason = self._dependence(node1, following)
+                    if reason:
+                        break
+                loop.nowait = reason is None
+                if reason:
+                    self._kept.append((names, following_names, reason))
+                    self._report.append(
+                        "Kept the barrier after the loop calling {0} as the "
+                        "loop calling {1} depends on it: {2}".format(
+                            ", ".join(names), ", ".join(following_names),
+                            reason))
+                else:
+                    self._removed.append(names)
+                    self._report.append(
+                        "Removed the barrier after the loop calling "
+                        "{0}".format(", ".join(names)))
+
+        return schedule, keep
+
+
 class GOceanOMPLoopTrans(OMPLoopTrans):
 
     ''' GOcean-specific orphan OpenMP loop transformation. Adds GOcean
@@ -1314,6 +1857,22 @@ class Dynamo0p3ColourTrans(ColourTrans):
         :rtype: (:py:class:`psyclone.dynamo0p3.DynSchedule`, \
                  :py:class:`psyclone.undoredo.Memento`)
 
+        '''
+        self._validate(node)
+
+        schedule, keep = ColourTrans.apply(self, node)
+
+        return schedule, keep
+
+    def _validate(self, node):
+        '''Checks that the supplied loop may be coloured.
+
+        :param node: the loop to transform.
+        :type node: :py:class:`psyclone.dynamo0p3.DynLoop`
+        :raises TransformationError: if the node is not a loop over cells \
+                                     on a continuous function space or if \
+                                     it is within an OpenMP region.
+
         '''
         # check node is a loop
         from psyclone.psyGen import Loop
@@ -1336,10 +1895,12 @@ class Dynamo0p3ColourTrans(ColourTrans):
                 "may be coloured but this loop is over {0}".
                 format(node.loop_type))
 
-        # Check whether we have a field that has INC access
-        if not node.has_inc_arg():
+        # Check whether the loop actually needs colouring (it does not
+        # if no field has INC access or if it only contains CMA assembly
+        # or matrix-matrix kernels)
+        if not node.requires_colouring():
             # TODO generate a warning here as we don't need to colour
-            # a loop that does not update a field with INC access
+            # a loop that is already race-free
             pass
 
         # Check that we're not attempting to colour a loop that is
@@ -1350,7 +1911,117 @@ class Dynamo0p3ColourTrans(ColourTrans):
             raise TransformationError("Cannot have a loop over colours "
                                       "within an OpenMP parallel region.")
 
-        schedule, keep = ColourTrans.apply(self, node)
+
+class Dynamo0p3TiledColourTrans(Dynamo0p3ColourTrans):
+    '''Split a Dynamo 0.3 loop over cells into colours of tiles so that it
+    can be parallelised with better cache locality than
+    :py:class:`psyclone.transformations.Dynamo0p3ColourTrans` gives. The
+    mesh is partitioned into tiles of neighbouring cells and the tiles
+    are coloured so that no two tiles of the same colour share a dof.
+    The loop is replaced by a (sequential) loop over the colours of
+    tiles, containing a loop over the tiles of that colour (which may be
+    parallelised), containing a (sequential) loop over the cells of a
+    tile. Each thread therefore works on a compact group of cells. For
+    example:
+
+    >>> from psyclone.parse import parse
+    >>> from psyclone.psyGen import PSyFactory
+    >>> api = "dynamo0.3"
+    >>> ast, invokeInfo = parse("file.f90", api=api)
+    >>> psy=PSyFactory(api).create(invokeInfo)
+    >>> schedule = psy.invokes.get('invoke_0').schedule
+    >>>
+    >>> from psyclone.transformations import Dynamo0p3TiledColourTrans, \\
+    ...     Dynamo0p3OMPLoopTrans, OMPParallelTrans
+    >>> ctrans = Dynamo0p3TiledColourTrans()
+    >>> otrans = Dynamo0p3OMPLoopTrans()
+    >>> ptrans = OMPParallelTrans()
+    >>> schedule, _ = ctrans.apply(schedule.children[0])
+    >>> # Parallelise the loop over the tiles of each colour
+    >>> tiles_loop = schedule.children[0].children[0]
+    >>> schedule, _ = otrans.apply(tiles_loop)
+    >>> schedule, _ = ptrans.apply(tiles_loop.parent)
+    >>> schedule.view()
+
+    The same rules apply as for
+    :py:class:`psyclone.transformations.Dynamo0p3ColourTrans` and, in
+    addition, loops containing inter-grid kernels may not be tiled.
+
+    '''
+
+    def __str__(self):
+        return ("Split a Dynamo 0.3 loop over cells into colours of tiles "
+                "of cells")
+
+    @property
+    def name(self):
+        ''' Returns the name of this transformation as a string.'''
+        return "Dynamo0p3TiledColourTrans"
+
+    def apply(self, node):
+        '''Converts the Loop represented by :py:obj:`node` into a nest
+        of three loops where the outer loop is over colours of tiles, the
+        middle loop is over the tiles of that colour and the inner loop is
+        over the cells of a tile.
+
+        :param node: the loop to transform.
+        :type node: :py:class:`psyclone.dynamo0p3.DynLoop`
+
+        :returns: 2-tuple of new schedule and memento of transform
+        :rtype: (:py:class:`psyclone.dynamo0p3.DynSchedule`, \
+                 :py:class:`psyclone.undoredo.Memento`)
+
+        '''
+        self._validate(node)
+        check_intergrid(node)
+
+        schedule = node.root
+
+        # create a memento of the schedule and the proposed transformation
+        keep = Memento(schedule, self, [node])
+
+        node_parent = node.parent
+        node_position = node.position
+
+        # create a loop over colours of tiles. This must be run
+        # sequentially
+        colours_loop = node.__class__(parent=node_parent,
+                                      loop_type="tilecolours")
+        colours_loop.field_space = node.field_space
+        colours_loop.iteration_space = node.iteration_space
+        colours_loop.set_lower_bound("start")
+        colours_loop.set_upper_bound("ntilecolours")
+        node_parent.addchild(colours_loop, index=node_position)
+
+        # create a loop over the tiles of a particular colour. This can
+        # be run in parallel
+        tiles_loop = node.__class__(parent=colours_loop, loop_type="tiles")
+        # create a loop over the cells of a tile. This must be run
+        # sequentially
+        tile_loop = node.__class__(parent=tiles_loop, loop_type="tile")
+        for loop in [tiles_loop, tile_loop]:
+            loop.field_space = node.field_space
+            loop.field_name = node.field_name
+            loop.iteration_space = node.iteration_space
+            loop.set_lower_bound("start")
+            loop.kernel = node.kernel
+        if Config.get().distributed_memory:
+            index = node.upper_bound_halo_depth
+            tiles_loop.set_upper_bound("tile_halo", index)
+            tile_loop.set_upper_bound("tilecell_halo", index)
+        else:  # no distributed memory
+            tiles_loop.set_upper_bound("ntiles")
+            tile_loop.set_upper_bound("ntilecell")
+        colours_loop.addchild(tiles_loop)
+        tiles_loop.addchild(tile_loop)
+
+        # move the contents of node to the loop over the cells of a tile
+        tile_loop.children.extend(node.children)
+        for child in node.children:
+            child.parent = tile_loop
+
+        # remove original loop
+        node_parent.children.remove(node)
 
         return schedule, keep
 
@@ -1390,11 +2061,16 @@ class ParallelRegionTrans(RegionTrans):
         # support this in the future, see #526, it does not warrant
         # making a separate dynamo-specific class.
         from psyclone.psyGen import HaloExchange, Schedule
+        from psyclone.dynamo0p3 import DynKindConversion
         for node in node_list:
             if isinstance(node, HaloExchange):
                 raise TransformationError(
                     "A halo exchange within a parallel region is not "
                     "supported")
+            if isinstance(node, DynKindConversion):
+                raise TransformationError(
+                    "A conversion of the kind of a kernel argument within a "
+                    "parallel region is not supported")
 
         if isinstance(node_list[0], Schedule):
             raise TransformationError(
@@ -1553,41 +2229,37 @@ class OMPParallelTrans(ParallelRegionTrans):
         super(OMPParallelTrans, self)._validate(node_list)
 
 
-class ACCParallelTrans(ParallelRegionTrans):
+class OMPTaskTrans(RegionTrans):
     '''
-    Create an OpenACC parallel region by inserting directives. This parallel
-    region *must* come after an enter-data directive (see `ACCDataTrans`). For
-    example:
+    Create an OpenMP PARALLEL region containing an OpenMP SINGLE region
+    in which each of the supplied nodes is executed as an OpenMP task.
+    The dependencies between the tasks are given by "depend" clauses
+    that are derived from the way in which each task accesses the
+    arguments of its kernels, halo exchanges and global sums. Kernels
+    that do not depend on one another may therefore be executed
+    concurrently and may overlap with communication. For example:
 
     >>> from psyclone.parse import parse
     >>> from psyclone.psyGen import PSyFactory
-    >>> api = "gocean1.0"
-    >>> filename = "nemolite2d_alg.f90"
-    >>> ast, invokeInfo = parse(filename, api=api, invoke_name="invoke")
-    >>> psy = PSyFactory(api).create(invokeInfo)
-    >>>
-    >>> from psyclone.psyGen import TransInfo
-    >>> t = TransInfo()
-    >>> ptrans = t.get_trans_name('ACCParallelTrans')
-    >>> dtrans = t.get_trans_name('ACCDataTrans')
+    >>> api = "dynamo0.3"
+    >>> _, invoke_info = parse("4.9_named_multikernel_invokes.f90", api=api)
+    >>> psy = PSyFactory(api).create(invoke_info)
     >>>
-    >>> schedule = psy.invokes.get('invoke_0').schedule
-    >>> schedule.view()
+    >>> from psyclone.transformations import OMPTaskTrans
+    >>> ttrans = OMPTaskTrans()
     >>>
-    >>> # Enclose everything within a single OpenACC PARALLEL region
-    >>> newschedule, _ = ptrans.apply(schedule.children)
-    >>> # Add an enter-data directive
-    >>> newschedule, _ = dtrans.apply(newschedule)
+    >>> schedule = psy.invokes.invoke_list[0].schedule
+    >>> # Execute every node of the schedule as an OpenMP task
+    >>> newschedule, _ = ttrans.apply(schedule.children)
     >>> newschedule.view()
-    '''
-    def __init__(self):
-        super(ACCParallelTrans, self).__init__()
-        from psyclone.psyGen import ACCParallelDirective
-        # Set the type of directive that the base class will use
-        self._pdirective = ACCParallelDirective
 
+    Since a task is executed by a single thread, loops containing
+    kernels with INC access do not need to be coloured.
+
+    '''
     def __str__(self):
-        return "Insert an OpenACC Parallel region"
+        return ("Execute nodes as OpenMP tasks within an OpenMP parallel "
+                "region")
 
     @property
     def name(self):
@@ -1595,38 +2267,500 @@ class ACCParallelTrans(ParallelRegionTrans):
         :returns: The name of this transformation as a string.
         :rtype: str
         '''
-        return "ACCParallelTrans"
+        return "OMPTaskTrans"
 
     def _validate(self, node_list):
         '''
-        OpenACC-specific validation checks that the supplied list
-        of nodes can be enclosed in a parallel region.
-
-        :param node_list: proposed list of nodes to put inside region.
-        :type node_list: list of :py:class:`psyclone.psyGen.Node`.
-        :raises NotImplementedError: if an API other than GOcean 1.0 is \
-                                     being used.
+        Check that the supplied list of Nodes may be executed as OpenMP
+        tasks.
+
+        :param node_list: list of Nodes to execute as tasks.
+        :type node_list: list of :py:class:`psyclone.psyGen.Node`
+        :raises NotImplementedError: if the nodes are not from a Dynamo 0.3 \
+                                     Schedule.
+        :raises TransformationError: if passed a Schedule.
+        :raises TransformationError: if the nodes are already within an \
+                                     OpenMP region.
+        :raises TransformationError: if the nodes contain an OpenMP or \
+                                     OpenACC directive.
+        :raises TransformationError: if any of the nodes is a conversion \
+                                     of the kind of a kernel argument.
         '''
-        from psyclone.gocean1p0 import GOSchedule
-        sched = node_list[0].root
-        if not isinstance(sched, GOSchedule):
-            raise NotImplementedError(
-                "OpenACC parallel regions are currently only "
-                "supported for the gocean 1.0 API")
-        super(ACCParallelTrans, self)._validate(node_list)
+        from psyclone.psyGen import Schedule, Directive, OMPDirective
+        from psyclone.dynamo0p3 import DynSchedule, DynKindConversion
 
+        if isinstance(node_list[0], Schedule):
+            raise TransformationError(
+                "A {0} transformation cannot be applied to a Schedule but "
+                "only to one or more nodes from within a Schedule.".
+                format(self.name))
 
-class GOConstLoopBoundsTrans(Transformation):
-    ''' Switch on (or off) the use of constant loop bounds within
-    a GOSchedule. In the absence of constant loop bounds, PSyclone will
-    generate loops where the bounds are obtained by de-referencing a field
-    object, e.g.:
-    ::
+        # The depend clauses are constructed from the same information
+        # as the dependence analysis, which is only available for the
+        # dynamo0.3 API
+        if not isinstance(node_list[0].root, DynSchedule):
+            raise NotImplementedError(
+                "OpenMP tasks are currently only supported for the "
+                "dynamo0.3 API")
 
-      DO j = my_field%grid%internal%ystart, my_field%grid%internal%ystop
+        if node_list[0].ancestor(OMPDirective):
+            raise TransformationError(
+                "Error in {0} transformation: cannot create OpenMP tasks "
+                "within another OpenMP region.".format(self.name))
 
-    Some compilers are able to produce more efficient code if they are
-    provided with information on the relative trip-counts of the loops
+        for node in node_list:
+            if isinstance(node, Directive) or \
+               node.walk(node.children, Directive):
+                raise TransformationError(
+                    "Error in {0} transformation: the nodes to be executed "
+                    "as tasks must not contain any OpenMP or OpenACC "
+                    "directives.".format(self.name))
+            if isinstance(node, DynKindConversion):
+                raise TransformationError(
+                    "Error in {0} transformation: a conversion of the kind "
+                    "of a kernel argument can not be executed as a "
+                    "task.".format(self.name))
+
+        super(OMPTaskTrans, self)._validate(node_list)
+
+    def apply(self, nodes):
+        '''
+        Enclose the supplied nodes within an OpenMP parallel region and
+        an OpenMP single region and make each of them an OpenMP task.
+
+        :param nodes: a single Node or a list of Nodes.
+        :type nodes: (list of) :py:class:`psyclone.psyGen.Node`
+        :returns: 2-tuple of new schedule and memento of transform.
+        :rtype: (:py:class:`psyclone.psyGen.Schedule`, \
+                 :py:class:`psyclone.undoredo.Memento`)
+        :raises TransformationError: if the nodes argument is not of the \
+                                     correct type.
+        '''
+        from psyclone.psyGen import Node, OMPParallelDirective, \
+            OMPSingleDirective, OMPTaskDirective
+
+        if isinstance(nodes, list) and isinstance(nodes[0], Node):
+            node_list = nodes
+        elif isinstance(nodes, Node):
+            node_list = [nodes]
+        else:
+            arg_type = str(type(nodes))
+            raise TransformationError("Error in {0} transformation. "
+                                      "Argument must be a single Node in a "
+                                      "schedule or a list of Nodes in a "
+                                      "schedule but have been passed an "
+                                      "object of type: {1}".
+                                      format(self.name, arg_type))
+        self._validate(node_list)
+
+        node_parent = node_list[0].parent
+        node_position = node_list[0].position
+
+        schedule = node_list[0].root
+        keep = Memento(schedule, self)
+
+        # Create the parallel region containing the single region
+        parallel = OMPParallelDirective(parent=node_parent)
+        single = OMPSingleDirective(parent=parallel)
+        parallel.addchild(single)
+
+        # Make each of the nodes a task within the single region
+        for child in node_list[:]:
+            node_parent.children.remove(child)
+            task = OMPTaskDirective(parent=single, children=[child])
+            child.parent = task
+            single.addchild(task)
+
+        node_parent.addchild(parallel, index=node_position)
+
+        return schedule, keep
+
+
+class OMPParallelRegionMergeTrans(Transformation):
+    '''Merges the OpenMP parallel regions of consecutive parallel loops
+    in a schedule so that each maximal group of them is executed within
+    a single OpenMP parallel region, with an OpenMP do directive for
+    each loop. This removes the cost of starting and ending a parallel
+    region for every loop. A loop (e.g. over colours) whose body is an
+    OpenMP parallel do loop joins the region in the same way so that
+    the parallel region is started once rather than once per
+    iteration. Existing OpenMP parallel regions that only contain
+    OpenMP do loops are merged with their neighbours. Any other node
+    (such as a halo exchange, a global sum or a serial loop) ends the
+    group, as does a loop that performs a reduction into a variable
+    accessed by a preceding loop in the group or that accesses the
+    result of a preceding reproducible reduction. For example:
+
+    >>> from psyclone.parse import parse
+    >>> from psyclone.psyGen import PSyFactory
+    >>> api = "dynamo0.3"
+    >>> ast, invokeInfo = parse("file.f90", api=api)
+    >>> psy=PSyFactory(api).create(invokeInfo)
+    >>> schedule = psy.invokes.get('invoke_0').schedule
+    >>>
+    >>> from psyclone.transformations import DynamoOMPParallelLoopTrans, \\
+    >>>     OMPParallelRegionMergeTrans
+    >>> for loop in schedule.loops():
+    >>>     schedule, _ = DynamoOMPParallelLoopTrans().apply(loop)
+    >>> trans = OMPParallelRegionMergeTrans()
+    >>> new_schedule, memento = trans.apply(schedule)
+    >>> print(trans.report())
+    >>> new_schedule.view()
+
+    '''
+    def __init__(self):
+        # The names of the kernels in each parallel region created by
+        # the last application of this transformation
+        self._merged = []
+        # The names of the kernels in the last node of a group and in
+        # the following node when the group had to be split, with the
+        # reason why
+        self._split = []
+
+    def __str__(self):
+        return ("Merges the OpenMP parallel regions of consecutive parallel "
+                "loops")
+
+    @property
+    def name(self):
+        '''
+        :returns: the name of this transformation as a string.
+        :rtype: str
+        '''
+        return "OMPParallelRegionMergeTrans"
+
+    @property
+    def merged(self):
+        '''
+        :returns: the names of the kernels in each OpenMP parallel \
+                  region created by the last application of this \
+                  transformation.
+        :rtype: :func:`list` of :func:`list` of str
+        '''
+        return self._merged
+
+    @property
+    def split(self):
+        '''
+        :returns: the names of the kernels in the last node of a group \
+                  and in the following node for each group of parallel \
+                  loops that had to be split by the last application of \
+                  this transformation, together with the reason.
+        :rtype: :func:`list` of 3-tuples (:func:`list` of str, \
+                :func:`list` of str, str)
+        '''
+        return self._split
+
+    def report(self):
+        '''
+        :returns: a description of the OpenMP parallel regions created by \
+                  the last application of this transformation and of \
+                  why consecutive parallel loops were not merged.
+        :rtype: str
+        '''
+        lines = []
+        for names in self._merged:
+            lines.append("Created an OpenMP parallel region enclosing the "
+                         "loops calling {0}".format(", ".join(names)))
+        for first, second, reason in self._split:
+            lines.append(
+                "Did not merge the loop calling {0} with the preceding loop "
+                "calling {1}: {2}".format(", ".join(second),
+                                          ", ".join(first), reason))
+        return "\n".join(lines)
+
+    @staticmethod
+    def _can_merge(node):
+        '''
+        :param node: a child of the schedule.
+        :type node: :py:class:`psyclone.psyGen.Node`
+        :returns: whether the supplied node is an OpenMP parallel do \
+                  loop, a loop whose body is an OpenMP parallel do loop \
+                  or an OpenMP parallel region containing only OpenMP do \
+                  loops.
+        :rtype: bool
+        '''
+        from psyclone.psyGen import Loop, OMPDoDirective, \
+            OMPParallelDirective, OMPParallelDoDirective
+        if isinstance(node, OMPParallelDoDirective):
+            return True
+        if isinstance(node, OMPParallelDirective):
+            for child in node.children:
+                if isinstance(child, Loop) and child.encloses_omp_do():
+                    continue
+                if not isinstance(child, OMPDoDirective):
+                    return False
+            return bool(node.children)
+        return (isinstance(node, Loop) and len(node.children) == 1 and
+                isinstance(node.children[0], OMPParallelDoDirective))
+
+    @staticmethod
+    def _conflict(node, accessed, reprod_reductions):
+        '''Checks whether the supplied node can be executed within the
+        same OpenMP parallel region as the preceding nodes. The variables
+        into which a parallel region performs reductions are initialised
+        before the region and the result of a reproducible reduction is
+        only computed after the end of the region.
+
+        :param node: the node to check.
+        :type node: :py:class:`psyclone.psyGen.Node`
+        :param accessed: the names of the arguments accessed by the \
+                         preceding nodes in the group.
+        :type accessed: set of str
+        :param reprod_reductions: the names of the variables into which \
+                                  the preceding nodes in the group \
+                                  perform reproducible reductions.
+        :type reprod_reductions: set of str
+        :returns: the reason why the node can not join the group or None \
+                  if it can.
+        :rtype: str or NoneType
+        '''
+        for call in node.reductions():
+            if call.reduction_arg.name in accessed:
+                return ("it performs a reduction into '{0}' which is "
+                        "accessed by a preceding loop".format(
+                            call.reduction_arg.name))
+        for call in node.calls():
+            for arg in call.arguments.args:
+                if arg.name in reprod_reductions:
+                    return ("it uses the result of the reproducible "
+                            "reduction into '{0}'".format(arg.name))
+        return None
+
+    @staticmethod
+    def _orphan(directive):
+        '''Replaces the supplied OpenMP parallel do directive with an
+        OpenMP do directive.
+
+        :param directive: the directive to replace.
+        :type directive: :py:class:`psyclone.psyGen.OMPParallelDoDirective`
+        :returns: the new directive.
+        :rtype: :py:class:`psyclone.psyGen.OMPDoDirective`
+        '''
+        from psyclone.psyGen import OMPDoDirective
+        parent = directive.parent
+        new_directive = OMPDoDirective(parent=parent,
+                                       children=directive.children,
+                                       omp_schedule=directive.omp_schedule,
+                                       reprod=directive.reprod)
+        for child in new_directive.children:
+            child.parent = new_directive
+        parent.children[directive.position] = new_directive
+        return new_directive
+
+    def _merge(self, group):
+        '''Encloses the supplied group of consecutive nodes within a single
+        OpenMP parallel region.
+
+        :param group: the nodes to enclose.
+        :type group: list of :py:class:`psyclone.psyGen.Node`
+        '''
+        from psyclone.psyGen import OMPDoDirective, OMPParallelDirective, \
+            OMPParallelDoDirective
+        nodes = []
+        for node in group:
+            if isinstance(node, OMPParallelDoDirective):
+                nodes.append(self._orphan(node))
+            elif isinstance(node, OMPParallelDirective):
+                # Replace the existing region with its children. The end
+                # of the region is no longer a barrier.
+                children = node.children
+                last = children[-1]
+                if isinstance(last, OMPDoDirective):
+                    last.nowait = False
+                parent = node.parent
+                position = node.position
+                parent.children[position:position+1] = children
+                for child in children:
+                    child.parent = parent
+                nodes.extend(children)
+            else:
+                self._orphan(node.children[0])
+                nodes.append(node)
+        OMPParallelTrans().apply(nodes)
+        self._merged.append(
+            [call.name for node in nodes for call in node.calls()])
+
+    def apply(self, schedule):
+        '''Merges every maximal group of consecutive parallel loops in the
+        supplied schedule into a single OpenMP parallel region. The
+        regions that were created and the reasons why consecutive
+        parallel loops were not merged are available from
+        :py:meth:`report` (and from the :py:attr:`merged` and
+        :py:attr:`split` properties).
+
+        :param schedule: the schedule whose parallel regions are to be \
+                         merged.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule` or \
+                        :py:class:`psyclone.gocean1p0.GOSchedule`
+        :returns: Tuple of the modified schedule and a record of the \
+                  transformation.
+        :rtype: (:py:class:`psyclone.psyGen.Schedule`, \
+                :py:class:`psyclone.undoredo.Memento`)
+        :raises TransformationError: if the supplied node is not a \
+                                     schedule.
+        :raises NotImplementedError: if the schedule is not from the \
+                                     dynamo0.3 or gocean1.0 API.
+        '''
+        from psyclone.psyGen import Schedule, Loop
+        from psyclone.dynamo0p3 import DynSchedule
+        from psyclone.gocean1p0 import GOSchedule
+        if not isinstance(schedule, Schedule):
+            raise TransformationError(
+                "Error in {0} transformation. The supplied node must be a "
+                "schedule but found '{1}'.".format(self.name,
+                                                   type(schedule)))
+        if not isinstance(schedule, (DynSchedule, GOSchedule)):
+            raise NotImplementedError(
+                "The {0} transformation is currently only supported for the "
+                "dynamo0.3 and gocean1.0 APIs".format(self.name))
+
+        # create a memento of the schedule and the proposed transformation
+        keep = Memento(schedule, self, [schedule])
+
+        self._merged = []
+        self._split = []
+        groups = []
+        group = []
+        accessed = set()
+        reprod_reductions = set()
+        for node in schedule.children:
+            if not self._can_merge(node):
+                # This node ends the group
+                groups.append(group)
+                group = []
+                continue
+            if not group:
+                accessed = set()
+                reprod_reductions = set()
+            reason = self._conflict(node, accessed, reprod_reductions)
+            if reason:
+                self._split.append(
+                    ([call.name for call in group[-1].calls()],
+                     [call.name for call in node.calls()], reason))
+                groups.append(group)
+                group = []
+                accessed = set()
+                reprod_reductions = set()
+            group.append(node)
+            for call in node.calls():
+                accessed.update(arg.name for arg in call.arguments.args)
+            reprod_reductions.update(call.reduction_arg.name for call in
+                                     node.reductions(reprod=True))
+        groups.append(group)
+
+        for group in groups:
+            # A single parallel loop is left unchanged but the parallel
+            # region is moved outside a loop containing a parallel loop
+            if len(group) > 1 or \
+               (len(group) == 1 and isinstance(group[0], Loop)):
+                self._merge(group)
+
+        return schedule, keep
+
+
+class ACCParallelTrans(ParallelRegionTrans):
+    '''
+    Create an OpenACC parallel region by inserting directives. This parallel
+    region *must* come after an enter-data directive (see `ACCDataTrans`). For
+    example:
+
+    >>> from psyclone.parse import parse
+    >>> from psyclone.psyGen import PSyFactory
+    >>> api = "gocean1.0"
+    >>> filename = "nemolite2d_alg.f90"
+    >>> ast, invokeInfo = parse(filename, api=api, invoke_name="invoke")
+    >>> psy = PSyFactory(api).create(invokeInfo)
+    >>>
+    >>> from psyclone.psyGen import TransInfo
+    >>> t = TransInfo()
+    >>> ptrans = t.get_trans_name('ACCParallelTrans')
+    >>> dtrans = t.get_trans_name('ACCDataTrans')
+    >>>
+    >>> schedule = psy.invokes.get('invoke_0').schedule
+    >>> schedule.view()
+    >>>
+    >>> # Enclose everything within a single OpenACC PARALLEL region
+    >>> newschedule, _ = ptrans.apply(schedule.children)
+    >>> # Add an enter-data directive
+    >>> newschedule, _ = dtrans.apply(newschedule)
+    >>> newschedule.view()
+    '''
+    def __init__(self):
+        super(ACCParallelTrans, self).__init__()
+        from psyclone.psyGen import ACCParallelDirective
+        # Set the type of directive that the base class will use
+        self._pdirective = ACCParallelDirective
+
+    def __str__(self):
+        return "Insert an OpenACC Parallel region"
+
+    @property
+    def name(self):
+        '''
+        :returns: The name of this transformation as a string.
+        :rtype: str
+        '''
+        return "ACCParallelTrans"
+
+    def _validate(self, node_list):
+        '''
+        OpenACC-specific validation checks that the supplied list
+        of nodes can be enclosed in a parallel region.
+
+        :param node_list: proposed list of nodes to put inside region.
+        :type node_list: list of :py:class:`psyclone.psyGen.Node`.
+        :raises NotImplementedError: if an API other than GOcean 1.0 or \
+                                     Dynamo 0.3 is being used.
+        :raises TransformationError: if the nodes of a Dynamo 0.3 \
+                                     Schedule cannot be executed on an \
+                                     OpenACC device.
+        '''
+        from psyclone.gocean1p0 import GOSchedule
+        from psyclone.dynamo0p3 import DynSchedule
+        sched = node_list[0].root
+        if not isinstance(sched, (GOSchedule, DynSchedule)):
+            raise NotImplementedError(
+                "OpenACC parallel regions are currently only "
+                "supported for the gocean 1.0 and dynamo0.3 APIs")
+        super(ACCParallelTrans, self)._validate(node_list)
+        if isinstance(sched, DynSchedule):
+            check_dynamo_acc(node_list, self.name)
+
+    def apply(self, nodes):
+        '''
+        Apply this transformation to a subset of the nodes within a
+        schedule - i.e. enclose the specified Loops in the schedule
+        within a single OpenACC parallel region. An API-specific
+        directive is used for a Dynamo 0.3 Schedule.
+
+        :param nodes: a single Node or a list of Nodes.
+        :type nodes: (list of) :py:class:`psyclone.psyGen.Node`.
+        :returns: (transformed schedule, memento of transformation)
+        :rtype: 2-tuple of (:py:class:`psyclone.psyGen.Schedule`, \
+                :py:class:`psyclone.undoredo.Memento`).
+        '''
+        from psyclone.psyGen import ACCParallelDirective, Node
+        from psyclone.dynamo0p3 import DynSchedule, DynACCParallelDirective
+        node = nodes[0] if isinstance(nodes, list) and nodes else nodes
+        if isinstance(node, Node) and isinstance(node.root, DynSchedule):
+            self._pdirective = DynACCParallelDirective
+        else:
+            self._pdirective = ACCParallelDirective
+        return super(ACCParallelTrans, self).apply(nodes)
+
+
+class GOConstLoopBoundsTrans(Transformation):
+    ''' Switch on (or off) the use of constant loop bounds within
+    a GOSchedule. In the absence of constant loop bounds, PSyclone will
+    generate loops where the bounds are obtained by de-referencing a field
+    object, e.g.:
+    ::
+
+      DO j = my_field%grid%internal%ystart, my_field%grid%internal%ystop
+
+    Some compilers are able to produce more efficient code if they are
+    provided with information on the relative trip-counts of the loops
     within an Invoke. With constant loop bounds switched on, PSyclone
     generates code like:
     ::
@@ -2245,7 +3379,7 @@ class ProfileRegionTrans(RegionTrans):
         ''' Returns the name of this transformation as a string '''
         return "ProfileRegionTrans"
 
-    def apply(self, nodes):
+    def apply(self, nodes, region_name=None, module_name=None):
         # pylint: disable=arguments-differ
         '''Apply this transformation to a subset of the nodes within a
         schedule - i.e. enclose the specified Nodes in the
@@ -2254,6 +3388,10 @@ class ProfileRegionTrans(RegionTrans):
         :param nodes: Can be a single node or a list of nodes.
         :type nodes: :py:obj:`psyclone.psygen.Node` or list of\
         :py:obj:`psyclone.psygen.Node`.
+        :param str region_name: optional name for the profile region. \
+        Defaults to the name of the first kernel in the region.
+        :param str module_name: optional module name for the profile \
+        region. Defaults to the module of the first kernel in the region.
         '''
 
         # Check whether we've been passed a list of nodes or just a
@@ -2293,7 +3431,9 @@ class ProfileRegionTrans(RegionTrans):
         keep = Memento(schedule, self)
 
         from psyclone.profiler import ProfileNode
-        profile_node = ProfileNode(parent=node_parent, children=node_list[:])
+        profile_node = ProfileNode(parent=node_parent, children=node_list[:],
+                                   region_name=region_name,
+                                   module_name=module_name)
 
         # Change all of the affected children so that they have
         # the ProfileNode astheir parent. Use a slice
@@ -2395,7 +3535,8 @@ class Dynamo0p3AsyncHaloExchangeTrans(Transformation):
 
         '''
         from psyclone.psyGen import HaloExchange
-        from psyclone.dynamo0p3 import DynHaloExchangeStart, DynHaloExchangeEnd
+        from psyclone.dynamo0p3 import DynHaloExchangeStart, \
+            DynHaloExchangeEnd, DynHaloExchangeGroup
 
         if not isinstance(node, HaloExchange) or \
            isinstance(node, (DynHaloExchangeStart, DynHaloExchangeEnd)):
@@ -2403,6 +3544,882 @@ class Dynamo0p3AsyncHaloExchangeTrans(Transformation):
                 "Error in Dynamo0p3AsyncHaloExchange transformation. Supplied "
                 "node must be a synchronous halo exchange but found '{0}'."
                 .format(type(node)))
+        if isinstance(node.parent, DynHaloExchangeGroup):
+            raise TransformationError(
+                "Error in Dynamo0p3AsyncHaloExchange transformation. Supplied "
+                "halo exchange for field '{0}' is part of a halo exchange "
+                "group.".format(node.field.name))
+
+
+class Dynamo0p3AsyncHaloExchangeOverlapTrans(Transformation):
+    '''Moves the start of every asynchronous halo exchange in a schedule
+    as early as the data dependencies allow and the end of every
+    asynchronous halo exchange as late as they allow, so that the
+    communication can be overlapped with as much computation as
+    possible. For example:
+
+    >>> from psyclone.parse import parse
+    >>> from psyclone.psyGen import PSyFactory
+    >>> api = "dynamo0.3"
+    >>> ast, invokeInfo = parse("file.f90", api=api)
+    >>> psy=PSyFactory(api).create(invokeInfo)
+    >>> schedule = psy.invokes.get('invoke_0').schedule
+    >>>
+    >>> from psyclone.psyGen import HaloExchange
+    >>> from psyclone.transformations import \\
+    ...     Dynamo0p3AsyncHaloExchangeTrans, \\
+    ...     Dynamo0p3AsyncHaloExchangeOverlapTrans
+    >>> ahex_trans = Dynamo0p3AsyncHaloExchangeTrans()
+    >>> for hex_node in schedule.walk(schedule.children, HaloExchange):
+    ...     ahex_trans.apply(hex_node)
+    >>> trans = Dynamo0p3AsyncHaloExchangeOverlapTrans()
+    >>> new_schedule, memento = trans.apply(schedule)
+    >>> new_schedule.view()
+    >>> print(trans.overlap_report(new_schedule))
+
+    '''
+
+    def __str__(self):
+        return ("Moves asynchronous halo exchange starts as early and ends "
+                "as late as possible.")
+
+    @property
+    def name(self):
+        '''
+        :returns: the name of this transformation as a string.
+        :rtype: str
+        '''
+        return "Dynamo0p3AsyncHaloExchangeOverlapTrans"
+
+    def apply(self, schedule):
+        '''Moves the asynchronous halo exchange starts in the supplied
+        schedule as early as possible and the asynchronous halo exchange
+        ends as late as possible, as determined by the dependence
+        analysis. Only the halo exchanges that are immediate children of
+        the schedule are moved.
+
+        :param schedule: the schedule containing the asynchronous halo \
+                         exchanges.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :returns: Tuple of the modified schedule and a record of the \
+                  transformation.
+        :rtype: (:py:class:`psyclone.psyGen.Schedule`, \
+                :py:class:`psyclone.undoredo.Memento`)
+
+        '''
+        self._validate(schedule)
+
+        # create a memento of the schedule and the proposed transformation
+        keep = Memento(schedule, self, [schedule])
+
+        from psyclone.dynamo0p3 import DynHaloExchangeStart, DynHaloExchangeEnd
+        move_trans = MoveTrans()
+        # Starts are moved in reverse order so that starts that are
+        # moved to the same location keep their relative order
+        starts = [node for node in schedule.children
+                  if isinstance(node, DynHaloExchangeStart)]
+        for hex_start in reversed(starts):
+            dependence = hex_start.backward_dependence()
+            if not dependence:
+                if hex_start.position > 0:
+                    move_trans.apply(hex_start, schedule.children[0])
+            elif dependence.position + 1 < hex_start.position:
+                move_trans.apply(hex_start, dependence, position="after")
+        ends = [node for node in schedule.children
+                if isinstance(node, DynHaloExchangeEnd)]
+        for hex_end in ends:
+            dependence = hex_end.forward_dependence()
+            if not dependence:
+                if hex_end.position < len(schedule.children) - 1:
+                    move_trans.apply(hex_end, schedule.children[-1],
+                                     position="after")
+            elif dependence.position - 1 > hex_end.position:
+                move_trans.apply(hex_end, dependence)
+
+        return schedule, keep
+
+    @staticmethod
+    def overlap_report(schedule):
+        '''Reports the computation that each asynchronous halo exchange in
+        the supplied schedule is overlapped with.
+
+        :param schedule: the schedule containing the asynchronous halo \
+                         exchanges.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :returns: one line for each asynchronous halo exchange giving \
+                  the field, the halo depth and the kernel calls that are \
+                  performed between its start and its end.
+        :rtype: str
+
+        '''
+        from psyclone.dynamo0p3 import DynHaloExchangeStart
+        lines = []
+        for hex_start in schedule.walk(schedule.children,
+                                       DynHaloExchangeStart):
+            field_id = hex_start.field.name
+            if hex_start.vector_index:
+                field_id += "({0})".format(hex_start.vector_index)
+            calls = hex_start.overlapped_calls()
+            lines.append(
+                "Halo exchange of '{0}' (depth={1}) overlaps {2} call(s)"
+                "{3}".format(field_id, hex_start._compute_halo_depth(),
+                             len(calls),
+                             ": " + ", ".join(call.name for call in calls)
+                             if calls else ""))
+        return "\n".join(lines)
+
+    def _validate(self, schedule):
+        '''Internal method to check whether the supplied node is valid for
+        this transformation.
+
+        :param schedule: the schedule containing the asynchronous halo \
+                         exchanges.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :raises TransformationError: if the supplied node is not a \
+                                     dynamo0.3 schedule.
+
+        '''
+        from psyclone.dynamo0p3 import DynSchedule
+        if not isinstance(schedule, DynSchedule):
+            raise TransformationError(
+                "Error in Dynamo0p3AsyncHaloExchangeOverlap transformation. "
+                "Supplied node must be a dynamo0.3 schedule but found '{0}'."
+                .format(type(schedule)))
+
+
+class Dynamo0p3HaloExchangeGroupTrans(Transformation):
+    '''Groups synchronous halo exchanges together so that they are
+    performed with a single (batched) call to the infrastructure rather
+    than with one call per field (or vector component). The halo
+    exchanges must have the same parent, exchange the same depth of
+    halo of fields of the same kind and must only be separated from
+    each other by other halo exchanges. For example:
+
+    >>> from psyclone.parse import parse
+    >>> from psyclone.psyGen import PSyFactory
+    >>> api = "dynamo0.3"
+    >>> ast, invokeInfo = parse("file.f90", api=api)
+    >>> psy=PSyFactory(api).create(invokeInfo)
+    >>> schedule = psy.invokes.get('invoke_0').schedule
+    >>> schedule.view()
+    >>>
+    >>> from psyclone.transformations import Dynamo0p3HaloExchangeGroupTrans
+    >>> trans = Dynamo0p3HaloExchangeGroupTrans()
+    >>> new_schedule, memento = trans.apply(schedule.children[0:3])
+    >>> new_schedule.view()
+
+    '''
+
+    def __str__(self):
+        return ("Groups synchronous halo exchanges into a single batched "
+                "halo exchange.")
+
+    @property
+    def name(self):
+        '''
+        :returns: the name of this transformation as a string.
+        :rtype: str
+        '''
+        return "Dynamo0p3HaloExchangeGroupTrans"
+
+    def apply(self, nodes):
+        '''Moves the supplied halo exchanges into a new
+        DynHaloExchangeGroup node which is placed at the position of the
+        first of them.
+
+        :param nodes: the synchronous halo exchanges to group.
+        :type nodes: :func:`list` of \
+                     :py:class:`psyclone.dynamo0p3.DynHaloExchange`
+        :returns: Tuple of the modified schedule and a record of the \
+                  transformation.
+        :rtype: (:py:class:`psyclone.psyGen.Schedule`, \
+                :py:class:`psyclone.undoredo.Memento`)
+
+        '''
+        self._validate(nodes)
+
+        schedule = nodes[0].root
+
+        # create a memento of the schedule and the proposed transformation
+        keep = Memento(schedule, self, nodes)
+
+        from psyclone.dynamo0p3 import DynHaloExchangeGroup
+        parent = nodes[0].parent
+        exchanges = sorted(nodes, key=lambda node: node.position)
+        position = exchanges[0].position
+        for exchange in exchanges:
+            parent.children.remove(exchange)
+        group = DynHaloExchangeGroup(children=exchanges, parent=parent)
+        for exchange in exchanges:
+            exchange.parent = group
+        parent.addchild(group, index=position)
+
+        return schedule, keep
+
+    def _validate(self, nodes):
+        '''Internal method to check whether the supplied nodes are valid
+        for this transformation.
+
+        :param nodes: the synchronous halo exchanges to group.
+        :type nodes: :func:`list` of \
+                     :py:class:`psyclone.dynamo0p3.DynHaloExchange`
+        :raises TransformationError: if fewer than two nodes are supplied.
+        :raises TransformationError: if any of the nodes is not a \
+                         synchronous halo exchange.
+        :raises TransformationError: if any of the nodes is already part \
+                         of a halo exchange group.
+        :raises TransformationError: if the nodes do not have the same \
+                         parent.
+        :raises TransformationError: if the nodes are separated by \
+                         anything other than halo exchanges.
+        :raises TransformationError: if the nodes do not exchange the \
+                         same depth of halo.
+        :raises TransformationError: if the nodes exchange fields that \
+                         hold data of different kinds.
+
+        '''
+        from psyclone.psyGen import HaloExchange
+        from psyclone.dynamo0p3 import DynHaloExchange, DynHaloExchangeStart, \
+            DynHaloExchangeEnd, DynHaloExchangeGroup
+
+        if not isinstance(nodes, (list, tuple)) or len(nodes) < 2:
+            raise TransformationError(
+                "Error in Dynamo0p3HaloExchangeGroup transformation. Supplied "
+                "nodes must be a list of at least two halo exchanges but "
+                "found '{0}'.".format(type(nodes)))
+        for node in nodes:
+            if not isinstance(node, DynHaloExchange) or \
+               isinstance(node, (DynHaloExchangeStart, DynHaloExchangeEnd)):
+                raise TransformationError(
+                    "Error in Dynamo0p3HaloExchangeGroup transformation. "
+                    "Supplied nodes must be synchronous halo exchanges but "
+                    "found '{0}'.".format(type(node)))
+            if isinstance(node.parent, DynHaloExchangeGroup):
+                raise TransformationError(
+                    "Error in Dynamo0p3HaloExchangeGroup transformation. "
+                    "Supplied halo exchange for field '{0}' is already part "
+                    "of a halo exchange group.".format(node.field.name))
+        parent = nodes[0].parent
+        if not all(node.parent is parent for node in nodes):
+            raise TransformationError(
+                "Error in Dynamo0p3HaloExchangeGroup transformation. Supplied "
+                "halo exchanges must have the same parent.")
+        positions = [node.position for node in nodes]
+        for node in parent.children[min(positions):max(positions)+1]:
+            if not isinstance(node, (HaloExchange, DynHaloExchangeGroup)):
+                raise TransformationError(
+                    "Error in Dynamo0p3HaloExchangeGroup transformation. "
+                    "Supplied halo exchanges must only be separated by other "
+                    "halo exchanges but found '{0}'.".format(type(node)))
+        depths = set(node._compute_halo_depth() for node in nodes)
+        if len(depths) > 1:
+            raise TransformationError(
+                "Error in Dynamo0p3HaloExchangeGroup transformation. Supplied "
+                "halo exchanges must exchange the same depth of halo but "
+                "found depths {0}.".format(sorted(depths)))
+        kinds = set(node.field.psy_precision for node in nodes)
+        if len(kinds) > 1:
+            raise TransformationError(
+                "Error in Dynamo0p3HaloExchangeGroup transformation. Supplied "
+                "halo exchanges must exchange fields of the same kind but "
+                "found kinds {0}.".format(sorted(kinds)))
+
+
+class Dynamo0p3GlobalSumGroupTrans(Transformation):
+    '''Groups global sums together so that they are performed with a
+    single (vector) global reduction rather than with one reduction per
+    scalar. The group is placed at the position of the last of the
+    supplied global sums so each of the others must be able to be
+    delayed until then, i.e. no node in between may read (or write)
+    the scalar that it sums. For example:
+
+    >>> from psyclone.parse import parse
+    >>> from psyclone.psyGen import PSyFactory
+    >>> api = "dynamo0.3"
+    >>> ast, invokeInfo = parse("file.f90", api=api)
+    >>> psy=PSyFactory(api).create(invokeInfo)
+    >>> schedule = psy.invokes.get('invoke_0').schedule
+    >>> schedule.view()
+    >>>
+    >>> from psyclone.transformations import Dynamo0p3GlobalSumGroupTrans
+    >>> trans = Dynamo0p3GlobalSumGroupTrans()
+    >>> new_schedule, memento = trans.apply([schedule.children[1],
+    >>>                                      schedule.children[3]])
+    >>> new_schedule.view()
+
+    '''
+
+    def __str__(self):
+        return ("Groups global sums into a single batched global "
+                "reduction.")
+
+    @property
+    def name(self):
+        '''
+        :returns: the name of this transformation as a string.
+        :rtype: str
+        '''
+        return "Dynamo0p3GlobalSumGroupTrans"
+
+    def apply(self, nodes):
+        '''Moves the supplied global sums into a new DynGlobalSumGroup
+        node which is placed at the position of the last of them.
+
+        :param nodes: the global sums to group.
+        :type nodes: :func:`list` of \
+                     :py:class:`psyclone.dynamo0p3.DynGlobalSum`
+        :returns: Tuple of the modified schedule and a record of the \
+                  transformation.
+        :rtype: (:py:class:`psyclone.psyGen.Schedule`, \
+                :py:class:`psyclone.undoredo.Memento`)
+
+        '''
+        self._validate(nodes)
+
+        schedule = nodes[0].root
+
+        # create a memento of the schedule and the proposed transformation
+        keep = Memento(schedule, self, nodes)
+
+        from psyclone.dynamo0p3 import DynGlobalSumGroup
+        parent = nodes[0].parent
+        global_sums = sorted(nodes, key=lambda node: node.position)
+        position = global_sums[-1].position - (len(global_sums) - 1)
+        for global_sum in global_sums:
+            parent.children.remove(global_sum)
+        group = DynGlobalSumGroup(children=global_sums, parent=parent)
+        for global_sum in global_sums:
+            global_sum.parent = group
+        parent.addchild(group, index=position)
+
+        return schedule, keep
+
+    def _validate(self, nodes):
+        '''Internal method to check whether the supplied nodes are valid
+        for this transformation.
+
+        :param nodes: the global sums to group.
+        :type nodes: :func:`list` of \
+                     :py:class:`psyclone.dynamo0p3.DynGlobalSum`
+        :raises TransformationError: if fewer than two nodes are supplied.
+        :raises TransformationError: if any of the nodes is not a \
+                         global sum.
+        :raises TransformationError: if any of the nodes is already part \
+                         of a global sum group.
+        :raises TransformationError: if the nodes do not have the same \
+                         parent.
+        :raises TransformationError: if any of the global sums cannot be \
+                         delayed until the last of them without breaking \
+                         a dependence.
+
+        '''
+        from psyclone.dynamo0p3 import DynGlobalSum, DynGlobalSumStart, \
+            DynGlobalSumEnd, DynGlobalSumGroup
+
+        if not isinstance(nodes, (list, tuple)) or len(nodes) < 2:
+            raise TransformationError(
+                "Error in Dynamo0p3GlobalSumGroup transformation. Supplied "
+                "nodes must be a list of at least two global sums but "
+                "found '{0}'.".format(type(nodes)))
+        for node in nodes:
+            if not isinstance(node, DynGlobalSum) or \
+               isinstance(node, (DynGlobalSumStart, DynGlobalSumEnd)):
+                raise TransformationError(
+                    "Error in Dynamo0p3GlobalSumGroup transformation. "
+                    "Supplied nodes must be global sums but found '{0}'."
+                    .format(type(node)))
+            if isinstance(node.parent, DynGlobalSumGroup):
+                raise TransformationError(
+                    "Error in Dynamo0p3GlobalSumGroup transformation. "
+                    "Supplied global sum of '{0}' is already part of a "
+                    "global sum group.".format(node.scalar.name))
+        parent = nodes[0].parent
+        if not all(node.parent is parent for node in nodes):
+            raise TransformationError(
+                "Error in Dynamo0p3GlobalSumGroup transformation. Supplied "
+                "global sums must have the same parent.")
+        global_sums = sorted(nodes, key=lambda node: node.position)
+        last = global_sums[-1]
+        for node in global_sums[:-1]:
+            if not node.is_valid_location(last, position="after"):
+                raise TransformationError(
+                    "Error in Dynamo0p3GlobalSumGroup transformation. The "
+                    "global sum of '{0}' cannot be delayed until the global "
+                    "sum of '{1}' as '{0}' is accessed in between.".format(
+                        node.scalar.name, last.scalar.name))
+
+
+class Dynamo0p3AsyncGlobalSumTrans(Transformation):
+    '''Splits a synchronous (blocking) global sum into a global sum start
+    and a global sum end. For example:
+
+    >>> from psyclone.parse import parse
+    >>> from psyclone.psyGen import PSyFactory
+    >>> api = "dynamo0.3"
+    >>> ast, invokeInfo = parse("file.f90", api=api)
+    >>> psy=PSyFactory(api).create(invokeInfo)
+    >>> schedule = psy.invokes.get('invoke_0').schedule
+    >>> schedule.view()
+    >>>
+    >>> from psyclone.transformations import Dynamo0p3AsyncGlobalSumTrans
+    >>> trans = Dynamo0p3AsyncGlobalSumTrans()
+    >>> new_schedule, memento = trans.apply(schedule.children[1])
+    >>> new_schedule.view()
+
+    '''
+
+    def __str__(self):
+        return "Changes a synchronous global sum into an asynchronous one."
+
+    @property
+    def name(self):
+        '''
+        :returns: the name of this transformation as a string.
+        :rtype: str
+        '''
+        return "Dynamo0p3AsyncGlobalSumTrans"
+
+    def apply(self, node):
+        '''Transforms a synchronous global sum, represented by a
+        DynGlobalSum node, into an asynchronous global sum, represented
+        by DynGlobalSumStart and DynGlobalSumEnd nodes.
+
+        :param node: a synchronous global sum node.
+        :type node: :py:class:`psyclone.dynamo0p3.DynGlobalSum`
+        :returns: Tuple of the modified schedule and a record of the \
+                  transformation.
+        :rtype: (:py:class:`psyclone.psyGen.Schedule`, \
+                :py:class:`psyclone.undoredo.Memento`)
+
+        '''
+        self._validate(node)
+
+        schedule = node.root
+
+        # create a memento of the schedule and the proposed transformation
+        keep = Memento(schedule, self, [node])
+
+        from psyclone.dynamo0p3 import DynGlobalSumStart, DynGlobalSumEnd
+        # add asynchronous start and end global sums and initialise
+        # them using information from the existing synchronous global
+        # sum
+        node.parent.addchild(
+            DynGlobalSumStart(node.scalar, parent=node.parent),
+            index=node.position)
+        node.parent.addchild(
+            DynGlobalSumEnd(node.scalar, parent=node.parent),
+            index=node.position)
+
+        # remove the existing synchronous global sum
+        node.parent.children.remove(node)
+
+        return schedule, keep
+
+    def _validate(self, node):
+        '''Internal method to check whether the node is valid for this
+        transformation.
+
+        :param node: a synchronous global sum node.
+        :type node: :py:class:`psyclone.dynamo0p3.DynGlobalSum`
+        :raises TransformationError: if the node argument is not a \
+                         synchronous global sum.
+        :raises TransformationError: if the global sum is part of a \
+                         global sum group.
+
+        '''
+        from psyclone.dynamo0p3 import DynGlobalSum, DynGlobalSumStart, \
+            DynGlobalSumEnd, DynGlobalSumGroup
+
+        if not isinstance(node, DynGlobalSum) or \
+           isinstance(node, (DynGlobalSumStart, DynGlobalSumEnd)):
+            raise TransformationError(
+                "Error in Dynamo0p3AsyncGlobalSum transformation. Supplied "
+                "node must be a synchronous global sum but found '{0}'."
+                .format(type(node)))
+        if isinstance(node.parent, DynGlobalSumGroup):
+            raise TransformationError(
+                "Error in Dynamo0p3AsyncGlobalSum transformation. Supplied "
+                "global sum of '{0}' is part of a global sum group."
+                .format(node.scalar.name))
+
+
+class Dynamo0p3AsyncGlobalSumOverlapTrans(Transformation):
+    '''Moves the end of every asynchronous global sum in a schedule as
+    late as the data dependencies allow, i.e. to just before the first
+    node that accesses the summed scalar, so that the global reduction
+    can be overlapped with as much independent computation as
+    possible. The start of an asynchronous global sum already
+    immediately follows the loop that computes the local sum so it is
+    not moved. For example:
+
+    >>> from psyclone.parse import parse
+    >>> from psyclone.psyGen import PSyFactory
+    >>> api = "dynamo0.3"
+    >>> ast, invokeInfo = parse("file.f90", api=api)
+    >>> psy=PSyFactory(api).create(invokeInfo)
+    >>> schedule = psy.invokes.get('invoke_0').schedule
+    >>>
+    >>> from psyclone.dynamo0p3 import DynGlobalSum
+    >>> from psyclone.transformations import \\
+    ...     Dynamo0p3AsyncGlobalSumTrans, \\
+    ...     Dynamo0p3AsyncGlobalSumOverlapTrans
+    >>> agsum_trans = Dynamo0p3AsyncGlobalSumTrans()
+    >>> for gsum_node in schedule.walk(schedule.children, DynGlobalSum):
+    ...     agsum_trans.apply(gsum_node)
+    >>> trans = Dynamo0p3AsyncGlobalSumOverlapTrans()
+    >>> new_schedule, memento = trans.apply(schedule)
+    >>> new_schedule.view()
+    >>> print(trans.overlap_report(new_schedule))
+
+    '''
+
+    def __str__(self):
+        return "Moves asynchronous global sum ends as late as possible."
+
+    @property
+    def name(self):
+        '''
+        :returns: the name of this transformation as a string.
+        :rtype: str
+        '''
+        return "Dynamo0p3AsyncGlobalSumOverlapTrans"
+
+    def apply(self, schedule):
+        '''Moves the asynchronous global sum ends in the supplied schedule
+        as late as possible, as determined by the dependence analysis.
+        Only the global sums that are immediate children of the schedule
+        are moved.
+
+        :param schedule: the schedule containing the asynchronous \
+                         global sums.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :returns: Tuple of the modified schedule and a record of the \
+                  transformation.
+        :rtype: (:py:class:`psyclone.psyGen.Schedule`, \
+                :py:class:`psyclone.undoredo.Memento`)
+
+        '''
+        self._validate(schedule)
+
+        # create a memento of the schedule and the proposed transformation
+        keep = Memento(schedule, self, [schedule])
+
+        from psyclone.dynamo0p3 import DynGlobalSumEnd
+        move_trans = MoveTrans()
+        ends = [node for node in schedule.children
+                if isinstance(node, DynGlobalSumEnd)]
+        for gsum_end in ends:
+            dependence = gsum_end.forward_dependence()
+            if not dependence:
+                if gsum_end.position < len(schedule.children) - 1:
+                    move_trans.apply(gsum_end, schedule.children[-1],
+                                     position="after")
+            elif dependence.position - 1 > gsum_end.position:
+                move_trans.apply(gsum_end, dependence)
+
+        return schedule, keep
+
+    @staticmethod
+    def overlap_report(schedule):
+        '''Reports the computation that each asynchronous global sum in the
+        supplied schedule is overlapped with.
+
+        :param schedule: the schedule containing the asynchronous \
+                         global sums.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :returns: one line for each asynchronous global sum giving the \
+                  scalar and the kernel calls that are performed between \
+                  its start and its end.
+        :rtype: str
+
+        '''
+        from psyclone.dynamo0p3 import DynGlobalSumStart
+        lines = []
+        for gsum_start in schedule.walk(schedule.children,
+                                        DynGlobalSumStart):
+            calls = gsum_start.overlapped_calls()
+            lines.append(
+                "Global sum of '{0}' overlaps {1} call(s){2}".format(
+                    gsum_start.scalar.name, len(calls),
+                    ": " + ", ".join(call.name for call in calls)
+                    if calls else ""))
+        return "\n".join(lines)
+
+    def _validate(self, schedule):
+        '''Internal method to check whether the supplied node is valid for
+        this transformation.
+
+        :param schedule: the schedule containing the asynchronous \
+                         global sums.
+        :type schedule: :py:class:`psyclone.dynamo0p3.DynSchedule`
+        :raises TransformationError: if the supplied node is not a \
+                                     dynamo0.3 schedule.
+
+        '''
+        from psyclone.dynamo0p3 import DynSchedule
+        if not isinstance(schedule, DynSchedule):
+            raise TransformationError(
+                "Error in Dynamo0p3AsyncGlobalSumOverlap transformation. "
+                "Supplied node must be a dynamo0.3 schedule but found '{0}'."
+                .format(type(schedule)))
+
+
+class Dynamo0p3LoopSplitTrans(Transformation):
+    '''Splits a Dynamo 0.3 loop over cells that reads halo data into a
+    loop over the inner cells, whose accesses (including any stencil
+    accesses) do not reach the halo, followed by a loop over the
+    remaining owned and halo cells. The halo exchanges (or halo exchange
+    ends) that precede the original loop are left between the two loops
+    so that the work on the inner cells can be overlapped with the
+    communication. For example:
+
+    >>> from psyclone.parse import parse
+    >>> from psyclone.psyGen import PSyFactory
+    >>> api = "dynamo0.3"
+    >>> ast, invokeInfo = parse("file.f90", api=api)
+    >>> psy=PSyFactory(api).create(invokeInfo)
+    >>> schedule = psy.invokes.get('invoke_0').schedule
+    >>> schedule.view()
+    >>>
+    >>> from psyclone.transformations import Dynamo0p3LoopSplitTrans
+    >>> trans = Dynamo0p3LoopSplitTrans()
+    >>> new_schedule, memento = trans.apply(schedule.children[3])
+    >>> new_schedule.view()
+
+    The loop over inner cells iterates up to the last cell of the
+    inner halo of the required depth (``mesh%get_last_inner_cell(depth)``)
+    so the mesh must have been partitioned with at least this depth of
+    inner halo.
+
+    '''
+
+    def __str__(self):
+        return ("Splits a loop over cells into a loop over inner cells and "
+                "a loop over the remaining cells.")
+
+    @property
+    def name(self):
+        '''
+        :returns: the name of this transformation as a string.
+        :rtype: str
+        '''
+        return "Dynamo0p3LoopSplitTrans"
+
+    def apply(self, node):
+        '''Splits the supplied loop into a loop over the inner cells,
+        which is placed before any halo exchanges that the loop depends
+        upon, and a loop over the remaining cells, which is the original
+        loop with a new lower bound.
+
+        :param node: the loop to split.
+        :type node: :py:class:`psyclone.dynamo0p3.DynLoop`
+        :returns: Tuple of the modified schedule and a record of the \
+                  transformation.
+        :rtype: (:py:class:`psyclone.psyGen.Schedule`, \
+                :py:class:`psyclone.undoredo.Memento`)
+
+        '''
+        self._validate(node)
+
+        schedule = node.root
+
+        # create a memento of the schedule and the proposed transformation
+        keep = Memento(schedule, self, [node])
+
+        from psyclone.psyGen import HaloExchange
+        from psyclone.dynamo0p3 import DynLoop, DynHaloExchangeStart, \
+            DynHaloExchangeGroup
+        depth = self._inner_depth(node)
+        parent = node.parent
+
+        # The loop over inner cells does not need any halo data so it
+        # can be placed before the halo exchanges (and halo exchange
+        # ends) that immediately precede the loop, unless the loop
+        # modifies the field being exchanged. Halo exchange starts are
+        # left where they are.
+        modified = self._modified_fields(node)
+        position = node.position
+        index = position
+        while index > 0 and isinstance(parent.children[index-1],
+                                       (HaloExchange, DynHaloExchangeGroup)):
+            exchange = parent.children[index-1]
+            if set(arg.name for arg in exchange.args) & modified:
+                break
+            index -= 1
+            if not isinstance(exchange, DynHaloExchangeStart):
+                position = index
+
+        inner_loop = DynLoop(parent=parent, loop_type=node.loop_type)
+        kernels = [self._copy_call(call, inner_loop)
+                   for call in node.children]
+        inner_loop.children.extend(kernels)
+        inner_loop.load(kernels[0])
+        inner_loop.set_lower_bound("start")
+        inner_loop.set_upper_bound("inner", depth)
+        parent.addchild(inner_loop, index=position)
+
+        # The original loop now starts after the last inner cell of
+        # the chosen depth
+        if depth == 1:
+            node.set_lower_bound("ncells")
+        else:
+            node.set_lower_bound("inner", depth-1)
+
+        return schedule, keep
+
+    @staticmethod
+    def _modified_fields(node):
+        '''
+        :param node: a loop.
+        :type node: :py:class:`psyclone.dynamo0p3.DynLoop`
+        :returns: the names of the arguments that are modified within \
+                  the loop.
+        :rtype: set of str
+        '''
+        from psyclone.dynamo0p3 import GH_WRITE_ACCESSES
+        return set(arg.name for call in node.calls()
+                   for arg in call.arguments.args
+                   if arg.access in GH_WRITE_ACCESSES)
+
+    @staticmethod
+    def _inner_depth(node):
+        '''Determines the depth of the inner halo up to which the cells of
+        the supplied loop can be computed without reading any halo data
+        (or annexed dofs). For each argument whose halo is read this is
+        the extent of its stencil (if any) plus one if it is continuous,
+        as cells on the edge of the partition share dofs with the halo.
+
+        :param node: the loop to split.
+        :type node: :py:class:`psyclone.dynamo0p3.DynLoop`
+        :returns: the depth of the inner halo (at least 1).
+        :rtype: int
+        :raises TransformationError: if a stencil extent is only known \
+                                     at run time.
+
+        '''
+        depth = 1
+        for call in node.calls():
+            for arg in call.arguments.args:
+                if not node._halo_read_access(arg):
+                    continue
+                extent = 0
+                if arg.descriptor.stencil:
+                    extent = arg.descriptor.stencil['extent']
+                    if not extent:
+                        if not arg.stencil.extent_arg.is_literal():
+                            raise TransformationError(
+                                "Error in Dynamo0p3LoopSplit transformation. "
+                                "The stencil extent of field '{0}' in kernel "
+                                "'{1}' is only known at run time.".format(
+                                    arg.name, call.name))
+                        extent = int(arg.stencil.extent_arg.text)
+                if not arg.discontinuous:
+                    extent += 1
+                depth = max(depth, extent)
+        return depth
+
+    @staticmethod
+    def _copy_call(call, parent):
+        '''Creates a copy of the supplied kernel call and of its arguments
+        for use in a new loop. Everything else (meta-data, function
+        spaces, stencils etc.) is shared with the original call.
+
+        :param call: the kernel call to copy.
+        :type call: :py:class:`psyclone.dynamo0p3.DynKern`
+        :param parent: the loop that will contain the copy.
+        :type parent: :py:class:`psyclone.dynamo0p3.DynLoop`
+        :returns: the copy of the kernel call.
+        :rtype: :py:class:`psyclone.dynamo0p3.DynKern`
+
+        '''
+        import copy
+        new_call = copy.copy(call)
+        new_call.parent = parent
+        new_call._children = []
+        arguments = copy.copy(call.arguments)
+        arguments._parent_call = new_call
+        arguments._args = []
+        for arg in call.arguments.args:
+            new_arg = copy.copy(arg)
+            new_arg._call = new_call
+            new_arg._kernel_args = arguments
+            arguments._args.append(new_arg)
+        new_call._arguments = arguments
+        return new_call
+
+    def _validate(self, node):
+        '''Internal method to check whether the supplied node is valid for
+        this transformation.
+
+        :param node: the loop to split.
+        :type node: :py:class:`psyclone.dynamo0p3.DynLoop`
+        :raises TransformationError: if the node is not a dynamo0.3 loop.
+        :raises TransformationError: if distributed memory is not enabled.
+        :raises TransformationError: if the loop is not over cells.
+        :raises TransformationError: if the loop does not start at the \
+                         first cell or does not end at the last owned \
+                         cell or in the halo.
+        :raises TransformationError: if the loop is not an immediate \
+                         child of the schedule.
+        :raises TransformationError: if the loop contains anything other \
+                         than (non inter-grid) kernel calls.
+        :raises TransformationError: if the loop does not read any halo \
+                         data.
+        :raises TransformationError: if a field that is modified within \
+                         the loop requires a halo exchange before it.
+
+        '''
+        from psyclone.psyGen import Schedule, HaloExchange
+        from psyclone.dynamo0p3 import DynLoop, DynKern
+        if not isinstance(node, DynLoop):
+            raise TransformationError(
+                "Error in Dynamo0p3LoopSplit transformation. Supplied node "
+                "must be a dynamo0.3 loop but found '{0}'.".format(type(node)))
+        if not Config.get().distributed_memory:
+            raise TransformationError(
+                "Error in Dynamo0p3LoopSplit transformation. Loops can only "
+                "be split when distributed memory is enabled.")
+        if node.loop_type != "":
+            raise TransformationError(
+                "Error in Dynamo0p3LoopSplit transformation. Only loops over "
+                "cells may be split but this loop is over '{0}'.".format(
+                    node.loop_type))
+        if node.lower_bound_name != "start" or \
+           node.upper_bound_name not in ["ncells", "cell_halo"]:
+            raise TransformationError(
+                "Error in Dynamo0p3LoopSplit transformation. The loop must "
+                "iterate from the first cell to 'ncells' or 'cell_halo' but "
+                "found '{0}' to '{1}'. Has it already been split?".format(
+                    node.lower_bound_name, node.upper_bound_name))
+        if not isinstance(node.parent, Schedule):
+            raise TransformationError(
+                "Error in Dynamo0p3LoopSplit transformation. The loop must "
+                "be an immediate child of the schedule but its parent is "
+                "'{0}'.".format(type(node.parent)))
+        for call in node.children:
+            if not isinstance(call, DynKern) or call.is_intergrid:
+                raise TransformationError(
+                    "Error in Dynamo0p3LoopSplit transformation. The loop "
+                    "must only contain (non inter-grid) kernel calls but "
+                    "found '{0}'.".format(type(call)))
+        halo_fields = node.unique_fields_with_halo_reads()
+        if not halo_fields:
+            raise TransformationError(
+                "Error in Dynamo0p3LoopSplit transformation. The loop does "
+                "not read any halo data so there is no communication to "
+                "overlap with.")
+        # The owned dofs of a field that is modified within the loop
+        # may be sent by a halo exchange of that field so the loop over
+        # inner cells could not be placed before it
+        modified = self._modified_fields(node)
+        for field in halo_fields:
+            if field.name in modified and \
+               any(isinstance(dep.call, HaloExchange)
+                   for dep in field.backward_write_dependencies()):
+                raise TransformationError(
+                    "Error in Dynamo0p3LoopSplit transformation. Field '{0}' "
+                    "is modified within the loop and requires a halo "
+                    "exchange before it.".format(field.name))
 
 
 class ACCDataTrans(Transformation):
@@ -2451,16 +4468,21 @@ class ACCDataTrans(Transformation):
                   transformation.
         :rtype: (:py:class:`psyclone.psyGen.Schedule`, \
                 :py:class:`psyclone.undoredo.Memento`)
-        :raises NotImplementedError: for any API other than GOcean 1.0.
+        :raises NotImplementedError: for any API other than GOcean 1.0 or \
+                                     Dynamo 0.3.
         :raises TransformationError: if passed something that is not a \
                          (subclass of) :py:class:`psyclone.psyGen.Schedule`.
         '''
         # Check that the supplied node is a Schedule
         from psyclone.psyGen import Schedule
         from psyclone.gocean1p0 import GOSchedule
+        from psyclone.dynamo0p3 import DynSchedule
 
         if isinstance(sched, GOSchedule):
             from psyclone.gocean1p0 import GOACCDataDirective as AccDataDir
+        elif isinstance(sched, DynSchedule):
+            from psyclone.dynamo0p3 import DynACCEnterDataDirective as \
+                AccDataDir
         elif isinstance(sched, Schedule):
             raise NotImplementedError(
                 "ACCDataTrans: ACCDataDirective not implemented for a "